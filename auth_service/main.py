@@ -61,6 +61,10 @@ GROUP_LABELS = {
     "/gr-vld-hr-assist-super-recruter": "супер-рекрутер"
 }
 
+# Core API: сброс кэша проверенных сессий при выходе
+CORE_API_URL = os.getenv("CORE_API_URL", "http://core_api:8000").rstrip("/")
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
 # Формирование правильного redirect_uri
 REDIRECT_URI = f"{AUTH_PUBLIC_URL}/callback"
 
@@ -196,6 +200,28 @@ def _delete_sid_cookie(response: Response) -> None:
     log.debug("Cookie удален: name=%s, path=/auth", COOKIE_NAME)
 
 
+async def _invalidate_core_api_session(sid: str) -> None:
+    """
+    Сбросить сессию в кэше проверок авторизации core_api.
+
+    Ошибка не мешает выходу: запись кэша core_api истечёт по TTL.
+
+    Args:
+        sid: Session ID
+    """
+    headers = {"X-Internal-Token": INTERNAL_API_TOKEN} if INTERNAL_API_TOKEN else {}
+    try:
+        async with httpx.AsyncClient(timeout=2) as client:
+            response = await client.post(
+                f"{CORE_API_URL}/internal/auth/sessions/invalidate",
+                json={"sid": sid},
+                headers=headers,
+            )
+            response.raise_for_status()
+    except httpx.HTTPError as e:
+        log.warning("Не удалось сбросить сессию в кэше core_api: %s", e)
+
+
 # ==================== ИНИЦИАЛИЗАЦИЯ ПРИЛОЖЕНИЯ ====================
 
 app = FastAPI(
@@ -477,6 +503,7 @@ async def logout(request: Request) -> RedirectResponse:
                 user.get("preferred_username", user.get("sub")),
                 sid,
             )
+        await _invalidate_core_api_session(sid)
 
     # Если есть logout endpoint у провайдера
     if LOGOUT_URL:
@@ -20,7 +20,14 @@ from alembic import context
 from app.db.base import Base
 from app.core.config import settings
 # Импортируем модели чтобы они были зарегистрированы в MetaData
-from app.db.models import User, GenerationResult  # noqa: F401
+from app.db.models import (  # noqa: F401
+    GenerationJob,
+    GenerationResult,
+    PayloadBlob,
+    SkillRelevanceMemo,
+    User,
+    VacancyCacheEntry,
+)
 
 # Объект конфигурации Alembic
 config = context.config
@@ -0,0 +1,99 @@
+"""baseline schema
+
+Базовая схема Core API: таблицы users и generation_results.
+
+Миграция идемпотентна: в базе, созданной до появления миграций в репозитории,
+создаются только отсутствующие таблицы. generation_results создаётся
+несекционированной — на секции её переводит миграция 20261018_0006.
+
+Revision ID: 20261018_0000
+Revises:
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0000"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Таблицы в порядке создания (удаляются в обратном)
+TABLES = (
+    "users",
+    "generation_results",
+)
+
+
+def _timestamp(name: str, comment: str) -> sa.Column:
+    return sa.Column(
+        name,
+        postgresql.TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+        comment=comment,
+    )
+
+
+def _create_users() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True,
+                  comment="Уникальный идентификатор пользователя"),
+        sa.Column("email", sa.String(255), nullable=False, unique=True,
+                  comment="Email пользователя (уникальный)"),
+        sa.Column("full_name", sa.String(255), nullable=False, comment="Полное имя пользователя"),
+        _timestamp("created_at", "Дата и время создания записи"),
+        _timestamp("updated_at", "Дата и время последнего обновления"),
+        comment="Таблица авторизованных пользователей",
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+
+def _create_generation_results() -> None:
+    op.create_table(
+        "generation_results",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True,
+                  comment="Уникальный идентификатор записи"),
+        sa.Column("user_id", sa.BigInteger(), sa.ForeignKey("users.id", ondelete="SET NULL"),
+                  nullable=True, comment="ID пользователя (NULL для анонимных запросов)"),
+        sa.Column("request_type", sa.String(100), nullable=False,
+                  comment="Тип генерации (job_description, resume_evaluation, etc.)"),
+        sa.Column("request_payload", postgresql.JSONB(), nullable=True,
+                  comment="Входные данные запроса"),
+        sa.Column("response_payload", postgresql.JSONB(), nullable=True,
+                  comment="Результат генерации"),
+        sa.Column("status", sa.String(50), nullable=False,
+                  comment="Статус выполнения (success, error, timeout)"),
+        sa.Column("error_message", sa.Text(), nullable=True, comment="Сообщение об ошибке"),
+        sa.Column("latency_ms", sa.Integer(), nullable=True,
+                  comment="Время выполнения в миллисекундах"),
+        _timestamp("created_at", "Дата и время создания записи"),
+        comment="Таблица результатов генераций LLM/ML воркеров",
+    )
+    op.create_index("ix_generation_results_user_id", "generation_results", ["user_id"])
+    op.create_index("ix_generation_results_request_type", "generation_results", ["request_type"])
+
+
+CREATORS = {
+    "users": _create_users,
+    "generation_results": _create_generation_results,
+}
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    for table in TABLES:
+        if table not in existing:
+            CREATORS[table]()
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.execute(f"DROP TABLE IF EXISTS {table}")
@@ -0,0 +1,46 @@
+"""create vacancy_cache
+
+Таблица vacancy_cache — кэш промежуточных результатов разбора вакансий
+(профиль вакансии, подготовленные навыки) с необязательным сроком жизни.
+
+Если таблица уже существует, миграция ничего не делает.
+
+Revision ID: 20261018_0001
+Revises: 20261018_0000
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0001"
+down_revision: Union[str, None] = "20261018_0000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if "vacancy_cache" in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        "vacancy_cache",
+        sa.Column("key", sa.String(128), primary_key=True,
+                  comment="Ключ записи (<этап>:<версия промптов>:<sha256>)"),
+        sa.Column("value", postgresql.JSONB(), nullable=False,
+                  comment="Сохранённый результат этапа"),
+        sa.Column("created_at", postgresql.TIMESTAMP(timezone=True), nullable=False,
+                  server_default=sa.func.now(), comment="Дата и время создания записи"),
+        sa.Column("expires_at", postgresql.TIMESTAMP(timezone=True), nullable=True,
+                  comment="Дата и время истечения записи (NULL — бессрочно)"),
+        comment="Кэш промежуточных результатов разбора вакансий",
+    )
+    op.create_index("ix_vacancy_cache_expires_at", "vacancy_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS vacancy_cache")
@@ -0,0 +1,62 @@
+"""create generation_jobs
+
+Таблица generation_jobs — асинхронные задачи генерации со статусом,
+последним этапом пайплайна и прогрессом выполнения.
+
+Если таблица уже существует, миграция ничего не делает.
+
+Revision ID: 20261018_0002
+Revises: 20261018_0001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0002"
+down_revision: Union[str, None] = "20261018_0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if "generation_jobs" in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        "generation_jobs",
+        sa.Column("id", sa.String(36), primary_key=True, comment="Идентификатор задачи (UUID)"),
+        sa.Column("user_id", sa.BigInteger(), sa.ForeignKey("users.id", ondelete="SET NULL"),
+                  nullable=True, comment="ID пользователя (NULL для анонимных запросов)"),
+        sa.Column("request_type", sa.String(100), nullable=False,
+                  comment="Тип генерации (job_description, resume_evaluation, etc.)"),
+        sa.Column("status", sa.String(50), nullable=False,
+                  comment="Статус задачи (queued, running, success, error)"),
+        sa.Column("stage", sa.String(100), nullable=True,
+                  comment="Последний завершённый этап пайплайна"),
+        sa.Column("progress", sa.Integer(), nullable=False,
+                  comment="Прогресс выполнения в процентах"),
+        sa.Column("request_payload", postgresql.JSONB(), nullable=True,
+                  comment="Входные данные запроса"),
+        sa.Column("response_payload", postgresql.JSONB(), nullable=True,
+                  comment="Результат генерации"),
+        sa.Column("error_message", sa.Text(), nullable=True, comment="Сообщение об ошибке"),
+        sa.Column("created_at", postgresql.TIMESTAMP(timezone=True), nullable=False,
+                  server_default=sa.func.now(), comment="Дата и время создания задачи"),
+        sa.Column("updated_at", postgresql.TIMESTAMP(timezone=True), nullable=False,
+                  server_default=sa.func.now(), comment="Дата и время последнего обновления"),
+        sa.Column("finished_at", postgresql.TIMESTAMP(timezone=True), nullable=True,
+                  comment="Дата и время завершения задачи"),
+        comment="Таблица асинхронных задач генерации",
+    )
+    op.create_index("ix_generation_jobs_user_id", "generation_jobs", ["user_id"])
+    op.create_index("ix_generation_jobs_status", "generation_jobs", ["status"])
+    op.create_index("ix_generation_jobs_created_at", "generation_jobs", ["created_at"])
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS generation_jobs")
@@ -0,0 +1,51 @@
+"""create skill_relevance_memo
+
+Таблица skill_relevance_memo — вердикты LLM по парам навыков вакансии
+и резюме, привязанные к версии промпта оценки релевантности.
+
+Если таблица уже существует, миграция ничего не делает.
+
+Revision ID: 20261018_0003
+Revises: 20261018_0002
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0003"
+down_revision: Union[str, None] = "20261018_0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if "skill_relevance_memo" in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        "skill_relevance_memo",
+        sa.Column("prompt_version", sa.String(64), primary_key=True,
+                  comment="Версия промпта оценки релевантности"),
+        sa.Column("vacancy_skill", sa.String(255), primary_key=True,
+                  comment="Нормализованный навык вакансии"),
+        sa.Column("resume_skill", sa.String(255), primary_key=True,
+                  comment="Нормализованный навык резюме"),
+        sa.Column("relevance", sa.String(50), nullable=False, comment="Категория аналогичности"),
+        sa.Column("reason", sa.Text(), nullable=True, comment="Обоснование LLM"),
+        sa.Column("hits", sa.BigInteger(), nullable=False, server_default="0",
+                  comment="Количество повторных использований вердикта"),
+        sa.Column("created_at", postgresql.TIMESTAMP(timezone=True), nullable=False,
+                  server_default=sa.func.now(), comment="Дата и время создания записи"),
+        sa.Column("updated_at", postgresql.TIMESTAMP(timezone=True), nullable=False,
+                  server_default=sa.func.now(), comment="Дата и время последнего обновления"),
+        comment="Вердикты LLM по парам навыков вакансии и резюме",
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS skill_relevance_memo")
@@ -0,0 +1,41 @@
+"""add generation_results.request_hash
+
+Столбец request_hash — sha256 нормализованных входных текстов, по которому
+повторно используется сохранённая оценка резюме, и индекс
+(request_type, request_hash) для её поиска.
+
+Если столбец и индекс уже существуют, миграция ничего не делает.
+
+Revision ID: 20261018_0004
+Revises: 20261018_0003
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0004"
+down_revision: Union[str, None] = "20261018_0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE generation_results ADD COLUMN IF NOT EXISTS request_hash VARCHAR(64)"
+    )
+    op.execute(
+        "COMMENT ON COLUMN generation_results.request_hash "
+        "IS 'Хэш нормализованных входных текстов (sha256)'"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_generation_results_request_hash "
+        "ON generation_results (request_type, request_hash)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_generation_results_request_hash")
+    op.execute("ALTER TABLE generation_results DROP COLUMN IF EXISTS request_hash")
@@ -0,0 +1,45 @@
+"""create payload_blobs
+
+Таблица payload_blobs — сжатые zlib тексты входных данных генераций,
+адресуемые по sha256, со счётчиком ссылок.
+
+Если таблица уже существует, миграция ничего не делает.
+
+Revision ID: 20261018_0005
+Revises: 20261018_0004
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0005"
+down_revision: Union[str, None] = "20261018_0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if "payload_blobs" in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        "payload_blobs",
+        sa.Column("hash", sa.String(64), primary_key=True, comment="sha256 исходного текста"),
+        sa.Column("data", sa.LargeBinary(), nullable=False, comment="Текст, сжатый zlib"),
+        sa.Column("size", sa.Integer(), nullable=False,
+                  comment="Размер исходного текста в байтах (UTF-8)"),
+        sa.Column("ref_count", sa.BigInteger(), nullable=False, server_default="0",
+                  comment="Количество записей, ссылающихся на текст"),
+        sa.Column("created_at", postgresql.TIMESTAMP(timezone=True), nullable=False,
+                  server_default=sa.func.now(), comment="Дата и время создания записи"),
+        comment="Сжатые тексты входных данных генераций (адресация по хэшу)",
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS payload_blobs")
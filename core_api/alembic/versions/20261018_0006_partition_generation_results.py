@@ -0,0 +1,158 @@
+"""partition generation_results by month
+
+Переводит существующую таблицу generation_results на помесячное
+секционирование по created_at:
+- первичный ключ (id, created_at), последовательность id сохраняется;
+- секции с первого месяца данных до PARTITIONS_AHEAD месяцев вперёд
+  и секция по умолчанию (следующие секции создаёт PartitionService);
+- индексы под постраничную выборку (created_at, id).
+
+Если таблица уже секционирована, миграция ничего не делает.
+
+Revision ID: 20261018_0006
+Revises: 20261018_0005
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.partitions import (
+    PARTITIONED_TABLE,
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+    month_start,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0006"
+down_revision: Union[str, None] = "20261018_0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LEGACY_TABLE = f"{PARTITIONED_TABLE}_legacy"
+
+# Секций, создаваемых вперёд от текущего месяца (значение PARTITIONS_AHEAD
+# по умолчанию; миграция не зависит от настроек приложения)
+PARTITIONS_AHEAD = 2
+
+COLUMNS = (
+    "id, user_id, request_type, request_payload, request_hash, response_payload, "
+    "status, error_message, latency_ms, created_at"
+)
+
+INDEXES = (
+    ("ix_generation_results_user_created", "user_id, created_at, id"),
+    ("ix_generation_results_type_created", "request_type, created_at, id"),
+    ("ix_generation_results_user_type_created", "user_id, request_type, created_at, id"),
+    ("ix_generation_results_created_at", "created_at"),
+    ("ix_generation_results_status", "status"),
+    ("ix_generation_results_request_hash", "request_type, request_hash"),
+)
+
+
+def _relkind(table: str):
+    return op.get_bind().execute(
+        sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": table},
+    ).scalar_one_or_none()
+
+
+def _rename_legacy() -> None:
+    """Переименовать таблицу и её индексы, освободив имена для новой таблицы."""
+    op.execute(f"ALTER TABLE {PARTITIONED_TABLE} RENAME TO {LEGACY_TABLE}")
+    op.execute(
+        f"ALTER TABLE {LEGACY_TABLE} RENAME CONSTRAINT {PARTITIONED_TABLE}_pkey TO {LEGACY_TABLE}_pkey"
+    )
+    indexes = op.get_bind().execute(
+        sa.text(
+            "SELECT indexname FROM pg_indexes WHERE tablename = :table "
+            "AND indexname <> :pkey"
+        ),
+        {"table": LEGACY_TABLE, "pkey": f"{LEGACY_TABLE}_pkey"},
+    ).scalars().all()
+    for index in indexes:
+        op.execute(f"ALTER INDEX {index} RENAME TO {index}_legacy")
+
+
+def upgrade() -> None:
+    if _relkind(PARTITIONED_TABLE) != "r":
+        return
+
+    _rename_legacy()
+
+    op.execute(
+        f"""
+        CREATE TABLE {PARTITIONED_TABLE} (
+            id BIGINT NOT NULL DEFAULT nextval('{PARTITIONED_TABLE}_id_seq'),
+            user_id BIGINT REFERENCES users (id) ON DELETE SET NULL,
+            request_type VARCHAR(100) NOT NULL,
+            request_payload JSONB,
+            request_hash VARCHAR(64),
+            response_payload JSONB,
+            status VARCHAR(50) NOT NULL,
+            error_message TEXT,
+            latency_ms INTEGER,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute(f"ALTER SEQUENCE {PARTITIONED_TABLE}_id_seq OWNED BY {PARTITIONED_TABLE}.id")
+
+    # Секции от первого месяца данных до PARTITIONS_AHEAD месяцев вперёд
+    current = month_start(datetime.now(timezone.utc))
+    oldest = op.get_bind().execute(
+        sa.text(f"SELECT min(created_at) FROM {LEGACY_TABLE}")
+    ).scalar_one_or_none()
+    month = month_start(oldest) if oldest is not None else current
+    while month <= add_months(current, PARTITIONS_AHEAD):
+        op.execute(create_partition_sql(month))
+        month = add_months(month, 1)
+    op.execute(create_default_partition_sql())
+
+    op.execute(
+        f"INSERT INTO {PARTITIONED_TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {LEGACY_TABLE}"
+    )
+    op.execute(f"DROP TABLE {LEGACY_TABLE}")
+
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {PARTITIONED_TABLE} ({columns})")
+
+
+def downgrade() -> None:
+    if _relkind(PARTITIONED_TABLE) != "p":
+        return
+
+    _rename_legacy()
+
+    op.execute(
+        f"""
+        CREATE TABLE {PARTITIONED_TABLE} (
+            id BIGINT PRIMARY KEY DEFAULT nextval('{PARTITIONED_TABLE}_id_seq'),
+            user_id BIGINT REFERENCES users (id) ON DELETE SET NULL,
+            request_type VARCHAR(100) NOT NULL,
+            request_payload JSONB,
+            request_hash VARCHAR(64),
+            response_payload JSONB,
+            status VARCHAR(50) NOT NULL,
+            error_message TEXT,
+            latency_ms INTEGER,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+        )
+        """
+    )
+    op.execute(f"ALTER SEQUENCE {PARTITIONED_TABLE}_id_seq OWNED BY {PARTITIONED_TABLE}.id")
+    op.execute(
+        f"INSERT INTO {PARTITIONED_TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {LEGACY_TABLE}"
+    )
+    op.execute(f"DROP TABLE {LEGACY_TABLE}")
+
+    op.execute(f"CREATE INDEX ix_generation_results_user_id ON {PARTITIONED_TABLE} (user_id)")
+    op.execute(f"CREATE INDEX ix_generation_results_request_type ON {PARTITIONED_TABLE} (request_type)")
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {PARTITIONED_TABLE} ({columns})")
@@ -1,17 +1,23 @@
 """Зависимости для FastAPI endpoints."""
 import json
+import secrets
 from typing import Optional
 import httpx
-from fastapi import Depends, Form, HTTPException, Request, status
+from fastapi import Depends, Form, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_session
+from app.db import SessionFactory, get_session, get_session_maker
 from app.rabbitmq import RabbitMQClient
-from app.services.user_service import UserService
+from app.repositories import SkillRelevanceMemoRepository, VacancyCacheRepository
+from app.services.user_service import UserIdCache, UserService
 from app.services.generation_service import GenerationService
 from app.services.logging_service import LoggingService
+from app.services.job_service import JobService
+from app.services.result_writer import ResultWriter
+from app.services.auth_client import AuthClient
 from app.api.schemas.common import UserData
 from app.core.config import settings
+from app.core.single_flight import SingleFlight
 from app.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -19,6 +25,25 @@ logger = setup_logger(__name__)
 # Глобальный клиент RabbitMQ (будет инициализирован в lifespan)
 _rabbit_client: Optional[RabbitMQClient] = None
 
+# Глобальный сервис асинхронных задач (будет инициализирован в lifespan)
+_job_service: Optional[JobService] = None
+
+# Глобальная фоновая запись результатов (будет инициализирована в lifespan)
+_result_writer: Optional[ResultWriter] = None
+
+# Глобальный клиент auth service (будет инициализирован в lifespan)
+_auth_client: Optional[AuthClient] = None
+
+# Объединение одинаковых одновременных запросов к воркерам
+_single_flight: Optional[SingleFlight] = (
+    SingleFlight() if settings.single_flight_enabled else None
+)
+
+# Кэш email → ID пользователя процесса
+_user_id_cache: Optional[UserIdCache] = (
+    UserIdCache(settings.user_cache_max_size) if settings.user_cache_max_size > 0 else None
+)
+
 
 def set_rabbit_client(client: RabbitMQClient) -> None:
     """
@@ -49,6 +74,98 @@ def get_rabbit_client() -> RabbitMQClient:
     return _rabbit_client
 
 
+def set_job_service(service: JobService) -> None:
+    """
+    Установить глобальный сервис асинхронных задач.
+    
+    Args:
+        service: Инициализированный сервис задач
+    """
+    global _job_service
+    _job_service = service
+
+
+def get_job_service() -> JobService:
+    """
+    Получить сервис асинхронных задач.
+    
+    Returns:
+        JobService: Инициализированный сервис
+        
+    Raises:
+        HTTPException: Если сервис не инициализирован
+    """
+    if _job_service is None:
+        raise HTTPException(
+            status_code=500,
+            detail="Сервис задач не инициализирован"
+        )
+    return _job_service
+
+
+def set_result_writer(writer: Optional[ResultWriter]) -> None:
+    """
+    Установить глобальную фоновую запись результатов.
+    
+    Args:
+        writer: Запущенный ResultWriter (None — запись в запросе)
+    """
+    global _result_writer
+    _result_writer = writer
+
+
+def get_result_writer() -> Optional[ResultWriter]:
+    """
+    Получить фоновую запись результатов.
+    
+    Returns:
+        Optional[ResultWriter]: ResultWriter или None, если фоновая запись отключена
+    """
+    return _result_writer
+
+
+def create_auth_client() -> AuthClient:
+    """
+    Создать клиент auth service по настройкам.
+    
+    Returns:
+        AuthClient: Клиент с пулом соединений и кэшем сессий
+    """
+    return AuthClient(
+        settings.auth_service_url,
+        cookie_name=settings.auth_cookie_name,
+        timeout=settings.auth_timeout,
+        max_connections=settings.auth_max_connections,
+        cache_ttl=settings.auth_cache_ttl,
+        negative_ttl=settings.auth_negative_cache_ttl,
+        max_size=settings.auth_cache_max_size,
+    )
+
+
+def set_auth_client(client: Optional[AuthClient]) -> None:
+    """
+    Установить глобальный клиент auth service.
+    
+    Args:
+        client: Клиент auth service (None — сбросить)
+    """
+    global _auth_client
+    _auth_client = client
+
+
+def get_auth_client() -> AuthClient:
+    """
+    Получить клиент auth service (создаётся при первом обращении, если не задан в lifespan).
+    
+    Returns:
+        AuthClient: Клиент auth service
+    """
+    global _auth_client
+    if _auth_client is None:
+        _auth_client = create_auth_client()
+    return _auth_client
+
+
 async def get_db_session() -> AsyncSession:
     """
     Получить сессию БД.
@@ -60,11 +177,26 @@ async def get_db_session() -> AsyncSession:
         yield session
 
 
+def get_session_factory() -> SessionFactory:
+    """
+    Получить фабрику сессий БД.
+    
+    Используется сервисами, которые ждут ответа воркеров: каждая операция
+    с БД выполняется в короткой сессии, а соединение возвращается в пул
+    сразу после неё, а не после завершения HTTP запроса.
+    
+    Returns:
+        SessionFactory: Фабрика сессий
+    """
+    return get_session_maker()
+
+
 async def get_current_user(request: Request) -> Optional[dict]:
     """
     Получить текущего пользователя из auth_service.
     
-    Проверяет cookie 'sid' через auth_service эндпоинт /me.
+    Проверяет cookie 'sid' через auth_service эндпоинт /me
+    (результат проверки кэшируется, см. AuthClient).
     
     Args:
         request: FastAPI Request объект
@@ -87,33 +219,10 @@ async def get_current_user(request: Request) -> Optional[dict]:
             )
         return None
     
-    # Проверяем сессию через auth_service
+    # Проверяем сессию через auth_service (с кэшем по sid)
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(
-                f"{settings.auth_service_url}/me",
-                cookies={settings.auth_cookie_name: sid}
-            )
-            
-            if response.status_code == 401:
-                if settings.auth_required:
-                    logger.warning("Недействительная или истекшая сессия")
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Недействительная или истекшая сессия"
-                    )
-                return None
-            
-            response.raise_for_status()
-            user_info = response.json()
-            
-            logger.info(
-                "Успешная проверка авторизации",
-                extra={"user": user_info.get("preferred_username", user_info.get("sub"))}
-            )
-            
-            return user_info
-            
+        user_info = await get_auth_client().get_user(sid)
+    
     except httpx.HTTPError as e:
         logger.error(f"Ошибка при проверке авторизации через auth_service: {e}")
         if settings.auth_required:
@@ -122,6 +231,15 @@ async def get_current_user(request: Request) -> Optional[dict]:
                 detail="Сервис авторизации недоступен"
             )
         return None
+    
+    if user_info is None and settings.auth_required:
+        logger.warning("Недействительная или истекшая сессия")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Недействительная или истекшая сессия"
+        )
+    
+    return user_info
 
 
 async def get_user_data(request: Request) -> Optional[UserData]:
@@ -172,47 +290,140 @@ async def require_auth(user_info: Optional[dict] = Depends(get_current_user)) ->
     return user_info
 
 
+def get_user_id_cache() -> Optional[UserIdCache]:
+    """
+    Получить кэш email → ID пользователя.
+    
+    Returns:
+        Optional[UserIdCache]: Кэш или None, если кэширование отключено
+    """
+    return _user_id_cache
+
+
 def get_user_service(
-    session: AsyncSession = Depends(get_db_session)
+    session_factory: SessionFactory = Depends(get_session_factory),
+    user_id_cache: Optional[UserIdCache] = Depends(get_user_id_cache)
 ) -> UserService:
     """
     Получить сервис работы с пользователями.
     
     Args:
-        session: Сессия БД
+        session_factory: Фабрика сессий БД
+        user_id_cache: Кэш email → ID пользователя (опционально)
         
     Returns:
         UserService: Экземпляр сервиса
     """
-    return UserService(session)
+    return UserService(session_factory, user_id_cache)
+
+
+def get_logging_service(
+    session_factory: SessionFactory = Depends(get_session_factory),
+    result_writer: Optional[ResultWriter] = Depends(get_result_writer)
+) -> LoggingService:
+    """
+    Получить сервис логирования.
+    
+    Args:
+        session_factory: Фабрика сессий БД
+        result_writer: Фоновая запись результатов (опционально)
+        
+    Returns:
+        LoggingService: Экземпляр сервиса
+    """
+    return LoggingService(session_factory, result_writer)
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    """
+    Получить группу объединения одинаковых запросов к воркерам.
+    
+    Returns:
+        Optional[SingleFlight]: Группа или None, если объединение отключено
+    """
+    return _single_flight
 
 
 def get_generation_service(
-    rabbit_client: RabbitMQClient = Depends(get_rabbit_client)
+    rabbit_client: RabbitMQClient = Depends(get_rabbit_client),
+    logging_service: LoggingService = Depends(get_logging_service),
+    single_flight: Optional[SingleFlight] = Depends(get_single_flight)
 ) -> GenerationService:
     """
     Получить сервис генерации.
     
     Args:
         rabbit_client: Клиент RabbitMQ
+        logging_service: Сервис логирования (поиск сохранённых оценок)
+        single_flight: Группа объединения одинаковых запросов (опционально)
         
     Returns:
         GenerationService: Экземпляр сервиса
     """
-    return GenerationService(rabbit_client)
+    return GenerationService(
+        rabbit_client,
+        logging_service,
+        pipeline_version=settings.resume_evaluation_pipeline_version,
+        cache_ttl=settings.evaluation_cache_ttl,
+        single_flight=single_flight,
+    )
 
 
-def get_logging_service(
+def get_vacancy_cache_repository(
     session: AsyncSession = Depends(get_db_session)
-) -> LoggingService:
+) -> VacancyCacheRepository:
     """
-    Получить сервис логирования.
+    Получить репозиторий кэша разбора вакансий.
     
     Args:
         session: Сессия БД
         
     Returns:
-        LoggingService: Экземпляр сервиса
+        VacancyCacheRepository: Экземпляр репозитория
+    """
+    return VacancyCacheRepository(session)
+
+
+def get_skill_relevance_repository(
+    session: AsyncSession = Depends(get_db_session)
+) -> SkillRelevanceMemoRepository:
+    """
+    Получить репозиторий вердиктов по парам навыков.
+    
+    Args:
+        session: Сессия БД
+        
+    Returns:
+        SkillRelevanceMemoRepository: Экземпляр репозитория
     """
-    return LoggingService(session)
+    return SkillRelevanceMemoRepository(session)
+
 
+async def verify_internal_token(
+    x_internal_token: Optional[str] = Header(None),
+) -> None:
+    """
+    Проверить токен внутренних эндпоинтов.
+    
+    Если internal_api_token не задан в настройках, внутренние эндпоинты недоступны.
+    
+    Args:
+        x_internal_token: Значение заголовка X-Internal-Token
+        
+    Raises:
+        HTTPException: 503, если токен не задан в настройках; 403, если токен не совпадает
+    """
+    if not settings.internal_api_token:
+        logger.warning("Обращение к внутреннему эндпоинту: INTERNAL_API_TOKEN не задан")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Внутренние эндпоинты отключены: токен не задан"
+        )
+    if not x_internal_token or not secrets.compare_digest(
+        x_internal_token, settings.internal_api_token
+    ):
+        logger.warning("Обращение к внутреннему эндпоинту с неверным токеном")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Неверный внутренний токен"
+        )
@@ -1,5 +1,5 @@
 """Модуль роутов API."""
-from app.api.routes import health, resume, job_description, questions
+from app.api.routes import health, resume, job_description, questions, internal, jobs, history
 
-__all__ = ["health", "resume", "job_description", "questions"]
+__all__ = ["health", "resume", "job_description", "questions", "internal", "jobs", "history"]
 
@@ -0,0 +1,85 @@
+"""Роуты для истории генераций пользователя."""
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from app.api.dependencies import get_logging_service, get_user_data, get_user_service
+from app.api.schemas.common import UserData
+from app.api.schemas.history import GenerationHistoryItem, GenerationHistoryResponse
+from app.core.pagination import Cursor, decode_cursor, encode_cursor
+from app.services.logging_service import LoggingService
+from app.services.user_service import UserService
+from app.logger import setup_logger
+
+router = APIRouter(prefix="/history", tags=["History"])
+logger = setup_logger(__name__)
+
+
+@router.get("", response_model=GenerationHistoryResponse)
+async def get_history(
+    request_type: Optional[str] = Query(None, description="Тип генерации"),
+    limit: int = Query(50, ge=1, le=200, description="Количество записей"),
+    cursor: Optional[str] = Query(None, description="Курсор из next_cursor предыдущей страницы"),
+    user_service: UserService = Depends(get_user_service),
+    logging_service: LoggingService = Depends(get_logging_service),
+    user_data: Optional[UserData] = Depends(get_user_data),
+):
+    """
+    Получить историю генераций текущего пользователя.
+    
+    Возвращает только краткие записи: входные данные и результаты
+    генераций из БД не читаются. Страницы выбираются по курсору
+    (created_at, id), поэтому глубина страницы не влияет на время ответа.
+    
+    Args:
+        request_type: Фильтр по типу генерации (опционально)
+        limit: Количество записей
+        cursor: Курсор следующей страницы
+        user_service: Сервис работы с пользователями
+        logging_service: Сервис логирования
+        user_data: Данные пользователя из cookie
+        
+    Returns:
+        GenerationHistoryResponse: Страница истории
+        
+    Raises:
+        HTTPException: 401, если пользователь не авторизован;
+            400, если курсор некорректен
+    """
+    if not user_data:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Требуется авторизация"
+        )
+    
+    page_cursor = None
+    if cursor:
+        try:
+            page_cursor = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+    
+    user_id = await user_service.get_or_create_user(
+        email=user_data.email,
+        full_name=user_data.full_name
+    )
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Не удалось получить данные пользователя"
+        )
+    
+    items = await logging_service.get_history(
+        user_id, request_type=request_type, limit=limit, cursor=page_cursor
+    )
+    
+    next_cursor = None
+    if len(items) == limit:
+        next_cursor = encode_cursor(Cursor(items[-1]["created_at"], items[-1]["id"]))
+    
+    return GenerationHistoryResponse(
+        items=[GenerationHistoryItem(**item) for item in items],
+        limit=limit,
+        next_cursor=next_cursor
+    )
@@ -0,0 +1,146 @@
+"""Внутренние роуты для воркеров."""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.dependencies import (
+    get_auth_client,
+    get_skill_relevance_repository,
+    get_vacancy_cache_repository,
+    verify_internal_token,
+)
+from app.api.schemas.auth_session import SessionInvalidateRequest
+from app.api.schemas.skill_relevance import (
+    SkillPairVerdict,
+    SkillRelevanceLookupRequest,
+    SkillRelevanceLookupResponse,
+    SkillRelevanceSetRequest,
+)
+from app.api.schemas.vacancy_cache import VacancyCacheEntryResponse, VacancyCacheSetRequest
+from app.core.config import settings
+from app.logger import setup_logger
+from app.repositories import SkillRelevanceMemoRepository, VacancyCacheRepository
+from app.services.auth_client import AuthClient
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+    dependencies=[Depends(verify_internal_token)],
+    include_in_schema=False,
+)
+logger = setup_logger(__name__)
+
+
+@router.get("/vacancy-cache/{key}", response_model=VacancyCacheEntryResponse)
+async def get_vacancy_cache_entry(
+    key: str,
+    repository: VacancyCacheRepository = Depends(get_vacancy_cache_repository),
+):
+    """
+    Получить запись кэша разбора вакансии.
+
+    Args:
+        key: Ключ записи
+        repository: Репозиторий кэша
+
+    Returns:
+        VacancyCacheEntryResponse: Сохранённая запись
+
+    Raises:
+        HTTPException: 404, если записи нет или она просрочена
+    """
+    value = await repository.get(key)
+    if value is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Запись не найдена"
+        )
+    return VacancyCacheEntryResponse(key=key, value=value)
+
+
+@router.put("/vacancy-cache/{key}", status_code=status.HTTP_204_NO_CONTENT)
+async def set_vacancy_cache_entry(
+    key: str,
+    request: VacancyCacheSetRequest,
+    repository: VacancyCacheRepository = Depends(get_vacancy_cache_repository),
+):
+    """
+    Сохранить запись кэша разбора вакансии.
+
+    Args:
+        key: Ключ записи
+        request: Значение и время жизни записи
+        repository: Репозиторий кэша
+    """
+    await repository.set(
+        key,
+        request.value,
+        ttl_seconds=request.ttl_seconds or settings.vacancy_cache_ttl,
+    )
+
+
+@router.post("/skill-relevance/lookup", response_model=SkillRelevanceLookupResponse)
+async def lookup_skill_relevance(
+    request: SkillRelevanceLookupRequest,
+    repository: SkillRelevanceMemoRepository = Depends(get_skill_relevance_repository),
+):
+    """
+    Найти сохранённые вердикты LLM по парам навыков.
+
+    Args:
+        request: Версия промпта и пары навыков
+        repository: Репозиторий вердиктов
+
+    Returns:
+        SkillRelevanceLookupResponse: Вердикты для известных пар
+    """
+    memos = await repository.get_many(
+        request.prompt_version,
+        [(pair.vacancy_skill, pair.resume_skill) for pair in request.pairs],
+    )
+    return SkillRelevanceLookupResponse(
+        pairs=[
+            SkillPairVerdict(
+                vacancy_skill=memo.vacancy_skill,
+                resume_skill=memo.resume_skill,
+                relevance=memo.relevance,
+                reason=memo.reason,
+            )
+            for memo in memos
+        ]
+    )
+
+
+@router.put("/skill-relevance", status_code=status.HTTP_204_NO_CONTENT)
+async def set_skill_relevance(
+    request: SkillRelevanceSetRequest,
+    repository: SkillRelevanceMemoRepository = Depends(get_skill_relevance_repository),
+):
+    """
+    Сохранить вердикты LLM по парам навыков.
+
+    Args:
+        request: Версия промпта и вердикты
+        repository: Репозиторий вердиктов
+    """
+    await repository.set_many(
+        request.prompt_version,
+        [pair.model_dump() for pair in request.pairs],
+    )
+
+
+@router.post("/auth/sessions/invalidate", status_code=status.HTTP_204_NO_CONTENT)
+async def invalidate_auth_session(
+    request: SessionInvalidateRequest,
+    auth_client: AuthClient = Depends(get_auth_client),
+):
+    """
+    Удалить сессию из кэша проверок авторизации.
+
+    Вызывается auth service при выходе пользователя, чтобы сессия
+    перестала приниматься сразу, а не по истечении TTL кэша.
+
+    Args:
+        request: Session ID
+        auth_client: Клиент auth service
+    """
+    auth_client.invalidate(request.sid)
@@ -0,0 +1,255 @@
+"""Роуты для асинхронных задач генерации."""
+
+import asyncio
+import json
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.api.dependencies import get_job_service, get_user_data, get_user_service
+from app.api.schemas.common import UserData
+from app.api.schemas.job_description import JobDescriptionRequest
+from app.api.schemas.jobs import JobStatusResponse, JobSubmitResponse
+from app.api.schemas.questions import QuestionGenerationRequest
+from app.api.schemas.resume import ResumeEvaluationRequest
+from app.core.config import settings
+from app.logger import setup_logger
+from app.repositories.generation_job import FINISHED_JOB_STATUSES
+from app.services.job_service import JobService
+from app.services.user_service import UserService
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+logger = setup_logger(__name__)
+
+
+async def submit_job(
+    request_type: str,
+    request_payload: dict,
+    job_service: JobService,
+    user_service: UserService,
+    user_data: Optional[UserData],
+) -> JobSubmitResponse:
+    """
+    Создать задачу от имени пользователя (если он авторизован).
+
+    Args:
+        request_type: Тип задачи
+        request_payload: Входные данные запроса
+        job_service: Сервис асинхронных задач
+        user_service: Сервис работы с пользователями
+        user_data: Данные пользователя из cookie (опционально)
+
+    Returns:
+        JobSubmitResponse: Идентификатор и статус созданной задачи
+    """
+    user_id = None
+    if user_data:
+        user_id = await user_service.get_or_create_user(
+            email=user_data.email,
+            full_name=user_data.full_name,
+        )
+
+    job = await job_service.submit(request_type, request_payload, user_id)
+
+    logger.info(
+        "Создана асинхронная задача",
+        extra={"job_id": job.id, "request_type": request_type},
+    )
+
+    return JobSubmitResponse(job_id=job.id, status=job.status)
+
+
+@router.post(
+    "/resume/evaluation",
+    response_model=JobSubmitResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_resume_evaluation(
+    request: ResumeEvaluationRequest,
+    job_service: JobService = Depends(get_job_service),
+    user_service: UserService = Depends(get_user_service),
+    user_data: Optional[UserData] = Depends(get_user_data),
+):
+    """
+    Создать задачу оценки соответствия резюме вакансии.
+
+    Результат запрашивается через GET /jobs/{job_id}.
+
+    Args:
+        request: Запрос с текстами вакансии и резюме
+        job_service: Сервис асинхронных задач
+        user_service: Сервис работы с пользователями
+        user_data: Данные пользователя из cookie (опционально)
+
+    Returns:
+        JobSubmitResponse: Идентификатор созданной задачи
+    """
+    return await submit_job(
+        "resume_evaluation",
+        {
+            "vacancy_text": request.vacancy_text,
+            "resume_text": request.resume_text,
+            "force_refresh": request.force_refresh,
+            "mode": request.mode,
+        },
+        job_service,
+        user_service,
+        user_data,
+    )
+
+
+@router.post(
+    "/questions/generate",
+    response_model=JobSubmitResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_questions_generation(
+    request: QuestionGenerationRequest,
+    job_service: JobService = Depends(get_job_service),
+    user_service: UserService = Depends(get_user_service),
+    user_data: Optional[UserData] = Depends(get_user_data),
+):
+    """
+    Создать задачу генерации вопросов для интервью.
+
+    Результат запрашивается через GET /jobs/{job_id}.
+
+    Args:
+        request: Запрос с текстами вакансии и резюме
+        job_service: Сервис асинхронных задач
+        user_service: Сервис работы с пользователями
+        user_data: Данные пользователя из cookie (опционально)
+
+    Returns:
+        JobSubmitResponse: Идентификатор созданной задачи
+    """
+    return await submit_job(
+        "question_generation",
+        {
+            "vacancy_text": request.vacancy_text,
+            "resume_text": request.resume_text,
+            "evaluation_id": request.evaluation_id,
+            "request_hash": request.request_hash,
+            "force_refresh": request.force_refresh,
+        },
+        job_service,
+        user_service,
+        user_data,
+    )
+
+
+@router.post(
+    "/job_description/generate",
+    response_model=JobSubmitResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_job_description_generation(
+    request: JobDescriptionRequest,
+    job_service: JobService = Depends(get_job_service),
+    user_service: UserService = Depends(get_user_service),
+    user_data: Optional[UserData] = Depends(get_user_data),
+):
+    """
+    Создать задачу генерации описания вакансии.
+
+    Результат запрашивается через GET /jobs/{job_id}.
+
+    Args:
+        request: Запрос с входными данными
+        job_service: Сервис асинхронных задач
+        user_service: Сервис работы с пользователями
+        user_data: Данные пользователя из cookie (опционально)
+
+    Returns:
+        JobSubmitResponse: Идентификатор созданной задачи
+    """
+    return await submit_job(
+        "job_description",
+        {"input_data": request.input_data},
+        job_service,
+        user_service,
+        user_data,
+    )
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job_status(
+    job_id: str,
+    job_service: JobService = Depends(get_job_service),
+):
+    """
+    Получить состояние задачи.
+
+    Args:
+        job_id: Идентификатор задачи
+        job_service: Сервис асинхронных задач
+
+    Returns:
+        JobStatusResponse: Статус, прогресс и результат задачи
+
+    Raises:
+        HTTPException: 404, если задача не найдена
+    """
+    job = await job_service.get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Задача не найдена"
+        )
+    return JobStatusResponse.model_validate(job)
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    job_service: JobService = Depends(get_job_service),
+):
+    """
+    Поток событий задачи в формате Server-Sent Events.
+
+    Событие отправляется при каждом изменении статуса или прогресса,
+    поток закрывается после завершения задачи (success или error).
+
+    Args:
+        job_id: Идентификатор задачи
+        job_service: Сервис асинхронных задач
+
+    Returns:
+        StreamingResponse: Поток text/event-stream
+
+    Raises:
+        HTTPException: 404, если задача не найдена
+    """
+    job = await job_service.get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Задача не найдена"
+        )
+
+    async def event_stream():
+        current = JobStatusResponse.model_validate(job)
+        last_event = None
+
+        while True:
+            event = current.model_dump_json()
+            if event != last_event:
+                yield f"event: job\ndata: {event}\n\n"
+                last_event = event
+
+            if current.status in FINISHED_JOB_STATUSES:
+                break
+
+            await asyncio.sleep(settings.job_events_poll_interval)
+            refreshed = await job_service.get_job(job_id)
+            if refreshed is None:
+                yield f"event: error\ndata: {json.dumps({'detail': 'Задача не найдена'}, ensure_ascii=False)}\n\n"
+                break
+            current = JobStatusResponse.model_validate(refreshed)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -35,7 +35,8 @@ async def generate_questions(
     
     Шаги:
     1. Получаем тексты вакансии и резюме
-    2. Вызываем пайплайн оценки соответствия и получаем report
+    2. Берём report из ранее выполненной оценки (evaluation_id, request_hash
+       или недавняя оценка тех же текстов) или вызываем пайплайн оценки соответствия
     3. Передаём report + исходные тексты в очередь генерации вопросов
     
     Args:
@@ -67,12 +68,36 @@ async def generate_questions(
                 full_name=user_data.full_name
             )
         
-        # Шаг 1: Оценка соответствия резюме
-        logger.debug("Отправка данных в очередь оценки резюме")
-        evaluation_report = await generation_service.evaluate_resume(
-            request.vacancy_text,
-            request.resume_text
-        )
+        # Шаг 1: Оценка соответствия резюме (переиспользуем сохранённую:
+        # по ссылке из запроса или недавнюю оценку тех же текстов)
+        evaluation = None
+        if not request.force_refresh:
+            request_hash = generation_service.evaluation_hash(
+                request.vacancy_text, request.resume_text
+            )
+            # Оценка должна относиться к тем же текстам вакансии и резюме
+            if request.request_hash in (None, request_hash):
+                evaluation = await generation_service.find_cached_evaluation(
+                    request_hash, request.evaluation_id
+                )
+            if evaluation is None and request.evaluation_id is not None:
+                logger.info(
+                    "Ранее выполненная оценка не найдена, оценка выполняется заново",
+                    extra={"evaluation_id": request.evaluation_id}
+                )
+        
+        if evaluation is not None:
+            logger.debug(
+                "Используется ранее выполненная оценка резюме",
+                extra={"evaluation_id": evaluation.id}
+            )
+            evaluation_report = evaluation.response_payload
+        else:
+            logger.debug("Отправка данных в очередь оценки резюме")
+            evaluation_report = await generation_service.evaluate_resume(
+                request.vacancy_text,
+                request.resume_text
+            )
         
         # Шаг 2: Генерация вопросов на основе report
         logger.debug("Отправка данных в очередь генерации вопросов")
@@ -90,6 +115,7 @@ async def generate_questions(
             request_payload={
                 "vacancy_text": request.vacancy_text,
                 "resume_text": request.resume_text,
+                "evaluation_id": evaluation.id if evaluation else None,
             },
             response_payload=result,
             latency_ms=latency_ms
@@ -97,10 +123,13 @@ async def generate_questions(
         
         logger.info(
             "Успешная генерация вопросов",
-            extra={"latency_ms": latency_ms}
+            extra={
+                "latency_ms": latency_ms,
+                "evaluation_reused": evaluation is not None,
+            }
         )
         
-        return result
+        return {**result, "evaluation_id": evaluation.id if evaluation else None}
     
     except Exception as e:
         # Логируем ошибку
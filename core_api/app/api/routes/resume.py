@@ -1,9 +1,11 @@
 """Роуты для оценки резюме."""
 
+import json
 import time
 from typing import Optional
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from app.api.dependencies import (
     get_generation_service,
@@ -11,7 +13,11 @@ from app.api.dependencies import (
     get_user_service,
     get_user_data,
 )
-from app.api.schemas.resume import ResumeEvaluationRequest, ResumeEvaluationResponse
+from app.api.schemas.resume import (
+    ResumeBatchEvaluationRequest,
+    ResumeEvaluationRequest,
+    ResumeEvaluationResponse,
+)
 from app.api.schemas.common import UserData
 from app.logger import setup_logger
 from app.services.generation_service import GenerationService
@@ -35,6 +41,11 @@ async def evaluate_resume(
 
     Принимает текстовые данные вакансии и резюме.
     Frontend должен предварительно извлечь текст из файлов.
+    Если те же тексты уже оценивались (в пределах evaluation_cache_ttl
+    и той же версии пайплайна), возвращается сохранённая оценка;
+    force_refresh=true выполняет оценку заново.
+    В режиме mode=partial при неуспехе части блоков возвращаются выполненные
+    блоки (status="partial", статусы блоков — в data.block_status).
 
     Args:
         request: Запрос с текстами вакансии и резюме
@@ -65,14 +76,32 @@ async def evaluate_resume(
                 full_name=user_data.full_name,
             )
 
+        # Сохранённая оценка тех же текстов отдаётся без запуска пайплайна
+        request_hash = generation_service.evaluation_hash(
+            request.vacancy_text, request.resume_text
+        )
+        if not request.force_refresh:
+            cached = await generation_service.find_cached_evaluation(request_hash)
+            if cached is not None:
+                logger.info(
+                    "Оценка резюме взята из сохранённой",
+                    extra={"evaluation_id": cached.id},
+                )
+                return {
+                    **cached.response_payload,
+                    "evaluation_id": cached.id,
+                    "request_hash": request_hash,
+                    "cached": True,
+                }
+
         # Генерируем результат
         result = await generation_service.evaluate_resume(
-            request.vacancy_text, request.resume_text
+            request.vacancy_text, request.resume_text, request.mode
         )
 
         # Логируем успех
         latency_ms = int((time.time() - start_time) * 1000)
-        await logging_service.log_success(
+        evaluation_id = await logging_service.log_success(
             request_type="resume_evaluation",
             user_id=user_id,
             request_payload={
@@ -81,13 +110,16 @@ async def evaluate_resume(
             },
             response_payload=result,
             latency_ms=latency_ms,
+            # Повторно используются только полные успешные оценки
+            request_hash=request_hash if result.get("status") == "success" else None,
         )
 
         logger.info(
             "Успешная обработка оценки резюме", extra={"latency_ms": latency_ms}
         )
 
-        return result
+        # Ссылка на оценку позволяет не выполнять её повторно при генерации вопросов
+        return {**result, "evaluation_id": evaluation_id, "request_hash": request_hash}
 
     except Exception as e:
         # Логируем ошибку
@@ -107,3 +139,108 @@ async def evaluate_resume(
 
         # Перебрасываем исключение для обработки middleware
         raise
+
+
+@router.post("/evaluation/batch")
+async def evaluate_resume_batch(
+    request: ResumeBatchEvaluationRequest,
+    user_service: UserService = Depends(get_user_service),
+    generation_service: GenerationService = Depends(get_generation_service),
+    logging_service: LoggingService = Depends(get_logging_service),
+    user_data: Optional[UserData] = Depends(get_user_data),
+):
+    """
+    Оценить несколько резюме по одной вакансии.
+
+    Вакансия разбирается один раз, резюме оцениваются параллельно.
+    Ответ передаётся потоком в формате NDJSON: по строке на каждое
+    резюме по мере готовности (type="item") и итоговая строка (type="done").
+
+    Args:
+        request: Запрос с текстом вакансии и списком резюме
+        user_service: Сервис работы с пользователями
+        generation_service: Сервис генерации
+        logging_service: Сервис логирования
+        user_data: Данные пользователя из cookie (опционально)
+
+    Returns:
+        StreamingResponse: Поток результатов оценки
+    """
+    start_time = time.time()
+    user_id = None
+
+    logger.info(
+        "Начало пакетной оценки резюме",
+        extra={
+            "vacancy_length": len(request.vacancy_text),
+            "resumes_count": len(request.resumes),
+        },
+    )
+
+    # Получаем или создаём пользователя
+    if user_data:
+        user_id = await user_service.get_or_create_user(
+            email=user_data.email,
+            full_name=user_data.full_name,
+        )
+
+    # Идентификатор по умолчанию — позиция резюме в запросе
+    resumes = [
+        {
+            "id": item.id if item.id is not None else str(index),
+            "resume_text": item.resume_text,
+        }
+        for index, item in enumerate(request.resumes)
+    ]
+
+    async def result_stream():
+        results = []
+        try:
+            async for message in generation_service.evaluate_resume_batch(
+                request.vacancy_text, resumes
+            ):
+                if message.get("type") == "item":
+                    results.append(message)
+                yield json.dumps(message, ensure_ascii=False) + "\n"
+
+        except Exception as e:
+            # Статус ответа уже отправлен — сообщаем об ошибке итоговой строкой
+            latency_ms = int((time.time() - start_time) * 1000)
+            await logging_service.log_error(
+                request_type="resume_evaluation_batch",
+                user_id=user_id,
+                error_message=str(e),
+                latency_ms=latency_ms,
+            )
+
+            logger.error(
+                "Ошибка при пакетной оценке резюме",
+                extra={"error_type": type(e).__name__, "message": str(e)},
+                exc_info=True,
+            )
+
+            yield json.dumps(
+                {"type": "done", "status": "error", "message": str(e)},
+                ensure_ascii=False,
+            ) + "\n"
+            return
+
+        # Логируем успех
+        latency_ms = int((time.time() - start_time) * 1000)
+        await logging_service.log_success(
+            request_type="resume_evaluation_batch",
+            user_id=user_id,
+            request_payload={
+                "vacancy_text": request.vacancy_text,
+                "resumes": resumes,
+            },
+            response_payload={"results": results},
+            latency_ms=latency_ms,
+        )
+
+        logger.info(
+            "Успешная пакетная оценка резюме",
+            extra={"latency_ms": latency_ms, "resumes_count": len(resumes)},
+        )
+
+    return StreamingResponse(result_stream(), media_type="application/x-ndjson")
@@ -0,0 +1,12 @@
+"""Схемы для управления кэшем сессий авторизации."""
+from pydantic import BaseModel, Field
+
+
+class SessionInvalidateRequest(BaseModel):
+    """Запрос на удаление сессии из кэша (после выхода пользователя)."""
+
+    sid: str = Field(
+        ...,
+        description="Session ID из cookie",
+        min_length=1
+    )
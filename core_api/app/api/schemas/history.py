@@ -0,0 +1,50 @@
+"""Схемы для истории генераций пользователя."""
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class GenerationHistoryItem(BaseModel):
+    """Краткая запись истории генераций (без входных данных и результата)."""
+
+    id: int = Field(
+        ...,
+        description="ID результата генерации"
+    )
+    request_type: str = Field(
+        ...,
+        description="Тип генерации (resume_evaluation, question_generation, job_description)"
+    )
+    status: str = Field(
+        ...,
+        description="Статус выполнения (success/error)"
+    )
+    error_message: Optional[str] = Field(
+        None,
+        description="Сообщение об ошибке (если status=error)"
+    )
+    latency_ms: Optional[int] = Field(
+        None,
+        description="Время выполнения в миллисекундах"
+    )
+    created_at: datetime = Field(
+        ...,
+        description="Дата и время создания записи"
+    )
+
+
+class GenerationHistoryResponse(BaseModel):
+    """Страница истории генераций пользователя."""
+
+    items: List[GenerationHistoryItem] = Field(
+        default_factory=list,
+        description="Записи истории, новые первыми"
+    )
+    limit: int = Field(
+        ...,
+        description="Максимальное количество записей на странице"
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Курсор следующей страницы (None — страница последняя)"
+    )
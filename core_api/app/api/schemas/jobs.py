@@ -0,0 +1,66 @@
+"""Схемы для асинхронных задач генерации."""
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+
+
+class JobSubmitResponse(BaseModel):
+    """Ответ на создание асинхронной задачи."""
+
+    job_id: str = Field(
+        ...,
+        description="Идентификатор задачи"
+    )
+    status: str = Field(
+        ...,
+        description="Статус задачи (queued)"
+    )
+
+
+class JobStatusResponse(BaseModel):
+    """Состояние асинхронной задачи."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    job_id: str = Field(
+        ...,
+        validation_alias="id",
+        description="Идентификатор задачи"
+    )
+    request_type: str = Field(
+        ...,
+        description="Тип генерации (resume_evaluation, question_generation, job_description)"
+    )
+    status: str = Field(
+        ...,
+        description="Статус задачи (queued, running, success, error)"
+    )
+    stage: Optional[str] = Field(
+        None,
+        description="Последний завершённый этап пайплайна"
+    )
+    progress: int = Field(
+        ...,
+        description="Прогресс выполнения в процентах"
+    )
+    result: Optional[dict] = Field(
+        None,
+        validation_alias="response_payload",
+        description="Результат генерации (в формате ответа синхронного эндпоинта)"
+    )
+    error_message: Optional[str] = Field(
+        None,
+        description="Сообщение об ошибке (если status=error)"
+    )
+    created_at: datetime = Field(
+        ...,
+        description="Дата и время создания задачи"
+    )
+    updated_at: datetime = Field(
+        ...,
+        description="Дата и время последнего обновления"
+    )
+    finished_at: Optional[datetime] = Field(
+        None,
+        description="Дата и время завершения задачи"
+    )
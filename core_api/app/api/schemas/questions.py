@@ -16,6 +16,19 @@ class QuestionGenerationRequest(BaseModel):
         description="Текст резюме",
         min_length=1
     )
+    evaluation_id: Optional[int] = Field(
+        None,
+        description="ID ранее выполненной оценки резюме (из ответа /resume/evaluation)"
+    )
+    request_hash: Optional[str] = Field(
+        None,
+        description="Хэш текстов вакансии и резюме ранее выполненной оценки",
+        max_length=64
+    )
+    force_refresh: bool = Field(
+        False,
+        description="Выполнить оценку резюме заново, не используя сохранённые оценки"
+    )
 
 
 class QuestionGenerationResponse(BaseModel):
@@ -33,4 +46,8 @@ class QuestionGenerationResponse(BaseModel):
         None,
         description="Сообщение об ошибке (если status=error)"
     )
+    evaluation_id: Optional[int] = Field(
+        None,
+        description="ID переиспользованной оценки резюме (если оценка не выполнялась заново)"
+    )
 
@@ -1,6 +1,9 @@
 """Схемы для оценки резюме."""
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Literal, Optional
+
+# Максимальное количество резюме в одном пакетном запросе
+MAX_BATCH_RESUMES = 200
 
 
 class ResumeEvaluationRequest(BaseModel):
@@ -16,6 +19,17 @@ class ResumeEvaluationRequest(BaseModel):
         description="Текст резюме",
         min_length=1
     )
+    force_refresh: bool = Field(
+        False,
+        description="Выполнить оценку заново, даже если есть сохранённая оценка тех же текстов"
+    )
+    mode: Literal["strict", "partial"] = Field(
+        "strict",
+        description=(
+            "Режим оценки: strict — неуспех любого блока прерывает оценку, "
+            "partial — возвращаются выполненные блоки и статус каждого блока"
+        )
+    )
 
 
 class ResumeEvaluationResponse(BaseModel):
@@ -23,7 +37,7 @@ class ResumeEvaluationResponse(BaseModel):
     
     status: str = Field(
         ...,
-        description="Статус выполнения (success/error)"
+        description="Статус выполнения (success/partial/failed/error)"
     )
     data: Optional[dict] = Field(
         None,
@@ -33,4 +47,46 @@ class ResumeEvaluationResponse(BaseModel):
         None,
         description="Сообщение об ошибке (если status=error)"
     )
+    evaluation_id: Optional[int] = Field(
+        None,
+        description="ID сохранённой оценки (можно передать в /questions/generate)"
+    )
+    request_hash: Optional[str] = Field(
+        None,
+        description="Хэш текстов вакансии и резюме (можно передать в /questions/generate)"
+    )
+    cached: bool = Field(
+        False,
+        description="Результат взят из сохранённой оценки тех же текстов"
+    )
+
+
+
+class ResumeBatchItem(BaseModel):
+    """Резюме в пакетном запросе."""
+    
+    id: Optional[str] = Field(
+        None,
+        description="Идентификатор резюме на стороне клиента (возвращается в результате)"
+    )
+    resume_text: str = Field(
+        ...,
+        description="Текст резюме",
+        min_length=1
+    )
+
 
+class ResumeBatchEvaluationRequest(BaseModel):
+    """Запрос на пакетную оценку резюме по одной вакансии."""
+    
+    vacancy_text: str = Field(
+        ...,
+        description="Текст вакансии",
+        min_length=1
+    )
+    resumes: List[ResumeBatchItem] = Field(
+        ...,
+        description="Список резюме",
+        min_length=1,
+        max_length=MAX_BATCH_RESUMES
+    )
@@ -0,0 +1,77 @@
+"""Схемы для внутренней памяти вердиктов по парам навыков."""
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+# Максимальная длина нормализованного навыка
+MAX_SKILL_LENGTH = 255
+
+# Максимальное количество пар в одном запросе
+MAX_SKILL_PAIRS = 2000
+
+
+class SkillPair(BaseModel):
+    """Пара навыков."""
+
+    vacancy_skill: str = Field(
+        ...,
+        description="Нормализованный навык вакансии",
+        max_length=MAX_SKILL_LENGTH
+    )
+    resume_skill: str = Field(
+        ...,
+        description="Нормализованный навык резюме",
+        max_length=MAX_SKILL_LENGTH
+    )
+
+
+class SkillPairVerdict(SkillPair):
+    """Вердикт LLM по паре навыков."""
+
+    relevance: str = Field(
+        ...,
+        description="Категория аналогичности",
+        max_length=50
+    )
+    reason: Optional[str] = Field(
+        None,
+        description="Обоснование LLM"
+    )
+
+
+class SkillRelevanceLookupRequest(BaseModel):
+    """Запрос на поиск вердиктов."""
+
+    prompt_version: str = Field(
+        ...,
+        description="Версия промпта оценки релевантности",
+        max_length=64
+    )
+    pairs: List[SkillPair] = Field(
+        ...,
+        description="Пары навыков для поиска",
+        max_length=MAX_SKILL_PAIRS
+    )
+
+
+class SkillRelevanceSetRequest(BaseModel):
+    """Запрос на сохранение вердиктов."""
+
+    prompt_version: str = Field(
+        ...,
+        description="Версия промпта оценки релевантности",
+        max_length=64
+    )
+    pairs: List[SkillPairVerdict] = Field(
+        ...,
+        description="Вердикты по парам навыков",
+        max_length=MAX_SKILL_PAIRS
+    )
+
+
+class SkillRelevanceLookupResponse(BaseModel):
+    """Найденные вердикты."""
+
+    pairs: List[SkillPairVerdict] = Field(
+        ...,
+        description="Найденные вердикты (только для известных пар)"
+    )
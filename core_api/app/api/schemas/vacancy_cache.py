@@ -0,0 +1,30 @@
+"""Схемы для внутреннего кэша разбора вакансий."""
+from pydantic import BaseModel, Field
+from typing import Optional
+
+
+class VacancyCacheSetRequest(BaseModel):
+    """Запрос на сохранение записи кэша."""
+
+    value: dict = Field(
+        ...,
+        description="Сохраняемый результат этапа разбора вакансии"
+    )
+    ttl_seconds: Optional[int] = Field(
+        None,
+        description="Время жизни записи в секундах (по умолчанию — из настроек)",
+        gt=0
+    )
+
+
+class VacancyCacheEntryResponse(BaseModel):
+    """Запись кэша разбора вакансии."""
+
+    key: str = Field(
+        ...,
+        description="Ключ записи"
+    )
+    value: dict = Field(
+        ...,
+        description="Сохранённый результат этапа разбора вакансии"
+    )
@@ -1,5 +1,7 @@
 """Конфигурация приложения Core API."""
 
+from typing import Literal, Optional
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -41,6 +43,16 @@ class RabbitMQConfig(ConfigBase):
     port: int
     default_vhost: str
 
+    # Таймауты RPC запросов к воркерам
+    rpc_timeout: float = Field(
+        default=600.0,
+        description="Таймаут ожидания ответа от воркера по умолчанию (секунды)"
+    )
+    rpc_queue_timeouts: dict[str, float] = Field(
+        default_factory=dict,
+        description="Таймауты для отдельных очередей, например {\"job_description_task\": 300}"
+    )
+
     @property
     def url(self) -> str:
         """URL подключения к RabbitMQ."""
@@ -69,6 +81,123 @@ class Settings(BaseSettings):
         default="sid",
         description="Имя cookie с session ID"
     )
+    auth_timeout: float = Field(
+        default=5.0,
+        description="Таймаут запроса к auth service (секунды)"
+    )
+    auth_max_connections: int = Field(
+        default=50,
+        description="Максимум соединений к auth service в пуле"
+    )
+    auth_cache_ttl: float = Field(
+        default=60.0,
+        description="Время жизни проверенной сессии в кэше (секунды, 0 — без кэша)"
+    )
+    auth_negative_cache_ttl: float = Field(
+        default=10.0,
+        description="Время жизни недействительной сессии (401) в кэше (секунды)"
+    )
+    auth_cache_max_size: int = Field(
+        default=10000,
+        description="Максимальное количество сессий в кэше"
+    )
+
+    # Объединение одинаковых одновременных запросов генерации
+    single_flight_enabled: bool = Field(
+        default=True,
+        description="Объединять одинаковые одновременные запросы к воркерам в один"
+    )
+
+    # Кэш email → ID пользователя
+    user_cache_max_size: int = Field(
+        default=10000,
+        description="Максимальное количество пользователей в кэше ID (0 — без кэша)"
+    )
+
+    # Внутренние эндпоинты для воркеров
+    internal_api_token: Optional[str] = Field(
+        default=None,
+        description="Токен для внутренних эндпоинтов (заголовок X-Internal-Token), None — эндпоинты отключены"
+    )
+    vacancy_cache_ttl: int = Field(
+        default=7 * 24 * 3600,
+        description="Время жизни записей кэша разбора вакансий по умолчанию (секунды)"
+    )
+
+    # Повторное использование оценок резюме
+    resume_evaluation_pipeline_version: str = Field(
+        default="1",
+        description="Версия пайплайна и промптов оценки резюме; смена версии делает сохранённые оценки неактуальными"
+    )
+    evaluation_cache_ttl: int = Field(
+        default=24 * 3600,
+        description="Сколько секунд сохранённая оценка резюме отдаётся повторно для тех же текстов (0 — не отдавать)"
+    )
+
+    # Асинхронные задачи генерации
+    job_events_poll_interval: float = Field(
+        default=1.0,
+        description="Интервал опроса статуса задачи для потока событий /jobs/{id}/events (секунды)"
+    )
+
+    # Хранение длинных текстов входных данных в payload_blobs
+    payload_blob_min_size: int = Field(
+        default=256,
+        description="Минимальная длина строки в request_payload (символов) для выноса в payload_blobs"
+    )
+
+    # Отложенная пакетная запись результатов генераций
+    result_writer_enabled: bool = Field(
+        default=True,
+        description="Записывать generation_results в фоне пачками (False — синхронно в запросе)"
+    )
+    result_writer_batch_size: int = Field(
+        default=100,
+        description="Максимальное количество записей в одной вставке"
+    )
+    result_writer_flush_interval: float = Field(
+        default=1.0,
+        description="Максимальное время ожидания записи в очереди до вставки (секунды)"
+    )
+    result_writer_max_queue_size: int = Field(
+        default=1000,
+        description="Размер очереди записей; при заполнении запросы ждут освобождения места"
+    )
+    result_writer_id_block_size: int = Field(
+        default=100,
+        description="Количество ID, резервируемых в последовательности за одно обращение к БД"
+    )
+    result_writer_max_retries: int = Field(
+        default=3,
+        description="Количество повторов вставки пачки при ошибке до построчной вставки"
+    )
+    result_writer_retry_backoff: float = Field(
+        default=0.5,
+        description="Начальная пауза перед повтором вставки пачки (секунды, удваивается)"
+    )
+
+    # Секции generation_results и срок хранения
+    partition_maintenance_interval: float = Field(
+        default=6 * 3600.0,
+        description="Интервал обслуживания секций generation_results (секунды, 0 — отключено)"
+    )
+    partitions_ahead: int = Field(
+        default=2,
+        description="Сколько месячных секций создавать заранее (кроме текущей)"
+    )
+    generation_results_retention_months: int = Field(
+        default=0,
+        description="Срок хранения generation_results в месяцах (0 — бессрочно)"
+    )
+    generation_results_retention_mode: Literal["drop", "archive"] = Field(
+        default="archive",
+        description="Что делать со старыми секциями: drop — удалить, archive — перенести в схему архива"
+    )
+    generation_results_archive_schema: str = Field(
+        default="archive",
+        pattern=r"^[a-z_][a-z0-9_]*$",
+        description="Схема для архивных секций generation_results"
+    )
 
 
 settings = Settings()
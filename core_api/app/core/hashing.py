@@ -0,0 +1,43 @@
+"""Хэши входных данных запросов генерации."""
+import hashlib
+import json
+
+
+def normalize_text(text: str) -> str:
+    """Нормализует текст для хэширования: схлопывает пробельные символы."""
+    return " ".join(text.split())
+
+
+def compute_request_hash(*texts: str) -> str:
+    """
+    Вычислить хэш входных текстов запроса.
+
+    Тексты, отличающиеся только пробелами и переносами строк,
+    получают одинаковый хэш.
+
+    Args:
+        texts: Входные тексты (например, вакансия и резюме)
+
+    Returns:
+        str: sha256 в шестнадцатеричном виде
+    """
+    payload = json.dumps([normalize_text(text) for text in texts], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def compute_evaluation_hash(vacancy_text: str, resume_text: str, pipeline_version: str) -> str:
+    """
+    Вычислить хэш оценки резюме: тексты вакансии и резюме плюс версия пайплайна.
+
+    После смены версии пайплайна (промптов, моделей) сохранённые оценки
+    получают другой хэш и повторно не используются.
+
+    Args:
+        vacancy_text: Текст вакансии
+        resume_text: Текст резюме
+        pipeline_version: Версия пайплайна оценки
+
+    Returns:
+        str: sha256 в шестнадцатеричном виде
+    """
+    return compute_request_hash(f"pipeline:{pipeline_version}", vacancy_text, resume_text)
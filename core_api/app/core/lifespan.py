@@ -2,12 +2,22 @@
 
 from contextlib import asynccontextmanager
 
-from app.api.dependencies import set_rabbit_client
+from app.api.dependencies import (
+    create_auth_client,
+    get_single_flight,
+    set_auth_client,
+    set_job_service,
+    set_rabbit_client,
+    set_result_writer,
+)
 from app.core.config import settings
-from app.db import init_db
+from app.db import get_session_maker, init_db
 from app.db.session import close_db
 from app.logger import setup_logger
 from app.rabbitmq import RabbitMQClient
+from app.services.job_service import JobService
+from app.services.partition_service import PartitionService
+from app.services.result_writer import ResultWriter
 from fastapi import FastAPI
 
 logger = setup_logger(__name__)
@@ -19,8 +29,9 @@ async def lifespan(app: FastAPI):
     Управление жизненным циклом приложения.
 
     Выполняет:
-    - При запуске: инициализация БД и RabbitMQ
-    - При завершении: корректное закрытие соединений
+    - При запуске: инициализация БД, RabbitMQ, фоновой записи результатов,
+      обслуживания секций generation_results и сервиса асинхронных задач
+    - При завершении: запись накопленных результатов и корректное закрытие соединений
 
     Args:
         app: Экземпляр FastAPI приложения
@@ -37,11 +48,19 @@ async def lifespan(app: FastAPI):
             "Ошибка при инициализации БД", extra={"error": str(e)}, exc_info=True
         )
 
+    # Клиент auth service: общий пул соединений и кэш сессий
+    auth_client = create_auth_client()
+    set_auth_client(auth_client)
+
     # Инициализация RabbitMQ
     rabbit_client = None
     try:
         logger.info("Инициализация клиента RabbitMQ")
-        rabbit_client = RabbitMQClient(settings.rabbitmq.url)
+        rabbit_client = RabbitMQClient(
+            settings.rabbitmq.url,
+            default_timeout=settings.rabbitmq.rpc_timeout,
+            queue_timeouts=settings.rabbitmq.rpc_queue_timeouts,
+        )
         await rabbit_client.connect()
         set_rabbit_client(rabbit_client)
         logger.info("RabbitMQ клиент успешно инициализирован")
@@ -51,12 +70,87 @@ async def lifespan(app: FastAPI):
         )
         raise  # останавливаем запуск
 
+    # Инициализация фоновой записи результатов генераций
+    result_writer = None
+    if settings.result_writer_enabled:
+        try:
+            result_writer = ResultWriter(
+                get_session_maker(),
+                batch_size=settings.result_writer_batch_size,
+                flush_interval=settings.result_writer_flush_interval,
+                max_queue_size=settings.result_writer_max_queue_size,
+                id_block_size=settings.result_writer_id_block_size,
+                max_retries=settings.result_writer_max_retries,
+                retry_backoff=settings.result_writer_retry_backoff,
+            )
+            result_writer.start()
+            set_result_writer(result_writer)
+            logger.info("Фоновая запись результатов успешно инициализирована")
+        except Exception as e:
+            result_writer = None
+            logger.error(
+                "Ошибка при инициализации фоновой записи результатов",
+                extra={"error": str(e)},
+                exc_info=True,
+            )
+
+    # Обслуживание секций generation_results (создание заранее, срок хранения)
+    partition_service = None
+    if settings.partition_maintenance_interval > 0:
+        partition_service = PartitionService(
+            get_session_maker(),
+            interval=settings.partition_maintenance_interval,
+            partitions_ahead=settings.partitions_ahead,
+            retention_months=settings.generation_results_retention_months,
+            mode=settings.generation_results_retention_mode,
+            archive_schema=settings.generation_results_archive_schema,
+        )
+        partition_service.start()
+        logger.info("Обслуживание секций generation_results запущено")
+
+    # Инициализация сервиса асинхронных задач
+    job_service = None
+    try:
+        job_service = JobService(
+            rabbit_client, get_session_maker(), result_writer, get_single_flight()
+        )
+        set_job_service(job_service)
+        logger.info("Сервис асинхронных задач успешно инициализирован")
+    except Exception as e:
+        logger.error(
+            "Ошибка при инициализации сервиса задач", extra={"error": str(e)}, exc_info=True
+        )
+
     # Приложение работает
     yield
 
     # ========== SHUTDOWN ==========
     logger.info("Завершение работы Core API")
 
+    # Остановка фоновых задач (до закрытия БД и RabbitMQ)
+    if job_service:
+        try:
+            await job_service.close()
+            logger.info("Фоновые задачи остановлены")
+        except Exception as e:
+            logger.error(
+                "Ошибка при остановке фоновых задач", extra={"error": str(e)}, exc_info=True
+            )
+
+    if partition_service:
+        await partition_service.close()
+
+    # Запись накопленных результатов (после остановки задач, до закрытия БД)
+    if result_writer:
+        set_result_writer(None)
+        try:
+            await result_writer.close()
+            logger.info("Накопленные результаты записаны в БД")
+        except Exception as e:
+            logger.error(
+                "Ошибка при записи накопленных результатов", extra={"error": str(e)}, exc_info=True
+            )
+
     # Закрытие подключения к БД
     try:
         await close_db()
@@ -64,6 +158,10 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error("Ошибка при закрытии БД", extra={"error": str(e)}, exc_info=True)
 
+    # Закрытие пула соединений к auth service
+    set_auth_client(None)
+    await auth_client.close()
+
     # Закрытие RabbitMQ
     if rabbit_client:
         try:
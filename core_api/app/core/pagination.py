@@ -0,0 +1,46 @@
+"""Курсоры для постраничной выборки по ключу (created_at, id)."""
+import base64
+from datetime import datetime
+from typing import NamedTuple
+
+
+class Cursor(NamedTuple):
+    """Позиция последней записи страницы."""
+
+    created_at: datetime
+    id: int
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """
+    Закодировать курсор в строку для передачи клиенту.
+
+    Args:
+        cursor: Позиция последней записи страницы
+
+    Returns:
+        str: Непрозрачная строка (urlsafe base64)
+    """
+    raw = f"{cursor.created_at.isoformat()}|{cursor.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(value: str) -> Cursor:
+    """
+    Раскодировать курсор, полученный от клиента.
+
+    Args:
+        value: Строка из encode_cursor
+
+    Returns:
+        Cursor: Позиция последней записи страницы
+
+    Raises:
+        ValueError: Если строка не является курсором
+    """
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        created_at, result_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|")
+        return Cursor(datetime.fromisoformat(created_at), int(result_id))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Некорректный курсор") from e
@@ -0,0 +1,111 @@
+"""
+Вынос длинных текстов из request_payload в payload_blobs.
+
+Длинные строковые значения заменяются ссылками {"$blob": <sha256>, "size": <байт>},
+а сами тексты сжимаются и сохраняются отдельно по хэшу содержимого.
+"""
+import hashlib
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+# Ключ ссылки на текст в payload_blobs
+BLOB_REF_KEY = "$blob"
+
+# Уровень сжатия zlib (баланс скорости и размера)
+COMPRESSION_LEVEL = 6
+
+
+@dataclass
+class Blob:
+    """Сжатый текст для записи в payload_blobs."""
+
+    hash: str
+    data: bytes
+    size: int
+    refs: int = 1
+
+
+def compress_text(text: str) -> Tuple[str, bytes, int]:
+    """
+    Сжать текст.
+
+    Returns:
+        Tuple[str, bytes, int]: (sha256 текста, сжатые данные, размер в байтах)
+    """
+    raw = text.encode("utf-8")
+    return hashlib.sha256(raw).hexdigest(), zlib.compress(raw, COMPRESSION_LEVEL), len(raw)
+
+
+def decompress_text(data: bytes) -> str:
+    """Распаковать текст."""
+    return zlib.decompress(data).decode("utf-8")
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Проверить, что значение — ссылка на текст в payload_blobs."""
+    return isinstance(value, dict) and BLOB_REF_KEY in value
+
+
+def dehydrate_payload(
+    payload: Optional[Dict[str, Any]],
+    min_size: int
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, Blob]]:
+    """
+    Заменить длинные строки верхнего уровня ссылками на payload_blobs.
+
+    Args:
+        payload: Входные данные запроса
+        min_size: Минимальная длина строки (символов) для выноса
+
+    Returns:
+        Tuple: (payload со ссылками, тексты для записи {hash: Blob})
+    """
+    if not payload:
+        return payload, {}
+
+    blobs: Dict[str, Blob] = {}
+    result: Dict[str, Any] = {}
+    for key, value in payload.items():
+        if not isinstance(value, str) or len(value) < min_size:
+            result[key] = value
+            continue
+
+        blob_hash, data, size = compress_text(value)
+        if blob_hash in blobs:
+            blobs[blob_hash].refs += 1
+        else:
+            blobs[blob_hash] = Blob(hash=blob_hash, data=data, size=size)
+        result[key] = {BLOB_REF_KEY: blob_hash, "size": size}
+
+    return result, blobs
+
+
+def payload_blob_hashes(payload: Optional[Dict[str, Any]]) -> list[str]:
+    """Хэши текстов, на которые ссылается payload (с повторами)."""
+    if not payload:
+        return []
+    return [value[BLOB_REF_KEY] for value in payload.values() if is_blob_ref(value)]
+
+
+def rehydrate_payload(
+    payload: Optional[Dict[str, Any]],
+    texts: Dict[str, str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Подставить тексты вместо ссылок.
+
+    Args:
+        payload: Входные данные со ссылками
+        texts: Тексты {hash: текст}
+
+    Returns:
+        Optional[Dict[str, Any]]: Входные данные с исходными текстами
+        (ссылки на отсутствующие тексты остаются как есть)
+    """
+    if not payload:
+        return payload
+    return {
+        key: texts.get(value[BLOB_REF_KEY], value) if is_blob_ref(value) else value
+        for key, value in payload.items()
+    }
@@ -0,0 +1,63 @@
+"""Объединение одинаковых одновременных запросов (single flight)."""
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict
+
+from app.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class SingleFlight:
+    """
+    Группа выполняющихся запросов с объединением по ключу.
+
+    Первый вызов do() с ключом запускает функцию в отдельной задаче,
+    последующие вызовы с тем же ключом до её завершения ждут ту же задачу
+    и получают копию её результата (или то же исключение). После
+    завершения ключ освобождается: результаты не кэшируются.
+
+    Отмена одного из ожидающих (например, обрыв HTTP соединения)
+    не прерывает задачу для остальных.
+    """
+
+    def __init__(self):
+        """Инициализация группы."""
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        """Количество выполняющихся запросов."""
+        return len(self._tasks)
+
+    def __contains__(self, key: str) -> bool:
+        """Выполняется ли запрос с этим ключом."""
+        return key in self._tasks
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Выполнить func или присоединиться к уже выполняющемуся запросу с тем же ключом.
+
+        Args:
+            key: Ключ запроса (тип запроса и хэш входных данных)
+            func: Функция без аргументов, возвращающая корутину
+
+        Returns:
+            Any: Результат func (присоединившиеся получают глубокую копию)
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            logger.debug("Присоединение к выполняющемуся запросу", extra={"key": key})
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = asyncio.create_task(func())
+        self._tasks[key] = task
+        task.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(task)
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        """Освободить ключ завершившейся задачи."""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Исключение уже получили ожидающие; без них его некому забрать
+        if not task.cancelled():
+            task.exception()
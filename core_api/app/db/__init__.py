@@ -8,7 +8,7 @@
 """
 
 from app.db.base import Base
-from app.db.session import get_session, init_db
+from app.db.session import SessionFactory, get_session, get_session_maker, init_db
 
-__all__ = ["Base", "get_session", "init_db"]
+__all__ = ["Base", "SessionFactory", "get_session", "get_session_maker", "init_db"]
 
@@ -4,6 +4,10 @@ ORM модели для таблиц PostgreSQL.
 Модуль содержит модели для:
 - users: авторизованные пользователи системы
 - generation_results: результаты работы LLM/ML воркеров
+- vacancy_cache: кэш промежуточных результатов разбора вакансий
+- generation_jobs: асинхронные задачи генерации и их прогресс
+- skill_relevance_memo: вердикты LLM по парам навыков
+- payload_blobs: сжатые тексты входных данных, общие для разных записей
 """
 
 from datetime import datetime
@@ -14,6 +18,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     func,
@@ -78,9 +83,9 @@ class User(Base):
         comment="Дата и время последнего обновления",
     )
 
-    # Связи
+    # Связи (загружаются только явно: selectinload/joinedload в запросе)
     generation_results: Mapped[list["GenerationResult"]] = relationship(
-        "GenerationResult", back_populates="user", lazy="selectin"
+        "GenerationResult", back_populates="user", lazy="raise"
     )
 
     # Индексы определены ниже через __table_args__
@@ -110,17 +115,21 @@ class GenerationResult(Base):
         user_id: ID пользователя (NULL для анонимных запросов)
         request_type: Тип генерации (job_description, resume_evaluation, etc.)
         request_payload: Входные данные запроса в формате JSON
+        request_hash: Хэш нормализованных входных текстов (для повторного использования результата)
         response_payload: Результат генерации в формате JSON
         status: Статус выполнения (success, error, timeout)
         error_message: Сообщение об ошибке (если есть)
         latency_ms: Время выполнения в миллисекундах
         created_at: Дата и время создания записи
         user: Связь с пользователем
+    
+    Таблица секционирована по месяцам created_at (см. app.db.partitions),
+    поэтому created_at входит в первичный ключ.
     """
 
     __tablename__ = "generation_results"
 
-    # Первичный ключ
+    # Первичный ключ (id, created_at)
     id: Mapped[int] = mapped_column(
         BigInteger,
         primary_key=True,
@@ -148,6 +157,12 @@ class GenerationResult(Base):
         JSONB, nullable=True, comment="Входные данные запроса"
     )
 
+    request_hash: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="Хэш нормализованных входных текстов (sha256)",
+    )
+
     response_payload: Mapped[Optional[dict]] = mapped_column(
         JSONB, nullable=True, comment="Результат генерации"
     )
@@ -169,26 +184,36 @@ class GenerationResult(Base):
         Integer, nullable=True, comment="Время выполнения в миллисекундах"
     )
 
-    # Временная метка
+    # Временная метка (ключ секционирования)
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
+        primary_key=True,
         nullable=False,
         server_default=func.now(),
         comment="Дата и время создания записи",
     )
 
-    # Связи
+    # Связи (загружаются только явно: selectinload/joinedload в запросе)
     user: Mapped[Optional["User"]] = relationship(
-        "User", back_populates="generation_results", lazy="selectin"
+        "User", back_populates="generation_results", lazy="raise"
     )
 
     # Индексы
+    # Индексы совпадают с порядком постраничной выборки (created_at, id)
     __table_args__ = (
-        Index("ix_generation_results_user_id", "user_id"),
-        Index("ix_generation_results_request_type", "request_type"),
+        Index("ix_generation_results_user_created", "user_id", "created_at", "id"),
+        Index("ix_generation_results_type_created", "request_type", "created_at", "id"),
+        Index(
+            "ix_generation_results_user_type_created",
+            "user_id", "request_type", "created_at", "id",
+        ),
         Index("ix_generation_results_created_at", "created_at"),
         Index("ix_generation_results_status", "status"),
-        {"comment": "Таблица результатов генераций LLM/ML воркеров"},
+        Index("ix_generation_results_request_hash", "request_type", "request_hash"),
+        {
+            "comment": "Таблица результатов генераций LLM/ML воркеров",
+            "postgresql_partition_by": "RANGE (created_at)",
+        },
     )
 
     def __repr__(self) -> str:
@@ -199,3 +224,314 @@ class GenerationResult(Base):
             f"request_type='{self.request_type}', "
             f"status='{self.status}')>"
         )
+
+
+class VacancyCacheEntry(Base):
+    """
+    Модель записи кэша разбора вакансии.
+
+    Хранит промежуточные результаты воркера оценки резюме, которые зависят
+    только от текста вакансии (профиль вакансии, подготовленные навыки).
+    Ключ — хэш нормализованного текста и название этапа, поэтому повторная
+    оценка резюме по той же вакансии не вызывает LLM для этих этапов.
+
+    Attributes:
+        key: Ключ записи (<этап>:<версия промптов>:<sha256>)
+        value: Сохранённый результат этапа в формате JSON
+        created_at: Дата и время создания записи
+        expires_at: Дата и время истечения записи (NULL — бессрочно)
+    """
+
+    __tablename__ = "vacancy_cache"
+
+    key: Mapped[str] = mapped_column(
+        String(128),
+        primary_key=True,
+        comment="Ключ записи (<этап>:<версия промптов>:<sha256>)",
+    )
+
+    value: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, comment="Сохранённый результат этапа"
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Дата и время создания записи",
+    )
+
+    expires_at: Mapped[Optional[datetime]] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+        comment="Дата и время истечения записи (NULL — бессрочно)",
+    )
+
+    __table_args__ = (
+        Index("ix_vacancy_cache_expires_at", "expires_at"),
+        {"comment": "Кэш промежуточных результатов разбора вакансий"},
+    )
+
+    def __repr__(self) -> str:
+        """Строковое представление записи кэша."""
+        return f"<VacancyCacheEntry(key='{self.key}', expires_at={self.expires_at})>"
+
+
+class GenerationJob(Base):
+    """
+    Модель асинхронной задачи генерации.
+
+    Клиент создаёт задачу и сразу получает её идентификатор, а Core API
+    выполняет запросы к воркерам в фоне и обновляет статус и прогресс
+    по мере получения сообщений от воркеров. Итог дополнительно
+    логируется в generation_results, как и для синхронных запросов.
+
+    Attributes:
+        id: Идентификатор задачи (UUID)
+        user_id: ID пользователя (NULL для анонимных запросов)
+        request_type: Тип генерации (job_description, resume_evaluation, etc.)
+        status: Статус задачи (queued, running, success, error)
+        stage: Последний завершённый этап пайплайна
+        progress: Прогресс выполнения в процентах
+        request_payload: Входные данные запроса в формате JSON
+        response_payload: Результат генерации в формате JSON
+        error_message: Сообщение об ошибке (если есть)
+        created_at: Дата и время создания задачи
+        updated_at: Дата и время последнего обновления
+        finished_at: Дата и время завершения задачи
+    """
+
+    __tablename__ = "generation_jobs"
+
+    # Первичный ключ
+    id: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        comment="Идентификатор задачи (UUID)",
+    )
+
+    # Связь с пользователем (опционально)
+    user_id: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+        comment="ID пользователя (NULL для анонимных запросов)",
+    )
+
+    request_type: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Тип генерации (job_description, resume_evaluation, etc.)",
+    )
+
+    # Состояние задачи
+    status: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        default="queued",
+        comment="Статус задачи (queued, running, success, error)",
+    )
+
+    stage: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True, comment="Последний завершённый этап пайплайна"
+    )
+
+    progress: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Прогресс выполнения в процентах",
+    )
+
+    # Данные запроса и ответа
+    request_payload: Mapped[Optional[dict]] = mapped_column(
+        JSONB, nullable=True, comment="Входные данные запроса"
+    )
+
+    response_payload: Mapped[Optional[dict]] = mapped_column(
+        JSONB, nullable=True, comment="Результат генерации"
+    )
+
+    error_message: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, comment="Сообщение об ошибке"
+    )
+
+    # Временные метки
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Дата и время создания задачи",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="Дата и время последнего обновления",
+    )
+
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+        comment="Дата и время завершения задачи",
+    )
+
+    __table_args__ = (
+        Index("ix_generation_jobs_user_id", "user_id"),
+        Index("ix_generation_jobs_status", "status"),
+        Index("ix_generation_jobs_created_at", "created_at"),
+        {"comment": "Таблица асинхронных задач генерации"},
+    )
+
+    def __repr__(self) -> str:
+        """Строковое представление задачи."""
+        return (
+            f"<GenerationJob(id='{self.id}', "
+            f"request_type='{self.request_type}', "
+            f"status='{self.status}', "
+            f"progress={self.progress})>"
+        )
+
+
+class SkillRelevanceMemo(Base):
+    """
+    Модель вердикта LLM по паре навыков.
+
+    Хранит результат оценки аналогичности навыка вакансии и навыка резюме,
+    чтобы воркер оценки резюме не спрашивал LLM о той же паре повторно.
+    Вердикты привязаны к версии промпта: после изменения промпта
+    старые записи не используются.
+
+    Attributes:
+        prompt_version: Версия промпта оценки релевантности
+        vacancy_skill: Нормализованный навык вакансии
+        resume_skill: Нормализованный навык резюме
+        relevance: Категория аналогичности
+        reason: Обоснование LLM
+        hits: Количество повторных использований вердикта
+        created_at: Дата и время создания записи
+        updated_at: Дата и время последнего обновления
+    """
+
+    __tablename__ = "skill_relevance_memo"
+
+    prompt_version: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="Версия промпта оценки релевантности",
+    )
+
+    vacancy_skill: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="Нормализованный навык вакансии",
+    )
+
+    resume_skill: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="Нормализованный навык резюме",
+    )
+
+    relevance: Mapped[str] = mapped_column(
+        String(50), nullable=False, comment="Категория аналогичности"
+    )
+
+    reason: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, comment="Обоснование LLM"
+    )
+
+    hits: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Количество повторных использований вердикта",
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Дата и время создания записи",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="Дата и время последнего обновления",
+    )
+
+    __table_args__ = (
+        {"comment": "Вердикты LLM по парам навыков вакансии и резюме"},
+    )
+
+    def __repr__(self) -> str:
+        """Строковое представление вердикта."""
+        return (
+            f"<SkillRelevanceMemo(prompt_version='{self.prompt_version}', "
+            f"vacancy_skill='{self.vacancy_skill}', "
+            f"resume_skill='{self.resume_skill}', "
+            f"relevance='{self.relevance}')>"
+        )
+
+
+class PayloadBlob(Base):
+    """
+    Модель сжатого текста входных данных.
+
+    Длинные тексты из request_payload (вакансии, резюме) хранятся один раз
+    по хэшу содержимого, а в generation_results остаются только ссылки
+    {"$blob": <hash>}. Счётчик ссылок позволяет удалить текст, когда на него
+    больше не ссылается ни одна запись.
+
+    Attributes:
+        hash: sha256 исходного текста
+        data: Текст, сжатый zlib
+        size: Размер исходного текста в байтах (UTF-8)
+        ref_count: Количество записей, ссылающихся на текст
+        created_at: Дата и время создания записи
+    """
+
+    __tablename__ = "payload_blobs"
+
+    hash: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="sha256 исходного текста",
+    )
+
+    data: Mapped[bytes] = mapped_column(
+        LargeBinary, nullable=False, comment="Текст, сжатый zlib"
+    )
+
+    size: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Размер исходного текста в байтах (UTF-8)"
+    )
+
+    ref_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Количество записей, ссылающихся на текст",
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Дата и время создания записи",
+    )
+
+    __table_args__ = (
+        {"comment": "Сжатые тексты входных данных генераций (адресация по хэшу)"},
+    )
+
+    def __repr__(self) -> str:
+        """Строковое представление текста."""
+        return f"<PayloadBlob(hash='{self.hash}', size={self.size}, ref_count={self.ref_count})>"
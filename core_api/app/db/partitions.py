@@ -0,0 +1,58 @@
+"""
+Помесячное секционирование таблицы generation_results.
+
+Таблица секционирована по диапазону created_at: одна секция на календарный
+месяц (generation_results_yYYYYmMM) и секция по умолчанию для записей вне
+созданных диапазонов. Старые секции удаляются или отсоединяются целиком,
+без построчного DELETE.
+"""
+import re
+from datetime import datetime, timezone
+from typing import Optional
+
+# Секционированная таблица
+PARTITIONED_TABLE = "generation_results"
+
+# Секция по умолчанию (записи вне созданных месячных секций)
+DEFAULT_PARTITION = f"{PARTITIONED_TABLE}_default"
+
+_PARTITION_RE = re.compile(rf"^{PARTITIONED_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+
+def month_start(value: datetime) -> datetime:
+    """Начало месяца (UTC) для момента времени."""
+    value = value.astimezone(timezone.utc) if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Сдвинуть начало месяца на months месяцев (может быть отрицательным)."""
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Имя секции для месяца."""
+    return f"{PARTITIONED_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """Месяц секции по её имени (None для секции по умолчанию и чужих таблиц)."""
+    match = _PARTITION_RE.match(name)
+    if match is None:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)
+
+
+def create_partition_sql(month: datetime) -> str:
+    """DDL месячной секции (идемпотентный)."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} "
+        f"PARTITION OF {PARTITIONED_TABLE} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def create_default_partition_sql() -> str:
+    """DDL секции по умолчанию (идемпотентный)."""
+    return f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARTITIONED_TABLE} DEFAULT"
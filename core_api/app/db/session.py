@@ -8,7 +8,8 @@
 """
 
 from collections.abc import AsyncGenerator
-from typing import Optional
+from contextlib import AbstractAsyncContextManager
+from typing import Callable, Optional
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -23,6 +24,11 @@ from app.logger import setup_logger
 # Логгер для модуля
 logger = setup_logger(__name__)
 
+# Фабрика сессий БД (async_sessionmaker или совместимый объект).
+# Сервисы открывают по ней короткие сессии на каждую операцию,
+# не удерживая соединение из пула на время ожидания воркеров
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
 # Глобальные переменные для движка и фабрики сессий
 _engine: Optional[AsyncEngine] = None
 _async_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
@@ -63,6 +69,25 @@ def init_db() -> None:
     logger.info("Подключение к PostgreSQL успешно настроено")
 
 
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """
+    Возвращает фабрику сессий для работы с БД короткими сессиями
+    (в фоновых задачах и в сервисах, которые ждут ответа воркеров).
+    
+    Returns:
+        async_sessionmaker[AsyncSession]: Фабрика сессий
+        
+    Raises:
+        RuntimeError: Если БД не была инициализирована
+    """
+    if _async_session_maker is None:
+        logger.error("База данных не инициализирована")
+        raise RuntimeError(
+            "База данных не инициализирована. "
+        )
+    return _async_session_maker
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Зависимость FastAPI для получения сессии БД.
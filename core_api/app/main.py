@@ -5,11 +5,12 @@ Core API - Основной сервис HR-ассистента.
 - Оценки резюме
 - Генерации описаний вакансий
 - Генерации вопросов для интервью
+- Асинхронного выполнения генераций с опросом статуса
 """
 
 from fastapi import FastAPI
 
-from api.routes import health, job_description, questions, resume
+from api.routes import health, history, internal, job_description, jobs, questions, resume
 from core.lifespan import lifespan
 from middleware.error_handler import ErrorHandlerMiddleware
 
@@ -29,3 +30,6 @@ app.include_router(health.router)
 app.include_router(resume.router)
 app.include_router(job_description.router)
 app.include_router(questions.router)
+app.include_router(jobs.router)
+app.include_router(history.router)
+app.include_router(internal.router)
@@ -6,7 +6,7 @@ RabbitMQ клиент для асинхронного взаимодействи
 import asyncio
 import json
 import uuid
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Optional
 
 import aio_pika
 
@@ -19,30 +19,50 @@ logger = setup_logger(__name__)
 class RabbitMQClient:
     """
     Клиент для асинхронного взаимодействия с RabbitMQ.
-    
+
+    Поддерживает множество одновременных RPC запросов через одно соединение
+    и одну очередь обратного вызова: каждому запросу соответствует свой
+    correlation_id и свой asyncio.Future, который разрешается напрямую
+    в обработчике ответов.
+
+    Для потоковых запросов (stream) вместо Future используется asyncio.Queue:
+    воркер отправляет несколько сообщений с одним correlation_id, последнее
+    из них имеет type="done".
+
     Attributes:
         rabbit_url (str): URL подключения к RabbitMQ
         connection: Активное соединение с RabbitMQ
         channel: Канал для отправки сообщений
         callback_queue: Очередь для получения ответов
-        response: Хранит полученный ответ
-        corr_id: Идентификатор корреляции для отслеживания запросов
+        futures: Ожидающие ответа запросы (correlation_id -> Future)
+        streams: Потоковые запросы (correlation_id -> Queue)
+        default_timeout: Таймаут ожидания ответа по умолчанию (секунды)
+        queue_timeouts: Таймауты ожидания ответа для отдельных очередей
         logger: Логгер для записи событий
     """
-    
-    def __init__(self, rabbit_url: str):
+
+    def __init__(
+        self,
+        rabbit_url: str,
+        default_timeout: float = 600.0,
+        queue_timeouts: Optional[Dict[str, float]] = None,
+    ):
         """
         Инициализация клиента RabbitMQ.
-        
+
         Args:
             rabbit_url (str): URL для подключения к RabbitMQ серверу
+            default_timeout (float): Таймаут ожидания ответа по умолчанию
+            queue_timeouts (Dict[str, float]): Таймауты для отдельных очередей
         """
         self.rabbit_url = rabbit_url
         self.connection = None
         self.channel = None
         self.callback_queue = None
-        self.response = None
-        self.corr_id = None
+        self.futures: Dict[str, asyncio.Future] = {}
+        self.streams: Dict[str, asyncio.Queue] = {}
+        self.default_timeout = default_timeout
+        self.queue_timeouts = queue_timeouts or {}
         self.logger = setup_logger(__name__)
         self.logger.info(
             "Инициализация клиента RabbitMQ",
@@ -52,13 +72,13 @@ class RabbitMQClient:
     async def connect(self):
         """
         Установка соединения с RabbitMQ.
-        
+
         Выполняет:
         1. Подключение к серверу RabbitMQ
         2. Создание канала
         3. Объявление очереди обратного вызова
         4. Настройку обработчика ответов
-        
+
         Raises:
             Exception: При ошибке подключения к RabbitMQ
         """
@@ -74,84 +94,202 @@ class RabbitMQClient:
             self.callback_queue = await self.channel.declare_queue(exclusive=True)
 
             self.logger.debug("Настройка получателя сообщений")
-            await self.callback_queue.consume(self.on_response)
+            await self.callback_queue.consume(self.on_response, no_ack=True)
 
             self.logger.info("Успешное подключение к RabbitMQ")
         except Exception as e:
             self.logger.error(f"Ошибка подключения к RabbitMQ: {str(e)}", exc_info=True)
             raise
 
-    async def on_response(self, message: aio_pika.IncomingMessage):
+    async def on_response(self, message: aio_pika.abc.AbstractIncomingMessage):
         """
         Обработчик входящих сообщений.
-        
+
+        Находит ожидающий запрос по correlation_id и передаёт ему ответ.
+        Ответы на отменённые или просроченные запросы отбрасываются.
+
         Args:
             message (aio_pika.IncomingMessage): Входящее сообщение от RabbitMQ
         """
-        if self.corr_id == message.correlation_id:
-            self.logger.debug(
-                "Получено ответное сообщение",
+        stream = self.streams.get(message.correlation_id)
+        if stream is not None:
+            stream.put_nowait(message.body)
+            return
+
+        future = self.futures.pop(message.correlation_id, None)
+        if future is None:
+            self.logger.warning(
+                "Получен ответ на неизвестный или отменённый запрос",
                 extra={"correlation_id": message.correlation_id}
             )
-            self.response = message.body
+            return
+
+        self.logger.debug(
+            "Получено ответное сообщение",
+            extra={"correlation_id": message.correlation_id}
+        )
+        if not future.done():
+            future.set_result(message.body)
+
+    def get_timeout(self, queue_name: str) -> float:
+        """
+        Получить таймаут ожидания ответа для очереди.
+
+        Args:
+            queue_name (str): Имя очереди
+
+        Returns:
+            float: Таймаут в секундах
+        """
+        return self.queue_timeouts.get(queue_name, self.default_timeout)
 
     async def call(
-        self, payload: Dict[str, Any], queue_name: str = "resume_evaluation_task"
+        self,
+        payload: Dict[str, Any],
+        queue_name: str = "resume_evaluation_task",
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Отправка RPC запроса в RabbitMQ и ожидание ответа.
-        
+
         Args:
             payload (Dict[str, Any]): Данные для отправки
             queue_name (str): Имя очереди для отправки запроса
-            
+            timeout (float): Таймаут ожидания ответа (по умолчанию — из настроек очереди)
+
         Returns:
             Dict[str, Any]: Результат обработки запроса
+
+        Raises:
+            TimeoutError: Если ответ не получен за отведённое время
         """
-        self.response = None
-        self.corr_id = str(uuid.uuid4())
+        timeout = timeout if timeout is not None else self.get_timeout(queue_name)
+        corr_id = str(uuid.uuid4())
+        future = asyncio.get_running_loop().create_future()
+        self.futures[corr_id] = future
+
         self.logger.debug(
             f"Отправка сообщения в очередь {queue_name}",
-            extra={"correlation_id": self.corr_id}
+            extra={"correlation_id": corr_id, "in_flight": len(self.futures)}
         )
 
-        exchange = self.channel.default_exchange
-        await exchange.publish(
-            aio_pika.Message(
-                body=json.dumps(payload).encode(),
-                content_type="application/json",
-                correlation_id=self.corr_id,
-                reply_to=self.callback_queue.name,
-            ),
-            routing_key=queue_name,  # Используем параметр очереди
-        )
+        try:
+            exchange = self.channel.default_exchange
+            await exchange.publish(
+                aio_pika.Message(
+                    body=json.dumps(payload).encode(),
+                    content_type="application/json",
+                    correlation_id=corr_id,
+                    reply_to=self.callback_queue.name,
+                    # Воркер не будет брать задачу, ответ на которую уже никто не ждёт
+                    expiration=timeout,
+                ),
+                routing_key=queue_name,  # Используем параметр очереди
+            )
+
+            # Ждём ответа (с таймаутом)
+            self.logger.debug("Ожидание ответа", extra={"correlation_id": corr_id})
+            body = await asyncio.wait_for(future, timeout=timeout)
 
-        # Ждём ответа (с таймаутом)
-        self.logger.debug("Ожидание ответа")
-        for _ in range(6000):  # 600 секунд
-            if self.response is not None:
-                result = json.loads(self.response)
-                self.logger.debug(
-                    "Получен ответ",
-                    extra={"correlation_id": self.corr_id}
-                )
-                return result
-            await asyncio.sleep(0.1)
-
-        self.logger.error(
-            "Превышено время ожидания ответа от воркера",
-            extra={"correlation_id": self.corr_id}
+        except asyncio.TimeoutError:
+            self.logger.error(
+                "Превышено время ожидания ответа от воркера",
+                extra={"correlation_id": corr_id, "queue": queue_name, "timeout": timeout}
+            )
+            raise TimeoutError("Таймаут ожидания ответа от воркера")
+
+        except asyncio.CancelledError:
+            self.logger.warning(
+                "Запрос отменён до получения ответа",
+                extra={"correlation_id": corr_id, "queue": queue_name}
+            )
+            raise
+
+        finally:
+            self.futures.pop(corr_id, None)
+
+        self.logger.debug("Получен ответ", extra={"correlation_id": corr_id})
+        return json.loads(body)
+
+    async def stream(
+        self,
+        payload: Dict[str, Any],
+        queue_name: str = "resume_evaluation_task",
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Отправка потокового RPC запроса: воркер присылает несколько ответов
+        с одним correlation_id, последний из них имеет type="done".
+
+        Args:
+            payload (Dict[str, Any]): Данные для отправки
+            queue_name (str): Имя очереди для отправки запроса
+            timeout (float): Таймаут ожидания каждого следующего сообщения
+                (по умолчанию — из настроек очереди)
+
+        Yields:
+            Dict[str, Any]: Очередное сообщение воркера
+
+        Raises:
+            TimeoutError: Если очередное сообщение не получено за отведённое время
+        """
+        timeout = timeout if timeout is not None else self.get_timeout(queue_name)
+        corr_id = str(uuid.uuid4())
+        queue: asyncio.Queue = asyncio.Queue()
+        self.streams[corr_id] = queue
+
+        self.logger.debug(
+            f"Отправка потокового запроса в очередь {queue_name}",
+            extra={"correlation_id": corr_id, "in_flight": len(self.streams)}
         )
-        raise TimeoutError("Таймаут ожидания ответа от воркера")
-    
+
+        try:
+            await self.channel.default_exchange.publish(
+                aio_pika.Message(
+                    body=json.dumps(payload).encode(),
+                    content_type="application/json",
+                    correlation_id=corr_id,
+                    reply_to=self.callback_queue.name,
+                    expiration=timeout,
+                ),
+                routing_key=queue_name,
+            )
+
+            while True:
+                try:
+                    body = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    self.logger.error(
+                        "Превышено время ожидания сообщения от воркера",
+                        extra={"correlation_id": corr_id, "queue": queue_name, "timeout": timeout}
+                    )
+                    raise TimeoutError("Таймаут ожидания ответа от воркера")
+
+                message = json.loads(body)
+                yield message
+                if message.get("type") == "done":
+                    break
+
+        finally:
+            self.streams.pop(corr_id, None)
+
+        self.logger.debug("Потоковый запрос завершён", extra={"correlation_id": corr_id})
+
     async def close(self):
         """
         Закрытие соединения с RabbitMQ.
+
+        Все ожидающие запросы отменяются.
         """
+        for future in self.futures.values():
+            if not future.done():
+                future.cancel()
+        self.futures.clear()
+        self.streams.clear()
+
         try:
             if self.connection and not self.connection.is_closed:
                 await self.connection.close()
                 self.logger.info("Соединение с RabbitMQ закрыто")
         except Exception as e:
             self.logger.error(f"Ошибка при закрытии соединения с RabbitMQ: {str(e)}")
-
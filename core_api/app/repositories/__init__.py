@@ -6,6 +6,19 @@
 
 from app.repositories.user import UserRepository
 from app.repositories.generation_result import GenerationResultRepository
+from app.repositories.generation_result_partition import GenerationResultPartitionRepository
+from app.repositories.vacancy_cache import VacancyCacheRepository
+from app.repositories.generation_job import GenerationJobRepository
+from app.repositories.skill_relevance_memo import SkillRelevanceMemoRepository
+from app.repositories.payload_blob import PayloadBlobRepository
 
-__all__ = ["UserRepository", "GenerationResultRepository"]
+__all__ = [
+    "UserRepository",
+    "GenerationResultRepository",
+    "GenerationResultPartitionRepository",
+    "VacancyCacheRepository",
+    "GenerationJobRepository",
+    "SkillRelevanceMemoRepository",
+    "PayloadBlobRepository",
+]
 
@@ -0,0 +1,137 @@
+"""
+Репозиторий для работы с асинхронными задачами генерации.
+
+Реализует создание, чтение и обновление записей GenerationJob.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import GenerationJob
+from app.logger import setup_logger
+
+# Логгер для модуля
+logger = setup_logger(__name__)
+
+# Статусы, после которых задача больше не меняется
+FINISHED_JOB_STATUSES = ("success", "error")
+
+
+class GenerationJobRepository:
+    """
+    Репозиторий для работы с асинхронными задачами генерации.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация репозитория.
+
+        Args:
+            session: Async сессия SQLAlchemy
+        """
+        self.session = session
+
+    async def get_by_id(self, job_id: str) -> Optional[GenerationJob]:
+        """
+        Получить задачу по ID.
+
+        Args:
+            job_id: Идентификатор задачи
+
+        Returns:
+            GenerationJob | None: Найденная задача или None
+        """
+        result = await self.session.execute(
+            select(GenerationJob).where(GenerationJob.id == job_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def create(
+        self,
+        request_type: str,
+        user_id: Optional[int] = None,
+        request_payload: Optional[dict] = None,
+    ) -> GenerationJob:
+        """
+        Создать задачу в статусе queued.
+
+        Args:
+            request_type: Тип запроса (job_description, resume_evaluation, etc.)
+            user_id: ID пользователя (опционально)
+            request_payload: Входные данные запроса
+
+        Returns:
+            GenerationJob: Созданная задача
+        """
+        job = GenerationJob(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            request_type=request_type,
+            request_payload=request_payload,
+            status="queued",
+            progress=0,
+        )
+
+        self.session.add(job)
+        await self.session.commit()
+        await self.session.refresh(job)
+
+        logger.info(
+            "Создана задача генерации",
+            extra={"job_id": job.id, "request_type": request_type, "user_id": user_id}
+        )
+
+        return job
+
+    async def update(self, job_id: str, **values: Any) -> None:
+        """
+        Обновить поля задачи.
+
+        Завершённые задачи (success, error) не изменяются.
+        При переходе в завершённый статус проставляется finished_at.
+
+        Args:
+            job_id: Идентификатор задачи
+            **values: Новые значения полей (status, stage, progress, ...)
+        """
+        if values.get("status") in FINISHED_JOB_STATUSES:
+            values.setdefault("finished_at", datetime.now(timezone.utc))
+
+        await self.session.execute(
+            update(GenerationJob)
+            .where(
+                GenerationJob.id == job_id,
+                GenerationJob.status.not_in(FINISHED_JOB_STATUSES),
+            )
+            .values(**values)
+        )
+        await self.session.commit()
+
+    async def fail_unfinished(self, error_message: str) -> int:
+        """
+        Перевести все незавершённые задачи в статус error.
+
+        Используется при остановке сервиса: фоновые задачи, выполнявшиеся
+        в процессе, после перезапуска продолжены не будут.
+
+        Args:
+            error_message: Сообщение об ошибке
+
+        Returns:
+            int: Количество обновлённых задач
+        """
+        result = await self.session.execute(
+            update(GenerationJob)
+            .where(GenerationJob.status.not_in(FINISHED_JOB_STATUSES))
+            .values(
+                status="error",
+                error_message=error_message,
+                finished_at=datetime.now(timezone.utc),
+            )
+        )
+        await self.session.commit()
+        return result.rowcount or 0
@@ -4,18 +4,56 @@
 Реализует операции CRUD для модели GenerationResult.
 """
 
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, insert, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import Cursor
+from app.core.payloads import Blob, payload_blob_hashes, rehydrate_payload
 from app.db.models import GenerationResult
+from app.repositories.payload_blob import PayloadBlobRepository
 from app.logger import setup_logger
 
 # Логгер для модуля
 logger = setup_logger(__name__)
 
+# Колонки краткой записи истории (без JSONB входных данных и результата)
+SUMMARY_COLUMNS = (
+    GenerationResult.id,
+    GenerationResult.request_type,
+    GenerationResult.status,
+    GenerationResult.error_message,
+    GenerationResult.latency_ms,
+    GenerationResult.created_at,
+)
+
+
+def paginate(query: Select, limit: int, cursor: Optional[Cursor] = None) -> Select:
+    """
+    Страница выборки по ключу (created_at, id), новые записи первыми.
+    
+    В отличие от OFFSET, стоимость не зависит от номера страницы:
+    чтение начинается сразу с позиции курсора по индексу.
+    
+    Args:
+        query: Запрос к generation_results
+        limit: Максимальное количество записей
+        cursor: Позиция последней записи предыдущей страницы
+        
+    Returns:
+        Select: Запрос страницы
+    """
+    if cursor is not None:
+        query = query.where(
+            tuple_(GenerationResult.created_at, GenerationResult.id)
+            < tuple_(cursor.created_at, cursor.id)
+        )
+    return query.order_by(
+        GenerationResult.created_at.desc(), GenerationResult.id.desc()
+    ).limit(limit)
+
 
 class GenerationResultRepository:
     """
@@ -58,6 +96,8 @@ class GenerationResultRepository:
         response_payload: Optional[dict] = None,
         error_message: Optional[str] = None,
         latency_ms: Optional[int] = None,
+        request_hash: Optional[str] = None,
+        blobs: Iterable[Blob] = (),
     ) -> GenerationResult:
         """
         Создать запись о результате генерации.
@@ -70,14 +110,19 @@ class GenerationResultRepository:
             response_payload: Результат генерации
             error_message: Сообщение об ошибке
             latency_ms: Время выполнения в мс
+            request_hash: Хэш нормализованных входных текстов
+            blobs: Тексты, на которые ссылается request_payload
             
         Returns:
             GenerationResult: Созданная запись
         """
+        await PayloadBlobRepository(self.session).add_refs(blobs)
+        
         result = GenerationResult(
             user_id=user_id,
             request_type=request_type,
             request_payload=request_payload,
+            request_hash=request_hash,
             response_payload=response_payload,
             status=status,
             error_message=error_message,
@@ -101,11 +146,121 @@ class GenerationResultRepository:
         
         return result
     
+    async def get_request_payload(self, result_id: int) -> Optional[dict]:
+        """
+        Получить входные данные запроса с восстановленными текстами.
+        
+        Args:
+            result_id: Идентификатор результата
+            
+        Returns:
+            dict | None: Входные данные или None, если запись не найдена
+        """
+        result = await self.session.execute(
+            select(GenerationResult.request_payload).where(GenerationResult.id == result_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        
+        payload = row.request_payload
+        texts = await PayloadBlobRepository(self.session).get_texts(payload_blob_hashes(payload))
+        return rehydrate_payload(payload, texts)
+    
+    async def reserve_ids(self, count: int) -> list[int]:
+        """
+        Зарезервировать ID в последовательности таблицы.
+        
+        Позволяет вернуть ID записи клиенту до её фактической вставки.
+        
+        Args:
+            count: Количество ID
+            
+        Returns:
+            list[int]: Зарезервированные ID
+        """
+        result = await self.session.execute(
+            text(
+                "SELECT nextval(pg_get_serial_sequence('generation_results', 'id')) "
+                "FROM generate_series(1, :count)"
+            ),
+            {"count": count},
+        )
+        return [row[0] for row in result]
+    
+    async def create_many(self, rows: list[dict], blobs: Iterable[Blob] = ()) -> None:
+        """
+        Вставить несколько записей одним запросом.
+        
+        Args:
+            rows: Значения полей GenerationResult для каждой записи
+            blobs: Тексты, на которые ссылаются request_payload записей
+        """
+        if not rows:
+            return
+        
+        await PayloadBlobRepository(self.session).add_refs(blobs)
+        await self.session.execute(insert(GenerationResult), rows)
+        await self.session.commit()
+        
+        logger.info(
+            "Сохранены результаты генераций",
+            extra={"count": len(rows)}
+        )
+    
+    async def find_reusable(
+        self,
+        request_type: str,
+        request_hash: str,
+        result_id: Optional[int] = None,
+        max_age: Optional[float] = None
+    ) -> Optional[GenerationResult]:
+        """
+        Найти успешный результат, который можно использовать повторно.
+        
+        Если передан result_id, результат ищется по ID и используется,
+        только если он получен для тех же входных данных (совпадает хэш):
+        по чужому ID нельзя получить результат для других текстов.
+        Иначе возвращается последний успешный результат с этим хэшем.
+        
+        Args:
+            request_type: Тип запроса
+            request_hash: Хэш нормализованных входных текстов
+            result_id: ID результата (опционально)
+            max_age: Максимальный возраст результата в секундах (опционально)
+            
+        Returns:
+            GenerationResult | None: Найденный результат или None
+        """
+        query = select(GenerationResult).where(
+            GenerationResult.request_type == request_type,
+            GenerationResult.request_hash == request_hash,
+            GenerationResult.status == "success",
+        )
+        if result_id is not None:
+            query = query.where(GenerationResult.id == result_id)
+        if max_age is not None:
+            query = query.where(
+                GenerationResult.created_at >= datetime.now(timezone.utc) - timedelta(seconds=max_age)
+            )
+        
+        result = await self.session.execute(
+            query.order_by(GenerationResult.created_at.desc()).limit(1)
+        )
+        found = result.scalar_one_or_none()
+        
+        # Воркер мог вернуть ответ с ошибкой, такой результат не переиспользуем
+        if found is None or not found.response_payload:
+            return None
+        if found.response_payload.get("status") != "success":
+            return None
+        return found
+    
     async def get_by_user_id(
         self,
         user_id: int,
         limit: int = 100,
-        offset: int = 0
+        cursor: Optional[Cursor] = None
     ) -> list[GenerationResult]:
         """
         Получить результаты генераций пользователя.
@@ -113,25 +268,54 @@ class GenerationResultRepository:
         Args:
             user_id: ID пользователя
             limit: Максимальное количество записей
-            offset: Смещение для пагинации
+            cursor: Позиция последней записи предыдущей страницы
             
         Returns:
             list[GenerationResult]: Список результатов генераций
         """
         result = await self.session.execute(
-            select(GenerationResult)
-            .where(GenerationResult.user_id == user_id)
-            .order_by(GenerationResult.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            paginate(
+                select(GenerationResult).where(GenerationResult.user_id == user_id),
+                limit,
+                cursor,
+            )
         )
         return list(result.scalars().all())
     
+    async def get_summaries_by_user(
+        self,
+        user_id: int,
+        request_type: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> list[Row]:
+        """
+        Получить краткие записи истории генераций пользователя.
+        
+        Выбираются только колонки SUMMARY_COLUMNS: входные данные
+        и результаты не читаются из БД.
+        
+        Args:
+            user_id: ID пользователя
+            request_type: Тип запроса (опционально)
+            limit: Максимальное количество записей
+            cursor: Позиция последней записи предыдущей страницы
+            
+        Returns:
+            list[Row]: Строки с полями SUMMARY_COLUMNS
+        """
+        query = select(*SUMMARY_COLUMNS).where(GenerationResult.user_id == user_id)
+        if request_type is not None:
+            query = query.where(GenerationResult.request_type == request_type)
+        
+        result = await self.session.execute(paginate(query, limit, cursor))
+        return list(result.all())
+    
     async def get_by_request_type(
         self,
         request_type: str,
         limit: int = 100,
-        offset: int = 0
+        cursor: Optional[Cursor] = None
     ) -> list[GenerationResult]:
         """
         Получить результаты генераций по типу запроса.
@@ -139,17 +323,17 @@ class GenerationResultRepository:
         Args:
             request_type: Тип запроса
             limit: Максимальное количество записей
-            offset: Смещение для пагинации
+            cursor: Позиция последней записи предыдущей страницы
             
         Returns:
             list[GenerationResult]: Список результатов генераций
         """
         result = await self.session.execute(
-            select(GenerationResult)
-            .where(GenerationResult.request_type == request_type)
-            .order_by(GenerationResult.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            paginate(
+                select(GenerationResult).where(GenerationResult.request_type == request_type),
+                limit,
+                cursor,
+            )
         )
         return list(result.scalars().all())
     
@@ -158,7 +342,7 @@ class GenerationResultRepository:
         user_id: int,
         request_type: str,
         limit: int = 100,
-        offset: int = 0
+        cursor: Optional[Cursor] = None
     ) -> list[GenerationResult]:
         """
         Получить результаты генераций пользователя по типу запроса.
@@ -167,20 +351,20 @@ class GenerationResultRepository:
             user_id: ID пользователя
             request_type: Тип запроса
             limit: Максимальное количество записей
-            offset: Смещение для пагинации
+            cursor: Позиция последней записи предыдущей страницы
             
         Returns:
             list[GenerationResult]: Список результатов генераций
         """
         result = await self.session.execute(
-            select(GenerationResult)
-            .where(
-                GenerationResult.user_id == user_id,
-                GenerationResult.request_type == request_type
+            paginate(
+                select(GenerationResult).where(
+                    GenerationResult.user_id == user_id,
+                    GenerationResult.request_type == request_type
+                ),
+                limit,
+                cursor,
             )
-            .order_by(GenerationResult.created_at.desc())
-            .limit(limit)
-            .offset(offset)
         )
         return list(result.scalars().all())
     
@@ -0,0 +1,133 @@
+"""
+Репозиторий для обслуживания секций generation_results.
+
+Создаёт месячные секции заранее, удаляет и архивирует старые секции.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.payloads import BLOB_REF_KEY
+from app.db.partitions import (
+    PARTITIONED_TABLE,
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+)
+from app.repositories.payload_blob import PayloadBlobRepository
+from app.logger import setup_logger
+
+# Логгер для модуля
+logger = setup_logger(__name__)
+
+
+class GenerationResultPartitionRepository:
+    """
+    Репозиторий для обслуживания секций generation_results.
+    
+    Имена секций берутся только из каталога PostgreSQL (list_partitions)
+    или строятся app.db.partitions, поэтому подставляются в DDL напрямую.
+    """
+    
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация репозитория.
+        
+        Args:
+            session: Async сессия SQLAlchemy
+        """
+        self.session = session
+    
+    async def is_partitioned(self) -> bool:
+        """Проверить, что generation_results — секционированная таблица."""
+        result = await self.session.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": PARTITIONED_TABLE},
+        )
+        return result.scalar_one_or_none() == "p"
+    
+    async def list_partitions(self) -> list[str]:
+        """
+        Получить имена секций generation_results.
+        
+        Returns:
+            list[str]: Имена секций (включая секцию по умолчанию)
+        """
+        result = await self.session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = to_regclass(:table) "
+                "ORDER BY child.relname"
+            ),
+            {"table": PARTITIONED_TABLE},
+        )
+        return [row[0] for row in result]
+    
+    async def ensure_partitions(self, first_month: datetime, count: int) -> None:
+        """
+        Создать недостающие месячные секции и секцию по умолчанию.
+        
+        Args:
+            first_month: Начало первого месяца
+            count: Количество месяцев начиная с first_month
+        """
+        await self.session.execute(text(create_default_partition_sql()))
+        for offset in range(count):
+            await self.session.execute(text(create_partition_sql(add_months(first_month, offset))))
+        await self.session.commit()
+    
+    async def drop_partition(self, name: str) -> int:
+        """
+        Удалить секцию вместе с записями.
+        
+        Ссылки записей секции на payload_blobs освобождаются
+        в той же транзакции.
+        
+        Args:
+            name: Имя секции
+            
+        Returns:
+            int: Количество удалённых текстов payload_blobs
+        """
+        result = await self.session.execute(
+            text(
+                f"SELECT ref.value ->> '{BLOB_REF_KEY}' FROM {name}, "
+                "jsonb_each(request_payload) AS ref "
+                f"WHERE jsonb_typeof(ref.value) = 'object' AND ref.value ? '{BLOB_REF_KEY}'"
+            )
+        )
+        released = await PayloadBlobRepository(self.session).release(row[0] for row in result)
+        
+        await self.session.execute(text(f"ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION {name}"))
+        await self.session.execute(text(f"DROP TABLE {name}"))
+        await self.session.commit()
+        
+        logger.info(
+            "Удалена секция результатов генераций",
+            extra={"partition": name, "released_blobs": released},
+        )
+        return released
+    
+    async def archive_partition(self, name: str, schema: str) -> None:
+        """
+        Отсоединить секцию и перенести её в схему архива.
+        
+        Записи остаются доступны в {schema}.{name}, ссылки на payload_blobs
+        сохраняются.
+        
+        Args:
+            name: Имя секции
+            schema: Схема архива
+        """
+        await self.session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+        await self.session.execute(text(f"ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION {name}"))
+        await self.session.execute(text(f"ALTER TABLE {name} SET SCHEMA {schema}"))
+        await self.session.commit()
+        
+        logger.info(
+            "Секция результатов генераций перенесена в архив",
+            extra={"partition": name, "schema": schema},
+        )
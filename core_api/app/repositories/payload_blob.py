@@ -0,0 +1,120 @@
+"""
+Репозиторий для работы со сжатыми текстами входных данных.
+
+Реализует запись с подсчётом ссылок, чтение и освобождение записей PayloadBlob.
+"""
+
+from typing import Iterable
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.payloads import Blob, decompress_text
+from app.db.models import PayloadBlob
+from app.logger import setup_logger
+
+# Логгер для модуля
+logger = setup_logger(__name__)
+
+
+class PayloadBlobRepository:
+    """
+    Репозиторий для работы со сжатыми текстами входных данных.
+
+    add_refs и release не фиксируют транзакцию: они вызываются в транзакции
+    записи или удаления результатов генераций, чтобы счётчик ссылок
+    менялся вместе с ними.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация репозитория.
+
+        Args:
+            session: Async сессия SQLAlchemy
+        """
+        self.session = session
+
+    async def add_refs(self, blobs: Iterable[Blob]) -> None:
+        """
+        Сохранить тексты и увеличить их счётчики ссылок.
+
+        Args:
+            blobs: Тексты для записи (повторы одного хэша суммируются)
+        """
+        # Повтор хэша в одном INSERT ... ON CONFLICT недопустим — суммируем ссылки
+        unique: dict[str, dict] = {}
+        for blob in blobs:
+            if blob.hash in unique:
+                unique[blob.hash]["ref_count"] += blob.refs
+            else:
+                unique[blob.hash] = {
+                    "hash": blob.hash,
+                    "data": blob.data,
+                    "size": blob.size,
+                    "ref_count": blob.refs,
+                }
+        if not unique:
+            return
+
+        stmt = insert(PayloadBlob).values(list(unique.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PayloadBlob.hash],
+            set_={"ref_count": PayloadBlob.ref_count + stmt.excluded.ref_count},
+        )
+        await self.session.execute(stmt)
+
+    async def get_texts(self, hashes: Iterable[str]) -> dict[str, str]:
+        """
+        Получить исходные тексты по хэшам.
+
+        Args:
+            hashes: Хэши текстов
+
+        Returns:
+            dict[str, str]: Найденные тексты {hash: текст}
+        """
+        hashes = set(hashes)
+        if not hashes:
+            return {}
+
+        result = await self.session.execute(
+            select(PayloadBlob.hash, PayloadBlob.data).where(PayloadBlob.hash.in_(hashes))
+        )
+        return {row.hash: decompress_text(row.data) for row in result}
+
+    async def release(self, hashes: Iterable[str]) -> int:
+        """
+        Уменьшить счётчики ссылок и удалить тексты, на которые больше нет ссылок.
+
+        Args:
+            hashes: Хэши текстов удаляемых записей (с повторами)
+
+        Returns:
+            int: Количество удалённых текстов
+        """
+        counts: dict[str, int] = {}
+        for blob_hash in hashes:
+            counts[blob_hash] = counts.get(blob_hash, 0) + 1
+        if not counts:
+            return 0
+
+        for blob_hash, count in counts.items():
+            await self.session.execute(
+                update(PayloadBlob)
+                .where(PayloadBlob.hash == blob_hash)
+                .values(ref_count=PayloadBlob.ref_count - count)
+            )
+
+        result = await self.session.execute(
+            delete(PayloadBlob).where(
+                PayloadBlob.hash.in_(list(counts)),
+                PayloadBlob.ref_count <= 0,
+            )
+        )
+        logger.debug(
+            "Освобождены тексты входных данных",
+            extra={"released": len(counts), "deleted": result.rowcount},
+        )
+        return result.rowcount
@@ -0,0 +1,97 @@
+"""
+Репозиторий для работы с вердиктами LLM по парам навыков.
+
+Реализует пакетное чтение и запись записей SkillRelevanceMemo.
+"""
+
+from sqlalchemy import tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import SkillRelevanceMemo
+from app.logger import setup_logger
+
+# Логгер для модуля
+logger = setup_logger(__name__)
+
+
+class SkillRelevanceMemoRepository:
+    """
+    Репозиторий для работы с вердиктами LLM по парам навыков.
+
+    Найденные вердикты учитываются в счётчике hits.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация репозитория.
+
+        Args:
+            session: Async сессия SQLAlchemy
+        """
+        self.session = session
+
+    async def get_many(
+        self, prompt_version: str, pairs: list[tuple[str, str]]
+    ) -> list[SkillRelevanceMemo]:
+        """
+        Получить вердикты для пар навыков и увеличить их счётчик использований.
+
+        Args:
+            prompt_version: Версия промпта
+            pairs: Пары (навык вакансии, навык резюме)
+
+        Returns:
+            list[SkillRelevanceMemo]: Найденные вердикты
+        """
+        if not pairs:
+            return []
+
+        result = await self.session.execute(
+            update(SkillRelevanceMemo)
+            .where(
+                SkillRelevanceMemo.prompt_version == prompt_version,
+                tuple_(SkillRelevanceMemo.vacancy_skill, SkillRelevanceMemo.resume_skill).in_(pairs),
+            )
+            .values(hits=SkillRelevanceMemo.hits + 1)
+            .returning(SkillRelevanceMemo)
+            .execution_options(synchronize_session=False)
+        )
+        memos = list(result.scalars().all())
+        await self.session.commit()
+        return memos
+
+    async def set_many(self, prompt_version: str, verdicts: list[dict]) -> None:
+        """
+        Сохранить вердикты (перезаписывает существующие).
+
+        Args:
+            prompt_version: Версия промпта
+            verdicts: Вердикты {"vacancy_skill", "resume_skill", "relevance", "reason"}
+        """
+        # Повтор пары в одном INSERT ... ON CONFLICT недопустим — оставляем последний вердикт
+        unique = {
+            (verdict["vacancy_skill"], verdict["resume_skill"]): verdict
+            for verdict in verdicts
+        }
+        if not unique:
+            return
+
+        stmt = insert(SkillRelevanceMemo).values(
+            [{"prompt_version": prompt_version, **verdict} for verdict in unique.values()]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                SkillRelevanceMemo.prompt_version,
+                SkillRelevanceMemo.vacancy_skill,
+                SkillRelevanceMemo.resume_skill,
+            ],
+            set_={"relevance": stmt.excluded.relevance, "reason": stmt.excluded.reason},
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+        logger.debug(
+            "Сохранены вердикты по парам навыков",
+            extra={"prompt_version": prompt_version, "count": len(verdicts)},
+        )
@@ -6,7 +6,8 @@
 
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import User
@@ -96,46 +97,49 @@ class UserRepository:
         
         return user
     
-    async def get_or_create_by_email(
+    async def upsert_by_email(
         self,
         email: str,
         full_name: str
-    ) -> tuple[User, bool]:
+    ) -> tuple[int, bool]:
         """
-        Получить существующего пользователя или создать нового.
+        Получить ID пользователя по email, создав его при отсутствии.
         
-        Ищет пользователя по email.
-        Если не найден - создаёт нового с переданными данными.
+        Один запрос INSERT ... ON CONFLICT (email) DO UPDATE ... RETURNING:
+        одновременные первые запросы одного пользователя не конфликтуют
+        по уникальному email. Для существующего пользователя обновляется имя.
         
         Args:
             email: Email пользователя (уникальный)
             full_name: Полное имя пользователя
             
         Returns:
-            tuple[User, bool]: Кортеж (пользователь, был_ли_создан)
-                - User: найденный или созданный пользователь
-                - bool: True если пользователь был создан, False если найден
+            tuple[int, bool]: Кортеж (ID пользователя, был_ли_создан)
         """
-        # Пытаемся найти существующего пользователя
-        user = await self.get_by_email(email)
+        stmt = insert(User).values(email=email, full_name=full_name)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.email],
+            set_={"full_name": stmt.excluded.full_name, "updated_at": func.now()},
+        ).returning(
+            User.id,
+            # xmax = 0 только у строки, вставленной этим запросом
+            (literal_column("xmax") == 0).label("created"),
+        )
+        
+        result = await self.session.execute(stmt)
+        row = result.one()
+        await self.session.commit()
         
-        if user is not None:
-            logger.debug(
-                "Найден существующий пользователь",
+        if row.created:
+            logger.info(
+                "Создан новый пользователь",
                 extra={
-                    "user_id": user.id,
+                    "user_id": row.id,
                     "email": email
                 }
             )
-            return user, False
-        
-        # Создаём нового пользователя
-        user = await self.create(
-            email=email,
-            full_name=full_name
-        )
         
-        return user, True
+        return row.id, row.created
     
     async def update(
         self,
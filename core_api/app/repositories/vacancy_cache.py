@@ -0,0 +1,103 @@
+"""
+Репозиторий для работы с кэшем разбора вакансий.
+
+Реализует чтение, запись и очистку записей VacancyCacheEntry.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import VacancyCacheEntry
+from app.logger import setup_logger
+
+# Логгер для модуля
+logger = setup_logger(__name__)
+
+
+class VacancyCacheRepository:
+    """
+    Репозиторий для работы с кэшем разбора вакансий.
+
+    Просроченные записи не возвращаются и удаляются методом delete_expired.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация репозитория.
+
+        Args:
+            session: Async сессия SQLAlchemy
+        """
+        self.session = session
+
+    async def get(self, key: str) -> Optional[dict]:
+        """
+        Получить значение по ключу.
+
+        Args:
+            key: Ключ записи
+
+        Returns:
+            dict | None: Сохранённое значение или None, если записи нет или она просрочена
+        """
+        now = datetime.now(timezone.utc)
+        result = await self.session.execute(
+            select(VacancyCacheEntry.value).where(
+                VacancyCacheEntry.key == key,
+                or_(
+                    VacancyCacheEntry.expires_at.is_(None),
+                    VacancyCacheEntry.expires_at > now,
+                ),
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def set(
+        self, key: str, value: dict, ttl_seconds: Optional[int] = None
+    ) -> None:
+        """
+        Сохранить значение по ключу (перезаписывает существующее).
+
+        Args:
+            key: Ключ записи
+            value: Сохраняемое значение
+            ttl_seconds: Время жизни записи в секундах (None — бессрочно)
+        """
+        expires_at = (
+            datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+            if ttl_seconds
+            else None
+        )
+        stmt = insert(VacancyCacheEntry).values(
+            key=key, value=value, expires_at=expires_at
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VacancyCacheEntry.key],
+            set_={"value": stmt.excluded.value, "expires_at": stmt.excluded.expires_at},
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+        logger.debug(
+            "Сохранена запись кэша вакансии",
+            extra={"key": key, "ttl_seconds": ttl_seconds},
+        )
+
+    async def delete_expired(self) -> int:
+        """
+        Удалить просроченные записи.
+
+        Returns:
+            int: Количество удалённых записей
+        """
+        result = await self.session.execute(
+            delete(VacancyCacheEntry).where(
+                VacancyCacheEntry.expires_at <= datetime.now(timezone.utc)
+            )
+        )
+        await self.session.commit()
+        return result.rowcount or 0
@@ -0,0 +1,137 @@
+"""Проверка сессий пользователей через auth service."""
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import httpx
+
+from app.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class AuthClient:
+    """
+    Клиент auth service с кэшем проверенных сессий.
+    
+    Запросы к /me идут через один пул keep-alive соединений. Результат
+    проверки кэшируется по sid: действительная сессия — на cache_ttl,
+    недействительная (401) — на negative_ttl. Повторный запрос с тем же
+    sid в пределах TTL обслуживается из памяти без обращения к сети.
+    Кэш ограничен max_size записями (вытесняются давно не используемые).
+    
+    Ошибки auth service (сеть, 5xx) не кэшируются.
+    """
+    
+    def __init__(
+        self,
+        base_url: str,
+        cookie_name: str = "sid",
+        timeout: float = 5.0,
+        max_connections: int = 50,
+        cache_ttl: float = 60.0,
+        negative_ttl: float = 10.0,
+        max_size: int = 10000
+    ):
+        """
+        Инициализация клиента.
+        
+        Args:
+            base_url: URL auth service
+            cookie_name: Имя cookie с session ID
+            timeout: Таймаут запроса (секунды)
+            max_connections: Максимум соединений в пуле
+            cache_ttl: Время жизни действительной сессии в кэше (секунды)
+            negative_ttl: Время жизни недействительной сессии в кэше (секунды)
+            max_size: Максимальное количество сессий в кэше
+        """
+        self.base_url = base_url.rstrip("/")
+        self.cookie_name = cookie_name
+        self.cache_ttl = cache_ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        # sid -> (момент истечения, данные пользователя или None для 401)
+        self._cache: "OrderedDict[str, Tuple[float, Optional[dict]]]" = OrderedDict()
+    
+    async def close(self) -> None:
+        """Закрыть пул соединений и очистить кэш."""
+        self._cache.clear()
+        await self._client.aclose()
+    
+    def invalidate(self, sid: str) -> None:
+        """
+        Удалить сессию из кэша (например, после выхода пользователя).
+        
+        Args:
+            sid: Session ID
+        """
+        self._cache.pop(sid, None)
+    
+    def _get_cached(self, sid: str) -> Tuple[bool, Optional[dict]]:
+        """Вернуть (найдено, данные пользователя) из кэша."""
+        entry = self._cache.get(sid)
+        if entry is None:
+            return False, None
+        
+        expires_at, user_info = entry
+        if expires_at <= time.monotonic():
+            del self._cache[sid]
+            return False, None
+        
+        self._cache.move_to_end(sid)
+        return True, user_info
+    
+    def _put(self, sid: str, user_info: Optional[dict], ttl: float) -> None:
+        """Сохранить результат проверки в кэше."""
+        if ttl <= 0:
+            return
+        self._cache[sid] = (time.monotonic() + ttl, user_info)
+        self._cache.move_to_end(sid)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+    
+    async def get_user(self, sid: str) -> Optional[dict]:
+        """
+        Проверить сессию и получить данные пользователя.
+        
+        Args:
+            sid: Session ID из cookie
+            
+        Returns:
+            Optional[dict]: Данные пользователя или None, если сессия недействительна
+            
+        Raises:
+            httpx.HTTPError: Если auth service недоступен или вернул ошибку
+        """
+        found, user_info = self._get_cached(sid)
+        if found:
+            return user_info
+        
+        # Cookie передаётся заголовком: cookie-jar общего клиента
+        # не должен переносить сессию одного пользователя в запросы другого
+        response = await self._client.get(
+            f"{self.base_url}/me",
+            headers={"Cookie": f"{self.cookie_name}={sid}"}
+        )
+        
+        if response.status_code == 401:
+            self._put(sid, None, self.negative_ttl)
+            return None
+        
+        response.raise_for_status()
+        user_info = response.json()
+        self._put(sid, user_info, self.cache_ttl)
+        
+        logger.info(
+            "Успешная проверка авторизации",
+            extra={"user": user_info.get("preferred_username", user_info.get("sub"))}
+        )
+        return user_info
@@ -1,26 +1,145 @@
 """Сервис для генерации через RabbitMQ."""
-from typing import Any, Dict
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
+from app.core.hashing import compute_evaluation_hash, compute_request_hash
+from app.core.single_flight import SingleFlight
+from app.db.models import GenerationResult
 from app.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
 class GenerationService:
-    """Сервис генерации контента через очереди RabbitMQ."""
+    """
+    Сервис генерации контента через очереди RabbitMQ.
     
-    def __init__(self, rabbit_client):
+    Оценка резюме для тех же текстов (с точностью до пробелов) и той же
+    версии пайплайна не выполняется повторно в течение cache_ttl:
+    find_cached_evaluation возвращает сохранённый результат.
+    
+    Одинаковые одновременные запросы (оценка, описание вакансии, вопросы)
+    объединяются через общий SingleFlight: воркеру отправляется одно
+    сообщение, результат получают все ожидающие.
+    """
+    
+    def __init__(
+        self,
+        rabbit_client,
+        logging_service=None,
+        pipeline_version: str = "1",
+        cache_ttl: float = 0,
+        single_flight: Optional[SingleFlight] = None
+    ):
         """
         Инициализация сервиса.
         
         Args:
             rabbit_client: Клиент RabbitMQ для отправки сообщений
+            logging_service: Сервис логирования для поиска сохранённых оценок (опционально)
+            pipeline_version: Версия пайплайна оценки резюме
+            cache_ttl: Время повторного использования оценки (секунды, 0 — не использовать)
+            single_flight: Группа объединения одинаковых запросов (None — без объединения)
         """
         self.rabbit_client = rabbit_client
+        self.logging_service = logging_service
+        self.pipeline_version = pipeline_version
+        self.cache_ttl = cache_ttl
+        self.single_flight = single_flight
+    
+    def evaluation_hash(self, vacancy_text: str, resume_text: str) -> str:
+        """
+        Хэш оценки резюме (нормализованные тексты и версия пайплайна).
+        
+        Args:
+            vacancy_text: Текст вакансии
+            resume_text: Текст резюме
+            
+        Returns:
+            str: sha256 в шестнадцатеричном виде
+        """
+        return compute_evaluation_hash(vacancy_text, resume_text, self.pipeline_version)
+    
+    def coalescing_key(self, queue_name: str, payload: Dict[str, Any]) -> str:
+        """
+        Ключ объединения запроса к воркеру: очередь и хэш значимых входных данных.
+        
+        Служебные поля запроса (evaluation_id, force_refresh и т.п.)
+        в ключ не входят.
+        
+        Args:
+            queue_name: Имя очереди воркера
+            payload: Сообщение воркеру
+            
+        Returns:
+            str: Ключ вида "<очередь>:<sha256>"
+        """
+        if queue_name == "resume_evaluation_task":
+            # Режимы strict и partial дают разные ответы при неуспехе блока
+            request_hash = "{}:{}".format(
+                self.evaluation_hash(payload["vacancy_text"], payload["resume_text"]),
+                payload.get("mode") or "strict"
+            )
+        elif queue_name == "question_generation_task":
+            request_hash = compute_request_hash(
+                payload["vacancy_text"],
+                payload["resume_text"],
+                json.dumps(payload["report"], ensure_ascii=False, sort_keys=True)
+            )
+        else:
+            request_hash = compute_request_hash(payload["input_data"])
+        return f"{queue_name}:{request_hash}"
+    
+    async def _call(self, queue_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Отправить запрос воркеру, присоединяясь к такому же выполняющемуся."""
+        if self.single_flight is None:
+            return await self.rabbit_client.call(payload, queue_name=queue_name)
+        
+        return await self.single_flight.do(
+            self.coalescing_key(queue_name, payload),
+            lambda: self.rabbit_client.call(payload, queue_name=queue_name)
+        )
+    
+    async def find_cached_evaluation(
+        self,
+        request_hash: str,
+        evaluation_id: Optional[int] = None
+    ) -> Optional[GenerationResult]:
+        """
+        Найти сохранённую успешную оценку резюме.
+        
+        По явной ссылке (evaluation_id) оценка возвращается без учёта
+        возраста, иначе — только не старше cache_ttl.
+        
+        Args:
+            request_hash: Хэш оценки (evaluation_hash)
+            evaluation_id: ID ранее выполненной оценки (опционально)
+            
+        Returns:
+            GenerationResult | None: Сохранённая оценка или None
+        """
+        if self.logging_service is None:
+            return None
+        if evaluation_id is None and self.cache_ttl <= 0:
+            return None
+        
+        evaluation = await self.logging_service.find_reusable_result(
+            "resume_evaluation",
+            request_hash,
+            evaluation_id,
+            max_age=None if evaluation_id is not None else self.cache_ttl
+        )
+        if evaluation is not None:
+            logger.debug(
+                "Найдена сохранённая оценка резюме",
+                extra={"evaluation_id": evaluation.id}
+            )
+        return evaluation
     
     async def evaluate_resume(
         self,
         vacancy_text: str,
-        resume_text: str
+        resume_text: str,
+        mode: str = "strict"
     ) -> Dict[str, Any]:
         """
         Оценить соответствие резюме вакансии.
@@ -28,6 +147,8 @@ class GenerationService:
         Args:
             vacancy_text: Текст вакансии
             resume_text: Текст резюме
+            mode: Режим оценки (strict — неуспех блока прерывает оценку,
+                partial — ответ со status="partial" и выполненными блоками)
             
         Returns:
             Dict[str, Any]: Результат оценки
@@ -40,14 +161,49 @@ class GenerationService:
             }
         )
         
-        result = await self.rabbit_client.call(
-            {"vacancy_text": vacancy_text, "resume_text": resume_text},
-            queue_name="resume_evaluation_task"
+        result = await self._call(
+            "resume_evaluation_task",
+            {"vacancy_text": vacancy_text, "resume_text": resume_text, "mode": mode}
         )
         
         logger.debug("Получен результат оценки резюме")
         return result
     
+    async def evaluate_resume_batch(
+        self,
+        vacancy_text: str,
+        resumes: List[Dict[str, Any]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Оценить несколько резюме по одной вакансии.
+        
+        Вакансия разбирается воркером один раз, результаты по резюме
+        возвращаются по мере готовности.
+        
+        Args:
+            vacancy_text: Текст вакансии
+            resumes: Резюме в формате [{"id": ..., "resume_text": ...}]
+            
+        Yields:
+            Dict[str, Any]: Результат по очередному резюме (type="item")
+                или итог пакета (type="done")
+        """
+        logger.debug(
+            "Отправка пакетного запроса на оценку резюме",
+            extra={
+                "vacancy_length": len(vacancy_text),
+                "resumes_count": len(resumes)
+            }
+        )
+        
+        async for message in self.rabbit_client.stream(
+            {"type": "batch", "vacancy_text": vacancy_text, "resumes": resumes},
+            queue_name="resume_evaluation_task"
+        ):
+            yield message
+        
+        logger.debug("Получены все результаты пакетной оценки резюме")
+    
     async def generate_job_description(
         self,
         input_data: str
@@ -66,9 +222,9 @@ class GenerationService:
             extra={"input_length": len(input_data)}
         )
         
-        result = await self.rabbit_client.call(
-            {"input_data": input_data},
-            queue_name="job_description_task"
+        result = await self._call(
+            "job_description_task",
+            {"input_data": input_data}
         )
         
         logger.debug("Получен результат генерации описания вакансии")
@@ -99,13 +255,13 @@ class GenerationService:
             }
         )
         
-        result = await self.rabbit_client.call(
+        result = await self._call(
+            "question_generation_task",
             {
                 "vacancy_text": vacancy_text,
                 "resume_text": resume_text,
                 "report": evaluation_report
-            },
-            queue_name="question_generation_task"
+            }
         )
         
         logger.debug("Получен результат генерации вопросов")
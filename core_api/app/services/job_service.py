@@ -0,0 +1,350 @@
+"""Сервис асинхронных задач генерации."""
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.single_flight import SingleFlight
+from app.db import SessionFactory
+from app.db.models import GenerationJob
+from app.repositories import GenerationJobRepository
+from app.services.generation_service import GenerationService
+from app.services.logging_service import LoggingService
+from app.services.result_writer import ResultWriter
+from app.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Поддерживаемые типы задач
+JOB_REQUEST_TYPES = ("resume_evaluation", "question_generation", "job_description")
+
+
+class JobService:
+    """
+    Сервис асинхронных задач генерации.
+
+    Создаёт задачу в таблице generation_jobs и выполняет запросы к воркерам
+    в фоновой asyncio-задаче, не удерживая HTTP соединение клиента.
+    Воркеры присылают сообщения type="progress" после каждого этапа
+    пайплайна, по ним обновляются stage и progress задачи.
+
+    Одинаковые одновременные шаги разных задач (тот же запрос к той же
+    очереди) выполняются воркером один раз: прогресс и итог шага
+    получают все присоединившиеся задачи.
+
+    Сервис создаётся один раз при запуске приложения: каждое обращение
+    к БД выполняется в отдельной короткой сессии.
+    """
+
+    def __init__(
+        self,
+        rabbit_client,
+        session_factory: SessionFactory,
+        result_writer: Optional[ResultWriter] = None,
+        single_flight: Optional[SingleFlight] = None
+    ):
+        """
+        Инициализация сервиса.
+
+        Args:
+            rabbit_client: Клиент RabbitMQ для отправки сообщений
+            session_factory: Фабрика сессий БД
+            result_writer: Фоновая запись результатов (None — запись сразу)
+            single_flight: Группа объединения одинаковых запросов (None — без объединения)
+        """
+        self.rabbit_client = rabbit_client
+        self.session_factory = session_factory
+        self.logging_service = LoggingService(session_factory, result_writer)
+        self.generation_service = GenerationService(
+            rabbit_client,
+            self.logging_service,
+            pipeline_version=settings.resume_evaluation_pipeline_version,
+            cache_ttl=settings.evaluation_cache_ttl,
+            single_flight=single_flight,
+        )
+        self.single_flight = single_flight
+        self.tasks: Dict[str, asyncio.Task] = {}
+        # Задачи, ожидающие шаг: ключ шага → {job_id: (progress_from, progress_to)}
+        self._step_watchers: Dict[str, Dict[str, Tuple[int, int]]] = {}
+
+    async def submit(
+        self,
+        request_type: str,
+        request_payload: Dict[str, Any],
+        user_id: Optional[int] = None
+    ) -> GenerationJob:
+        """
+        Создать задачу и запустить её выполнение в фоне.
+
+        Args:
+            request_type: Тип задачи (resume_evaluation, question_generation, job_description)
+            request_payload: Входные данные запроса
+            user_id: ID пользователя (опционально)
+
+        Returns:
+            GenerationJob: Созданная задача в статусе queued
+
+        Raises:
+            ValueError: Если тип задачи не поддерживается
+        """
+        if request_type not in JOB_REQUEST_TYPES:
+            raise ValueError(f"Неподдерживаемый тип задачи: {request_type}")
+
+        async with self.session_factory() as session:
+            job = await GenerationJobRepository(session).create(
+                request_type=request_type,
+                user_id=user_id,
+                request_payload=request_payload,
+            )
+
+        task = asyncio.create_task(
+            self._run(job.id, request_type, request_payload, user_id)
+        )
+        self.tasks[job.id] = task
+        task.add_done_callback(lambda _: self.tasks.pop(job.id, None))
+
+        return job
+
+    async def get_job(self, job_id: str) -> Optional[GenerationJob]:
+        """
+        Получить задачу по ID.
+
+        Args:
+            job_id: Идентификатор задачи
+
+        Returns:
+            GenerationJob | None: Найденная задача или None
+        """
+        async with self.session_factory() as session:
+            return await GenerationJobRepository(session).get_by_id(job_id)
+
+    async def close(self) -> None:
+        """
+        Остановить выполняющиеся задачи.
+
+        Задачи этого процесса переводятся в статус error: после
+        перезапуска сервиса их выполнение не продолжится.
+        """
+        job_ids = list(self.tasks)
+        for task in list(self.tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+
+        for job_id in job_ids:
+            try:
+                await self._update(
+                    job_id,
+                    status="error",
+                    error_message="Задача прервана остановкой сервиса"
+                )
+            except Exception as e:
+                logger.error(
+                    "Ошибка при завершении задачи",
+                    extra={"job_id": job_id, "error": str(e)}
+                )
+
+    async def _update(self, job_id: str, **values: Any) -> None:
+        """Обновить поля задачи в отдельной сессии."""
+        async with self.session_factory() as session:
+            await GenerationJobRepository(session).update(job_id, **values)
+
+    async def _find_evaluation(self, request_payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Найти ранее выполненную оценку резюме: по ссылке из запроса
+        (evaluation_id или request_hash) или недавнюю оценку тех же текстов.
+
+        Returns:
+            Optional[Dict[str, Any]]: Отчёт об оценке или None
+        """
+        if request_payload.get("force_refresh"):
+            return None
+
+        request_hash = self.generation_service.evaluation_hash(
+            request_payload["vacancy_text"], request_payload["resume_text"]
+        )
+        # Оценка должна относиться к тем же текстам вакансии и резюме
+        if request_payload.get("request_hash") not in (None, request_hash):
+            return None
+
+        evaluation = await self.generation_service.find_cached_evaluation(
+            request_hash, request_payload.get("evaluation_id")
+        )
+        return evaluation.response_payload if evaluation else None
+
+    async def _run_step(
+        self,
+        job_id: str,
+        queue_name: str,
+        payload: Dict[str, Any],
+        progress_from: int = 0,
+        progress_to: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Отправить запрос воркеру и обновлять прогресс задачи до получения итога.
+
+        Прогресс воркера (0-100) пересчитывается в диапазон
+        [progress_from, progress_to], если задача состоит из нескольких шагов.
+        Если такой же шаг уже выполняется для другой задачи, задача
+        присоединяется к нему.
+
+        Returns:
+            Dict[str, Any]: Итоговый ответ воркера
+        """
+        # Ключ отличается от ключа синхронных запросов: ответы потока и call не совпадают
+        key = "stream:" + self.generation_service.coalescing_key(queue_name, payload)
+        watchers = self._step_watchers.setdefault(key, {})
+        watchers[job_id] = (progress_from, progress_to)
+
+        try:
+            if self.single_flight is None:
+                return await self._stream_step(key, queue_name, payload)
+            return await self.single_flight.do(
+                key, lambda: self._stream_step(key, queue_name, payload)
+            )
+        finally:
+            watchers.pop(job_id, None)
+            if not watchers and self._step_watchers.get(key) is watchers:
+                del self._step_watchers[key]
+
+    async def _stream_step(
+        self,
+        key: str,
+        queue_name: str,
+        payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Выполнить шаг у воркера, передавая прогресс всем ожидающим задачам."""
+        result = None
+        async for message in self.rabbit_client.stream(
+            {**payload, "report_progress": True},
+            queue_name=queue_name
+        ):
+            message_type = message.pop("type", None)
+            if message_type == "progress":
+                worker_progress = int(message.get("progress", 0))
+                watchers = list(self._step_watchers.get(key, {}).items())
+                for job_id, (progress_from, progress_to) in watchers:
+                    progress = progress_from + (progress_to - progress_from) * worker_progress // 100
+                    await self._update(job_id, stage=message.get("stage"), progress=progress)
+            elif message_type == "done":
+                result = message
+
+        if result is None:
+            raise RuntimeError("Воркер не прислал итоговый ответ")
+        return result
+
+    async def _run(
+        self,
+        job_id: str,
+        request_type: str,
+        request_payload: Dict[str, Any],
+        user_id: Optional[int]
+    ) -> None:
+        """Выполнить задачу и сохранить результат."""
+        start_time = time.time()
+        cached = False
+
+        try:
+            await self._update(job_id, status="running")
+
+            if request_type == "resume_evaluation":
+                result = await self._find_evaluation(request_payload)
+                cached = result is not None
+                if not cached:
+                    result = await self._run_step(job_id, "resume_evaluation_task", request_payload)
+
+            elif request_type == "job_description":
+                result = await self._run_step(job_id, "job_description_task", request_payload)
+
+            else:
+                # Генерация вопросов: сначала оценка резюме (если не передана
+                # ссылка на готовую), затем вопросы по её отчёту
+                evaluation_report = await self._find_evaluation(request_payload)
+                if evaluation_report is None:
+                    # Вопросы строятся по полному отчёту
+                    evaluation_report = await self._run_step(
+                        job_id, "resume_evaluation_task", {**request_payload, "mode": "strict"}, 0, 50
+                    )
+                else:
+                    await self._update(job_id, stage="resume_evaluation", progress=50)
+                # Без успешной оценки вопросы не генерируются
+                if evaluation_report.get("status") != "success":
+                    raise RuntimeError(
+                        evaluation_report.get("message") or "Не удалось получить отчет по оценке резюме"
+                    )
+                result = await self._run_step(
+                    job_id,
+                    "question_generation_task",
+                    {**request_payload, "report": evaluation_report},
+                    50,
+                    100
+                )
+
+        except Exception as e:
+            latency_ms = int((time.time() - start_time) * 1000)
+            logger.error(
+                "Ошибка при выполнении задачи",
+                extra={"job_id": job_id, "error_type": type(e).__name__, "message": str(e)},
+                exc_info=True
+            )
+            try:
+                await self._update(job_id, status="error", error_message=str(e))
+                await self.logging_service.log_error(
+                    request_type=request_type,
+                    user_id=user_id,
+                    error_message=str(e),
+                    latency_ms=latency_ms,
+                    request_payload=request_payload
+                )
+            except Exception as db_error:
+                logger.error(
+                    "Ошибка при сохранении статуса задачи",
+                    extra={"job_id": job_id, "error": str(db_error)}
+                )
+            return
+
+        latency_ms = int((time.time() - start_time) * 1000)
+        # Частичная оценка (mode=partial) — успешная задача с неполным отчётом
+        succeeded = result.get("status") in ("success", "partial")
+
+        values: Dict[str, Any] = {"response_payload": result}
+        if succeeded:
+            values.update(status="success", progress=100)
+        else:
+            values.update(status="error", error_message=result.get("message"))
+
+        try:
+            await self._update(job_id, **values)
+            # Сохранённая оценка уже есть в generation_results
+            if not cached:
+                request_hash = None
+                # Повторно используются только полные успешные оценки
+                if request_type == "resume_evaluation" and result.get("status") == "success":
+                    request_hash = self.generation_service.evaluation_hash(
+                        request_payload["vacancy_text"], request_payload["resume_text"]
+                    )
+                await self.logging_service.log_success(
+                    request_type=request_type,
+                    user_id=user_id,
+                    request_payload=request_payload,
+                    response_payload=result,
+                    latency_ms=latency_ms,
+                    request_hash=request_hash
+                )
+        except Exception as e:
+            logger.error(
+                "Ошибка при сохранении результата задачи",
+                extra={"job_id": job_id, "error": str(e)},
+                exc_info=True
+            )
+            return
+
+        logger.info(
+            "Задача генерации завершена",
+            extra={
+                "job_id": job_id,
+                "request_type": request_type,
+                "status": result.get("status"),
+                "latency_ms": latency_ms,
+                "cached": cached
+            }
+        )
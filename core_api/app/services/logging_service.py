@@ -1,24 +1,59 @@
 """Сервис логирования результатов генераций."""
-from typing import Any, Dict, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+from app.core.pagination import Cursor
+from app.core.payloads import dehydrate_payload
+from app.db import SessionFactory
+from app.db.models import GenerationResult
 from app.repositories import GenerationResultRepository
+from app.services.result_writer import ResultWriter
 from app.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
 class LoggingService:
-    """Сервис логирования результатов в БД."""
+    """
+    Сервис логирования результатов в БД.
     
-    def __init__(self, session: AsyncSession):
+    Каждая операция выполняется в отдельной короткой сессии, поэтому
+    соединение из пула не удерживается, пока запрос ждёт ответа воркера.
+    Если передан result_writer, записи вставляются в фоне пачками
+    и запрос не ждёт записи в БД.
+    
+    Длинные тексты входных данных (вакансии, резюме) сохраняются в
+    payload_blobs один раз, в request_payload остаются только ссылки.
+    """
+    
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        result_writer: Optional[ResultWriter] = None
+    ):
         """
         Инициализация сервиса.
         
         Args:
-            session: Async сессия SQLAlchemy
+            session_factory: Фабрика сессий БД
+            result_writer: Фоновая запись результатов (None — запись в запросе)
         """
-        self.session = session
-        self.gen_repo = GenerationResultRepository(session)
+        self.session_factory = session_factory
+        self.result_writer = result_writer
+    
+    async def _save(self, **values: Any) -> int:
+        """Сохранить запись сразу или поставить её в очередь фоновой записи."""
+        values["request_payload"], blobs = dehydrate_payload(
+            values.get("request_payload"), settings.payload_blob_min_size
+        )
+        
+        if self.result_writer is not None:
+            return await self.result_writer.enqueue(values, blobs.values())
+        
+        async with self.session_factory() as session:
+            result = await GenerationResultRepository(session).create(
+                **values, blobs=blobs.values()
+            )
+        return result.id
     
     async def log_success(
         self,
@@ -26,8 +61,9 @@ class LoggingService:
         user_id: Optional[int],
         request_payload: Dict[str, Any],
         response_payload: Any,
-        latency_ms: int
-    ) -> None:
+        latency_ms: int,
+        request_hash: Optional[str] = None
+    ) -> Optional[int]:
         """
         Залогировать успешный результат.
         
@@ -37,19 +73,24 @@ class LoggingService:
             request_payload: Входные данные запроса
             response_payload: Результат генерации
             latency_ms: Время выполнения в миллисекундах
+            request_hash: Хэш нормализованных входных текстов (опционально)
+            
+        Returns:
+            Optional[int]: ID сохранённой записи или None, если сохранить не удалось
         """
         try:
             # Преобразуем response_payload в dict если это не dict
             if not isinstance(response_payload, dict):
                 response_payload = {"result": str(response_payload)}
             
-            await self.gen_repo.create(
+            result_id = await self._save(
                 request_type=request_type,
                 status="success",
                 user_id=user_id,
                 request_payload=request_payload,
                 response_payload=response_payload,
-                latency_ms=latency_ms
+                latency_ms=latency_ms,
+                request_hash=request_hash
             )
             
             logger.debug(
@@ -60,6 +101,7 @@ class LoggingService:
                     "latency_ms": latency_ms
                 }
             )
+            return result_id
         
         except Exception as e:
             logger.error(
@@ -70,6 +112,7 @@ class LoggingService:
                 },
                 exc_info=True
             )
+            return None
     
     async def log_error(
         self,
@@ -90,7 +133,7 @@ class LoggingService:
             request_payload: Входные данные запроса (опционально)
         """
         try:
-            await self.gen_repo.create(
+            await self._save(
                 request_type=request_type,
                 status="error",
                 user_id=user_id,
@@ -117,4 +160,73 @@ class LoggingService:
                 },
                 exc_info=True
             )
-
+    
+    async def get_request_payload(self, result_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Получить входные данные записи с восстановленными текстами.
+        
+        Args:
+            result_id: ID результата
+            
+        Returns:
+            Optional[Dict[str, Any]]: Входные данные или None, если запись не найдена
+        """
+        async with self.session_factory() as session:
+            return await GenerationResultRepository(session).get_request_payload(result_id)
+    
+    async def get_history(
+        self,
+        user_id: int,
+        request_type: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Получить историю генераций пользователя без входных данных и результатов.
+        
+        Args:
+            user_id: ID пользователя
+            request_type: Тип запроса (опционально)
+            limit: Максимальное количество записей
+            cursor: Позиция последней записи предыдущей страницы
+            
+        Returns:
+            List[Dict[str, Any]]: Краткие записи, новые первыми
+        """
+        async with self.session_factory() as session:
+            rows = await GenerationResultRepository(session).get_summaries_by_user(
+                user_id, request_type=request_type, limit=limit, cursor=cursor
+            )
+        return [dict(row._mapping) for row in rows]
+    
+    async def find_reusable_result(
+        self,
+        request_type: str,
+        request_hash: str,
+        result_id: Optional[int] = None,
+        max_age: Optional[float] = None
+    ) -> Optional[GenerationResult]:
+        """
+        Найти сохранённый успешный результат для тех же входных данных.
+        
+        Сначала проверяются записи, ещё ожидающие фоновой вставки.
+        
+        Args:
+            request_type: Тип запроса
+            request_hash: Хэш нормализованных входных текстов
+            result_id: ID результата (опционально)
+            max_age: Максимальный возраст результата в секундах (опционально)
+            
+        Returns:
+            GenerationResult | None: Найденный результат или None
+        """
+        if self.result_writer is not None:
+            row = self.result_writer.find_pending(request_type, request_hash, result_id)
+            if row is not None:
+                payload = row.get("response_payload") or {}
+                return GenerationResult(**row) if payload.get("status") == "success" else None
+        
+        async with self.session_factory() as session:
+            return await GenerationResultRepository(session).find_reusable(
+                request_type, request_hash, result_id, max_age
+            )
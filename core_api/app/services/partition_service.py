@@ -0,0 +1,125 @@
+"""Обслуживание секций generation_results: создание заранее и срок хранения."""
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.db import SessionFactory
+from app.db.partitions import add_months, month_start, partition_month
+from app.repositories import GenerationResultPartitionRepository
+from app.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class PartitionService:
+    """
+    Периодическое обслуживание секций generation_results.
+    
+    При каждом запуске:
+    - создаёт секции текущего и следующих partitions_ahead месяцев;
+    - секции старше retention_months удаляет (mode="drop") или
+      переносит в схему архива (mode="archive").
+    
+    Старые данные уходят целой секцией, без построчного DELETE и VACUUM.
+    """
+    
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        interval: float = 6 * 3600.0,
+        partitions_ahead: int = 2,
+        retention_months: int = 0,
+        mode: str = "archive",
+        archive_schema: str = "archive"
+    ):
+        """
+        Инициализация сервиса.
+        
+        Args:
+            session_factory: Фабрика сессий БД
+            interval: Интервал между запусками (секунды)
+            partitions_ahead: Количество секций, создаваемых заранее
+            retention_months: Срок хранения в месяцах (0 — бессрочно)
+            mode: drop — удалять старые секции, archive — переносить в архив
+            archive_schema: Схема архива
+        """
+        self.session_factory = session_factory
+        self.interval = interval
+        self.partitions_ahead = partitions_ahead
+        self.retention_months = retention_months
+        self.mode = mode
+        self.archive_schema = archive_schema
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Запустить периодическое обслуживание."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def close(self) -> None:
+        """Остановить периодическое обслуживание."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    def expired_partitions(self, partitions: list[str], now: datetime) -> list[str]:
+        """
+        Выбрать секции, целиком вышедшие за срок хранения.
+        
+        Args:
+            partitions: Имена секций
+            now: Текущее время
+            
+        Returns:
+            list[str]: Имена секций для удаления или архивации
+        """
+        if self.retention_months <= 0:
+            return []
+        
+        oldest_kept = add_months(month_start(now), -self.retention_months)
+        return [
+            name for name in partitions
+            if (month := partition_month(name)) is not None and month < oldest_kept
+        ]
+    
+    async def run_once(self) -> None:
+        """Создать недостающие секции и обработать устаревшие."""
+        now = datetime.now(timezone.utc)
+        
+        async with self.session_factory() as session:
+            repository = GenerationResultPartitionRepository(session)
+            if not await repository.is_partitioned():
+                logger.warning("Таблица generation_results не секционирована, обслуживание пропущено")
+                return
+            
+            await repository.ensure_partitions(month_start(now), self.partitions_ahead + 1)
+            expired = self.expired_partitions(await repository.list_partitions(), now)
+            
+            for name in expired:
+                if self.mode == "drop":
+                    await repository.drop_partition(name)
+                else:
+                    await repository.archive_partition(name, self.archive_schema)
+        
+        logger.info(
+            "Обслуживание секций generation_results завершено",
+            extra={"expired": len(expired), "mode": self.mode},
+        )
+    
+    async def _run(self) -> None:
+        """Запускать обслуживание с интервалом interval."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(
+                    "Ошибка при обслуживании секций generation_results",
+                    extra={"error": str(e)},
+                    exc_info=True
+                )
+            await asyncio.sleep(self.interval)
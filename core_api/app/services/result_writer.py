@@ -0,0 +1,233 @@
+"""Отложенная пакетная запись результатов генераций."""
+import asyncio
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+from app.core.payloads import Blob
+from app.db import SessionFactory
+from app.repositories import GenerationResultRepository
+from app.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ResultWriter:
+    """
+    Фоновая запись generation_results.
+
+    Записи складываются в ограниченную очередь и вставляются пачками
+    в фоновой asyncio-задаче: при накоплении batch_size записей или
+    через flush_interval после первой записи пачки. Запрос ждёт только
+    при заполненной очереди (обратное давление), а не вставки в БД.
+
+    ID записей резервируются в последовательности блоками, поэтому
+    ID возвращается клиенту сразу, до вставки. До вставки запись
+    доступна для поиска через find_pending.
+
+    Пачка, вставка которой завершилась ошибкой, повторяется max_retries раз
+    с экспоненциальной паузой, затем записи вставляются по одной: теряются
+    только записи, которые не удалось вставить (счётчик dropped_count).
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 1000,
+        id_block_size: int = 100,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5
+    ):
+        """
+        Инициализация сервиса.
+
+        Args:
+            session_factory: Фабрика сессий БД
+            batch_size: Максимальное количество записей в одной вставке
+            flush_interval: Максимальное время ожидания записи до вставки (секунды)
+            max_queue_size: Размер очереди записей
+            id_block_size: Количество ID, резервируемых за одно обращение к БД
+            max_retries: Количество повторов вставки пачки до построчной вставки
+            retry_backoff: Начальная пауза перед повтором (секунды, удваивается)
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.id_block_size = id_block_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        # Количество записей, которые не удалось вставить
+        self.dropped_count = 0
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._ids: Deque[int] = deque()
+        self._ids_lock = asyncio.Lock()
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._blobs: Dict[int, List[Blob]] = {}
+        self._task: Optional[asyncio.Task] = None
+        # Пробуждает сборку пачки при новой записи или остановке
+        self._wakeup = asyncio.Event()
+        self._closing = False
+
+    def start(self) -> None:
+        """Запустить фоновую задачу записи."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Дождаться записи всех накопленных результатов и остановить задачу."""
+        if self._task is None:
+            return
+
+        # Неполная пачка записывается сразу, не дожидаясь flush_interval
+        self._closing = True
+        self._wakeup.set()
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def enqueue(self, row: Dict[str, Any], blobs: Iterable[Blob] = ()) -> int:
+        """
+        Поставить запись в очередь на вставку.
+
+        Args:
+            row: Значения полей GenerationResult (без id)
+            blobs: Тексты, на которые ссылается request_payload записи
+
+        Returns:
+            int: ID, под которым запись будет сохранена
+        """
+        row = {**row, "id": await self._next_id()}
+        row.setdefault("created_at", datetime.now(timezone.utc))
+
+        self._pending[row["id"]] = row
+        self._blobs[row["id"]] = list(blobs)
+        if self._queue.full():
+            logger.warning(
+                "Очередь записи результатов заполнена, запрос ждёт",
+                extra={"queue_size": self._queue.qsize()}
+            )
+        try:
+            await self._queue.put(row)
+        except BaseException:
+            self._pending.pop(row["id"], None)
+            self._blobs.pop(row["id"], None)
+            raise
+        self._wakeup.set()
+        return row["id"]
+
+    def find_pending(
+        self,
+        request_type: str,
+        request_hash: str,
+        result_id: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Найти ещё не записанный успешный результат по хэшу входных данных.
+
+        Args:
+            request_type: Тип запроса
+            request_hash: Хэш нормализованных входных текстов
+            result_id: ID результата (опционально)
+
+        Returns:
+            Optional[Dict[str, Any]]: Последняя подходящая запись или None
+        """
+        rows = [self._pending[result_id]] if result_id in self._pending else (
+            [] if result_id is not None else list(self._pending.values())
+        )
+        matching = [
+            row for row in rows
+            if row.get("request_type") == request_type
+            and row.get("request_hash") == request_hash
+            and row.get("status") == "success"
+        ]
+        return max(matching, key=lambda row: row["created_at"], default=None)
+
+    async def _next_id(self) -> int:
+        """Выдать следующий зарезервированный ID (резервирует блок при необходимости)."""
+        async with self._ids_lock:
+            if not self._ids:
+                async with self.session_factory() as session:
+                    ids = await GenerationResultRepository(session).reserve_ids(self.id_block_size)
+                    await session.commit()
+                self._ids.extend(ids)
+            return self._ids.popleft()
+
+    async def _run(self) -> None:
+        """Собирать записи из очереди в пачки и вставлять их."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                self._wakeup.clear()
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+
+                timeout = deadline - loop.time()
+                if self._closing or timeout <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(batch)
+
+    async def _insert(self, rows: List[Dict[str, Any]]) -> None:
+        """Вставить записи и тексты, на которые они ссылаются, в одной транзакции."""
+        blobs = [blob for row in rows for blob in self._blobs.get(row["id"], [])]
+        async with self.session_factory() as session:
+            await GenerationResultRepository(session).create_many(rows, blobs)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """Вставить пачку записей: одним запросом с повторами, затем по одной."""
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    await self._insert(batch)
+                    return
+                except Exception as e:
+                    logger.warning(
+                        "Ошибка при пакетной записи результатов в БД",
+                        extra={"count": len(batch), "attempt": attempt + 1, "error": str(e)}
+                    )
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+
+            # Пачка не вставилась: вставляем по одной, теряются только ошибочные записи
+            dropped = 0
+            for row in batch:
+                try:
+                    await self._insert([row])
+                except Exception as e:
+                    dropped += 1
+                    logger.error(
+                        "Не удалось записать результат в БД",
+                        extra={"id": row["id"], "error": str(e)},
+                        exc_info=True
+                    )
+            self.dropped_count += dropped
+            logger.error(
+                "Пакетная запись результатов выполнена по одной записи",
+                extra={
+                    "count": len(batch),
+                    "dropped": dropped,
+                    "dropped_total": self.dropped_count,
+                }
+            )
+        finally:
+            for row in batch:
+                self._pending.pop(row["id"], None)
+                self._blobs.pop(row["id"], None)
+                self._queue.task_done()
@@ -1,24 +1,82 @@
 """Сервис для работы с пользователями."""
-from typing import Optional
-from sqlalchemy.ext.asyncio import AsyncSession
+from collections import OrderedDict
+from typing import Optional, Tuple
+from app.db import SessionFactory
 from app.repositories import UserRepository
 from app.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+class UserIdCache:
+    """
+    Кэш email → ID пользователя в памяти процесса.
+    
+    Ограничен max_size записями (вытесняются давно не используемые).
+    Вместе с ID хранится имя: при смене имени запись обновляется в БД.
+    """
+    
+    def __init__(self, max_size: int = 10000):
+        """
+        Инициализация кэша.
+        
+        Args:
+            max_size: Максимальное количество пользователей в кэше
+        """
+        self.max_size = max_size
+        self._items: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+    
+    def get(self, email: str, full_name: str) -> Optional[int]:
+        """
+        Получить ID пользователя, если он закэширован с тем же именем.
+        
+        Args:
+            email: Email пользователя
+            full_name: Полное имя пользователя
+            
+        Returns:
+            Optional[int]: ID пользователя или None
+        """
+        item = self._items.get(email)
+        if item is None or item[1] != full_name:
+            return None
+        self._items.move_to_end(email)
+        return item[0]
+    
+    def put(self, email: str, full_name: str, user_id: int) -> None:
+        """Сохранить ID пользователя в кэше."""
+        self._items[email] = (user_id, full_name)
+        self._items.move_to_end(email)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Очистить кэш."""
+        self._items.clear()
+
+
 class UserService:
-    """Сервис управления пользователями."""
+    """
+    Сервис управления пользователями.
     
-    def __init__(self, session: AsyncSession):
+    Каждая операция выполняется в отдельной короткой сессии.
+    ID уже известных пользователей берутся из кэша без обращения к БД.
+    """
+    
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        cache: Optional[UserIdCache] = None
+    ):
         """
         Инициализация сервиса.
         
         Args:
-            session: Async сессия SQLAlchemy
+            session_factory: Фабрика сессий БД
+            cache: Кэш email → ID пользователя (опционально)
         """
-        self.session = session
-        self.user_repo = UserRepository(session)
+        self.session_factory = session_factory
+        self.cache = cache
     
     async def get_or_create_user(
         self,
@@ -37,27 +95,17 @@ class UserService:
         Returns:
             Optional[int]: ID пользователя или None при ошибке
         """
+        if self.cache is not None:
+            user_id = self.cache.get(email, full_name)
+            if user_id is not None:
+                return user_id
+        
         try:
-            user, created = await self.user_repo.get_or_create_by_email(
-                email=email,
-                full_name=full_name,
-            )
-            
-            if created:
-                logger.info(
-                    "Создан новый пользователь",
-                    extra={
-                        "user_id": user.id,
-                        "email": email
-                    }
-                )
-            else:
-                logger.debug(
-                    "Найден существующий пользователь",
-                    extra={"user_id": user.id}
+            async with self.session_factory() as session:
+                user_id, created = await UserRepository(session).upsert_by_email(
+                    email=email,
+                    full_name=full_name,
                 )
-            
-            return user.id
         
         except Exception as e:
             logger.error(
@@ -66,4 +114,14 @@ class UserService:
                 exc_info=True
             )
             return None
-
+        
+        if not created:
+            logger.debug(
+                "Найден существующий пользователь",
+                extra={"user_id": user_id}
+            )
+        
+        if self.cache is not None:
+            self.cache.put(email, full_name, user_id)
+        
+        return user_id
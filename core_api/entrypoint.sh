@@ -3,12 +3,14 @@
 echo "🔍 Проверяю наличие каталога миграций..."
 mkdir -p alembic/versions
 
-echo "🚀 Применяю миграции базы данных (best-effort)..."
+echo "🚀 Применяю миграции базы данных..."
 
 if uv run alembic upgrade head 2>&1; then
     echo "✅ Миграции успешно применены"
 else
-    echo "⚠️  Не удалось применить миграции."
+    echo "❌ Не удалось применить миграции, приложение не запущено."
+    echo "   Если в alembic_version записана локальная ревизия, см. раздел «Миграции БД» в README."
+    exit 1
 fi
 
 echo "✅ Запускаю приложение..."
@@ -0,0 +1,101 @@
+"""
+Замер стоимости запросов пользователя в зависимости от количества его генераций.
+
+Создаёт тестового пользователя, добавляет ему результаты генераций
+с типичными по размеру входными данными и замеряет:
+- поиск пользователя по email (выполняется в каждом авторизованном запросе);
+- страницу истории генераций.
+
+Время обоих запросов не должно расти с количеством сохранённых результатов.
+Все изменения выполняются в одной транзакции и откатываются в конце.
+
+Использование (из директории core_api):
+    uv run python scripts/benchmark_user_requests.py [--sizes 0 100 1000 10000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.db import get_session_maker, init_db  # noqa: E402
+from app.db.models import GenerationResult, User  # noqa: E402
+from app.db.session import close_db  # noqa: E402
+from app.repositories import GenerationResultRepository, UserRepository  # noqa: E402
+
+BENCHMARK_EMAIL = "benchmark-user-requests@example.com"
+# Размер входных данных и результата одной генерации (символов)
+PAYLOAD_SIZE = 8000
+
+
+async def measure(session, coro_factory, repeat: int) -> float:
+    """Медиана времени выполнения запроса в миллисекундах."""
+    timings = []
+    for _ in range(repeat):
+        # Без identity map: каждый замер читает данные из БД
+        session.expunge_all()
+        started = time.perf_counter()
+        await coro_factory()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def run(sizes: list[int], repeat: int) -> None:
+    init_db()
+    session_maker = get_session_maker()
+
+    async with session_maker() as session:
+        try:
+            user = User(email=BENCHMARK_EMAIL, full_name="Benchmark")
+            session.add(user)
+            await session.flush()
+            user_id = user.id
+
+            users = UserRepository(session)
+            results = GenerationResultRepository(session)
+            stored = 0
+
+            print(f"{'результатов':>12} | {'get_by_email, мс':>17} | {'история, мс':>12}")
+            for size in sorted(sizes):
+                if size > stored:
+                    await session.execute(
+                        insert(GenerationResult),
+                        [
+                            {
+                                "user_id": user_id,
+                                "request_type": "resume_evaluation",
+                                "status": "success",
+                                "request_payload": {"vacancy_text": "v" * PAYLOAD_SIZE},
+                                "response_payload": {"status": "success", "data": "r" * PAYLOAD_SIZE},
+                            }
+                            for _ in range(size - stored)
+                        ],
+                    )
+                    stored = size
+
+                lookup = await measure(session, lambda: users.get_by_email(BENCHMARK_EMAIL), repeat)
+                history = await measure(
+                    session, lambda: results.get_summaries_by_user(user_id, limit=50), repeat
+                )
+                print(f"{size:>12} | {lookup:>17.2f} | {history:>12.2f}")
+        finally:
+            await session.rollback()
+
+    await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
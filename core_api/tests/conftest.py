@@ -7,7 +7,12 @@ from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from app.api.dependencies import get_rabbit_client
+from app.api.dependencies import (
+    get_rabbit_client,
+    get_result_writer,
+    get_session_factory,
+    get_user_id_cache,
+)
 
 from app.core.config import settings
 from app.db import get_session
@@ -17,6 +22,7 @@ from httpx import AsyncClient, Response
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 TEST_DATABASE_URL = settings.postgres.url
+TEST_INTERNAL_API_TOKEN = "test-internal-token"
 
 
 @pytest.fixture(scope="session")
@@ -107,7 +113,31 @@ def mock_rabbit_client():
             }
         return {"status": "error", "message": "Unknown queue"}
 
+    # Мокаем потоковый вызов: пакетная оценка резюме или задача с прогрессом
+    async def mock_stream(payload, queue_name):
+        if payload.get("report_progress"):
+            yield {"type": "progress", "stage": "first_stage", "progress": 50}
+            result = await mock_call(payload, queue_name)
+            yield {**result, "type": "done"}
+            return
+
+        for index, resume in enumerate(payload["resumes"]):
+            yield {
+                "type": "item",
+                "index": index,
+                "id": resume["id"],
+                "status": "success",
+                "data": {"skills_report": {"match": "good"}},
+            }
+        yield {
+            "type": "done",
+            "status": "success",
+            "total": len(payload["resumes"]),
+            "succeeded": len(payload["resumes"]),
+        }
+
     mock_client.call = AsyncMock(side_effect=mock_call)
+    mock_client.stream = mock_stream
     mock_client.connection = MagicMock()
     mock_client.connection.is_closed = False
 
@@ -115,7 +145,34 @@ def mock_rabbit_client():
 
 
 @pytest.fixture
-def test_client(test_db_session, mock_rabbit_client):
+def test_session_factory(test_db_session):
+    """Фабрика сессий, которая всегда возвращает тестовую сессию БД."""
+    from contextlib import asynccontextmanager
+
+    @asynccontextmanager
+    async def session_factory():
+        yield test_db_session
+
+    return session_factory
+
+
+@pytest.fixture
+def override_job_service(test_session_factory, mock_rabbit_client):
+    """
+    Переопределяет сервис асинхронных задач: задачи выполняются
+    через мок RabbitMQ клиента и тестовую сессию БД.
+    """
+    from app.api.dependencies import get_job_service
+    from app.services.job_service import JobService
+
+    job_service = JobService(mock_rabbit_client, test_session_factory)
+    app.dependency_overrides[get_job_service] = lambda: job_service
+    yield job_service
+    app.dependency_overrides.pop(get_job_service, None)
+
+
+@pytest.fixture
+def test_client(test_db_session, test_session_factory, mock_rabbit_client):
     """Создает тестовый клиент FastAPI с подменой зависимостей."""
 
     # Переопределяем зависимости
@@ -126,6 +183,9 @@ def test_client(test_db_session, mock_rabbit_client):
         return mock_rabbit_client
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_session_factory] = lambda: test_session_factory
+    app.dependency_overrides[get_result_writer] = lambda: None
+    app.dependency_overrides[get_user_id_cache] = lambda: None
     app.dependency_overrides[get_rabbit_client] = override_get_rabbit_client
 
     with TestClient(app) as client:
@@ -136,7 +196,7 @@ def test_client(test_db_session, mock_rabbit_client):
 
 
 @pytest.fixture
-async def async_test_client(test_db_session, mock_rabbit_client):
+async def async_test_client(test_db_session, test_session_factory, mock_rabbit_client):
     """Создает асинхронный тестовый клиент."""
     from httpx import ASGITransport
 
@@ -148,6 +208,9 @@ async def async_test_client(test_db_session, mock_rabbit_client):
         return mock_rabbit_client
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_session_factory] = lambda: test_session_factory
+    app.dependency_overrides[get_result_writer] = lambda: None
+    app.dependency_overrides[get_user_id_cache] = lambda: None
     app.dependency_overrides[get_rabbit_client] = override_get_rabbit_client
 
     async with AsyncClient(
@@ -303,7 +366,7 @@ def override_auth_none():
 
 
 @pytest.fixture
-def test_client_with_auth(test_db_session, mock_rabbit_client, override_auth_optional):
+def test_client_with_auth(test_db_session, test_session_factory, mock_rabbit_client, override_auth_optional):
     """
     Создает тестовый клиент FastAPI с авторизованным пользователем.
     """
@@ -316,6 +379,9 @@ def test_client_with_auth(test_db_session, mock_rabbit_client, override_auth_opt
         return mock_rabbit_client
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_session_factory] = lambda: test_session_factory
+    app.dependency_overrides[get_result_writer] = lambda: None
+    app.dependency_overrides[get_user_id_cache] = lambda: None
     app.dependency_overrides[get_rabbit_client] = override_get_rabbit_client
 
     with TestClient(app) as client:
@@ -326,7 +392,7 @@ def test_client_with_auth(test_db_session, mock_rabbit_client, override_auth_opt
 
 
 @pytest.fixture
-def test_client_no_auth(test_db_session, mock_rabbit_client, override_auth_none):
+def test_client_no_auth(test_db_session, test_session_factory, mock_rabbit_client, override_auth_none):
     """
     Создает тестовый клиент FastAPI без авторизации.
     """
@@ -339,6 +405,9 @@ def test_client_no_auth(test_db_session, mock_rabbit_client, override_auth_none)
         return mock_rabbit_client
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_session_factory] = lambda: test_session_factory
+    app.dependency_overrides[get_result_writer] = lambda: None
+    app.dependency_overrides[get_user_id_cache] = lambda: None
     app.dependency_overrides[get_rabbit_client] = override_get_rabbit_client
 
     with TestClient(app) as client:
@@ -346,3 +415,13 @@ def test_client_no_auth(test_db_session, mock_rabbit_client, override_auth_none)
 
     # Очищаем переопределения после теста
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def internal_client(test_client_no_auth, monkeypatch):
+    """
+    Тестовый клиент для внутренних эндпоинтов (с заголовком X-Internal-Token).
+    """
+    monkeypatch.setattr(settings, "internal_api_token", TEST_INTERNAL_API_TOKEN)
+    test_client_no_auth.headers["X-Internal-Token"] = TEST_INTERNAL_API_TOKEN
+    return test_client_no_auth
@@ -0,0 +1,99 @@
+"""
+Тесты для клиента auth service с кэшем сессий.
+"""
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.services.auth_client import AuthClient
+
+
+class FakeAuthService:
+    """Подменяет httpx.AsyncClient.get: отвечает по sid и считает запросы."""
+
+    def __init__(self, responses: dict):
+        self.responses = responses
+        self.calls = 0
+
+    async def get(self, client, url, headers=None, **kwargs):
+        self.calls += 1
+        sid = headers["Cookie"].split("=", 1)[1]
+        status_code, body = self.responses[sid]
+        if status_code is None:
+            raise httpx.ConnectError("Connection error")
+        return httpx.Response(status_code, json=body, request=httpx.Request("GET", url))
+
+    def patch(self):
+        service = self
+
+        async def get(client, url, **kwargs):
+            return await service.get(client, url, **kwargs)
+
+        return patch("httpx.AsyncClient.get", new=get)
+
+
+@pytest.mark.asyncio
+async def test_valid_session_is_cached(mock_keycloak_user):
+    """Повторная проверка той же сессии не обращается к auth service."""
+    service = FakeAuthService({"good": (200, mock_keycloak_user)})
+    client = AuthClient("http://auth", cache_ttl=60)
+
+    with service.patch():
+        first = await client.get_user("good")
+        second = await client.get_user("good")
+
+    assert first == second == mock_keycloak_user
+    assert service.calls == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_invalid_session_is_cached_negatively():
+    """Ответ 401 кэшируется на negative_ttl."""
+    service = FakeAuthService({"bad": (401, {"detail": "Unauthorized"})})
+    client = AuthClient("http://auth", negative_ttl=60)
+
+    with service.patch():
+        assert await client.get_user("bad") is None
+        assert await client.get_user("bad") is None
+
+    assert service.calls == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_and_errors_are_not_cached(mock_keycloak_user):
+    """После invalidate сессия проверяется заново, ошибки auth service не кэшируются."""
+    service = FakeAuthService({"good": (200, mock_keycloak_user), "down": (None, None)})
+    client = AuthClient("http://auth", cache_ttl=60)
+
+    with service.patch():
+        await client.get_user("good")
+        client.invalidate("good")
+        await client.get_user("good")
+
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPError):
+                await client.get_user("down")
+
+    assert service.calls == 4
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded(mock_keycloak_user):
+    """При переполнении вытесняется давно не использованная сессия."""
+    service = FakeAuthService({sid: (200, mock_keycloak_user) for sid in ("a", "b", "c")})
+    client = AuthClient("http://auth", cache_ttl=60, max_size=2)
+
+    with service.patch():
+        await client.get_user("a")
+        await client.get_user("b")
+        await client.get_user("a")
+        await client.get_user("c")
+        await client.get_user("a")
+        await client.get_user("b")
+
+    assert service.calls == 4
+    await client.close()
@@ -0,0 +1,73 @@
+"""
+Тесты для истории генераций пользователя.
+"""
+import pytest
+
+
+@pytest.mark.unit
+def test_history_without_auth(test_client_no_auth):
+    """История недоступна без авторизации."""
+    response = test_client_no_auth.get("/history")
+    
+    assert response.status_code == 401
+
+
+@pytest.mark.unit
+def test_history_contains_summary_without_payloads(
+    test_client_with_auth, sample_vacancy_text, sample_resume_text
+):
+    """После генерации запись появляется в истории без входных данных и результата."""
+    payload = {
+        "vacancy_text": sample_vacancy_text,
+        "resume_text": sample_resume_text,
+    }
+    evaluation = test_client_with_auth.post("/resume/evaluation", json=payload).json()
+    
+    response = test_client_with_auth.get("/history", params={"request_type": "resume_evaluation"})
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert data["items"][0]["id"] == evaluation["evaluation_id"]
+    assert data["items"][0]["request_type"] == "resume_evaluation"
+    assert "request_payload" not in data["items"][0]
+    assert "response_payload" not in data["items"][0]
+
+
+@pytest.mark.unit
+def test_history_limit_validation(test_client_with_auth):
+    """Размер страницы ограничен."""
+    response = test_client_with_auth.get("/history", params={"limit": 1000})
+    
+    assert response.status_code == 422
+
+
+@pytest.mark.unit
+def test_history_pages_by_cursor(test_client_with_auth, sample_vacancy_text, sample_resume_text):
+    """Страницы по курсору идут подряд без повторов."""
+    payload = {
+        "vacancy_text": sample_vacancy_text,
+        "resume_text": sample_resume_text,
+        "force_refresh": True,
+    }
+    for _ in range(3):
+        test_client_with_auth.post("/resume/evaluation", json=payload)
+    
+    first = test_client_with_auth.get("/history", params={"limit": 2}).json()
+    second = test_client_with_auth.get(
+        "/history", params={"limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    
+    assert first["next_cursor"] is not None
+    first_ids = [item["id"] for item in first["items"]]
+    second_ids = [item["id"] for item in second["items"]]
+    assert not set(first_ids) & set(second_ids)
+    assert first_ids + second_ids == sorted(first_ids + second_ids, reverse=True)
+
+
+@pytest.mark.unit
+def test_history_invalid_cursor(test_client_with_auth):
+    """Некорректный курсор отклоняется."""
+    response = test_client_with_auth.get("/history", params={"cursor": "broken"})
+    
+    assert response.status_code == 400
@@ -0,0 +1,101 @@
+"""
+Тесты для асинхронных задач генерации.
+"""
+import json
+import time
+import uuid
+
+import pytest
+
+
+def wait_for_job(client, job_id: str, attempts: int = 50) -> dict:
+    """Опрашивает задачу, пока она не завершится."""
+    for _ in range(attempts):
+        data = client.get(f"/jobs/{job_id}").json()
+        if data["status"] in ("success", "error"):
+            return data
+        time.sleep(0.05)
+    raise AssertionError(f"Задача {job_id} не завершилась")
+
+
+@pytest.mark.unit
+def test_resume_evaluation_job(override_job_service, test_client_no_auth, sample_vacancy_text, sample_resume_text):
+    """Задача оценки резюме создаётся сразу, результат доступен через опрос."""
+    payload = {"vacancy_text": sample_vacancy_text, "resume_text": sample_resume_text}
+
+    response = test_client_no_auth.post("/jobs/resume/evaluation", json=payload)
+
+    assert response.status_code == 202
+    submitted = response.json()
+    assert submitted["status"] == "queued"
+
+    data = wait_for_job(test_client_no_auth, submitted["job_id"])
+
+    assert data["status"] == "success"
+    assert data["progress"] == 100
+    assert data["request_type"] == "resume_evaluation"
+    assert data["result"]["status"] == "success"
+    assert "skills_report" in data["result"]["data"]
+
+
+@pytest.mark.unit
+def test_questions_job_runs_evaluation_first(override_job_service, test_client_no_auth, mock_rabbit_client, sample_vacancy_text, sample_resume_text):
+    """Задача генерации вопросов передаёт воркеру отчёт об оценке резюме."""
+    payload = {"vacancy_text": sample_vacancy_text, "resume_text": sample_resume_text}
+
+    response = test_client_no_auth.post("/jobs/questions/generate", json=payload)
+    assert response.status_code == 202
+
+    data = wait_for_job(test_client_no_auth, response.json()["job_id"])
+
+    assert data["status"] == "success"
+    assert set(data["result"]["data"]) == {"experience", "motivation", "personal"}
+
+
+@pytest.mark.unit
+def test_questions_job_fails_on_failed_evaluation(override_job_service, test_client_no_auth, mock_rabbit_client, sample_vacancy_text, sample_resume_text):
+    """При неуспешной оценке резюме вопросы не запрашиваются, задача завершается ошибкой."""
+    queues = []
+
+    async def failed_evaluation_stream(payload, queue_name):
+        queues.append(queue_name)
+        yield {"type": "done", "status": "failed", "data": None, "message": "Оценка не выполнена"}
+
+    mock_rabbit_client.stream = failed_evaluation_stream
+    payload = {"vacancy_text": sample_vacancy_text, "resume_text": sample_resume_text}
+
+    response = test_client_no_auth.post("/jobs/questions/generate", json=payload)
+    data = wait_for_job(test_client_no_auth, response.json()["job_id"])
+
+    assert data["status"] == "error"
+    assert queues == ["resume_evaluation_task"]
+
+
+@pytest.mark.unit
+def test_job_events_stream(override_job_service, test_client_no_auth):
+    """Поток событий завершается итоговым состоянием задачи."""
+    response = test_client_no_auth.post(
+        "/jobs/job_description/generate", json={"input_data": "Python разработчик"}
+    )
+    job_id = response.json()["job_id"]
+
+    response = test_client_no_auth.get(f"/jobs/{job_id}/events")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = [
+        json.loads(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert events[-1]["status"] == "success"
+    assert events[-1]["result"]["data"]["job_site"] == "Test job description"
+
+
+@pytest.mark.unit
+def test_job_not_found(override_job_service, test_client_no_auth):
+    """Неизвестная задача возвращает 404."""
+    response = test_client_no_auth.get(f"/jobs/{uuid.uuid4()}")
+
+    assert response.status_code == 404
@@ -0,0 +1,65 @@
+"""
+Тесты для секционирования generation_results и постраничной выборки по курсору.
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.pagination import Cursor, decode_cursor, encode_cursor
+from app.db.partitions import (
+    DEFAULT_PARTITION,
+    add_months,
+    create_partition_sql,
+    month_start,
+    partition_month,
+    partition_name,
+)
+from app.services.partition_service import PartitionService
+
+
+@pytest.mark.unit
+def test_month_boundaries():
+    """Границы месяцев считаются в UTC и переходят через год."""
+    month = month_start(datetime(2026, 12, 31, 23, 59, tzinfo=timezone.utc))
+
+    assert month == datetime(2026, 12, 1, tzinfo=timezone.utc)
+    assert add_months(month, 1) == datetime(2027, 1, 1, tzinfo=timezone.utc)
+    assert add_months(month, -12) == datetime(2025, 12, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.unit
+def test_partition_names():
+    """Имя секции однозначно задаёт месяц, секция по умолчанию месяца не имеет."""
+    month = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    assert partition_name(month) == "generation_results_y2026m03"
+    assert partition_month(partition_name(month)) == month
+    assert partition_month(DEFAULT_PARTITION) is None
+    assert "FROM ('2026-03-01T00:00:00+00:00') TO ('2026-04-01T00:00:00+00:00')" in create_partition_sql(month)
+
+
+@pytest.mark.unit
+def test_expired_partitions():
+    """За срок хранения выходят только месячные секции старше retention_months."""
+    service = PartitionService(session_factory=None, retention_months=3)
+    partitions = [
+        DEFAULT_PARTITION,
+        "generation_results_y2026m06",
+        "generation_results_y2026m07",
+        "generation_results_y2026m10",
+    ]
+
+    expired = service.expired_partitions(partitions, datetime(2026, 10, 18, tzinfo=timezone.utc))
+
+    assert expired == ["generation_results_y2026m06"]
+    assert PartitionService(session_factory=None).expired_partitions(partitions, datetime.now(timezone.utc)) == []
+
+
+@pytest.mark.unit
+def test_cursor_roundtrip():
+    """Курсор восстанавливается из строки, некорректная строка отклоняется."""
+    cursor = Cursor(datetime(2026, 10, 18, 12, 30, 15, 123456, tzinfo=timezone.utc), 42)
+
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
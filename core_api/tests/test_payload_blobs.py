@@ -0,0 +1,50 @@
+"""
+Тесты для выноса длинных текстов входных данных в payload_blobs.
+"""
+import pytest
+
+from app.core.payloads import (
+    BLOB_REF_KEY,
+    decompress_text,
+    dehydrate_payload,
+    payload_blob_hashes,
+    rehydrate_payload,
+)
+
+
+@pytest.mark.unit
+def test_long_texts_are_replaced_with_refs():
+    """Длинные строки заменяются ссылками, короткие и нестроковые остаются."""
+    payload = {"vacancy_text": "a" * 300, "resume_text": "short", "evaluation_id": 5}
+
+    dehydrated, blobs = dehydrate_payload(payload, min_size=256)
+
+    assert dehydrated["resume_text"] == "short"
+    assert dehydrated["evaluation_id"] == 5
+    assert dehydrated["vacancy_text"][BLOB_REF_KEY] in blobs
+    assert dehydrated["vacancy_text"]["size"] == 300
+
+    blob = blobs[dehydrated["vacancy_text"][BLOB_REF_KEY]]
+    assert len(blob.data) < blob.size
+    assert decompress_text(blob.data) == payload["vacancy_text"]
+
+
+@pytest.mark.unit
+def test_same_text_is_stored_once():
+    """Одинаковые тексты хранятся один раз с несколькими ссылками."""
+    text = "Python developer " * 20
+    dehydrated, blobs = dehydrate_payload({"vacancy_text": text, "resume_text": text}, min_size=10)
+
+    assert len(blobs) == 1
+    assert next(iter(blobs.values())).refs == 2
+    assert len(payload_blob_hashes(dehydrated)) == 2
+
+
+@pytest.mark.unit
+def test_rehydrate_restores_original_payload():
+    """Восстановление возвращает исходные входные данные."""
+    payload = {"vacancy_text": "v" * 500, "resume_text": "r" * 500, "report": None}
+    dehydrated, blobs = dehydrate_payload(payload, min_size=256)
+    texts = {blob_hash: decompress_text(blob.data) for blob_hash, blob in blobs.items()}
+
+    assert rehydrate_payload(dehydrated, texts) == payload
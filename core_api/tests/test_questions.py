@@ -146,3 +146,53 @@ def test_question_generation_calls_resume_evaluation_first(test_client_no_auth,
     # Проверяем, что были вызваны оба воркера
     assert mock_rabbit_client.call.call_count == 2  # resume_evaluation + question_generation
 
+
+
+def called_queues(mock_rabbit_client) -> list:
+    """Очереди, в которые отправлялись RPC-запросы."""
+    return [call.kwargs["queue_name"] for call in mock_rabbit_client.call.call_args_list]
+
+
+@pytest.mark.unit
+def test_question_generation_reuses_evaluation(test_client_no_auth, mock_rabbit_client, sample_vacancy_text, sample_resume_text):
+    """Вопросы по ссылке на оценку не запускают оценку резюме повторно."""
+    payload = {
+        "vacancy_text": sample_vacancy_text,
+        "resume_text": sample_resume_text
+    }
+    evaluation = test_client_no_auth.post("/resume/evaluation", json=payload).json()
+    assert evaluation["evaluation_id"] is not None
+    
+    response = test_client_no_auth.post(
+        "/questions/generate",
+        json={**payload, "evaluation_id": evaluation["evaluation_id"]}
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["evaluation_id"] == evaluation["evaluation_id"]
+    assert called_queues(mock_rabbit_client) == [
+        "resume_evaluation_task",
+        "question_generation_task",
+    ]
+
+
+@pytest.mark.unit
+def test_question_generation_evaluation_for_other_texts(test_client_no_auth, mock_rabbit_client, sample_vacancy_text, sample_resume_text):
+    """Оценка других текстов не переиспользуется, оценка выполняется заново."""
+    evaluation = test_client_no_auth.post(
+        "/resume/evaluation",
+        json={"vacancy_text": sample_vacancy_text, "resume_text": sample_resume_text}
+    ).json()
+    
+    response = test_client_no_auth.post(
+        "/questions/generate",
+        json={
+            "vacancy_text": sample_vacancy_text,
+            "resume_text": "Другое резюме",
+            "evaluation_id": evaluation["evaluation_id"],
+        }
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["evaluation_id"] is None
+    assert called_queues(mock_rabbit_client).count("resume_evaluation_task") == 2
@@ -0,0 +1,158 @@
+"""
+Тесты для фоновой пакетной записи результатов генераций.
+"""
+import asyncio
+import itertools
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.repositories import GenerationResultRepository
+from app.services.result_writer import ResultWriter
+
+
+@pytest.fixture
+def fake_repository(monkeypatch):
+    """Подменяет запросы репозитория: ID из счётчика, вставки в список."""
+    counter = itertools.count(1)
+    inserts: list[list[dict]] = []
+
+    async def reserve_ids(self, count):
+        return [next(counter) for _ in range(count)]
+
+    async def create_many(self, rows, blobs=()):
+        inserts.append(list(rows))
+
+    monkeypatch.setattr(GenerationResultRepository, "reserve_ids", reserve_ids)
+    monkeypatch.setattr(GenerationResultRepository, "create_many", create_many)
+    return inserts
+
+
+@asynccontextmanager
+async def session_factory():
+    session = MagicMock()
+
+    async def commit():
+        return None
+
+    session.commit = commit
+    yield session
+
+
+def make_row(index: int) -> dict:
+    return {
+        "request_type": "resume_evaluation",
+        "status": "success",
+        "request_hash": f"hash-{index}",
+        "response_payload": {"status": "success"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_rows_are_inserted_in_batches(fake_repository):
+    """Записи вставляются пачками не больше batch_size."""
+    writer = ResultWriter(session_factory, batch_size=3, flush_interval=10, id_block_size=2)
+    writer.start()
+
+    ids = [await writer.enqueue(make_row(index)) for index in range(7)]
+    await writer.close()
+
+    assert ids == list(range(1, 8))
+    assert [len(batch) for batch in fake_repository] == [3, 3, 1]
+    assert [row["id"] for batch in fake_repository for row in batch] == ids
+
+
+@pytest.mark.asyncio
+async def test_flush_by_interval(fake_repository):
+    """Неполная пачка вставляется по истечении flush_interval."""
+    writer = ResultWriter(session_factory, batch_size=100, flush_interval=0.05)
+    writer.start()
+
+    await writer.enqueue(make_row(1))
+    await asyncio.sleep(0.2)
+
+    assert len(fake_repository) == 1
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_pending_rows_are_searchable(fake_repository):
+    """Запись доступна для поиска до вставки и исчезает из очереди после неё."""
+    writer = ResultWriter(session_factory, batch_size=100, flush_interval=10)
+    writer.start()
+
+    result_id = await writer.enqueue(make_row(1))
+
+    assert writer.find_pending("resume_evaluation", "hash-1")["id"] == result_id
+    assert writer.find_pending("resume_evaluation", "hash-1", result_id + 1) is None
+    assert writer.find_pending("resume_evaluation", "hash-2") is None
+
+    await writer.close()
+
+    assert writer.find_pending("resume_evaluation", "hash-1") is None
+    assert len(fake_repository) == 1
+
+
+@pytest.mark.asyncio
+async def test_backpressure_when_queue_is_full(fake_repository):
+    """При заполненной очереди запись ждёт, пока фоновая задача не освободит место."""
+    writer = ResultWriter(session_factory, batch_size=1, flush_interval=10, max_queue_size=1)
+
+    await writer.enqueue(make_row(1))
+    blocked = asyncio.create_task(writer.enqueue(make_row(2)))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+
+    writer.start()
+    await asyncio.wait_for(blocked, timeout=1)
+    await writer.close()
+
+    assert sum(len(batch) for batch in fake_repository) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried(fake_repository, monkeypatch):
+    """Пачка с временной ошибкой вставки повторяется целиком."""
+    calls = itertools.count(1)
+    create_many = GenerationResultRepository.create_many
+
+    async def flaky_create_many(self, rows, blobs=()):
+        if next(calls) <= 2:
+            raise RuntimeError("connection reset")
+        await create_many(self, rows, blobs)
+
+    monkeypatch.setattr(GenerationResultRepository, "create_many", flaky_create_many)
+    writer = ResultWriter(session_factory, batch_size=3, flush_interval=10, retry_backoff=0)
+    writer.start()
+
+    for index in range(3):
+        await writer.enqueue(make_row(index))
+    await writer.close()
+
+    assert [len(batch) for batch in fake_repository] == [3]
+    assert writer.dropped_count == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_single_rows(fake_repository, monkeypatch):
+    """После повторов записи вставляются по одной, теряется только ошибочная."""
+    create_many = GenerationResultRepository.create_many
+
+    async def create_many_rejecting_bad_row(self, rows, blobs=()):
+        if any(row["request_hash"] == "hash-1" for row in rows):
+            raise ValueError("invalid row")
+        await create_many(self, rows, blobs)
+
+    monkeypatch.setattr(GenerationResultRepository, "create_many", create_many_rejecting_bad_row)
+    writer = ResultWriter(
+        session_factory, batch_size=3, flush_interval=10, max_retries=2, retry_backoff=0
+    )
+    writer.start()
+
+    ids = [await writer.enqueue(make_row(index)) for index in range(3)]
+    await writer.close()
+
+    assert [row["id"] for batch in fake_repository for row in batch] == [ids[0], ids[2]]
+    assert writer.dropped_count == 1
+    assert writer.find_pending("resume_evaluation", "hash-0") is None
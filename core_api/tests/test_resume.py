@@ -1,6 +1,8 @@
 """
 Тесты для resume evaluation endpoint.
 """
+import json
+
 import pytest
 
 
@@ -136,3 +138,112 @@ def test_resume_evaluation_response_structure(test_client_with_auth, sample_vaca
     assert "work_experience_report" in result_data
     assert "skills_report" in result_data
 
+
+@pytest.mark.unit
+def test_resume_evaluation_batch_streams_results(test_client_no_auth, sample_vacancy_text, sample_resume_text):
+    """Тест пакетной оценки: строка на каждое резюме и итоговая строка."""
+    payload = {
+        "vacancy_text": sample_vacancy_text,
+        "resumes": [
+            {"id": "first", "resume_text": sample_resume_text},
+            {"resume_text": sample_resume_text},
+        ],
+    }
+
+    response = test_client_no_auth.post("/resume/evaluation/batch", json=payload)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    items = [line for line in lines if line["type"] == "item"]
+
+    assert [item["id"] for item in items] == ["first", "1"]
+    assert lines[-1]["type"] == "done"
+    assert lines[-1]["succeeded"] == 2
+
+
+@pytest.mark.unit
+def test_resume_evaluation_batch_empty(test_client_no_auth, sample_vacancy_text):
+    """Тест пакетной оценки без резюме."""
+    payload = {"vacancy_text": sample_vacancy_text, "resumes": []}
+
+    response = test_client_no_auth.post("/resume/evaluation/batch", json=payload)
+
+    assert response.status_code == 422  # Validation error
+
+
+@pytest.mark.unit
+def test_resume_evaluation_repeat_is_cached(test_client_no_auth, mock_rabbit_client, sample_vacancy_text, sample_resume_text):
+    """Повторная оценка тех же текстов берётся из сохранённой без вызова воркера."""
+    payload = {"vacancy_text": sample_vacancy_text, "resume_text": sample_resume_text}
+
+    first = test_client_no_auth.post("/resume/evaluation", json=payload).json()
+    second = test_client_no_auth.post(
+        "/resume/evaluation",
+        json={**payload, "resume_text": f"  {sample_resume_text}\n"},
+    ).json()
+
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["evaluation_id"] == first["evaluation_id"]
+    assert second["data"] == first["data"]
+    assert mock_rabbit_client.call.call_count == 1
+
+
+@pytest.mark.unit
+def test_resume_evaluation_force_refresh(test_client_no_auth, mock_rabbit_client, sample_vacancy_text, sample_resume_text):
+    """force_refresh выполняет оценку заново."""
+    payload = {"vacancy_text": sample_vacancy_text, "resume_text": sample_resume_text}
+
+    first = test_client_no_auth.post("/resume/evaluation", json=payload).json()
+    second = test_client_no_auth.post(
+        "/resume/evaluation", json={**payload, "force_refresh": True}
+    ).json()
+
+    assert second["cached"] is False
+    assert second["evaluation_id"] != first["evaluation_id"]
+    assert mock_rabbit_client.call.call_count == 2
+
+
+@pytest.mark.unit
+def test_evaluation_hash_depends_on_pipeline_version():
+    """Смена версии пайплайна меняет хэш оценки, пробелы — нет."""
+    from app.core.hashing import compute_evaluation_hash
+
+    base = compute_evaluation_hash("vacancy", "resume", "1")
+
+    assert compute_evaluation_hash(" vacancy\n", "resume ", "1") == base
+    assert compute_evaluation_hash("vacancy", "resume", "2") != base
+
+
+@pytest.mark.unit
+def test_resume_evaluation_partial_mode(test_client_no_auth, mock_rabbit_client, sample_vacancy_text, sample_resume_text):
+    """Режим оценки передаётся воркеру."""
+    response = test_client_no_auth.post(
+        "/resume/evaluation",
+        json={
+            "vacancy_text": sample_vacancy_text,
+            "resume_text": sample_resume_text,
+            "mode": "partial",
+        },
+    )
+
+    assert response.status_code == 200
+    payload = mock_rabbit_client.call.call_args.args[0]
+    assert payload["mode"] == "partial"
+
+
+@pytest.mark.unit
+def test_resume_evaluation_unknown_mode(test_client_no_auth, sample_vacancy_text, sample_resume_text):
+    """Неизвестный режим оценки отклоняется."""
+    response = test_client_no_auth.post(
+        "/resume/evaluation",
+        json={
+            "vacancy_text": sample_vacancy_text,
+            "resume_text": sample_resume_text,
+            "mode": "fast",
+        },
+    )
+
+    assert response.status_code == 422
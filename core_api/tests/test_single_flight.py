@@ -0,0 +1,115 @@
+"""
+Тесты объединения одинаковых одновременных запросов.
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.single_flight import SingleFlight
+from app.services.generation_service import GenerationService
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """Одновременные вызовы с одним ключом выполняют функцию один раз."""
+    group = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"status": "success", "data": {"value": 1}}
+
+    waiters = [asyncio.create_task(group.do("key", work)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert "key" in group
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == 1
+    assert all(result == results[0] for result in results)
+    # Присоединившиеся получают копию результата
+    assert results[1] is not results[0]
+    assert len(group) == 0
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_separately():
+    """Разные ключи не объединяются, завершённый ключ не кэшируется."""
+    group = SingleFlight()
+    work = AsyncMock(return_value="ok")
+
+    await asyncio.gather(group.do("a", work), group.do("b", work))
+    await group.do("a", work)
+
+    assert work.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_error_is_propagated_to_all_waiters():
+    """Исключение получают все ожидающие, после него ключ свободен."""
+    group = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise RuntimeError("worker failed")
+
+    waiters = [asyncio.create_task(group.do("key", failing)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert "key" not in group
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_others():
+    """Отмена первого ожидающего не прерывает запрос для остальных."""
+    group = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "ok"
+
+    leader = asyncio.create_task(group.do("key", work))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(group.do("key", work))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    release.set()
+
+    assert await follower == "ok"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_generation_service_coalesces_identical_evaluations():
+    """Одинаковые одновременные оценки резюме отправляют воркеру одно сообщение."""
+    release = asyncio.Event()
+
+    async def call(payload, queue_name):
+        await release.wait()
+        return {"status": "success", "data": {}}
+
+    rabbit_client = AsyncMock()
+    rabbit_client.call.side_effect = call
+    service = GenerationService(rabbit_client, single_flight=SingleFlight())
+
+    waiters = [
+        asyncio.create_task(service.evaluate_resume("Вакансия", "Резюме")),
+        asyncio.create_task(service.evaluate_resume(" Вакансия\n", "Резюме ")),
+        asyncio.create_task(service.evaluate_resume("Вакансия", "Другое резюме")),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*waiters)
+
+    assert rabbit_client.call.call_count == 2
@@ -0,0 +1,55 @@
+"""
+Тесты для внутренней памяти вердиктов по парам навыков.
+"""
+import uuid
+
+import pytest
+
+
+@pytest.mark.unit
+def test_skill_relevance_set_and_lookup(internal_client):
+    """Сохранённые вердикты находятся только для своей версии промпта."""
+    prompt_version = f"test-{uuid.uuid4().hex[:8]}"
+    verdict = {
+        "vacancy_skill": "контейнеризация",
+        "resume_skill": "docker",
+        "relevance": "Частичная аналогичность",
+        "reason": "Docker — инструмент контейнеризации",
+    }
+
+    response = internal_client.put(
+        "/internal/skill-relevance",
+        json={"prompt_version": prompt_version, "pairs": [verdict]},
+    )
+    assert response.status_code == 204
+
+    pairs = [
+        {"vacancy_skill": "контейнеризация", "resume_skill": "docker"},
+        {"vacancy_skill": "контейнеризация", "resume_skill": "git"},
+    ]
+    response = internal_client.post(
+        "/internal/skill-relevance/lookup",
+        json={"prompt_version": prompt_version, "pairs": pairs},
+    )
+    assert response.status_code == 200
+    assert response.json()["pairs"] == [verdict]
+
+    response = internal_client.post(
+        "/internal/skill-relevance/lookup",
+        json={"prompt_version": f"{prompt_version}-new", "pairs": pairs},
+    )
+    assert response.json()["pairs"] == []
+
+
+@pytest.mark.unit
+def test_skill_relevance_lookup_validation(internal_client):
+    """Слишком длинный навык отклоняется валидацией."""
+    response = internal_client.post(
+        "/internal/skill-relevance/lookup",
+        json={
+            "prompt_version": "1",
+            "pairs": [{"vacancy_skill": "x" * 300, "resume_skill": "docker"}],
+        },
+    )
+
+    assert response.status_code == 422
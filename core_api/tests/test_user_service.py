@@ -0,0 +1,69 @@
+"""
+Тесты для получения ID пользователя с кэшем.
+"""
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.repositories import UserRepository
+from app.services.user_service import UserIdCache, UserService
+
+
+@pytest.fixture
+def upserts(monkeypatch):
+    """Подменяет upsert пользователя: ID из словаря, вызовы в список."""
+    calls: list[tuple[str, str]] = []
+    ids: dict[str, int] = {}
+
+    async def upsert_by_email(self, email, full_name):
+        calls.append((email, full_name))
+        created = email not in ids
+        ids.setdefault(email, len(ids) + 1)
+        return ids[email], created
+
+    monkeypatch.setattr(UserRepository, "upsert_by_email", upsert_by_email)
+    return calls
+
+
+@asynccontextmanager
+async def session_factory():
+    yield MagicMock()
+
+
+@pytest.mark.asyncio
+async def test_known_user_is_resolved_from_cache(upserts):
+    """Повторный запрос того же пользователя не обращается к БД."""
+    service = UserService(session_factory, UserIdCache())
+
+    first = await service.get_or_create_user("user@example.com", "User")
+    second = await service.get_or_create_user("user@example.com", "User")
+
+    assert first == second == 1
+    assert len(upserts) == 1
+
+
+@pytest.mark.asyncio
+async def test_changed_name_is_written(upserts):
+    """При смене имени запись обновляется в БД, ID не меняется."""
+    service = UserService(session_factory, UserIdCache())
+
+    await service.get_or_create_user("user@example.com", "User")
+    user_id = await service.get_or_create_user("user@example.com", "Renamed User")
+
+    assert user_id == 1
+    assert upserts == [("user@example.com", "User"), ("user@example.com", "Renamed User")]
+
+
+@pytest.mark.unit
+def test_cache_is_bounded():
+    """При переполнении вытесняется давно не использованный пользователь."""
+    cache = UserIdCache(max_size=2)
+    cache.put("a@example.com", "A", 1)
+    cache.put("b@example.com", "B", 2)
+    cache.get("a@example.com", "A")
+    cache.put("c@example.com", "C", 3)
+
+    assert cache.get("a@example.com", "A") == 1
+    assert cache.get("b@example.com", "B") is None
+    assert cache.get("c@example.com", "C") == 3
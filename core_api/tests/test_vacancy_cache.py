@@ -0,0 +1,60 @@
+"""
+Тесты для внутреннего кэша разбора вакансий.
+"""
+import uuid
+
+import pytest
+
+from app.core.config import settings
+
+
+@pytest.mark.unit
+def test_vacancy_cache_set_and_get(internal_client):
+    """Сохранённая запись возвращается по тому же ключу."""
+    key = f"profile:{uuid.uuid4().hex}"
+    value = {"position": "Python-разработчик", "work_years": 3}
+
+    response = internal_client.put(
+        f"/internal/vacancy-cache/{key}", json={"value": value, "ttl_seconds": 60}
+    )
+    assert response.status_code == 204
+
+    response = internal_client.get(f"/internal/vacancy-cache/{key}")
+    assert response.status_code == 200
+    assert response.json() == {"key": key, "value": value}
+
+
+@pytest.mark.unit
+def test_vacancy_cache_missing_key(internal_client):
+    """Отсутствующий ключ возвращает 404."""
+    response = internal_client.get(f"/internal/vacancy-cache/profile:{uuid.uuid4().hex}")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.unit
+def test_vacancy_cache_requires_token(test_client_no_auth, monkeypatch):
+    """Запрос без заголовка или с неверным токеном отклоняется."""
+    monkeypatch.setattr(settings, "internal_api_token", "secret")
+
+    response = test_client_no_auth.get("/internal/vacancy-cache/profile:any")
+    assert response.status_code == 403
+
+    response = test_client_no_auth.get(
+        "/internal/vacancy-cache/profile:any", headers={"X-Internal-Token": "wrong"}
+    )
+    assert response.status_code == 403
+
+    response = test_client_no_auth.get(
+        "/internal/vacancy-cache/profile:any", headers={"X-Internal-Token": "secret"}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.unit
+def test_vacancy_cache_disabled_without_token(test_client_no_auth, monkeypatch):
+    """Без токена в настройках внутренние эндпоинты недоступны."""
+    monkeypatch.setattr(settings, "internal_api_token", None)
+
+    response = test_client_no_auth.get("/internal/vacancy-cache/profile:any")
+    assert response.status_code == 503
@@ -6,6 +6,7 @@ import asyncio
 from typing import Any, Dict
 
 from utils.logger import setup_logger
+from utils.worker_loop import run_sync
 from pipelines.format_job_description.get_flyer_format import get_flyer_format
 from pipelines.format_job_description.get_media_format import get_media_format
 from pipelines.format_job_description.get_social_media_format import get_social_media_format
@@ -85,8 +86,8 @@ async def get_format(input: str) -> Dict[str, Any]:
 
 
 def get_format_sync(input: str) -> Dict[str, Any]:
-    """Синхронная обёртка."""
-    return asyncio.run(get_format(input))
+    """Синхронная обёртка (выполняется в общем event loop воркера)."""
+    return run_sync(get_format(input))
 
 
 # Тестовые данные
@@ -6,7 +6,7 @@
 import asyncio
 from typing import Optional
 
-from utils.create_llm_with_retries import get_structured_llm
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.job_description.prompts.generation.prompt_builder import (
     generation_full_prompt,
@@ -18,9 +18,6 @@ from pipelines.job_description.pydantic_models.generation import (
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def job_generation_llm(
     conditions, education, experience, key_skills, other, position, soft_skills
@@ -43,49 +40,23 @@ async def job_generation_llm(
         ChatOpenAI: Экземпляр LLM, привязанный к схеме вывода через `.with_structured_output()`.
     """
     
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(f"Попытка {attempt}/{MAX_ATTEMPTS}")
-
-        try:
-            # Получаем LLM с нужной температурой для этой попытки
-            structured_llm = get_structured_llm(
-                pydantic_model=GeneratedVacancyDescription, attempt_number=attempt
-            )
-
-            # Формируем промпт
-            prompt_input = {
-                "conditions": conditions,
-                "education": education,
-                "experience": experience,
-                "key_skills": key_skills,
-                "other": other,
-                "position": position,
-                "soft_skills": soft_skills,
-            }
-            messages = await generation_full_prompt.ainvoke(prompt_input)
-
-            # Выполняем запрос
-            response = await structured_llm.ainvoke(messages)
-            logger.info(f"Успешно получено значение после {attempt} попытки")
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"Ошибка при попытке {attempt}: {str(e)}")
-
-            if attempt == MAX_ATTEMPTS:
-                break
-
-    # Все попытки провалились
-    logger.error(
-        f"Все {MAX_ATTEMPTS} попыток спарсить текст провалились: {str(last_exception)}",
-        exc_info=True,
+    # Формируем входные данные для промпта
+    prompt_input = {
+        "conditions": conditions,
+        "education": education,
+        "experience": experience,
+        "key_skills": key_skills,
+        "other": other,
+        "position": position,
+        "soft_skills": soft_skills,
+    }
+
+    return await invoke_structured_llm(
+        pydantic_model=GeneratedVacancyDescription,
+        prompt=generation_full_prompt,
+        prompt_input=prompt_input,
+        description="сгенерировать описание вакансии",
     )
-    return None
 
 
 if __name__ == "__main__":
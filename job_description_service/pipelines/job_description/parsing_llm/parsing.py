@@ -6,7 +6,7 @@
 import asyncio
 from typing import Optional
 
-from utils.create_llm_with_retries import get_structured_llm
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.job_description.prompts.parsing.prompt_builder import (
     parsing_full_prompt,
@@ -18,9 +18,6 @@ from pipelines.job_description.pydantic_models.parsing import (
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def parse_llm(text: str) -> Optional[ParsedVacancyData]:
     """
@@ -35,41 +32,15 @@ async def parse_llm(text: str) -> Optional[ParsedVacancyData]:
         ChatOpenAI: Экземпляр LLM, привязанный к схеме вывода через `.with_structured_output()`.
     """
 
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(f"Попытка {attempt}/{MAX_ATTEMPTS}")
-
-        try:
-            # Получаем LLM с нужной температурой для этой попытки
-            structured_llm = get_structured_llm(
-                pydantic_model=ParsedVacancyData, attempt_number=attempt
-            )
-
-            # Формируем промпт
-            prompt_input = {"vacancy_description": text}
-            messages = await parsing_full_prompt.ainvoke(prompt_input)
-
-            # Выполняем запрос
-            response = await structured_llm.ainvoke(messages)
-            logger.info(f"Успешно получено значение после {attempt} попытки")
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"Ошибка при попытке {attempt}: {str(e)}")
-
-            if attempt == MAX_ATTEMPTS:
-                break
+    # Формируем входные данные для промпта
+    prompt_input = {"vacancy_description": text}
 
-    # Все попытки провалились
-    logger.error(
-        f"Все {MAX_ATTEMPTS} попыток спарсить текст провалились: {str(last_exception)}",
-        exc_info=True,
+    return await invoke_structured_llm(
+        pydantic_model=ParsedVacancyData,
+        prompt=parsing_full_prompt,
+        prompt_input=prompt_input,
+        description="разобрать описание вакансии",
     )
-    return None
 
 
 # Тестовые данные
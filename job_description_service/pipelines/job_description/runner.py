@@ -6,6 +6,7 @@ import asyncio
 from typing import Any, Dict
 
 from utils.logger import setup_logger
+from utils.worker_loop import run_sync
 from pipelines.job_description.generate_job_description import get_structured_job_description
 from pipelines.job_description.generate_soft_skills import get_soft_skills
 from pipelines.job_description.parse_input import get_structured_input
@@ -119,8 +120,8 @@ async def get_job_description(input: str) -> Dict[str, Any]:
 
 
 def get_job_description_sync(input: str) -> Dict[str, Any]:
-    """Синхронная обёртка."""
-    return asyncio.run(get_job_description(input))
+    """Синхронная обёртка (выполняется в общем event loop воркера)."""
+    return run_sync(get_job_description(input))
 
 
 # Тестовые данные
@@ -6,7 +6,7 @@
 import asyncio
 from typing import Optional
 
-from utils.create_llm_with_retries import get_structured_llm
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.job_description.prompts.soft_skills.prompt_builder import (
     soft_skills_full_prompt,
@@ -16,9 +16,6 @@ from pipelines.job_description.pydantic_models.soft_skills import GeneratedSoftS
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def soft_skills_llm(text: str) -> Optional[GeneratedSoftSkills]:
     """
@@ -33,40 +30,15 @@ async def soft_skills_llm(text: str) -> Optional[GeneratedSoftSkills]:
         ChatOpenAI: Экземпляр LLM, привязанный к схеме вывода через `.with_structured_output()`.
     """
 
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(f"Попытка {attempt}/{MAX_ATTEMPTS}")
-
-        try:
-            # Получаем LLM с нужной температурой для этой попытки
-            structured_llm = get_structured_llm(
-                pydantic_model=GeneratedSoftSkills, attempt_number=attempt
-            )
-
-            # Формируем промпт
-            prompt_input = {"vacancy_description": text}
-            messages = await soft_skills_full_prompt.ainvoke(prompt_input)
-
-            # Выполняем запрос
-            response = await structured_llm.ainvoke(messages)
-            logger.info(f"Успешно получено значение после {attempt} попытки")
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"Ошибка при попытке {attempt}: {str(e)}")
-
-            if attempt == MAX_ATTEMPTS:
-                break
+    # Формируем входные данные для промпта
+    prompt_input = {"vacancy_description": text}
 
-    # Все попытки провалились
-    logger.error(f"Все {MAX_ATTEMPTS} попыток спарсить текст провалились: {str(last_exception)}",
-        exc_info=True,
+    return await invoke_structured_llm(
+        pydantic_model=GeneratedSoftSkills,
+        prompt=soft_skills_full_prompt,
+        prompt_input=prompt_input,
+        description="сгенерировать софт-скилы",
     )
-    return None
 
 
 # Тестовые данные
@@ -3,10 +3,12 @@
 Запускает полный пайплайн: извлечение → сравнение → отчёт.
 """
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 from pipelines.format_job_description.runner import get_format_sync
 from pipelines.job_description.runner import get_job_description_sync
+from utils.llm_limiter import llm_stage, track_queue_time
+from utils.llm_retry import retry_budget
 from utils.logger import setup_logger
 from get_report import get_report
 
@@ -14,16 +16,55 @@ from get_report import get_report
 logger = setup_logger(__name__)
 
 
-def run_pipeline(text: str) -> Dict[str, Any]:
+def run_pipeline(
+    text: str,
+    on_progress: Optional[Callable[[str, int], None]] = None,
+) -> Dict[str, Any]:
     """
     Основная функция пайплайна — принимает текст и возвращает отчёт.
+
+    Args:
+        text: Входные данные для генерации
+        on_progress: Колбэк (этап, процент выполнения), вызываемый после каждого этапа
     """
     logger.info("Запуск модуля: job_description_service")
 
+    # Время ожидания в очереди ограничителя LLM по этапам и бюджет повторов запросов
+    with track_queue_time() as queue_times, retry_budget() as budget:
+        report = _run_stages(text, on_progress)
+
+    logger.info(
+        "Время ожидания запросов к LLM по этапам",
+        extra={"queue_time": {stage: round(seconds, 3) for stage, seconds in queue_times.items()}},
+    )
+    logger.info(
+        f"Попытки запросов к LLM: {sum(budget.attempts.values())}, повторов {budget.used}, "
+        f"исправлено ответов {sum(budget.repaired.values())}",
+        extra=budget.summary(),
+    )
+    return report
+
+
+def _run_stages(
+    text: str,
+    on_progress: Optional[Callable[[str, int], None]],
+) -> Dict[str, Any]:
+    """Выполняет этапы пайплайна (см. run_pipeline)."""
+
+    def report_progress(stage: str, progress: int) -> None:
+        if on_progress is None:
+            return
+        try:
+            on_progress(stage, progress)
+        except Exception as e:
+            # Ошибка отправки прогресса не должна прерывать генерацию
+            logger.warning(f"Не удалось отправить прогресс этапа {stage}: {str(e)}")
+
     # === Шаг 1: Генерация описания вакансии ===
     logger.info("Генерация описания вакансии запущена")
     try:
-        job_description = get_job_description_sync(input=text)
+        with llm_stage("job_description"):
+            job_description = get_job_description_sync(input=text)
         
         # Проверка статуса structured_job_description
         if job_description is None or job_description.get("status") == "failed":
@@ -47,13 +88,16 @@ def run_pipeline(text: str) -> Dict[str, Any]:
             "status": "failed"
         }
 
+    report_progress("job_description", 50)
+
     # Преобразуем в строку тк так во всех функциях настроено все на текст
     job_description_data = f"{job_description}" # todo
     
     # === Шаг 2: Генерация описаний для различных форматов ===
     logger.info("Генерация описания для различных форматов")
     try:
-        job_formats = get_format_sync(input=job_description_data)
+        with llm_stage("job_formats"):
+            job_formats = get_format_sync(input=job_description_data)
         
         # Проверка статуса structured_job_description
         if job_formats is None or job_formats.get("status") == "failed":
@@ -76,6 +120,8 @@ def run_pipeline(text: str) -> Dict[str, Any]:
             "status": "failed"
         }
 
+    report_progress("job_formats", 100)
+
     # === Шаг 3: Формируем общий отчёт ===
     report_raw = {"job_description": job_description, "job_formats": job_formats}
 
@@ -0,0 +1,213 @@
+"""
+Локальное исправление структурированного вывода LLM.
+
+Если ответ модели не прошёл валидацию Pydantic-моделью, сырой ответ
+(аргументы вызова функции или JSON в тексте) исправляется без повторного
+запроса к LLM:
+- значения Literal с отличием в регистре, пробелах, кавычках, обрезанные
+  или с опечаткой приводятся к ближайшему допустимому значению
+  (только если оно определяется однозначно);
+- неизвестные ключи удаляются;
+- отсутствующие обязательные поля, допускающие None, заполняются None
+  (поля со значениями по умолчанию заполняет сама модель).
+
+Повторный запрос к LLM выполняется, только если исправленный ответ
+всё равно не проходит валидацию.
+"""
+
+import difflib
+import json
+import os
+import re
+import types
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union, get_args, get_origin
+
+from dotenv import load_dotenv
+from pydantic import BaseModel, ValidationError
+
+from utils.logger import setup_logger
+
+# Логирование
+logger = setup_logger(__name__)
+
+load_dotenv()
+
+# Минимальное сходство значения с допустимым значением Literal (0..1)
+OUTPUT_REPAIR_LITERAL_CUTOFF = float(os.getenv("OUTPUT_REPAIR_LITERAL_CUTOFF", "0.85"))
+# Минимальная длина обрезанного значения для поиска по префиксу
+OUTPUT_REPAIR_MIN_PREFIX = int(os.getenv("OUTPUT_REPAIR_MIN_PREFIX", "5"))
+
+_SPACES = re.compile(r"\s+")
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def _normalize(value: str) -> str:
+    """Нормализует строку для сравнения: регистр, пробелы, кавычки и знаки по краям."""
+    return _SPACES.sub(" ", value).strip(" \"'«».,;:").casefold()
+
+
+def snap_literal(value: str, choices: Tuple[Any, ...]) -> Optional[str]:
+    """
+    Находит допустимое значение Literal, ближайшее к value.
+
+    Args:
+        value: Значение из ответа модели
+        choices: Допустимые значения Literal
+
+    Returns:
+        Допустимое значение или None, если оно не определяется однозначно
+    """
+    by_normalized: Dict[str, List[str]] = {}
+    for choice in choices:
+        if isinstance(choice, str):
+            by_normalized.setdefault(_normalize(choice), []).append(choice)
+
+    normalized = _normalize(value)
+    exact = by_normalized.get(normalized, [])
+    if len(exact) == 1:
+        return exact[0]
+    if exact:
+        return None
+
+    # Обрезанное значение
+    if len(normalized) >= OUTPUT_REPAIR_MIN_PREFIX:
+        prefixed = [key for key in by_normalized if key.startswith(normalized)]
+        if len(prefixed) == 1 and len(by_normalized[prefixed[0]]) == 1:
+            return by_normalized[prefixed[0]][0]
+
+    # Опечатка: лучшее совпадение должно быть единственным
+    scored = sorted(
+        (
+            (difflib.SequenceMatcher(None, normalized, key).ratio(), key)
+            for key in by_normalized
+        ),
+        reverse=True,
+    )
+    if not scored or scored[0][0] < OUTPUT_REPAIR_LITERAL_CUTOFF:
+        return None
+    if len(scored) > 1 and scored[1][0] == scored[0][0]:
+        return None
+    candidates = by_normalized[scored[0][1]]
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def _allows_none(annotation: Any) -> bool:
+    """Допускает ли тип значение None."""
+    return annotation is None or type(None) in get_args(annotation)
+
+
+def repair_value(annotation: Any, value: Any) -> Any:
+    """
+    Исправляет значение по аннотации поля (рекурсивно для списков и вложенных моделей).
+
+    Значения, которые исправить нельзя, возвращаются как есть:
+    итог определяет валидация модели.
+    """
+    origin = get_origin(annotation)
+
+    if origin is Literal:
+        choices = get_args(annotation)
+        if value in choices or not isinstance(value, str):
+            return value
+        snapped = snap_literal(value, choices)
+        return value if snapped is None else snapped
+
+    if origin is Union or origin is types.UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if value is None or len(args) != 1:
+            return value
+        return repair_value(args[0], value)
+
+    if origin in (list, List) and isinstance(value, list):
+        args = get_args(annotation)
+        if not args:
+            return value
+        return [repair_value(args[0], item) for item in value]
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, dict):
+        return repair_fields(annotation, value)
+
+    return value
+
+
+def repair_fields(model: Type[BaseModel], data: Dict[str, Any]) -> Dict[str, Any]:
+    """Исправляет словарь полей модели: ключи, значения и отсутствующие поля."""
+    fields = model.model_fields
+    keys: Dict[str, str] = {}
+    for name, field in fields.items():
+        keys[_normalize(name)] = name
+        if field.alias:
+            keys[_normalize(field.alias)] = name
+
+    repaired: Dict[str, Any] = {}
+    for key, value in data.items():
+        name = keys.get(_normalize(key)) if isinstance(key, str) else None
+        # Неизвестные ключи удаляются
+        if name is None or name in repaired:
+            continue
+        repaired[name] = repair_value(fields[name].annotation, value)
+
+    for name, field in fields.items():
+        if name not in repaired and field.is_required() and _allows_none(field.annotation):
+            repaired[name] = None
+
+    return repaired
+
+
+def _loads(text: Any) -> Optional[Any]:
+    """Разбирает JSON из текста ответа (в том числе в блоке ``` или с текстом вокруг)."""
+    if not isinstance(text, str):
+        return None
+    text = _CODE_FENCE.sub("", text.strip())
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    try:
+        return json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return None
+
+
+def extract_raw_output(message: Any) -> Optional[Any]:
+    """
+    Извлекает сырой структурированный вывод из ответа модели (AIMessage).
+
+    Returns:
+        Аргументы первого вызова функции, JSON из текста ответа или None
+    """
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        return tool_calls[0].get("args")
+
+    invalid_tool_calls = getattr(message, "invalid_tool_calls", None)
+    if invalid_tool_calls:
+        return _loads(invalid_tool_calls[0].get("args"))
+
+    return _loads(getattr(message, "content", None))
+
+
+def repair_structured_output(model: Type[BaseModel], message: Any) -> Optional[BaseModel]:
+    """
+    Исправляет ответ модели, не прошедший валидацию.
+
+    Args:
+        model: Класс Pydantic-модели ответа
+        message: Сырой ответ модели (AIMessage)
+
+    Returns:
+        Экземпляр model или None, если исправить ответ не удалось
+    """
+    data = extract_raw_output(message)
+    if not isinstance(data, dict):
+        return None
+
+    try:
+        return model.model_validate(repair_fields(model, data))
+    except ValidationError as e:
+        logger.debug(f"Ответ {model.__name__} не удалось исправить: {str(e)}")
+        return None
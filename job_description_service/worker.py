@@ -1,6 +1,10 @@
 """
 Воркер для обработки задач из RabbitMQ.
 Вызывает run_pipeline из resume_evaluation_service.runner.
+
+Если в задаче указан report_progress=true, после каждого этапа пайплайна
+в reply_to отправляется сообщение type="progress", а итоговый ответ
+помечается type="done".
 """
 
 import json
@@ -11,6 +15,7 @@ from dotenv import load_dotenv
 
 from runner import run_pipeline
 from utils.logger import setup_logger
+from utils.worker_loop import close_worker_loop
 
 # Логирование
 logger = setup_logger(__name__)
@@ -39,12 +44,28 @@ def run_job_description_worker():
     channel.basic_qos(prefetch_count=1)
 
     def on_request(ch, method, properties, body):
+        def publish(response: dict) -> None:
+            ch.basic_publish(
+                exchange="",
+                routing_key=properties.reply_to,
+                properties=pika.BasicProperties(correlation_id=properties.correlation_id),
+                body=json.dumps(response, ensure_ascii=False),
+            )
+
+        def on_progress(stage: str, progress: int) -> None:
+            publish({"type": "progress", "stage": stage, "progress": progress})
+
+        report_progress = False
         try:
             request_data = json.loads(body)
             input_data = request_data["input_data"]
+            report_progress = bool(request_data.get("report_progress"))
 
             # Выполняем пайплайн
-            report = run_pipeline(text=input_data)
+            report = run_pipeline(
+                text=input_data,
+                on_progress=on_progress if report_progress else None,
+            )
 
             try:
                 # Пробуем стандартную сериализацию
@@ -66,12 +87,9 @@ def run_job_description_worker():
                 "data": {"message": f"Ошибка воркера: {str(e)}", "data": None},
             }
 
-        ch.basic_publish(
-            exchange="",
-            routing_key=properties.reply_to,
-            properties=pika.BasicProperties(correlation_id=properties.correlation_id),
-            body=json.dumps(response, ensure_ascii=False),
-        )
+        if report_progress:
+            response["type"] = "done"
+        publish(response)
         ch.basic_ack(delivery_tag=method.delivery_tag)
         logger.info("💤 Готов к приёму новой задачи...")
 
@@ -84,6 +102,9 @@ def run_job_description_worker():
     except KeyboardInterrupt:
         logger.info("🛑 Воркер остановлен")
         connection.close()
+    finally:
+        # Закрываем HTTP-клиенты LLM и event loop воркера
+        close_worker_loop()
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@
 import asyncio
 from typing import Optional
 
-from utils.create_llm_with_retries import get_structured_llm
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.prompts.motivation_block.prompt_builder import motivaion_block_full_prompt
 from pipelines.pydantic_models.questions_blocks import MotivationBlock
@@ -14,9 +14,6 @@ from pipelines.pydantic_models.questions_blocks import MotivationBlock
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def motivation_block_llm(vacancy: str, resume: str, work_experience_evaluation: str, salary_evaluation: str) -> Optional[MotivationBlock]:
     """
@@ -34,41 +31,15 @@ async def motivation_block_llm(vacancy: str, resume: str, work_experience_evalua
         ChatOpenAI: Экземпляр LLM, привязанный к схеме вывода через `.with_structured_output()`.
     """
 
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(f"Попытка {attempt}/{MAX_ATTEMPTS}")
-
-        try:
-            # Получаем LLM с нужной температурой для этой попытки
-            structured_llm = get_structured_llm(
-                pydantic_model=MotivationBlock, attempt_number=attempt
-            )
-
-            # Формируем промпт
-            prompt_input = {"vacancy_text": vacancy, 
-                            "resume_text": resume,
-                            "work_experience_evaluation": work_experience_evaluation,
-                            "salary_evaluation": salary_evaluation}
-            messages = await motivaion_block_full_prompt.ainvoke(prompt_input)
-
-            # Выполняем запрос
-            response = await structured_llm.ainvoke(messages)
-            logger.info(f"Успешно получено значение после {attempt} попытки")
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"Ошибка при попытке {attempt}: {str(e)}")
-
-            if attempt == MAX_ATTEMPTS:
-                break
-
-    # Все попытки провалились
-    logger.error(
-        f"Все {MAX_ATTEMPTS} попыток cгенерировать блок вопросов провалились: {str(last_exception)}",
-        exc_info=True,
+    # Формируем входные данные для промпта
+    prompt_input = {"vacancy_text": vacancy,
+                    "resume_text": resume,
+                    "work_experience_evaluation": work_experience_evaluation,
+                    "salary_evaluation": salary_evaluation}
+
+    return await invoke_structured_llm(
+        pydantic_model=MotivationBlock,
+        prompt=motivaion_block_full_prompt,
+        prompt_input=prompt_input,
+        description="сгенерировать блок вопросов о мотивации",
     )
-    return None
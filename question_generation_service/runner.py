@@ -3,24 +3,38 @@
 Запускает полный пайплайн: извлечение → сравнение → отчёт.
 """
 import asyncio
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from pipelines.generate_experience_block import get_experience_block
 from pipelines.generate_motivation_block import get_motivation_block
 from pipelines.generate_personal_block import get_personal_block
+from utils.llm_limiter import set_llm_stage, track_queue_time
+from utils.llm_retry import retry_budget
 from utils.logger import setup_logger
 from utils.prepare_work_evaluation_report import format_work_experience_report
 from utils.prepare_skills_evaluation_report import format_skills_report
 from utils.prepare_salary_evaluation_report import format_salary_report
+from utils.worker_loop import run_sync
 
 
 # Логирование
 logger = setup_logger(__name__)
 
 
-async def run_pipeline(vacancy: str, resume: str, report: dict) -> dict:
+async def run_pipeline(
+    vacancy: str,
+    resume: str,
+    report: dict,
+    on_progress: Optional[Callable[[str, int], None]] = None,
+) -> dict:
     """
     Основная функция пайплайна — принимает текст и возвращает отчёт.
+
+    Args:
+        vacancy: Текст вакансии
+        resume: Текст резюме
+        report: Отчёт по оценке резюме
+        on_progress: Колбэк (этап, процент выполнения), вызываемый после каждого блока
     """
     logger.info("Запуск модуля: question_generation_service")
 
@@ -62,17 +76,48 @@ async def run_pipeline(vacancy: str, resume: str, report: dict) -> dict:
     motivation_block_task = get_motivation_block(vacancy, resume, work_exp_report_block, salary_report_block)
     personal_block_task = get_personal_block(vacancy, resume, work_exp_report_block)
 
+    blocks_total = 3
+    blocks_done = 0
+
+    async def track(stage: str, coro: Awaitable[dict]) -> dict:
+        """Выполняет блок генерации и сообщает о его завершении."""
+        nonlocal blocks_done
+        # Блок выполняется в своей задаче gather, этап действует только в ней
+        set_llm_stage(stage)
+        result = await coro
+        blocks_done += 1
+        if on_progress is not None:
+            try:
+                on_progress(stage, 100 * blocks_done // blocks_total)
+            except Exception as e:
+                # Ошибка отправки прогресса не должна прерывать генерацию
+                logger.warning(f"Не удалось отправить прогресс этапа {stage}: {str(e)}")
+        return result
+
     try:
-        experience_block_data, motivation_block_data, personal_block_data = await asyncio.gather(
-            experience_block_task, motivation_block_task, personal_block_task,
-            return_exceptions=True,
-        )
+        with track_queue_time() as queue_times, retry_budget() as budget:
+            experience_block_data, motivation_block_data, personal_block_data = await asyncio.gather(
+                track("experience", experience_block_task),
+                track("motivation", motivation_block_task),
+                track("personal", personal_block_task),
+                return_exceptions=True,
+            )
     except Exception as e:
         logger.error(f"Ошибка при извлечении структурированных данных: {str(e)}")
         return {
             "status": "failed"
         }
 
+    logger.info(
+        "Время ожидания запросов к LLM по этапам",
+        extra={"queue_time": {stage: round(seconds, 3) for stage, seconds in queue_times.items()}},
+    )
+    logger.info(
+        f"Попытки запросов к LLM: {sum(budget.attempts.values())}, повторов {budget.used}, "
+        f"исправлено ответов {sum(budget.repaired.values())}",
+        extra=budget.summary(),
+    )
+
     if experience_block_data is None or experience_block_data.get("status") == "failed":
         return {
             "status": "failed"
@@ -99,10 +144,15 @@ async def run_pipeline(vacancy: str, resume: str, report: dict) -> dict:
     return report
 
 def run_pipeline_sync(
-    vacancy: str, resume: str, report: dict
+    vacancy: str,
+    resume: str,
+    report: dict,
+    on_progress: Optional[Callable[[str, int], None]] = None,
 ) -> Dict[str, Any]:
-    """Синхронная обёртка для пайплайна оценки навыков."""
-    return asyncio.run(run_pipeline(vacancy=vacancy, resume=resume, report=report))
+    """Синхронная обёртка для пайплайна оценки навыков (выполняется в общем event loop воркера)."""
+    return run_sync(
+        run_pipeline(vacancy=vacancy, resume=resume, report=report, on_progress=on_progress)
+    )
 
 
 async def main():
@@ -1,22 +1,294 @@
 """
 Функция для создания LLM с structured_output и температурой, зависящей от номера попытки.
+
+Клиенты LLM берутся из общего реестра процесса: на каждую пару (модель, base_url)
+держится один пул keep-alive HTTP-соединений, а привязки with_structured_output
+кэшируются по (Pydantic-модель, температура). Поэтому попытки и этапы пайплайна
+не создают заново ни ChatOpenAI, ни HTTP-клиент.
+
+Каждый запрос проходит через общий ограничитель (utils.llm_limiter), поэтому
+встроенные повторы клиента OpenAI отключены (LLM_CLIENT_MAX_RETRIES): повторные
+попытки после 429 выполняются циклом попыток с паузой ограничителя.
+
+Привязки возвращают сырой ответ вместе с результатом разбора (include_raw),
+чтобы ответ, не прошедший валидацию, можно было исправить локально
+(utils.output_repair) без повторного запроса.
 """
-from langchain_mistralai import ChatMistralAI
+import asyncio
 import os
-from typing import Type
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Type
 
+import httpx
 from dotenv import load_dotenv
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
+from utils.llm_limiter import estimate_tokens, get_llm_limiter, get_retry_after, is_rate_limit_error
+from utils.logger import setup_logger
+
+# Логирование
+logger = setup_logger(__name__)
+
+# Загружаем переменные окружения
+load_dotenv()
+
 # Конфигурация
 MAX_ATTEMPTS = 10  # всего 10 попыток на исправление
 FINAL_TEMPERATURE = 0.7  # на последней попытке температура 0.7
 
+# Настройки пула HTTP-соединений к LLM
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))  # секунд
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "120"))  # секунд
+LLM_CLIENT_MAX_RETRIES = int(os.getenv("LLM_CLIENT_MAX_RETRIES", "0"))
+# Способ получения структурированного вывода (function_calling, json_schema, json_mode).
+# При json_schema клиент OpenAI сам валидирует ответ, и сырой ответ для исправления недоступен
+LLM_STRUCTURED_OUTPUT_METHOD = os.getenv("LLM_STRUCTURED_OUTPUT_METHOD", "function_calling")
+# Максимальное количество закэшированных привязок with_structured_output
+LLM_BINDINGS_CACHE_SIZE = int(os.getenv("LLM_BINDINGS_CACHE_SIZE", "256"))
+
+
+def get_temperature(attempt_number: int) -> float:
+    """
+    Рассчитывает температуру для номера попытки: от 0.0 до FINAL_TEMPERATURE.
+
+    Args:
+        attempt_number: Номер попытки (1..MAX_ATTEMPTS).
+
+    Returns:
+        Температура, округлённая до сотых
+    """
+    if not (1 <= attempt_number <= MAX_ATTEMPTS):
+        raise ValueError(f"Номер попытки должен быть от 1 до {MAX_ATTEMPTS}")
+
+    temperature = 0.0 + (FINAL_TEMPERATURE * (attempt_number - 1)) / (MAX_ATTEMPTS - 1)
+    return round(temperature, 2)
+
+
+class LLMClientRegistry:
+    """
+    Реестр клиентов LLM процесса.
+
+    Синхронный HTTP-клиент общий для процесса. Асинхронный клиент привязан
+    к event loop (соединения httpx нельзя переиспользовать в другом loop),
+    поэтому он и построенные на нём привязки хранятся отдельно для каждого
+    loop и закрываются aclose_loop перед его завершением. В сервисах с одним
+    долгоживущим loop это один пул на процесс.
+
+    Attributes:
+        model_name: Название модели
+        api_base: URL API
+        api_key: Ключ API
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        api_base: Optional[str] = None,
+        api_key: Optional[str] = None,
+        bindings_cache_size: int = LLM_BINDINGS_CACHE_SIZE,
+    ):
+        self.model_name = model_name if model_name is not None else os.getenv("OPENAI_MODEL_NAME")
+        self.api_base = api_base if api_base is not None else os.getenv("OPENAI_API_BASE")
+        self.api_key = api_key if api_key is not None else os.getenv("OPENAI_API_KEY")
+        self.bindings_cache_size = bindings_cache_size
+
+        self._lock = threading.Lock()
+        self._sync_http_clients: Dict[Tuple[str, str], httpx.Client] = {}
+        # Состояние без запущенного loop (синхронные вызовы)
+        self._default_state: Dict[str, Any] = self._new_state()
+        # Состояние для каждого event loop
+        self._loop_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _new_state() -> Dict[str, Any]:
+        """Создаёт пустое состояние: HTTP-клиенты, ChatOpenAI и привязки."""
+        return {"http": {}, "llms": {}, "bindings": OrderedDict()}
+
+    def _state(self) -> Dict[str, Any]:
+        """Возвращает состояние для текущего event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._default_state
+
+        state = self._loop_states.get(loop)
+        if state is None:
+            state = self._new_state()
+            self._loop_states[loop] = state
+        return state
+
+    @property
+    def _client_key(self) -> Tuple[str, str]:
+        return (self.model_name or "", self.api_base or "")
+
+    @staticmethod
+    def _limits() -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+        )
+
+    def _get_sync_http_client(self) -> httpx.Client:
+        """Возвращает общий синхронный HTTP-клиент для (модель, base_url)."""
+        client = self._sync_http_clients.get(self._client_key)
+        if client is None:
+            client = httpx.Client(limits=self._limits(), timeout=LLM_TIMEOUT)
+            self._sync_http_clients[self._client_key] = client
+        return client
+
+    def _get_async_http_client(self, state: Dict[str, Any]) -> httpx.AsyncClient:
+        """Возвращает асинхронный HTTP-клиент для (модель, base_url) в текущем loop."""
+        client = state["http"].get(self._client_key)
+        if client is None:
+            client = httpx.AsyncClient(limits=self._limits(), timeout=LLM_TIMEOUT)
+            state["http"][self._client_key] = client
+            logger.info(
+                "Создан пул HTTP-соединений к LLM",
+                extra={"model": self.model_name, "base_url": self.api_base},
+            )
+        return client
+
+    def get_llm(self, temperature: float) -> ChatOpenAI:
+        """
+        Возвращает ChatOpenAI с указанной температурой на общих HTTP-клиентах.
+
+        Args:
+            temperature: Температура генерации
+
+        Returns:
+            Клиент ChatOpenAI
+        """
+        with self._lock:
+            state = self._state()
+            key = (*self._client_key, temperature)
+            llm = state["llms"].get(key)
+            if llm is None:
+                llm = ChatOpenAI(
+                    model=self.model_name,
+                    api_key=self.api_key,
+                    base_url=self.api_base,
+                    temperature=temperature,
+                    max_retries=LLM_CLIENT_MAX_RETRIES,
+                    http_client=self._get_sync_http_client(),
+                    http_async_client=self._get_async_http_client(state),
+                )
+                state["llms"][key] = llm
+            return llm
+
+    def get_structured_llm(self, pydantic_model: Type[BaseModel], temperature: float) -> Runnable:
+        """
+        Возвращает закэшированную привязку with_structured_output.
+
+        Кэш ограничен LRU: модели, создаваемые динамически на каждый запрос,
+        не накапливаются в памяти.
+
+        Args:
+            pydantic_model: Класс Pydantic-модели для structured_output.
+            temperature: Температура генерации
+
+        Returns:
+            подключение к llm с .with_structured_output(pydantic_model, include_raw=True):
+            возвращает словарь {'raw', 'parsed', 'parsing_error'}
+        """
+        llm = self.get_llm(temperature)
+        with self._lock:
+            bindings: OrderedDict = self._state()["bindings"]
+            key = (pydantic_model, *self._client_key, temperature)
+            structured_llm = bindings.get(key)
+            if structured_llm is None:
+                structured_llm = llm.with_structured_output(
+                    pydantic_model, method=LLM_STRUCTURED_OUTPUT_METHOD, include_raw=True
+                )
+                bindings[key] = structured_llm
+                while len(bindings) > self.bindings_cache_size:
+                    bindings.popitem(last=False)
+            else:
+                bindings.move_to_end(key)
+            return structured_llm
+
+    async def aclose_loop(self) -> None:
+        """
+        Закрывает асинхронные HTTP-клиенты текущего event loop и удаляет его состояние.
+
+        Вызывается перед завершением loop: без этого соединения пула
+        остаются открытыми до сборки мусора.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._loop_states.pop(loop, None)
+        if state is None:
+            return
+        for client in state["http"].values():
+            await client.aclose()
+
+    def close(self) -> None:
+        """Закрывает синхронные HTTP-клиенты и сбрасывает кэши."""
+        with self._lock:
+            for client in self._sync_http_clients.values():
+                client.close()
+            self._sync_http_clients.clear()
+            self._default_state = self._new_state()
+            self._loop_states = weakref.WeakKeyDictionary()
+
+
+class RateLimitedLLM:
+    """
+    Обёртка над привязкой LLM, выполняющая запросы через общий ограничитель.
+
+    Attributes:
+        runnable: Привязка with_structured_output
+    """
+
+    def __init__(self, runnable: Runnable):
+        self.runnable = runnable
+
+    async def ainvoke(self, input: Any, config: Any = None, **kwargs: Any) -> Any:
+        """Выполняет запрос к LLM, дождавшись слота и бюджета ограничителя."""
+        limiter = get_llm_limiter()
+        async with limiter.slot(estimate_tokens(input)):
+            try:
+                response = await self.runnable.ainvoke(input, config, **kwargs)
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    limiter.on_rate_limited(get_retry_after(e))
+                raise
+        limiter.on_success()
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.runnable, name)
+
+
+# Глобальный реестр клиентов LLM
+_llm_client_registry: Optional[LLMClientRegistry] = None
+
+
+def set_llm_client_registry(registry: Optional[LLMClientRegistry]) -> None:
+    """Устанавливает глобальный реестр клиентов LLM."""
+    global _llm_client_registry
+    _llm_client_registry = registry
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    """Возвращает глобальный реестр клиентов LLM (создаёт при первом обращении)."""
+    global _llm_client_registry
+    if _llm_client_registry is None:
+        _llm_client_registry = LLMClientRegistry()
+    return _llm_client_registry
+
 
 def get_structured_llm(
     pydantic_model: Type[BaseModel], attempt_number: int
-) -> ChatOpenAI:
+) -> RateLimitedLLM:
     """
     Возвращает LLM, настроенный на возврат указанной Pydantic-модели
     и настройками температуры, которая увеличивается с номером попытки.
@@ -26,38 +298,9 @@ def get_structured_llm(
         attempt_number: Номер попытки (1..MAX_ATTEMPTS).
 
     Returns:
-        подключение к llm с .with_structured_output(pydantic_model)
+        подключение к llm с .with_structured_output(pydantic_model, include_raw=True)
     """
-    if not (1 <= attempt_number <= MAX_ATTEMPTS):
-        raise ValueError(f"Номер попытки должен быть от 1 до {MAX_ATTEMPTS}")
+    temperature = get_temperature(attempt_number)
+    logger.debug(f"Температура: {temperature}")
 
-    # Рассчитываем температуру: от 0.0 до 0.7
-    temperature = 0.0 + (FINAL_TEMPERATURE * (attempt_number - 1)) / (MAX_ATTEMPTS - 1)
-    temperature = round(temperature, 2)
-
-    # Загружаем переменные окружения
-    load_dotenv()
-
-    api_base = os.getenv("OPENAI_API_BASE")
-    api_key = os.getenv("OPENAI_API_KEY")
-    model_name = os.getenv("OPENAI_MODEL_NAME")
-
-    # if not api_base or not api_key or not model_name:
-    #     raise ValueError("Не видно переменные окружения")
-
-    # Инициализируем LLM с нужной температурой
-    llm = ChatOpenAI(
-        model=model_name,
-        api_key=api_key,
-        base_url=api_base,
-        temperature=temperature,
-    )
-    
-    # llm = ChatMistralAI(
-    #     model_name = model_name,
-    #     api_key = api_key,
-    #     temperature = temperature
-    # )
-    print(f"Температура: {temperature}")
-
-    return llm.with_structured_output(pydantic_model)  # Добавляем pydantic модель к llm (запросу)
+    return RateLimitedLLM(get_llm_client_registry().get_structured_llm(pydantic_model, temperature))
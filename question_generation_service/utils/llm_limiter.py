@@ -0,0 +1,295 @@
+"""
+Общий ограничитель запросов к LLM в процессе воркера.
+
+Ограничивает:
+- количество одновременно выполняемых запросов (LLM_MAX_CONCURRENCY);
+- запросы и токены в минуту (LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE, 0 — без ограничения).
+
+Очередь за слотом упорядочена по приоритету: запросы интерактивных задач
+обслуживаются раньше пакетных. После ошибки превышения лимита провайдера (429)
+все новые запросы процесса ждут (Retry-After или экспоненциальная задержка).
+
+Время ожидания в очереди накапливается по этапам пайплайна: этап задаётся
+контекстом llm_stage, а track_queue_time собирает время для одного запуска.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import random
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from utils.logger import setup_logger
+
+# Логирование
+logger = setup_logger(__name__)
+
+load_dotenv()
+
+# Настройки ограничителя
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))  # запросов одновременно
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "0"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "0"))
+LLM_RATE_LIMIT_BACKOFF_BASE = float(os.getenv("LLM_RATE_LIMIT_BACKOFF_BASE", "1"))  # секунд
+LLM_RATE_LIMIT_BACKOFF_MAX = float(os.getenv("LLM_RATE_LIMIT_BACKOFF_MAX", "60"))  # секунд
+LLM_OUTPUT_TOKENS_ESTIMATE = int(os.getenv("LLM_OUTPUT_TOKENS_ESTIMATE", "500"))
+# Символов на токен при оценке размера запроса (с запасом для кириллицы)
+CHARS_PER_TOKEN = 3
+
+# Приоритеты запросов (меньше — раньше)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 1
+
+# Приоритет и этап текущей задачи
+_priority: ContextVar[int] = ContextVar("llm_priority", default=PRIORITY_INTERACTIVE)
+_stage: ContextVar[str] = ContextVar("llm_stage", default="default")
+# Время ожидания по этапам для текущего запуска пайплайна
+_queue_times: ContextVar[Optional[Dict[str, float]]] = ContextVar("llm_queue_times", default=None)
+
+
+def set_llm_priority(priority: int) -> None:
+    """Устанавливает приоритет запросов к LLM для текущей задачи."""
+    _priority.set(priority)
+
+
+def set_llm_stage(stage: str) -> None:
+    """Устанавливает этап пайплайна для учёта времени ожидания."""
+    _stage.set(stage)
+
+
+@contextmanager
+def llm_stage(stage: str) -> Iterator[None]:
+    """Контекст этапа пайплайна для учёта времени ожидания."""
+    token = _stage.set(stage)
+    try:
+        yield
+    finally:
+        _stage.reset(token)
+
+
+@contextmanager
+def track_queue_time() -> Iterator[Dict[str, float]]:
+    """
+    Собирает время ожидания в очереди к LLM по этапам для одного запуска.
+
+    Returns:
+        Словарь {этап: секунды ожидания}, заполняемый по мере выполнения
+    """
+    queue_times: Dict[str, float] = {}
+    token = _queue_times.set(queue_times)
+    try:
+        yield queue_times
+    finally:
+        _queue_times.reset(token)
+
+
+def estimate_tokens(prompt) -> int:
+    """Оценивает количество токенов запроса с учётом ответа."""
+    text = prompt.to_string() if hasattr(prompt, "to_string") else str(prompt)
+    return len(text) // CHARS_PER_TOKEN + LLM_OUTPUT_TOKENS_ESTIMATE
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Проверяет, что ошибка — превышение лимита провайдера (429)."""
+    return getattr(error, "status_code", None) == 429 or type(error).__name__ == "RateLimitError"
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Возвращает Retry-After из ответа провайдера (в секундах), если он есть."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Ведро токенов с пополнением за минуту.
+
+    Резервирование выполняется сразу (ведро может уйти в минус),
+    а вызывающий ждёт, пока долг не восстановится. Так запросы
+    получают бюджет в порядке очереди.
+
+    Attributes:
+        per_minute: Пополнение в минуту (0 — без ограничения)
+    """
+
+    def __init__(self, per_minute: int):
+        self.per_minute = per_minute
+        self._available = float(per_minute)
+        self._updated = time.monotonic()
+
+    def reserve(self, amount: float) -> float:
+        """
+        Резервирует amount единиц.
+
+        Returns:
+            Сколько секунд нужно подождать до использования резерва
+        """
+        if self.per_minute <= 0:
+            return 0.0
+        now = time.monotonic()
+        rate = self.per_minute / 60
+        self._available = min(self.per_minute, self._available + (now - self._updated) * rate)
+        self._updated = now
+        # Запрос больше ведра не должен ждать вечно
+        self._available -= min(amount, self.per_minute)
+        return max(0.0, -self._available / rate)
+
+
+class LLMLimiter:
+    """
+    Ограничитель запросов к LLM.
+
+    Attributes:
+        max_concurrency: Максимум одновременно выполняемых запросов
+        queue_time: Суммарное время ожидания по этапам за время работы процесса
+        calls: Количество запросов по этапам
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        requests_per_minute: int = LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = LLM_TOKENS_PER_MINUTE,
+    ):
+        self.max_concurrency = max_concurrency
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._blocked_until = 0.0
+        self._rate_limit_streak = 0
+        self.queue_time: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+
+    async def _acquire_slot(self, priority: int) -> None:
+        """Ждёт свободный слот; при освобождении слот передаётся самому приоритетному."""
+        if self._in_flight < self.max_concurrency and not self._waiters:
+            self._in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._counter), future)
+        heapq.heappush(self._waiters, entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Слот уже передан — возвращаем его
+                self._release_slot()
+            else:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release_slot(self) -> None:
+        """Освобождает слот или передаёт его следующему в очереди."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._in_flight -= 1
+
+    async def _wait_for_budget(self, tokens: int) -> None:
+        """Ждёт окончания задержки после 429 и бюджета запросов/токенов в минуту."""
+        while True:
+            delay = self._blocked_until - time.monotonic()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+
+        delay = max(self._requests.reserve(1), self._tokens.reserve(tokens))
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0) -> AsyncIterator[None]:
+        """
+        Занимает слот для одного запроса к LLM.
+
+        Args:
+            tokens: Оценка количества токенов запроса
+        """
+        priority = _priority.get()
+        stage = _stage.get()
+        started = time.monotonic()
+
+        await self._acquire_slot(priority)
+        try:
+            await self._wait_for_budget(tokens)
+            self._record_wait(stage, time.monotonic() - started)
+            yield
+        finally:
+            self._release_slot()
+
+    def _record_wait(self, stage: str, waited: float) -> None:
+        """Учитывает время ожидания этапа."""
+        self.queue_time[stage] = self.queue_time.get(stage, 0.0) + waited
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+        queue_times = _queue_times.get()
+        if queue_times is not None:
+            queue_times[stage] = queue_times.get(stage, 0.0) + waited
+        if waited >= 1:
+            logger.info(
+                f"Запрос к LLM ждал в очереди {waited:.2f} с",
+                extra={"stage": stage, "queue_time": round(waited, 3), "in_flight": self._in_flight},
+            )
+
+    def on_success(self) -> None:
+        """Сбрасывает серию ошибок 429 после успешного запроса."""
+        self._rate_limit_streak = 0
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """
+        Приостанавливает новые запросы после ошибки 429.
+
+        Args:
+            retry_after: Задержка из заголовка Retry-After (секунд)
+        """
+        self._rate_limit_streak += 1
+        if retry_after is None:
+            retry_after = min(
+                LLM_RATE_LIMIT_BACKOFF_MAX,
+                LLM_RATE_LIMIT_BACKOFF_BASE * 2 ** (self._rate_limit_streak - 1),
+            )
+            retry_after *= random.uniform(0.8, 1.2)
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        logger.warning(
+            f"Превышен лимит запросов к LLM, пауза {retry_after:.1f} с",
+            extra={"streak": self._rate_limit_streak, "retry_after": round(retry_after, 3)},
+        )
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Возвращает суммарное время ожидания и количество запросов по этапам."""
+        return {
+            stage: {"queue_time": round(self.queue_time[stage], 3), "calls": self.calls[stage]}
+            for stage in self.queue_time
+        }
+
+
+# Глобальный ограничитель запросов к LLM
+_llm_limiter = LLMLimiter()
+
+
+def set_llm_limiter(limiter: LLMLimiter) -> None:
+    """Устанавливает глобальный ограничитель запросов к LLM."""
+    global _llm_limiter
+    _llm_limiter = limiter
+
+
+def get_llm_limiter() -> LLMLimiter:
+    """Возвращает глобальный ограничитель запросов к LLM."""
+    return _llm_limiter
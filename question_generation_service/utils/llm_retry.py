@@ -0,0 +1,279 @@
+"""
+Повторные попытки запросов к LLM со структурированным выводом.
+
+Ответ, не прошедший валидацию, сначала исправляется локально (utils.output_repair).
+Ошибка попытки классифицируется, и повтор выполняется только там, где он помогает:
+- validation — ответ не разобран в Pydantic-модель и не исправлен:
+  повтор сразу, с повышением температуры;
+- rate_limit — превышен лимит провайдера (429): повтор без собственной паузы,
+  общий ограничитель (utils.llm_limiter) уже задерживает новые запросы;
+- timeout, transport, server — таймаут, сбой соединения, 5xx: повтор после
+  экспоненциальной паузы с jitter, температура не меняется;
+- fatal — ошибка запроса (400, 401, 403, 404, ...): без повторов.
+
+Повторы ограничены количеством попыток на запрос (LLM_MAX_ATTEMPTS) и общим
+бюджетом повторов на одну задачу (LLM_RETRY_BUDGET, см. retry_budget):
+на патологических входных данных запросы не множат стоимость и время в разы.
+Количество попыток и исправленных ответов по запросам накапливается в бюджете
+и пишется в лог задачи.
+"""
+
+import asyncio
+import json
+import os
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+
+import httpx
+from dotenv import load_dotenv
+from langchain_core.exceptions import OutputParserException
+from pydantic import BaseModel, ValidationError
+
+from utils.create_llm_with_retries import MAX_ATTEMPTS, get_structured_llm
+from utils.llm_limiter import is_rate_limit_error
+from utils.logger import setup_logger
+from utils.output_repair import repair_structured_output
+
+# Логирование
+logger = setup_logger(__name__)
+
+load_dotenv()
+
+# Настройки повторов
+LLM_MAX_ATTEMPTS = min(int(os.getenv("LLM_MAX_ATTEMPTS", "5")), MAX_ATTEMPTS)  # попыток на запрос
+LLM_RETRY_BUDGET = int(os.getenv("LLM_RETRY_BUDGET", "20"))  # повторов на задачу, 0 — без ограничения
+LLM_RETRY_BACKOFF_BASE = float(os.getenv("LLM_RETRY_BACKOFF_BASE", "0.5"))  # секунд
+LLM_RETRY_BACKOFF_MAX = float(os.getenv("LLM_RETRY_BACKOFF_MAX", "10"))  # секунд
+
+# Классы ошибок
+ERROR_VALIDATION = "validation"
+ERROR_RATE_LIMIT = "rate_limit"
+ERROR_TIMEOUT = "timeout"
+ERROR_TRANSPORT = "transport"
+ERROR_SERVER = "server"
+ERROR_FATAL = "fatal"
+
+# Классы, для которых повтор выполняется после паузы
+BACKOFF_ERRORS = (ERROR_TIMEOUT, ERROR_TRANSPORT, ERROR_SERVER)
+
+
+def classify_error(error: Exception) -> str:
+    """Определяет класс ошибки запроса к LLM."""
+    if is_rate_limit_error(error):
+        return ERROR_RATE_LIMIT
+
+    # Ошибки клиента OpenAI проверяются по имени класса (APITimeoutError наследует APIConnectionError)
+    name = type(error).__name__
+    if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException)) or name == "APITimeoutError":
+        return ERROR_TIMEOUT
+    if isinstance(error, httpx.TransportError) or name == "APIConnectionError":
+        return ERROR_TRANSPORT
+
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        if status_code >= 500:
+            return ERROR_SERVER
+        if status_code == 408:
+            return ERROR_TIMEOUT
+        return ERROR_FATAL
+
+    if isinstance(error, (ValidationError, OutputParserException, json.JSONDecodeError)):
+        return ERROR_VALIDATION
+
+    # Прочие ошибки разбора ответа повторяются как ошибки валидации
+    return ERROR_VALIDATION
+
+
+def get_backoff(retry_number: int) -> float:
+    """
+    Пауза перед повтором: экспонента с полным jitter.
+
+    Args:
+        retry_number: Номер повтора (1, 2, ...)
+
+    Returns:
+        Пауза в секундах
+    """
+    ceiling = min(LLM_RETRY_BACKOFF_MAX, LLM_RETRY_BACKOFF_BASE * 2 ** (retry_number - 1))
+    return random.uniform(0, ceiling)
+
+
+class RetryBudget:
+    """
+    Бюджет повторов одной задачи (оценки, генерации).
+
+    Attributes:
+        limit: Максимальное количество повторов (0 — без ограничения)
+        used: Использовано повторов
+        attempts: Количество попыток по запросам (имя Pydantic-модели)
+        repaired: Количество ответов, исправленных без повторного запроса
+        errors: Количество ошибок по классам
+    """
+
+    def __init__(self, limit: int = LLM_RETRY_BUDGET):
+        self.limit = limit
+        self.used = 0
+        self.attempts: Dict[str, int] = {}
+        self.repaired: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def spend(self) -> bool:
+        """Резервирует один повтор. Возвращает False, если бюджет исчерпан."""
+        if self.limit > 0 and self.used >= self.limit:
+            return False
+        self.used += 1
+        return True
+
+    def record_attempt(self, request: str) -> None:
+        """Учитывает попытку запроса."""
+        self.attempts[request] = self.attempts.get(request, 0) + 1
+
+    def record_repair(self, request: str) -> None:
+        """Учитывает ответ, исправленный без повторного запроса."""
+        self.repaired[request] = self.repaired.get(request, 0) + 1
+
+    def record_error(self, error_class: str) -> None:
+        """Учитывает ошибку попытки."""
+        self.errors[error_class] = self.errors.get(error_class, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Сводка для лога задачи."""
+        return {
+            "retries": self.used,
+            "retry_budget": self.limit,
+            "attempts": dict(self.attempts),
+            "repaired": dict(self.repaired),
+            "errors": dict(self.errors),
+        }
+
+
+# Бюджет повторов текущей задачи
+_budget: ContextVar[Optional[RetryBudget]] = ContextVar("llm_retry_budget", default=None)
+
+
+@contextmanager
+def retry_budget(limit: int = LLM_RETRY_BUDGET) -> Iterator[RetryBudget]:
+    """
+    Общий бюджет повторов для всех запросов к LLM одной задачи.
+
+    Returns:
+        Бюджет, заполняемый по мере выполнения (для лога задачи)
+    """
+    budget = RetryBudget(limit)
+    token = _budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget.reset(token)
+
+
+def resolve_structured_output(
+    pydantic_model: Type[BaseModel], result: Dict[str, Any]
+) -> Tuple[BaseModel, bool]:
+    """
+    Результат привязки with_structured_output(include_raw=True).
+
+    Args:
+        pydantic_model: Класс Pydantic-модели ответа
+        result: Словарь {'raw', 'parsed', 'parsing_error'}
+
+    Returns:
+        Экземпляр pydantic_model и признак того, что ответ исправлен локально
+
+    Raises:
+        Exception: Ошибка разбора, если ответ не удалось исправить
+    """
+    if result.get("parsed") is not None:
+        return result["parsed"], False
+
+    repaired = repair_structured_output(pydantic_model, result.get("raw"))
+    if repaired is not None:
+        return repaired, True
+
+    raise result.get("parsing_error") or OutputParserException(
+        "Ответ модели не содержит структурированного вывода"
+    )
+
+
+def _temperature_attempt(step: int, max_attempts: int) -> int:
+    """Номер попытки для температуры: последний повтор получает максимальную температуру."""
+    if max_attempts <= 1:
+        return 1
+    return 1 + round((step - 1) * (MAX_ATTEMPTS - 1) / (max_attempts - 1))
+
+
+async def invoke_structured_llm(
+    pydantic_model: Type[BaseModel],
+    prompt: Any,
+    prompt_input: Dict[str, Any],
+    description: str,
+    max_attempts: int = LLM_MAX_ATTEMPTS,
+) -> Optional[BaseModel]:
+    """
+    Выполняет запрос к LLM со структурированным выводом и повторами по классу ошибки.
+
+    Args:
+        pydantic_model: Класс Pydantic-модели ответа
+        prompt: Шаблон промпта (ChatPromptTemplate)
+        prompt_input: Входные данные шаблона
+        description: Что делает запрос (для логов), например "извлечь курсы"
+        max_attempts: Максимальное количество попыток
+
+    Returns:
+        Экземпляр pydantic_model или None, если все попытки провалились
+    """
+    budget = _budget.get()
+    request = pydantic_model.__name__
+    messages = await prompt.ainvoke(prompt_input)
+
+    # Шаг температуры растёт только после ошибок валидации
+    temperature_step = 1
+    last_exception: Optional[Exception] = None
+
+    for attempt in range(1, max_attempts + 1):
+        logger.info(f"Попытка {attempt}/{max_attempts}: {description}")
+        if budget is not None:
+            budget.record_attempt(request)
+
+        try:
+            structured_llm = get_structured_llm(
+                pydantic_model=pydantic_model,
+                attempt_number=_temperature_attempt(temperature_step, max_attempts),
+            )
+            response, repaired = resolve_structured_output(
+                pydantic_model, await structured_llm.ainvoke(messages)
+            )
+            if repaired:
+                logger.info(f"Ответ исправлен без повторного запроса: {description}")
+                if budget is not None:
+                    budget.record_repair(request)
+            logger.info(f"Успешно после {attempt} попытки: {description}")
+            return response
+
+        except Exception as e:
+            last_exception = e
+            error_class = classify_error(e)
+            if budget is not None:
+                budget.record_error(error_class)
+            logger.warning(
+                f"Ошибка при попытке {attempt} ({error_class}): {description}: {str(e)}"
+            )
+
+        if error_class == ERROR_FATAL or attempt == max_attempts:
+            break
+        if budget is not None and not budget.spend():
+            logger.warning(f"Бюджет повторов задачи исчерпан: {description}")
+            break
+
+        if error_class == ERROR_VALIDATION:
+            temperature_step += 1
+        elif error_class in BACKOFF_ERRORS:
+            await asyncio.sleep(get_backoff(attempt))
+
+    logger.error(
+        f"Не удалось {description} за {attempt} попыток: {str(last_exception)}",
+        exc_info=last_exception,
+    )
+    return None
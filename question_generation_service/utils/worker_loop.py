@@ -0,0 +1,49 @@
+"""
+Общий event loop синхронного воркера.
+
+Воркер на pika обрабатывает сообщения синхронно, а пайплайны асинхронные.
+asyncio.run на каждое сообщение создавал новый event loop, а с ним новый
+пул HTTP-соединений к LLM (клиенты реестра привязаны к loop), который
+не закрывался. Корутины выполняются в одном долгоживущем loop процесса:
+пул соединений и привязки LLM переиспользуются между сообщениями,
+а при остановке воркера HTTP-клиенты loop закрываются (close_worker_loop).
+"""
+
+import asyncio
+from typing import Awaitable, Optional, TypeVar
+
+from utils.create_llm_with_retries import get_llm_client_registry
+
+T = TypeVar("T")
+
+# Event loop воркера
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    Выполняет корутину в общем event loop воркера (создаёт его при первом вызове).
+
+    Args:
+        coro: Корутина пайплайна
+
+    Returns:
+        Результат корутины
+    """
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop.run_until_complete(coro)
+
+
+def close_worker_loop() -> None:
+    """Закрывает HTTP-клиенты LLM event loop воркера и сам loop."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        return
+    try:
+        _worker_loop.run_until_complete(get_llm_client_registry().aclose_loop())
+        _worker_loop.run_until_complete(_worker_loop.shutdown_asyncgens())
+    finally:
+        _worker_loop.close()
+        _worker_loop = None
@@ -1,6 +1,10 @@
 """
 Воркер для обработки задач из RabbitMQ.
 Вызывает run_pipeline из resume_evaluation_service.runner.
+
+Если в задаче указан report_progress=true, после каждого блока генерации
+в reply_to отправляется сообщение type="progress", а итоговый ответ
+помечается type="done".
 """
 
 import json
@@ -12,6 +16,7 @@ from dotenv import load_dotenv
 
 from runner import run_pipeline_sync
 from utils.logger import setup_logger
+from utils.worker_loop import close_worker_loop
 
 # Логирование
 logger = setup_logger(__name__)
@@ -40,32 +45,52 @@ def run_question_generation_worker():
     channel.basic_qos(prefetch_count=1)
 
     def on_request(ch, method, properties, body):
+        def publish(response: dict) -> None:
+            ch.basic_publish(
+                exchange="",
+                routing_key=properties.reply_to,
+                properties=pika.BasicProperties(correlation_id=properties.correlation_id),
+                body=json.dumps(response, ensure_ascii=False),
+            )
+
+        def on_progress(stage: str, progress: int) -> None:
+            publish({"type": "progress", "stage": stage, "progress": progress})
+
+        report_progress = False
         try:
             request_data = json.loads(body)
+            report_progress = bool(request_data.get("report_progress"))
             vacancy_text = request_data.get("vacancy_text", None)
             resume_text = request_data.get("resume_text", None)
             report_raw = request_data.get("report")
             
-            if report_raw.get("status") == "success":
-                report = report_raw.get("data")
-            else:
-                logger.error("Не удалось получить отчет по образованию")
-                return {"status": "failed"}
+            if not isinstance(report_raw, dict) or report_raw.get("status") != "success":
+                raise ValueError("Не получен успешный отчет по оценке резюме")
+            report = report_raw.get("data")
 
             print('report', report)
 
             # Выполняем пайплайн
-            result = run_pipeline_sync(vacancy=vacancy_text, resume=resume_text, report=report)
+            result = run_pipeline_sync(
+                vacancy=vacancy_text,
+                resume=resume_text,
+                report=report,
+                on_progress=on_progress if report_progress else None,
+            )
 
             if result is None or result.get("status") == "failed":
-                logger.error("Не удалось получить отчет по образованию")
-                return {"status": "failed"}
-
-            # Формируем ответ
-            response = {
-                "status": "success",
-                "data": result,
-            }
+                logger.error("Не удалось сгенерировать вопросы")
+                response = {
+                    "status": "failed",
+                    "data": None,
+                    "message": "Не удалось сгенерировать вопросы",
+                }
+            else:
+                # Формируем ответ
+                response = {
+                    "status": "success",
+                    "data": result,
+                }
 
         except Exception as e:
             # Возвращаем валидный data даже при ошибке
@@ -75,12 +100,9 @@ def run_question_generation_worker():
                 "message": f"Ошибка воркера: {str(e)}",
             }
 
-        ch.basic_publish(
-            exchange="",
-            routing_key=properties.reply_to,
-            properties=pika.BasicProperties(correlation_id=properties.correlation_id),
-            body=json.dumps(response, ensure_ascii=False),
-        )
+        if report_progress:
+            response["type"] = "done"
+        publish(response)
         ch.basic_ack(delivery_tag=method.delivery_tag)
         logger.info("💤 Готов к приёму новой задачи...")
 
@@ -95,6 +117,9 @@ def run_question_generation_worker():
     except KeyboardInterrupt:
         logger.info("🛑 Воркер остановлен")
         connection.close()
+    finally:
+        # Закрываем HTTP-клиенты LLM и event loop воркера
+        close_worker_loop()
 
 
 if __name__ == "__main__":
@@ -7,15 +7,12 @@ from typing import Optional
 
 from pipelines.additional_evaluation.prompts.prompt_builder import additional_full_prompt
 from pipelines.additional_evaluation.pydantic_models.additional_info import WorkScheduleComparison
-from utils.create_llm_with_retries import get_structured_llm
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def additional_llm(resume: str, vacancy: str) -> Optional[WorkScheduleComparison]:
     """
@@ -31,42 +28,12 @@ async def additional_llm(resume: str, vacancy: str) -> Optional[WorkScheduleComp
         ChatOpenAI: Экземпляр LLM, привязанный к схеме вывода через `.with_structured_output()`.
     """
 
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(f"Попытка {attempt}/{MAX_ATTEMPTS}")
-
-        try:
-            # Получаем LLM с нужной температурой для этой попытки
-            structured_llm = get_structured_llm(
-                pydantic_model=WorkScheduleComparison, attempt_number=attempt
-            )
-
-            # Формируем промпт
-            prompt_input = {"resume": resume, "vacancy": vacancy}
-            messages = await additional_full_prompt.ainvoke(prompt_input)
-
-            # Выполняем запрос
-            response = await structured_llm.ainvoke(messages)
-            logger.info(
-                f"Успешно получено значение после {attempt} попытки"
-            )
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(
-                f"Ошибка при попытке {attempt}: {str(e)}"
-            )
-
-            if attempt == MAX_ATTEMPTS:
-                break
+    # Формируем входные данные для промпта
+    prompt_input = {"resume": resume, "vacancy": vacancy}
 
-    # Все попытки провалились
-    logger.error(
-        f"Все {MAX_ATTEMPTS} попыток извлечь условия работы провалились: {str(last_exception)}",
-        exc_info=True,
+    return await invoke_structured_llm(
+        pydantic_model=WorkScheduleComparison,
+        prompt=additional_full_prompt,
+        prompt_input=prompt_input,
+        description="извлечь условия работы",
     )
-    return None
@@ -4,24 +4,29 @@
 
 import asyncio
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from utils.logger import setup_logger
 from pipelines.additional_evaluation.additional_info import get_additional_info
+from pipelines.vacancy_profile.extract_profile import format_vacancy_schedule, resolve_vacancy_profile
 
 # Логирование
 logger = setup_logger(__name__)
 
 
 async def evaluate_additional_match(
-    resume_text: str, vacancy_text: str
+    resume_text: str,
+    vacancy_text: Optional[str] = None,
+    vacancy_profile: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Полный пайплайн: извлечение дополнительной информации → сравнение → отчёт.
+    Вместо полного текста вакансии в LLM передаётся график из профиля вакансии.
 
     Args:
         resume_text: Текст резюме
-        vacancy_text: Текст вакансии
+        vacancy_text: Текст вакансии (используется, если профиль не передан)
+        vacancy_profile: Профиль вакансии
 
     Returns:
         Словарь с отчётом о соответствии графика работы и тд.
@@ -29,7 +34,13 @@ async def evaluate_additional_match(
     logger.info("Запуск пайплайна оценки дополнительной информации")
 
     try:
-        result = await get_additional_info(resume_text, vacancy_text)
+        vacancy_profile = await resolve_vacancy_profile(vacancy_text, vacancy_profile)
+        if vacancy_profile.get("status") == "failed":
+            result = None
+        else:
+            result = await get_additional_info(
+                resume_text, format_vacancy_schedule(vacancy_profile)
+            )
         
         # Процесс получения дополнительной информации
         if result is None or result.get("status") == "failed":
@@ -7,9 +7,7 @@ import asyncio
 import sys
 from typing import Optional
 
-from langchain_core.messages import BaseMessage
-
-from utils.create_llm_with_retries import get_structured_llm
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.education_evaluation.prompts.extract_courses.extract_course_prompt_builder import (
     extract_course_full_prompt,
@@ -19,9 +17,6 @@ from pipelines.education_evaluation.pydantic_models.extract_courses import Cours
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def extract_course_llm(text: str) -> Optional[CourseList]:
     """
@@ -39,49 +34,16 @@ async def extract_course_llm(text: str) -> Optional[CourseList]:
                               При ошибках или пустом тексте возвращается `CourseList(course_list=[])`.
     """
 
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(f"Попытка {attempt}/{MAX_ATTEMPTS} для извлечения курсов")
-
-        try:
-            # Получаем LLM с увеличивающейся температурой
-            structured_llm = get_structured_llm(
-                pydantic_model=CourseList, attempt_number=attempt
-            )
-
-            # Формируем входные данные для промпта
-            prompt_input = {"text": text.strip()}
-
-            # Генерируем сообщения (системный + few-shot + пользовательский)
-            messages: list[BaseMessage] = await extract_course_full_prompt.ainvoke(
-                prompt_input
-            )
+    # Формируем входные данные для промпта
+    prompt_input = {"text": text.strip()}
 
-            # Выполняем вызов модели
-            response: CourseList = await structured_llm.ainvoke(messages)
-
-            logger.info(f"Успешно извлечены курсы после {attempt} попытки")
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"Ошибка при попытке {attempt} извлечь курсы: {str(e)}")
-
-            if attempt == MAX_ATTEMPTS:
-                break
-
-    # Все попытки провалились
-    logger.error(
-        f"Все {MAX_ATTEMPTS} попыток извлечь курсы провалились: {str(last_exception)}",
-        exc_info=True,
+    return await invoke_structured_llm(
+        pydantic_model=CourseList,
+        prompt=extract_course_full_prompt,
+        prompt_input=prompt_input,
+        description="извлечь курсы",
     )
 
-    # Возвращаем пустой список курсов при полном провале
-    return None
-
 
 # === Тестовый запуск ===
 if __name__ == "__main__":
@@ -7,9 +7,7 @@ import asyncio
 import sys
 from typing import Optional
 
-from langchain_core.messages import BaseMessage
-
-from utils.create_llm_with_retries import get_structured_llm
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.education_evaluation.prompts.extract_main_edu.extract_main_edu_prompt_builder import (
     extract_main_edu_full_prompt,
@@ -21,9 +19,6 @@ from pipelines.education_evaluation.pydantic_models.extract_main_edu import (
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def extract_main_edu_llm(text: str, text_type: str) -> Optional[EducationList]:
     """
@@ -42,53 +37,16 @@ async def extract_main_edu_llm(text: str, text_type: str) -> Optional[EducationL
                                  и специализациями, или None при полном провале.
     """
 
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(f"Попытка {attempt}/{MAX_ATTEMPTS} для извлечения образования из {text_type}")
-
-        try:
-            # Получаем LLM с увеличивающейся температурой
-            structured_llm = get_structured_llm(
-                pydantic_model=EducationList, attempt_number=attempt
-            )
-
-            # Формируем входные данные для промпта
-            prompt_input = {"text": text.strip(), "text_type": text_type}
+    # Формируем входные данные для промпта
+    prompt_input = {"text": text.strip(), "text_type": text_type}
 
-            # Генерируем сообщения
-            messages = await extract_main_edu_full_prompt.ainvoke(
-                prompt_input
-            )
-
-            # Выполняем вызов модели
-            response = await structured_llm.ainvoke(messages)
-
-            logger.info(
-                f"Успешно извлечена информация об образовании после {attempt} попытки"
-            )
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(
-                f"Ошибка при попытке {attempt} извлечь образование из {text_type}: {str(e)}",
-            )
-            
-            if attempt == MAX_ATTEMPTS:
-                break
-
-    # Все попытки провалились
-    logger.error(
-        f"Все {MAX_ATTEMPTS} попыток извлечь образование из {text_type} провалились: {str(last_exception)}",
-        exc_info=True,
+    return await invoke_structured_llm(
+        pydantic_model=EducationList,
+        prompt=extract_main_edu_full_prompt,
+        prompt_input=prompt_input,
+        description=f"извлечь образование из {text_type}",
     )
 
-    # Возвращаем дефолтное значение согласно правилам
-    return None
-
 
 # === Тестовый запуск ===
 if __name__ == "__main__":
@@ -1,11 +1,16 @@
 """"Модель для оценки релевантности курсов"""
 
-from typing import List, Literal
+from functools import lru_cache
+from typing import List, Tuple
 
 from pydantic import BaseModel, Field, create_model
 
+from utils.dynamic_models import DYNAMIC_MODEL_CACHE_SIZE, DYNAMIC_SCHEMA_MODE, choice_field
 
-def create_relevance_course_model(course_names: list[str]) -> type[BaseModel]:
+
+def create_relevance_course_model(
+    course_names: list[str], mode: str = DYNAMIC_SCHEMA_MODE
+) -> type[BaseModel]:
     """
     Создаёт Pydantic-модель с динамическим `Literal` типом для оценки релевантности курса.
     
@@ -14,11 +19,15 @@ def create_relevance_course_model(course_names: list[str]) -> type[BaseModel]:
         reason (str): Краткое обоснование, почему курс релевантен/нерелевантен.
         relevance (bool): Релевантен ли курс для вакансии.
     """
-    CourseLiteral = Literal[tuple(course_names)]
+    return _relevance_course_model(tuple(course_names), mode)
+
 
+@lru_cache(maxsize=DYNAMIC_MODEL_CACHE_SIZE)
+def _relevance_course_model(course_names: Tuple[str, ...], mode: str) -> type[BaseModel]:
+    """Модель курса (кэшируется, см. create_relevance_course_model)."""
     return create_model(
         "RelevanceCourse",
-        course_name=(CourseLiteral, Field(..., description="Название курса")),
+        course_name=choice_field(course_names, "Название курса", mode),
         reason=(
             str,
             Field(
@@ -30,14 +39,26 @@ def create_relevance_course_model(course_names: list[str]) -> type[BaseModel]:
     )
 
 
-def create_relevance_course_list_model(course_names: list[str]) -> type[BaseModel]:
+def create_relevance_course_list_model(
+    course_names: list[str], mode: str = DYNAMIC_SCHEMA_MODE
+) -> type[BaseModel]:
     """
     Создаёт динамическую модель списка курсов с релевантностью. 
     
     Attributes:
         courses (List[RelevanceCourse]): Список курсов с оценкой релевантности.
+
+    Args:
+        course_names: Названия курсов
+        mode: Режим схемы (enum или index, см. utils.dynamic_models)
     """
-    RelevanceCourse = create_relevance_course_model(course_names)
+    return _relevance_course_list_model(tuple(course_names), mode)
+
+
+@lru_cache(maxsize=DYNAMIC_MODEL_CACHE_SIZE)
+def _relevance_course_list_model(course_names: Tuple[str, ...], mode: str) -> type[BaseModel]:
+    """Модель списка курсов (кэшируется, см. create_relevance_course_list_model)."""
+    RelevanceCourse = _relevance_course_model(course_names, mode)
 
     return create_model(
         "RelevanceCourseList",
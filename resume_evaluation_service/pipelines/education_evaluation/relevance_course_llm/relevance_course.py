@@ -7,10 +7,10 @@ import asyncio
 import sys
 from typing import Dict, List, Optional
 
-from langchain_core.messages import BaseMessage
 from pydantic import BaseModel
 
-from utils.create_llm_with_retries import get_structured_llm
+from utils.dynamic_models import DYNAMIC_SCHEMA_MODE, SCHEMA_MODE_INDEX
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.education_evaluation.prompts.course_relevance.course_relevance_prompt_builder import (
     relevance_course_full_prompt,
@@ -20,9 +20,6 @@ from pipelines.education_evaluation.pydantic_models.course_relevance import crea
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток для оценки релевантности курсов
-MAX_ATTEMPTS = 10
-
 
 async def evaluate_courses_relevance_llm(
     courses: List[Dict[str, str]], vacancy: str
@@ -50,47 +47,22 @@ async def evaluate_courses_relevance_llm(
         logger.error(f"Ошибка при создании динамической модели: {str(e)}", exc_info=True)
         return None
 
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(f"Попытка {attempt}/{MAX_ATTEMPTS} для оценки релевантности курсов")
-
-        try:
-            # Получаем LLM с увеличивающейся температурой
-            structured_llm = get_structured_llm(
-                pydantic_model=RelevanceCourseList, attempt_number=attempt
-            )
-
-            # Формируем входные данные
-            prompt_input = {
-                "courses": courses,
-                "job_description": vacancy.strip(),
-            }
-
-            # Генерируем сообщения
-            messages = await relevance_course_full_prompt.ainvoke(
-                prompt_input
-            )
-
-            # Выполняем вызов
-            response = await structured_llm.ainvoke(messages)
-
-            logger.info(f"Успешно оценена релевантность курсов после {attempt} попытки")
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"Ошибка при попытке {attempt} оценить релевантность курсов: {str(e)}")
-
-            if attempt == MAX_ATTEMPTS:
-                break
-
-    # Все попытки провалились
-    logger.error(f"Все {MAX_ATTEMPTS} попыток оценить релевантность курсов провалились: {str(last_exception)}")
-    
-    return None
+    # В режиме index ответ ссылается на курсы по номерам
+    if DYNAMIC_SCHEMA_MODE == SCHEMA_MODE_INDEX:
+        courses = [{"id": number, **course} for number, course in enumerate(courses, 1)]
+
+    # Формируем входные данные для промпта
+    prompt_input = {
+        "courses": courses,
+        "job_description": vacancy.strip(),
+    }
+
+    return await invoke_structured_llm(
+        pydantic_model=RelevanceCourseList,
+        prompt=relevance_course_full_prompt,
+        prompt_input=prompt_input,
+        description="оценить релевантность курсов",
+    )
 
 
 # === Тестовый запуск ===
@@ -4,114 +4,86 @@
 
 import asyncio
 import sys
-from typing import Any, Dict
+from typing import Any, Awaitable, Dict, Optional, Union
 
 from utils.logger import setup_logger
+from utils.stage_graph import StageGraph, is_failed
 from pipelines.education_evaluation.extract_courses import get_courses
 from pipelines.education_evaluation.extract_edu import get_education
 from pipelines.education_evaluation.get_report import get_report
 from pipelines.education_evaluation.course_relevance import get_courses_relevance
+from pipelines.vacancy_profile.extract_profile import format_vacancy_summary, resolve_vacancy_profile
 
 # Логирование
 logger = setup_logger(__name__)
 
 
 async def evaluate_education_match_pipeline(
-    resume_text: str, vacancy_text: str
+    resume_text: str,
+    vacancy_text: Optional[str] = None,
+    vacancy_profile: Union[Dict[str, Any], Awaitable[Dict[str, Any]], None] = None,
 ) -> Dict[str, Any]:
     """
     Полный пайплайн:
-    1. Извлечение образования и курсов
+    1. Извлечение образования и курсов (требования вакансии — из профиля вакансии)
     2. Оценка релевантности курсов
     3. Генерация полного отчёта
 
+    Этапы выполняются по графу зависимостей: оценка релевантности курсов
+    начинается сразу после извлечения курсов и профиля вакансии, не дожидаясь
+    извлечения основного образования.
+
     Returns:
         Полный отчет с оценкой по критериям.
     """
     logger.info("Запуск пайплайна оценки образования и курсов")
 
-    # Параллельно извлекаем образование и курсы
-    try:
-        resume_edu_task = get_education(resume_text, text_type="резюме")
-        vacancy_edu_task = get_education(vacancy_text, text_type="вакансии")
-        resume_courses_task = get_courses(resume_text)
-
-        parsing_results = await asyncio.gather(
-            resume_edu_task,
-            vacancy_edu_task,
-            resume_courses_task,
-            return_exceptions=True,
-        )
-
-        resume_edu, vacancy_edu, resume_courses = parsing_results
-
-    except Exception as e:
-        logger.error(
-            f"Ошибка при извлечении данных: {str(e)}", exc_info=True
-        )
-        return {
-            "final_score": 0,
-            "error": "Ошибка при парсинге образования или курсов",
-            "details": str(e),
-            "status": "failed"
-        }
-
-    # Проверяем что resume_edu не None и статус не "failed"
-    if resume_edu is None or resume_edu.get("status") == "failed":
-        return {'status': 'failed'}
-
-    # Проверяем что vacancy_edu не None и статус не "failed"
-    if vacancy_edu is None or vacancy_edu.get("status") == "failed":
-        return {'status': 'failed'}
-
-    # Проверяем что resume_courses не None и статус не "failed"
-    if resume_courses is None or resume_courses.get("status") == "failed":
-        return {'status': 'failed'}
-
-    # Если курсы найдены, то оценим релевантность
-    course_list = resume_courses.get('course_list', [])
-
-    if course_list:
+    async def courses_relevance(
+        resume_courses: Dict[str, Any], vacancy_profile: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # Если курсы найдены, то оценим релевантность
+        course_list = resume_courses.get('course_list', [])
+        if not course_list:
+            return {'courses': [], 'status': 'success'}
 
         # Преобразуем курсы
         course_items = [
-                    {"course_name": c.get('course_name'), "description": c.get('description')}
-                    for c in resume_courses.get('course_list')
-                ]
+            {"course_name": c.get('course_name'), "description": c.get('description')}
+            for c in course_list
+        ]
         # Оцениваем релевантность курсов
-        try:
-            courses_relevance = await get_courses_relevance(course_items, vacancy_text)
-
-            # Процесс получения дополнительной информации
-            if courses_relevance is None or courses_relevance.get("status") == "failed":
-                return {"status": "failed"}
-
-        except Exception as e:
-            logger.error(
-                f"Ошибка при оценке релевантности курсов: {str(e)}", exc_info=True
-            )
-            return {'status': 'failed'}
-
-    else:
-        courses_relevance = {'courses': [], 'status': 'success'}
-
+        return await get_courses_relevance(
+            course_items, format_vacancy_summary(vacancy_profile)
+        )
 
-    # print("Courses relevance:", courses_relevance)
-    # print("resume_edu:", resume_edu)
-    # print("resume_courses:", resume_courses)
-    # print("vacancy_edu:", vacancy_edu)
-    # Передаём данные в отчёт
-    try:
-        report = get_report(
+    async def report(
+        resume_edu: Dict[str, Any],
+        vacancy_profile: Dict[str, Any],
+        resume_courses: Dict[str, Any],
+        courses_relevance: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        # Передаём данные в отчёт
+        return get_report(
             resume_edu=resume_edu,
-            vacancy_edu=vacancy_edu,
+            vacancy_edu={'edu_list': vacancy_profile.get('edu_list', [])},
             resume_courses=resume_courses,
             courses_relevance=courses_relevance
         )
-        return report
-    except Exception as e:
-        logger.error(f"Ошибка при генерации отчёта: {str(e)}", exc_info=True)
-        return {'status': 'failed'}
+
+    # Блок выполняется целиком или не выполняется: при неуспехе этапа остальные отменяются
+    graph = StageGraph("education", fail_fast=True)
+    graph.add("resume_edu", lambda: get_education(resume_text, text_type="резюме"))
+    graph.add("vacancy_profile", lambda: resolve_vacancy_profile(vacancy_text, vacancy_profile))
+    graph.add("resume_courses", lambda: get_courses(resume_text))
+    graph.add("courses_relevance", courses_relevance, deps=("resume_courses", "vacancy_profile"))
+    graph.add(
+        "report",
+        report,
+        deps=("resume_edu", "vacancy_profile", "resume_courses", "courses_relevance"),
+    )
+
+    results = await graph.run()
+    return results["report"] if not is_failed(results["report"]) else {'status': 'failed'}
 
 def evaluate_education_match_sync(
     resume_text: str, vacancy_text: str
@@ -3,28 +3,34 @@
 """
 
 import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from utils.logger import setup_logger
 from pipelines.salary_evaluation.extract_sales import get_salary
 from pipelines.salary_evaluation.get_report import compare_salaries
+from pipelines.vacancy_profile.extract_profile import resolve_vacancy_profile
 
 # Логирование
 logger = setup_logger(__name__)
 
-async def evaluate_salary_match(resume_text: str, vacancy_text: str) -> Dict[str, Any]:
+async def evaluate_salary_match(
+    resume_text: str,
+    vacancy_text: Optional[str] = None,
+    vacancy_profile: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
     """
     Полный пайплайн: извлечение + сравнение + отчёт.
+    Зарплата вакансии берётся из профиля вакансии; если профиль не передан,
+    он извлекается из vacancy_text.
     """
 
-    # Параллельно извлекаем зарплату из резюме и вакансии
+    # Параллельно извлекаем зарплату из резюме и профиль вакансии
     logger.info("Извлекаем текст из резюме")
     resume_task = get_salary(resume_text, text_type="резюме")
-    logger.info("Извлекаем текст из вакансии")
-    vacancy_task = get_salary(vacancy_text, text_type="вакансии")
+    vacancy_task = resolve_vacancy_profile(vacancy_text, vacancy_profile)
 
     try:
-        resume_data, vacancy_data = await asyncio.gather(resume_task, vacancy_task)
+        resume_data, vacancy_profile = await asyncio.gather(resume_task, vacancy_task)
     except Exception as e:
         return {
             "score": 0,
@@ -51,8 +57,9 @@ async def evaluate_salary_match(resume_text: str, vacancy_text: str) -> Dict[str
             "status": "failed"
         }
     
-    # Проверка статуса vacancy_data
-    if vacancy_data is None or vacancy_data.get("status") == "failed":
+    # Проверка статуса профиля вакансии
+    vacancy_data = vacancy_profile.get("salary") if vacancy_profile else None
+    if vacancy_data is None:
         logger.error("Ошибка: Не удалось извлечь зарплатные ожидания из вакансии")
         return {
             "score": 0,
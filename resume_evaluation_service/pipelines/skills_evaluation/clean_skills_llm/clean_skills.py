@@ -5,7 +5,7 @@
 
 from typing import Optional
 
-from utils.create_llm_with_retries import get_structured_llm
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.skills_evaluation.prompts.clean_skills.prompt_builder import clean_skills_full_prompt
 from pipelines.skills_evaluation.pydantic_models.clean_skills import SkillsList
@@ -13,9 +13,6 @@ from pipelines.skills_evaluation.pydantic_models.clean_skills import SkillsList
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def clean_skills_llm(skills: list) -> Optional[SkillsList]:
     """
@@ -29,38 +26,12 @@ async def clean_skills_llm(skills: list) -> Optional[SkillsList]:
         ChatOpenAI: Экземпляр LLM, привязанный к схеме вывода через `.with_structured_output()`.
     """
     
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(f"Попытка {attempt}/{MAX_ATTEMPTS}")
-
-        try:
-            # Получаем LLM с нужной температурой для этой попытки
-            structured_llm = get_structured_llm(
-                pydantic_model=SkillsList, attempt_number=attempt
-            )
-
-            # Формируем промпт
-            prompt_input = {"skills": skills}
-            messages = await clean_skills_full_prompt.ainvoke(prompt_input)
-
-            # Выполняем запрос
-            response = await structured_llm.ainvoke(messages)
-            logger.info(f"Успешно получено значение после {attempt} попытки")
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"Ошибка при попытке {attempt}: {str(e)}")
-
-            if attempt == MAX_ATTEMPTS:
-                break
-
-    # Все попытки провалились
-    logger.error(
-        f"Все {MAX_ATTEMPTS} попыток извлечь навыки провалились: {str(last_exception)}",
-        exc_info=True,
+    # Формируем входные данные для промпта
+    prompt_input = {"skills": skills}
+
+    return await invoke_structured_llm(
+        pydantic_model=SkillsList,
+        prompt=clean_skills_full_prompt,
+        prompt_input=prompt_input,
+        description="очистить навыки",
     )
-    return None
@@ -1,122 +0,0 @@
-examples_reqs_extraction = [
-    {
-        "input": """Вакансия: Python-разработчик
-
-Обязанности:
-- Разработка серверной части веб-приложений
-- Работа в команде по Scrum
-
-Требования:
-- Уверенное знание Python 3.9+
-- Опыт с Django от 1 года
-- Навыки работы с PostgreSQL
-- Docker — будет плюсом""",
-        "output": """{
-  "requirements_text": "Уверенное знание Python 3.9+. Опыт с Django от 1 года. Навыки работы с PostgreSQL. Docker — будет плюсом"
-}""",
-    },
-    {
-        "input": """Вакансия: Аналитик данных
-
-Обязанности:
-- Сбор и анализ данных для маркетинговых кампаний
-
-Требования:
-- Продвинутый уровень Excel
-- Опыт с Power BI или Tableau
-- Желательно знание SQL""",
-        "output": """{
-  "requirements_text": "Продвинутый уровень Excel. Опыт с Power BI или Tableau. Желательно знание SQL"
-}""",
-    },
-    {
-        "input": """Вакансия: Менеджер проектов
-
-Обязанности:
-- Ведение проектов по разработке ИТ-систем
-
-Требования:
-- Опыт работы с Jira и Confluence
-- Понимание Agile-подхода
-- Приветствуется сертификация PMP""",
-        "output": """{
-  "requirements_text": "Опыт работы с Jira и Confluence. Понимание Agile-подхода. Приветствуется сертификация PMP"
-}""",
-    },
-    {
-        "input": """Вакансия: Бухгалтер
-
-Обязанности:
-- Подготовка финансовой отчётности
-- Ведение учёта доходов и расходов
-
-Требования:
-- Уверенное знание 1С:Бухгалтерия
-- Знание налогового и бухгалтерского учета
-- Владение Excel
-- Знание МСФО будет плюсом""",
-        "output": """{
-  "requirements_text": "Уверенное знание 1С:Бухгалтерия. Знание налогового и бухгалтерского учета. Владение Excel. Знание МСФО будет плюсом"
-}""",
-    },
-    {
-        "input": """Вакансия: Логист
-
-Обязанности:
-- Организация и контроль перевозок
-- Взаимодействие с транспортными компаниями
-
-Требования:
-- Опыт работы с системами управления складом (WMS)
-- Владение Excel
-- Знание документооборота
-- Приветствуется знание английского языка""",
-        "output": """{
-  "requirements_text": "Опыт работы с системами управления складом (WMS). Владение Excel. Знание документооборота. Приветствуется знание английского языка"
-}""",
-    },
-    {
-        "input": """Вакансия: Экономист
-
-Обязанности:
-- Подготовка планов и прогнозов бюджета
-
-Требования:
-- Опыт финансового анализа
-- Знание Excel на продвинутом уровне
-- Умение строить финансовые модели
-- Желательно знание Python или R для анализа данных""",
-        "output": """{
-  "requirements_text": "Опыт финансового анализа. Знание Excel на продвинутом уровне. Умение строить финансовые модели. Желательно знание Python или R для анализа данных"
-}""",
-    },
-    {
-        "input": """Вакансия: Специалист по документообороту
-
-Обязанности:
-- Оформление кадровых документов
-- Ведение архива
-
-Мы ожидаем:
-- Опыт работы с кадровой документацией
-- Знание делопроизводства
-- Владение 1С и Outlook""",
-        "output": """{
-  "requirements_text": "Опыт работы с кадровой документацией. Знание делопроизводства. Владение 1С и Outlook"
-}""",
-    },
-    {
-        "input": """Вакансия: DevOps Engineer
-
-Обязанности:
-- Настройка CI/CD
-- Администрирование облачной инфраструктуры
-
-Квалификация:
-- Обязательно: опыт с Kubernetes, AWS
-- Желательно: знание Terraform, Ansible""",
-        "output": """{
-  "requirements_text": "Обязательно: опыт с Kubernetes, AWS. Желательно: знание Terraform, Ansible"
-}""",
-    },
-]
@@ -1 +0,0 @@
-reqs_extraction_human_prompt = "Извлеки требования из новой вакансии: {vacancy_text}"
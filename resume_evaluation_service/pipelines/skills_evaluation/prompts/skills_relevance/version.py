@@ -0,0 +1,29 @@
+"""
+Версия промпта оценки релевантности навыков.
+
+Вычисляется по тексту системного и пользовательского промптов и примерам,
+поэтому любое их изменение автоматически делает устаревшими сохранённые
+вердикты LLM. Ручной номер ревизии повышается, если меняется смысл
+категорий без изменения текста (например, модель или схема ответа).
+"""
+
+import hashlib
+import json
+
+from pipelines.skills_evaluation.prompts.skills_relevance.examples import skill_relevance_examples
+from pipelines.skills_evaluation.prompts.skills_relevance.human import skill_relevance_human_prompt
+from pipelines.skills_evaluation.prompts.skills_relevance.system import skills_relevance_system_prompt
+
+# Ручная ревизия промпта
+SKILLS_RELEVANCE_PROMPT_REVISION = 1
+
+_digest = hashlib.sha256(
+    "\n".join([
+        skills_relevance_system_prompt,
+        skill_relevance_human_prompt,
+        json.dumps(skill_relevance_examples, ensure_ascii=False, sort_keys=True),
+    ]).encode("utf-8")
+).hexdigest()[:12]
+
+# Версия промпта: <ревизия>-<хэш текста>
+SKILLS_RELEVANCE_PROMPT_VERSION = f"{SKILLS_RELEVANCE_PROMPT_REVISION}-{_digest}"
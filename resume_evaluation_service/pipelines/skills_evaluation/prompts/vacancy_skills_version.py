@@ -0,0 +1,48 @@
+"""
+Версия промптов подготовки навыков вакансии.
+
+Подготовка навыков вакансии — классификация требований, очистка,
+агрегация и сопоставление навыков — кэшируется целиком, поэтому версия
+вычисляется по промптам и примерам всех четырёх этапов: изменение любого
+из них делает устаревшими навыки в кэше вакансий. Ручной номер ревизии
+повышается, если меняется смысл результата без изменения текста.
+"""
+
+import hashlib
+import json
+
+from pipelines.skills_evaluation.prompts.agg_skills.examples import skill_aggregation_examples
+from pipelines.skills_evaluation.prompts.agg_skills.human import agg_skills_human_prompt
+from pipelines.skills_evaluation.prompts.agg_skills.system import agg_skills_system_prompt
+from pipelines.skills_evaluation.prompts.classify_skills.examples import examples_vac_skills
+from pipelines.skills_evaluation.prompts.classify_skills.human import human as classify_skills_human_prompt
+from pipelines.skills_evaluation.prompts.classify_skills.system import system_prompt_vac_skills
+from pipelines.skills_evaluation.prompts.clean_skills.examples import skill_classification_examples
+from pipelines.skills_evaluation.prompts.clean_skills.human import skills_classification_human_prompt
+from pipelines.skills_evaluation.prompts.clean_skills.system import skill_classification_system_prompt
+from pipelines.skills_evaluation.prompts.skills_match.examples import skill_categorize_examples
+from pipelines.skills_evaluation.prompts.skills_match.human import skill_categorize_human_prompt
+from pipelines.skills_evaluation.prompts.skills_match.system import skill_categorize_system_prompt
+
+# Ручная ревизия промптов
+VACANCY_SKILLS_PROMPT_REVISION = 1
+
+_digest = hashlib.sha256(
+    "\n".join([
+        system_prompt_vac_skills,
+        classify_skills_human_prompt,
+        json.dumps(examples_vac_skills, ensure_ascii=False, sort_keys=True),
+        skill_classification_system_prompt,
+        skills_classification_human_prompt,
+        json.dumps(skill_classification_examples, ensure_ascii=False, sort_keys=True),
+        agg_skills_system_prompt,
+        agg_skills_human_prompt,
+        json.dumps(skill_aggregation_examples, ensure_ascii=False, sort_keys=True),
+        skill_categorize_system_prompt,
+        skill_categorize_human_prompt,
+        json.dumps(skill_categorize_examples, ensure_ascii=False, sort_keys=True),
+    ]).encode("utf-8")
+).hexdigest()[:12]
+
+# Версия промптов: <ревизия>-<хэш текста>
+VACANCY_SKILLS_PROMPT_VERSION = f"{VACANCY_SKILLS_PROMPT_REVISION}-{_digest}"
@@ -1,34 +1,39 @@
 """Модель данных для для матчинга навыков"""
 
-from typing import List, Literal
+from functools import lru_cache
+from typing import List, Tuple
 
 from pydantic import BaseModel, Field, create_model
 
+from utils.dynamic_models import DYNAMIC_MODEL_CACHE_SIZE, DYNAMIC_SCHEMA_MODE, choice_field
 
-def create_pydantic_skills_agg_match_model(vacancy_skills: list, agg_skills: list):
+
+def create_pydantic_skills_agg_match_model(
+    vacancy_skills: list, agg_skills: list, mode: str = DYNAMIC_SCHEMA_MODE
+):
     """
     Создает динамическую модель для матчинга навыка
 
     Attributes:
         original_name : Исходная формулировка навыка
         category : Категория к которой наиболее можно отнести исходный навык
+
+    Args:
+        vacancy_skills: Навыки вакансии
+        agg_skills: Категории (агрегированные навыки резюме)
+        mode: Режим схемы (enum или index, см. utils.dynamic_models)
     """
+    return _skills_agg_match_model(tuple(vacancy_skills), tuple(agg_skills), mode)
 
-    skillsLiteral = Literal[tuple(agg_skills)]  # собираем Literal на основе списка
-    vacancySkillsLiteral = Literal[tuple(vacancy_skills)]
 
+@lru_cache(maxsize=DYNAMIC_MODEL_CACHE_SIZE)
+def _skills_agg_match_model(vacancy_skills: Tuple[str, ...], agg_skills: Tuple[str, ...], mode: str):
+    """Модель для набора навыков (кэшируется, см. create_pydantic_skills_agg_match_model)."""
     CategorizedSkill = create_model(
         "CategorizedSkill",
-        original_name=(
-            vacancySkillsLiteral,
-            Field(..., description="Исходная формулировка навыка"),
-        ),
-        category=(
-            skillsLiteral,
-            Field(
-                ...,
-                description="Категория к которой наиболее можно отнести исходный навык",
-            ),
+        original_name=choice_field(vacancy_skills, "Исходная формулировка навыка", mode),
+        category=choice_field(
+            agg_skills, "Категория к которой наиболее можно отнести исходный навык", mode
         ),
     )
 
@@ -1,12 +1,15 @@
 """Модель данных для определения релевантности навыков"""
 
-from typing import List, Literal
+from functools import lru_cache
+from typing import List, Literal, Tuple
 
 from pydantic import BaseModel, Field, create_model
 
+from utils.dynamic_models import DYNAMIC_MODEL_CACHE_SIZE, DYNAMIC_SCHEMA_MODE, choice_field
+
 
 def create_pydantic_skills_relevance_matching_model(
-    unmatched_vac_list: list, unmatched_res_list: list
+    unmatched_vac_list: list, unmatched_res_list: list, mode: str = DYNAMIC_SCHEMA_MODE
 ):
     """
     Создает динамическую модель для определения релевантности навыка
@@ -16,9 +19,20 @@ def create_pydantic_skills_relevance_matching_model(
         resume_skill: Навык из резюме
         reason: Причина релевантности
         relevance_category: Категория релевантности
+
+    Args:
+        unmatched_vac_list: Навыки вакансии
+        unmatched_res_list: Навыки резюме
+        mode: Режим схемы навыков (enum или index, см. utils.dynamic_models)
     """
-    unmatched_vac_skills_literal = Literal[tuple(unmatched_vac_list)]
-    unmatched_res_skills_literal = Literal[tuple(unmatched_res_list)]
+    return _skills_relevance_model(tuple(unmatched_vac_list), tuple(unmatched_res_list), mode)
+
+
+@lru_cache(maxsize=DYNAMIC_MODEL_CACHE_SIZE)
+def _skills_relevance_model(
+    unmatched_vac_list: Tuple[str, ...], unmatched_res_list: Tuple[str, ...], mode: str
+):
+    """Модель для набора навыков (кэшируется, см. create_pydantic_skills_relevance_matching_model)."""
 
     relevance_category = [
         "Полная аналогичность",
@@ -39,14 +53,8 @@ def create_pydantic_skills_relevance_matching_model(
 
     RelevancedSkills = create_model(
         "RelevancedSkills",
-        vacancy_skill=(
-            unmatched_vac_skills_literal,
-            Field(..., description="Навык из вакансии"),
-        ),
-        resume_skill=(
-            unmatched_res_skills_literal,
-            Field(..., description="Навык из резюме"),
-        ),
+        vacancy_skill=choice_field(unmatched_vac_list, "Навык из вакансии", mode),
+        resume_skill=choice_field(unmatched_res_list, "Навык из резюме", mode),
         reason=(
             str,
             Field(
@@ -5,7 +5,7 @@
 
 from typing import Optional
 
-from utils.create_llm_with_retries import get_structured_llm
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.skills_evaluation.prompts.resume_parser.prompt_builder import resume_parser_full_prompt
 from pipelines.skills_evaluation.pydantic_models.resume_parser import ParsedResumeSkills
@@ -13,9 +13,6 @@ from pipelines.skills_evaluation.pydantic_models.resume_parser import ParsedResu
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def resume_parser_llm(resume: str) -> Optional[ParsedResumeSkills]:
     """
@@ -29,38 +26,12 @@ async def resume_parser_llm(resume: str) -> Optional[ParsedResumeSkills]:
     Returns:
         ChatOpenAI: Экземпляр LLM, привязанный к схеме вывода через `.with_structured_output()`.
     """
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(f"Попытка {attempt}/{MAX_ATTEMPTS}")
-
-        try:
-            # Получаем LLM с нужной температурой для этой попытки
-            structured_llm = get_structured_llm(
-                pydantic_model=ParsedResumeSkills, attempt_number=attempt
-            )
-
-            # Формируем промпт
-            prompt_input = {"resume": resume}
-            messages = await resume_parser_full_prompt.ainvoke(prompt_input)
-
-            # Выполняем запрос
-            response = await structured_llm.ainvoke(messages)
-            logger.info(f"Успешно получено значение после {attempt} попытки")
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"Ошибка при попытке {attempt}: {str(e)}")
-
-            if attempt == MAX_ATTEMPTS:
-                break
-
-    # Все попытки провалились
-    logger.error(
-        f"Все {MAX_ATTEMPTS} попыток извлечь зарплату провалились: {str(last_exception)}",
-        exc_info=True,
+    # Формируем входные данные для промпта
+    prompt_input = {"resume": resume}
+
+    return await invoke_structured_llm(
+        pydantic_model=ParsedResumeSkills,
+        prompt=resume_parser_full_prompt,
+        prompt_input=prompt_input,
+        description="извлечь навыки из резюме",
     )
-    return None
@@ -1,81 +1,71 @@
 # resume_evaluation_service/pipelines/skills_evaluation/runner.py
 """
 Финальный runner: извлекает навыки -> классифицирует -> агрегирует -> сопоставляет -> оценивает -> отчёт.
+Подготовка навыков вакансии кэшируется по тексту требований.
 """
 
 import asyncio
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Dict, List, Optional, Union
 
 from utils.logger import setup_logger
 from pipelines.skills_evaluation.agg_skills import get_agg_skills
 from pipelines.skills_evaluation.classify_skills import get_classify_reqs
 from pipelines.skills_evaluation.clean_skills import get_cleaned_skills
-from pipelines.skills_evaluation.extract_reqs import get_reqs
 from pipelines.skills_evaluation.get_report import get_report
+from pipelines.skills_evaluation.prompts.vacancy_skills_version import VACANCY_SKILLS_PROMPT_VERSION
 from pipelines.skills_evaluation.resume_parser import get_resume_skills
+from pipelines.skills_evaluation.skill_matcher import match_skills
+from pipelines.skills_evaluation.skill_relevance_memo import get_skill_relevance_memo
 from pipelines.skills_evaluation.skills_match import get_skills_match
 from pipelines.skills_evaluation.skills_relevance import get_skills_relevance
+from pipelines.vacancy_profile.extract_profile import resolve_vacancy_profile
+from utils.stage_graph import StageGraph, is_failed
+from utils.vacancy_cache import cached_stage
 
 # Настройка логирования
 logger = setup_logger(__name__)
 
 
-async def evaluate_skills_pipeline(
-    resume_text: str, vacancy_text: str
-) -> Dict[str, Any]:
+# Категории, которые мы допускаем к проверке
+VERIFIABLE_CATEGORIES = {
+    "Технология/инструмент",
+    "Язык программирования",
+    "Язык",
+    "Стандарт/методология",
+    "Деловой навык",
+    "Процессный навык"
+}
+
+
+async def prepare_vacancy_skills(requirements_text: str) -> Dict[str, Any]:
     """
-    Полный асинхронный пайплайн оценки соответствия навыков кандидата вакансии.
+    Подготовка навыков вакансии: классификация -> очистка -> стандартизация -> сопоставление.
+    Зависит только от блока требований вакансии, поэтому результат кэшируется
+    и переиспользуется при оценке следующих резюме по той же вакансии.
 
     Args:
-        resume_text: Текст резюме.
-        vacancy_text: Текст вакансии.
+        requirements_text: Текст блока требований вакансии.
 
     Returns:
-        Словарь с финальным отчётом или ошибкой.
+        Словарь с vacancy_skills_data, aggregated_vacancy_skills и name_to_category
+        или {'status': 'failed'}.
     """
-    logger.info("Запуск пайплайна оценки навыков")
+    return await cached_stage(
+        "skills",
+        requirements_text or "",
+        VACANCY_SKILLS_PROMPT_VERSION,
+        lambda: _prepare_vacancy_skills(requirements_text),
+    )
 
-    try:
-        # --- 1. Извлечение текста требований из вакансии ---
-        logger.info("Начато извлечение блока требований из вакансии")
-        vacancy_requirements_task = get_reqs(vacancy_text)
-
-        # --- 2. Извлечение навыков из резюме ---
-        logger.info("Начато извлечение навыков из резюме")
-        resume_skills_task = get_resume_skills(resume_text)
-
-        # Параллельное выполнение задач
-        parsing_results = await asyncio.gather(
-            vacancy_requirements_task,
-            resume_skills_task,
-            return_exceptions=True,
-        )
 
-        vacancy_requirements_data, resume_skills_data = parsing_results
-
-    except Exception as e:
-        logger.error(
-            f"Ошибка при извлечении данных: {str(e)}", exc_info=True
-        )
-        return {"status": "failed"}
-
-    # Проверка на наличие ошибок при извлечении требований из вакансии
-    if vacancy_requirements_data is None or vacancy_requirements_data.get("status") == "failed":
-        logger.error("Не удалось извлечь требования в вакансии")
-        return {"status": "failed"}
-
-    # Проверка на наличие ошибок при извлечении навыков из резюме
-    if resume_skills_data is None or resume_skills_data.get("status") == "failed":
-        logger.error("Не удалось извлечь навыки из резюме")
-        return {"status": "failed"}
+async def _prepare_vacancy_skills(requirements_text: str) -> Dict[str, Any]:
+    """Выполняет этапы подготовки навыков вакансии с помощью LLM."""
 
     # --- 3. Классификация требований вакансии на must_have/nice_to_have ---
     try:
         logger.info("Начата классификация требований вакансии")
-        vacancy_skills_data = await get_classify_reqs(
-            vacancy_requirements_data.get('requirements_text')
-        )
+        vacancy_skills_data = await get_classify_reqs(requirements_text)
 
     except Exception as e:
         logger.error(
@@ -109,19 +99,9 @@ async def evaluate_skills_pipeline(
         logger.error("Не удалось нормализовать навыки вакансии")
         return {"status": "failed"}
 
-    # Категории, которые мы допускаем к проверке
-    verifiable_categories = {
-        "Технология/инструмент",
-        "Язык программирования",
-        "Язык",
-        "Стандарт/методология",
-        "Деловой навык",
-        "Процессный навык"
-    }
-
     # Проставляем флаг на скилы, которые мы будем проверять
     for skill in cleaned_vacancy_skills.get('skills'):
-        skill['is_verifiable'] = skill.get('category') in verifiable_categories
+        skill['is_verifiable'] = skill.get('category') in VERIFIABLE_CATEGORIES
 
     # Верифицированные навыки
     verifiable_skills = [skill.get('skill_name') for skill in cleaned_vacancy_skills.get('skills') if skill.get('is_verifiable')]
@@ -168,6 +148,74 @@ async def evaluate_skills_pipeline(
             for skill in matched_vacancy_skills['skills']
         }
 
+    return {
+        "vacancy_skills_data": vacancy_skills_data,
+        "aggregated_vacancy_skills": aggregated_vacancy_skills,
+        "name_to_category": name_to_category,
+        "status": "success",
+    }
+
+
+async def _ready(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Уже готовый результат этапа."""
+    return result
+
+
+async def evaluate_skills_pipeline(
+    resume_text: str,
+    vacancy_text: Optional[str] = None,
+    vacancy_profile: Union[Dict[str, Any], Awaitable[Dict[str, Any]], None] = None,
+    vacancy_skills: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Полный асинхронный пайплайн оценки соответствия навыков кандидата вакансии.
+
+    Args:
+        resume_text: Текст резюме.
+        vacancy_text: Текст вакансии (используется, если профиль не передан).
+        vacancy_profile: Профиль вакансии с блоком требований или ожидание его извлечения.
+        vacancy_skills: Уже подготовленные навыки вакансии (результат prepare_vacancy_skills).
+
+    Returns:
+        Словарь с финальным отчётом или ошибкой.
+    """
+    logger.info("Запуск пайплайна оценки навыков")
+
+    async def vacancy_skills_stage(vacancy_profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Подготовленные навыки вакансии (из кэша или через LLM)."""
+        return await prepare_vacancy_skills(vacancy_profile.get('requirements_text'))
+
+    # Этапы вакансии и резюме выполняются параллельно по графу зависимостей
+    # Блок выполняется целиком или не выполняется: при неуспехе этапа остальные отменяются
+    graph = StageGraph("skills", fail_fast=True)
+    if vacancy_skills is not None:
+        graph.add("vacancy_skills", lambda: _ready(vacancy_skills))
+    else:
+        # --- 1. Профиль вакансии с блоком требований ---
+        graph.add("vacancy_profile", lambda: resolve_vacancy_profile(vacancy_text, vacancy_profile))
+        # --- 3-6. Навыки вакансии (из кэша или через LLM) ---
+        graph.add("vacancy_skills", vacancy_skills_stage, deps=("vacancy_profile",))
+    # --- 2. Извлечение навыков из резюме ---
+    graph.add("resume_skills", lambda: get_resume_skills(resume_text))
+
+    results = await graph.run()
+    prepared_vacancy_skills = results["vacancy_skills"]
+    resume_skills_data = results["resume_skills"]
+
+    # Проверка на наличие ошибок при подготовке навыков вакансии
+    if is_failed(prepared_vacancy_skills):
+        logger.error("Не удалось подготовить навыки вакансии")
+        return {"status": "failed"}
+
+    # Проверка на наличие ошибок при извлечении навыков из резюме
+    if is_failed(resume_skills_data):
+        logger.error("Не удалось извлечь навыки из резюме")
+        return {"status": "failed"}
+
+    vacancy_skills_data = prepared_vacancy_skills['vacancy_skills_data']
+    aggregated_vacancy_skills = prepared_vacancy_skills['aggregated_vacancy_skills']
+    name_to_category = prepared_vacancy_skills['name_to_category']
+
     # --- 7. Пробуем прямо сопоставить навыки с резюме ---
 
     # Приводим навыки к нижнему регистру
@@ -181,43 +229,43 @@ async def evaluate_skills_pipeline(
     print('current_unmatched_resume_skills', current_unmatched_skills)
     print('current_match', current_match)
 
-    # --- 8. Оценка релевантности оставшихся навыков
-
-    def get_all_pairs(vacancy_skills: list, resume_skills: list):
-        '''Возвращает все возможные пары навыков между вакансии и резюме'''
-        pairs = []
+    # --- 8. Оценка релевантности оставшихся навыков ---
 
-        for v_skill in vacancy_skills:
-            for r_skill in resume_skills:
-                pairs.append({
-                    "vacancy_skill": v_skill,
-                    "resume_skill": r_skill
-                })
-
-        return pairs
-
-    pairs = get_all_pairs(current_unmatched_skills,resume_skills_list)
-    print(pairs)
-
-    try:
-        logger.info("Начинаем оценивать релевантность оставшихся навыков")
-        unmatched_vacancy_skills_relevance = await get_skills_relevance(
-            current_unmatched_skills,
-            resume_skills_list,
-            pairs
-        )
-    except Exception as e:
-        logger.error(
-            f"Ошибка при извлечении данных: {str(e)}", exc_info=True
-        )
-        return {"status": "failed"}
-
-    # Проверка на наличие ошибок сопоставления навыков вакансии
-    if unmatched_vacancy_skills_relevance is None or unmatched_vacancy_skills_relevance.get("status") == "failed":
-        logger.error("Не удалось сопоставить навыки вакансии")
-        return {"status": "failed"}
+    # Локально разрешаем очевидные пары и отбираем top-k кандидатов для LLM
+    skill_match = match_skills(current_unmatched_skills, resume_skills_list)
 
+    # Пары, по которым LLM уже выносила вердикт, берём из памяти
+    memo = get_skill_relevance_memo()
+    memo_pairs, llm_pairs = await memo.lookup(skill_match.candidate_pairs)
 
+    if llm_pairs:
+        try:
+            logger.info("Начинаем оценивать релевантность оставшихся навыков")
+            unmatched_vacancy_skills_relevance = await get_skills_relevance(
+                list(dict.fromkeys(p["vacancy_skill"] for p in llm_pairs)),
+                list(dict.fromkeys(p["resume_skill"] for p in llm_pairs)),
+                llm_pairs
+            )
+        except Exception as e:
+            logger.error(
+                f"Ошибка при извлечении данных: {str(e)}", exc_info=True
+            )
+            return {"status": "failed"}
+
+        # Проверка на наличие ошибок сопоставления навыков вакансии
+        if unmatched_vacancy_skills_relevance is None or unmatched_vacancy_skills_relevance.get("status") == "failed":
+            logger.error("Не удалось сопоставить навыки вакансии")
+            return {"status": "failed"}
+
+        # Сохраняем вердикты LLM
+        await memo.remember(unmatched_vacancy_skills_relevance.get("pairs", []))
+    else:
+        # Все пары разрешены локально или из памяти — LLM не вызываем
+        unmatched_vacancy_skills_relevance = {"pairs": [], "status": "success"}
+
+    unmatched_vacancy_skills_relevance["pairs"] = (
+        skill_match.resolved_pairs + memo_pairs + unmatched_vacancy_skills_relevance.get("pairs", [])
+    )
 
     # --- 9. Генерация финального отчёта ---
     logger.info("Генерация финального отчёта по навыкам")
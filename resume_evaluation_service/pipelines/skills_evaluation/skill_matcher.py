@@ -0,0 +1,285 @@
+"""
+Локальное сопоставление навыков вакансии и резюме без обращения к LLM.
+
+Навыки приводятся к каноническому виду (регистр, версии, служебные слова,
+словарь синонимов). Пары с одинаковым каноническим названием и пары,
+по которым LLM уже выносила вердикт, разрешаются локально. Для остальных
+навыков вакансии кандидаты из резюме ранжируются по сходству (токены,
+триграммы символов, связанные навыки), и в LLM отправляются только
+top-k кандидатов на каждый навык вакансии вместо полного декартова произведения.
+
+Словарь синонимов и связанных навыков задаётся вручную (SEED_ALIASES,
+SEED_RELATED) и вердиктами LLM не пополняется: вердикт относится к паре
+"навык вакансии → навык резюме" и к версии промпта, поэтому хранится
+в памяти вердиктов (skill_relevance_memo), а не как симметричный синоним.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from dotenv import load_dotenv
+
+from utils.clean_text import clean_text
+from utils.logger import setup_logger
+
+# Логирование
+logger = setup_logger(__name__)
+
+load_dotenv()
+
+# Настройки сопоставления
+SKILLS_RELEVANCE_TOP_K = int(os.getenv("SKILLS_RELEVANCE_TOP_K", "5"))  # кандидатов на навык вакансии
+
+# Категории релевантности (совпадают с моделью skills_relevance)
+FULL_RELEVANCE = "Полная аналогичность"
+PARTIAL_RELEVANCE = "Частичная аналогичность"
+
+# Служебные слова, которые не меняют смысл навыка
+STOP_WORDS = {
+    "знание", "знания", "опыт", "работы", "работа", "с", "со", "в", "и",
+    "навык", "навыки", "умение", "понимание", "владение", "принципов",
+    "основ", "основы", "уверенное", "хорошее", "базовое", "язык", "языка",
+}
+
+# Синонимы: каноническое название -> варианты написания
+SEED_ALIASES: Dict[str, List[str]] = {
+    "postgresql": ["postgres", "postgre", "psql", "постгрес"],
+    "javascript": ["js", "джаваскрипт"],
+    "typescript": ["ts"],
+    "kubernetes": ["k8s", "кубернетес"],
+    "docker": ["докер"],
+    "git": ["гит"],
+    "ооп": ["oop", "объектно-ориентированное программирование", "object oriented programming"],
+    "drf": ["django rest framework"],
+    "ci/cd": ["ci cd", "cicd"],
+    "machine learning": ["ml", "машинное обучение"],
+    "английский": ["english", "английский язык"],
+    "1с": ["1c"],
+    "ms excel": ["excel", "microsoft excel", "эксель"],
+    "rest api": ["rest", "restful api", "restful"],
+}
+
+# Связанные навыки: навык вакансии -> навыки резюме, косвенно подтверждающие его
+SEED_RELATED: Dict[str, List[str]] = {
+    "python": ["django", "drf", "fastapi", "flask", "pandas", "numpy"],
+    "javascript": ["typescript", "react", "vue", "angular", "node.js"],
+    "java": ["spring", "spring boot", "kotlin"],
+    "sql": ["postgresql", "mysql", "oracle", "ms sql", "clickhouse"],
+    "контейнеризация": ["docker", "kubernetes", "podman"],
+}
+
+
+def _strip(text: str) -> str:
+    """Приводит навык к нижнему регистру и убирает версии и пунктуацию."""
+    text = clean_text(text or "").lower().replace("ё", "е")
+    text = re.sub(r"[^\w\s\+#\./-]", " ", text).strip().rstrip(".")
+    # Версии: "3", "3.6", "3+"
+    text = re.sub(r"(?<![\w.])\d+(\.\d+)*\+?(?=\s|$)", " ", text)
+    return re.sub(r"\s+", " ", text).strip(" -/")
+
+
+def normalize_skill(name: str) -> str:
+    """
+    Нормализует название навыка: регистр, версии, пунктуация, служебные слова.
+
+    Args:
+        name: Название навыка
+
+    Returns:
+        Нормализованное название (служебные слова убираются, только если
+        после этого что-то остаётся)
+    """
+    text = _strip(name)
+    tokens = [token for token in text.split(" ") if token not in STOP_WORDS]
+    return " ".join(tokens) if tokens else text
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Триграммы символов с границами слова."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    """Коэффициент Жаккара двух множеств."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def similarity(a: str, b: str) -> float:
+    """
+    Лексическое сходство двух канонических названий навыков (0..1).
+
+    Берётся максимум из сходства по токенам, по триграммам символов
+    и вложенности токенов ("django" — "django framework").
+    """
+    if a == b:
+        return 1.0
+    tokens_a, tokens_b = set(a.split(" ")), set(b.split(" "))
+    containment = 0.8 if tokens_a <= tokens_b or tokens_b <= tokens_a else 0.0
+    return max(
+        _jaccard(tokens_a, tokens_b),
+        _jaccard(_trigrams(a), _trigrams(b)),
+        containment,
+    )
+
+
+class SkillSynonyms:
+    """
+    Словарь синонимов и связанных навыков.
+
+    Attributes:
+        aliases: Нормализованное название -> каноническое название
+        related: Каноническое название навыка вакансии -> связанные канонические названия
+    """
+
+    def __init__(self):
+        self.aliases: Dict[str, str] = {}
+        self.related: Dict[str, Set[str]] = {}
+
+        for canonical, variants in SEED_ALIASES.items():
+            self.add_alias(canonical, canonical)
+            for variant in variants:
+                self.add_alias(variant, canonical)
+
+        for skill, related_skills in SEED_RELATED.items():
+            for related_skill in related_skills:
+                self.add_related(skill, related_skill)
+
+    def canonical(self, name: str) -> str:
+        """Возвращает каноническое название навыка."""
+        normalized = normalize_skill(name)
+        return self.aliases.get(normalized, normalized)
+
+    def add_alias(self, name: str, canonical: str) -> None:
+        """Добавляет синоним для канонического названия."""
+        target = self.aliases.get(normalize_skill(canonical), normalize_skill(canonical))
+        self.aliases.setdefault(normalize_skill(name), target)
+
+    def add_related(self, vacancy_skill: str, resume_skill: str) -> None:
+        """Отмечает навык резюме как связанный с навыком вакансии."""
+        self.related.setdefault(self.canonical(vacancy_skill), set()).add(
+            self.canonical(resume_skill)
+        )
+
+    def is_related(self, vacancy_canonical: str, resume_canonical: str) -> bool:
+        """Проверяет, подтверждает ли навык резюме навык вакансии."""
+        return resume_canonical in self.related.get(vacancy_canonical, ())
+
+
+# Глобальный словарь синонимов
+_skill_synonyms = SkillSynonyms()
+
+
+def set_skill_synonyms(synonyms: SkillSynonyms) -> None:
+    """Устанавливает глобальный словарь синонимов."""
+    global _skill_synonyms
+    _skill_synonyms = synonyms
+
+
+def get_skill_synonyms() -> SkillSynonyms:
+    """Возвращает глобальный словарь синонимов."""
+    return _skill_synonyms
+
+
+@dataclass
+class SkillMatchResult:
+    """
+    Результат локального сопоставления.
+
+    Attributes:
+        resolved_pairs: Пары, разрешённые без LLM (в формате ответа skills_relevance)
+        candidate_pairs: Пары для оценки LLM ({"vacancy_skill", "resume_skill"})
+        total_pairs: Количество пар в полном декартовом произведении
+    """
+
+    resolved_pairs: List[dict] = field(default_factory=list)
+    candidate_pairs: List[dict] = field(default_factory=list)
+    total_pairs: int = 0
+
+    @property
+    def candidate_vacancy_skills(self) -> List[str]:
+        """Навыки вакансии, которые нужно оценить LLM."""
+        return list(dict.fromkeys(p["vacancy_skill"] for p in self.candidate_pairs))
+
+    @property
+    def candidate_resume_skills(self) -> List[str]:
+        """Навыки резюме, которые участвуют в оценке LLM."""
+        return list(dict.fromkeys(p["resume_skill"] for p in self.candidate_pairs))
+
+
+def match_skills(
+    vacancy_skills: List[str],
+    resume_skills: List[str],
+    top_k: int = SKILLS_RELEVANCE_TOP_K,
+    synonyms: Optional[SkillSynonyms] = None,
+) -> SkillMatchResult:
+    """
+    Сопоставляет навыки вакансии и резюме локально и отбирает кандидатов для LLM.
+
+    Для каждого навыка вакансии:
+    1. совпадение канонических названий — "Полная аналогичность", в LLM не отправляется;
+    2. связанные навыки из словаря — "Частичная аналогичность";
+    3. остальные навыки резюме ранжируются по сходству, в LLM уходят top_k лучших.
+
+    Args:
+        vacancy_skills: Навыки вакансии, не совпавшие напрямую
+        resume_skills: Навыки резюме
+        top_k: Максимальное количество кандидатов на навык вакансии
+        synonyms: Словарь синонимов (по умолчанию — глобальный)
+
+    Returns:
+        SkillMatchResult с разрешёнными парами и кандидатами для LLM
+    """
+    synonyms = synonyms or get_skill_synonyms()
+    result = SkillMatchResult(total_pairs=len(vacancy_skills) * len(resume_skills))
+
+    resume_canonicals = [(skill, synonyms.canonical(skill)) for skill in resume_skills]
+
+    for vacancy_skill in vacancy_skills:
+        vacancy_canonical = synonyms.canonical(vacancy_skill)
+
+        # 1) Совпадение по нормализованному названию или синониму
+        exact = next((r for r, rc in resume_canonicals if rc == vacancy_canonical), None)
+        if exact is not None:
+            result.resolved_pairs.append({
+                "vacancy_skill": vacancy_skill,
+                "resume_skill": exact,
+                "reason": "Совпадение по нормализованному названию или синониму",
+                "relevance": FULL_RELEVANCE,
+            })
+            continue
+
+        # 2) Связанные навыки — частичная аналогичность, полную ещё может найти LLM
+        scored = []
+        for resume_skill, resume_canonical in resume_canonicals:
+            if synonyms.is_related(vacancy_canonical, resume_canonical):
+                result.resolved_pairs.append({
+                    "vacancy_skill": vacancy_skill,
+                    "resume_skill": resume_skill,
+                    "reason": "Навык из того же стека по словарю связанных навыков",
+                    "relevance": PARTIAL_RELEVANCE,
+                })
+                continue
+            scored.append((similarity(vacancy_canonical, resume_canonical), resume_skill))
+
+        # 3) Top-k кандидатов по сходству (при равенстве — в исходном порядке)
+        scored.sort(key=lambda item: item[0], reverse=True)
+        for _, resume_skill in scored[:top_k]:
+            result.candidate_pairs.append({
+                "vacancy_skill": vacancy_skill,
+                "resume_skill": resume_skill,
+            })
+
+    logger.info(
+        "Локальное сопоставление навыков завершено",
+        extra={
+            "total_pairs": result.total_pairs,
+            "resolved_pairs": len(result.resolved_pairs),
+            "llm_pairs": len(result.candidate_pairs),
+        },
+    )
+    return result
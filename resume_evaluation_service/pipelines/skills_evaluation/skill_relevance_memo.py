@@ -0,0 +1,284 @@
+"""
+Память вердиктов LLM по парам навыков.
+
+Вердикты skills_relevance_llm ("Полная/Частичная/Отсутствует аналогичность"
+и причина) сохраняются по нормализованной паре (навык вакансии, навык резюме)
+и версии промпта. Перед вызовом LLM пары ищутся в памяти, и повторные пары
+не расходуют токены. Смена промпта меняет версию, и старые вердикты
+перестают использоваться.
+
+Бэкенд выбирается переменной окружения SKILL_MEMO_BACKEND:
+- memory (по умолчанию) — LRU в памяти воркера
+- core_api — таблица skill_relevance_memo в PostgreSQL через внутренние эндпоинты Core API
+- none — память отключена
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from dotenv import load_dotenv
+
+from pipelines.skills_evaluation.prompts.skills_relevance.version import SKILLS_RELEVANCE_PROMPT_VERSION
+from pipelines.skills_evaluation.skill_matcher import FULL_RELEVANCE, normalize_skill
+from utils.logger import setup_logger
+
+# Логирование
+logger = setup_logger(__name__)
+
+load_dotenv()
+
+# Настройки памяти вердиктов
+SKILL_MEMO_BACKEND = os.getenv("SKILL_MEMO_BACKEND", "memory")
+SKILL_MEMO_MAX_SIZE = int(os.getenv("SKILL_MEMO_MAX_SIZE", "10000"))  # пар в памяти
+CORE_API_URL = os.getenv("CORE_API_URL", "http://core_api:8000")
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
+# Максимальная длина навыка в таблице Core API
+MAX_SKILL_LENGTH = 255
+
+# Ключ пары: (нормализованный навык вакансии, нормализованный навык резюме)
+PairKey = Tuple[str, str]
+
+
+def make_pair_key(vacancy_skill: str, resume_skill: str) -> PairKey:
+    """Строит ключ пары навыков по нормализованным названиям."""
+    return normalize_skill(vacancy_skill), normalize_skill(resume_skill)
+
+
+class SkillMemoBackend:
+    """Базовый бэкенд памяти вердиктов: ничего не хранит."""
+
+    async def get_many(
+        self, prompt_version: str, keys: List[PairKey]
+    ) -> Dict[PairKey, dict]:
+        """Возвращает найденные вердикты {ключ: {"relevance", "reason"}}."""
+        return {}
+
+    async def set_many(self, prompt_version: str, verdicts: Dict[PairKey, dict]) -> None:
+        """Сохраняет вердикты."""
+        return None
+
+
+class InMemorySkillMemo(SkillMemoBackend):
+    """
+    LRU-память вердиктов в процессе воркера.
+
+    Attributes:
+        max_size: Максимальное количество пар
+    """
+
+    def __init__(self, max_size: int = SKILL_MEMO_MAX_SIZE):
+        self.max_size = max_size
+        self._data: "OrderedDict[tuple, dict]" = OrderedDict()
+
+    async def get_many(
+        self, prompt_version: str, keys: List[PairKey]
+    ) -> Dict[PairKey, dict]:
+        found = {}
+        for key in keys:
+            verdict = self._data.get((prompt_version, *key))
+            if verdict is not None:
+                self._data.move_to_end((prompt_version, *key))
+                found[key] = dict(verdict)
+        return found
+
+    async def set_many(self, prompt_version: str, verdicts: Dict[PairKey, dict]) -> None:
+        for key, verdict in verdicts.items():
+            self._data[(prompt_version, *key)] = dict(verdict)
+            self._data.move_to_end((prompt_version, *key))
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+
+class CoreApiSkillMemo(SkillMemoBackend):
+    """
+    Память вердиктов в PostgreSQL через внутренние эндпоинты Core API.
+    Общая для всех экземпляров воркера и переживает их перезапуск.
+
+    Attributes:
+        base_url: URL Core API
+    """
+
+    def __init__(
+        self,
+        base_url: str = CORE_API_URL,
+        token: Optional[str] = INTERNAL_API_TOKEN,
+        timeout: float = 5.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        headers = {"X-Internal-Token": token} if token else {}
+        self._client = httpx.AsyncClient(timeout=timeout, headers=headers)
+
+    @staticmethod
+    def _fits(key: PairKey) -> bool:
+        """Проверяет, что пара помещается в таблицу Core API."""
+        return all(len(skill) <= MAX_SKILL_LENGTH for skill in key)
+
+    async def get_many(
+        self, prompt_version: str, keys: List[PairKey]
+    ) -> Dict[PairKey, dict]:
+        keys = [key for key in keys if self._fits(key)]
+        if not keys:
+            return {}
+        response = await self._client.post(
+            f"{self.base_url}/internal/skill-relevance/lookup",
+            json={
+                "prompt_version": prompt_version,
+                "pairs": [{"vacancy_skill": v, "resume_skill": r} for v, r in keys],
+            },
+        )
+        response.raise_for_status()
+        return {
+            (item["vacancy_skill"], item["resume_skill"]): {
+                "relevance": item["relevance"],
+                "reason": item.get("reason"),
+            }
+            for item in response.json().get("pairs", [])
+        }
+
+    async def set_many(self, prompt_version: str, verdicts: Dict[PairKey, dict]) -> None:
+        verdicts = {key: verdict for key, verdict in verdicts.items() if self._fits(key)}
+        if not verdicts:
+            return
+        response = await self._client.put(
+            f"{self.base_url}/internal/skill-relevance",
+            json={
+                "prompt_version": prompt_version,
+                "pairs": [
+                    {
+                        "vacancy_skill": v,
+                        "resume_skill": r,
+                        "relevance": verdict["relevance"],
+                        "reason": verdict.get("reason"),
+                    }
+                    for (v, r), verdict in verdicts.items()
+                ],
+            },
+        )
+        response.raise_for_status()
+
+
+class SkillRelevanceMemo:
+    """
+    Память вердиктов с учётом попаданий.
+
+    Attributes:
+        backend: Бэкенд хранения
+        prompt_version: Версия промпта, к которой относятся вердикты
+        lookups: Количество пар, которые искались в памяти
+        hits: Количество найденных пар
+    """
+
+    def __init__(
+        self,
+        backend: SkillMemoBackend,
+        prompt_version: str = SKILLS_RELEVANCE_PROMPT_VERSION,
+    ):
+        self.backend = backend
+        self.prompt_version = prompt_version
+        self.lookups = 0
+        self.hits = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля найденных пар за время работы процесса."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    async def lookup(self, pairs: List[dict]) -> Tuple[List[dict], List[dict]]:
+        """
+        Ищет вердикты для пар навыков.
+
+        Если для навыка вакансии найдена "Полная аналогичность", остальные
+        его пары больше не нужны и тоже исключаются из оценки LLM.
+
+        Args:
+            pairs: Пары {"vacancy_skill", "resume_skill"}
+
+        Returns:
+            (найденные пары с relevance и reason, пары для оценки LLM)
+        """
+        if not pairs:
+            return [], []
+
+        keys = [make_pair_key(p["vacancy_skill"], p["resume_skill"]) for p in pairs]
+        try:
+            found = await self.backend.get_many(self.prompt_version, list(dict.fromkeys(keys)))
+        except Exception as e:
+            logger.warning(f"Ошибка чтения памяти вердиктов навыков: {str(e)}")
+            found = {}
+
+        resolved, remaining = [], []
+        fully_matched = set()
+        for pair, key in zip(pairs, keys):
+            verdict = found.get(key)
+            if verdict is None:
+                remaining.append(pair)
+                continue
+            resolved.append({**pair, "relevance": verdict["relevance"], "reason": verdict.get("reason")})
+            if verdict["relevance"] == FULL_RELEVANCE:
+                fully_matched.add(pair["vacancy_skill"])
+
+        remaining = [p for p in remaining if p["vacancy_skill"] not in fully_matched]
+
+        self.lookups += len(pairs)
+        self.hits += len(resolved)
+        logger.info(
+            f"Память вердиктов навыков: найдено {len(resolved)} из {len(pairs)} пар",
+            extra={
+                "prompt_version": self.prompt_version,
+                "hits": len(resolved),
+                "lookups": len(pairs),
+                "total_hit_rate": round(self.hit_rate, 3),
+            },
+        )
+        return resolved, remaining
+
+    async def remember(self, pairs: List[dict]) -> None:
+        """
+        Сохраняет вердикты LLM.
+
+        Args:
+            pairs: Пары {"vacancy_skill", "resume_skill", "relevance", "reason"}
+        """
+        verdicts = {
+            make_pair_key(p["vacancy_skill"], p["resume_skill"]): {
+                "relevance": p["relevance"],
+                "reason": p.get("reason"),
+            }
+            for p in pairs
+            if p.get("vacancy_skill") and p.get("resume_skill") and p.get("relevance")
+        }
+        if not verdicts:
+            return
+        try:
+            await self.backend.set_many(self.prompt_version, verdicts)
+        except Exception as e:
+            logger.warning(f"Ошибка записи в память вердиктов навыков: {str(e)}")
+
+
+def _create_backend(name: str) -> SkillMemoBackend:
+    """Создаёт бэкенд памяти вердиктов по названию."""
+    if name == "memory":
+        return InMemorySkillMemo()
+    if name == "core_api":
+        return CoreApiSkillMemo()
+    if name != "none":
+        logger.warning(f"Неизвестный бэкенд памяти вердиктов: {name}, память отключена")
+    return SkillMemoBackend()
+
+
+# Глобальная память вердиктов
+_skill_relevance_memo = SkillRelevanceMemo(_create_backend(SKILL_MEMO_BACKEND))
+
+
+def set_skill_relevance_memo(memo: SkillRelevanceMemo) -> None:
+    """Устанавливает глобальную память вердиктов."""
+    global _skill_relevance_memo
+    _skill_relevance_memo = memo
+
+
+def get_skill_relevance_memo() -> SkillRelevanceMemo:
+    """Возвращает глобальную память вердиктов."""
+    return _skill_relevance_memo
@@ -5,10 +5,10 @@
 
 from typing import Optional
 
-from langchain_core.messages import BaseMessage
 from pydantic import BaseModel
 
-from utils.create_llm_with_retries import get_structured_llm
+from utils.dynamic_models import DYNAMIC_SCHEMA_MODE, SCHEMA_MODE_INDEX, numbered
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.skills_evaluation.prompts.skills_match.prompt_builder import skills_match_full_prompt
 from pipelines.skills_evaluation.pydantic_models.skills_match import create_pydantic_skills_agg_match_model
@@ -16,9 +16,6 @@ from pipelines.skills_evaluation.pydantic_models.skills_match import create_pyda
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def skills_match_llm(
     vacancy_skills: list, agg_skills: list
@@ -49,47 +46,16 @@ async def skills_match_llm(
         )
         return None
 
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(
-            f"Попытка {attempt}/{MAX_ATTEMPTS} для оценки релевантности курсов"
-        )
-
-        try:
-            # Получаем LLM с увеличивающейся температурой
-            structured_llm = get_structured_llm(
-                pydantic_model=CategorizedSkill, attempt_number=attempt
-            )
-
-            # Формируем входные данные
-            prompt_input = {"vacancy_skills_list": vacancy_skills, "skills": agg_skills}
-
-            # Генерируем сообщения
-            messages: list[BaseMessage] = await skills_match_full_prompt.ainvoke(
-                prompt_input
-            )
-
-            # Выполняем вызов
-            response = await structured_llm.ainvoke(messages)
-
-            logger.info(f"Успешно оценена релевантность опыта после {attempt} попытки")
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(
-                f"Ошибка при попытке {attempt} оценить релевантность опыта: {str(e)}",
-            )
-
-            if attempt == MAX_ATTEMPTS:
-                break
-
-    # Все попытки провалились
-    logger.error(
-        f"Все {MAX_ATTEMPTS} попыток оценить релевантность курсов провалились: {str(last_exception)}",
-        exc_info=True,
+    # Формируем входные данные для промпта
+    # (в режиме index ответ ссылается на навыки и категории по номерам)
+    if DYNAMIC_SCHEMA_MODE == SCHEMA_MODE_INDEX:
+        prompt_input = {"vacancy_skills_list": numbered(vacancy_skills), "skills": numbered(agg_skills)}
+    else:
+        prompt_input = {"vacancy_skills_list": vacancy_skills, "skills": agg_skills}
+
+    return await invoke_structured_llm(
+        pydantic_model=CategorizedSkill,
+        prompt=skills_match_full_prompt,
+        prompt_input=prompt_input,
+        description="сопоставить навыки",
     )
-    return None
@@ -5,10 +5,10 @@
 
 from typing import Optional
 
-from langchain_core.messages import BaseMessage
 from pydantic import BaseModel
 
-from utils.create_llm_with_retries import get_structured_llm
+from utils.dynamic_models import DYNAMIC_SCHEMA_MODE, SCHEMA_MODE_INDEX, numbered
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.skills_evaluation.prompts.skills_relevance.prompt_builder import skills_relevance_full_prompt
 from pipelines.skills_evaluation.pydantic_models.skills_relevance import (
@@ -18,9 +18,6 @@ from pipelines.skills_evaluation.pydantic_models.skills_relevance import (
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def skills_relevance_llm(
     unmatched_vac_list: list, unmatched_res_list: list, pairs
@@ -51,47 +48,31 @@ async def skills_relevance_llm(
         )
         return None
 
-    # Последняя ошибка
-    last_exception = None
-
-    # Для каждой попытки
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(
-            f"Попытка {attempt}/{MAX_ATTEMPTS} для оценки релевантности курсов"
-        )
-
-        try:
-            # Получаем LLM с увеличивающейся температурой
-            structured_llm = get_structured_llm(
-                pydantic_model=RelevancedSkills, attempt_number=attempt
-            )
-
-            # Формируем входные данные
-            prompt_input = {"input": {"pairs": pairs}}
-
-            # Генерируем сообщения
-            messages: list[BaseMessage] = await skills_relevance_full_prompt.ainvoke(
-                prompt_input
-            )
-
-            # Выполняем вызов
-            response = await structured_llm.ainvoke(messages)
-
-            logger.info("Успешно оценена релевантность опыта после %d попытки", attempt)
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(
-                f"Ошибка при попытке {attempt} оценить релевантность опыта: {str(e)}"
-            )
-
-            if attempt == MAX_ATTEMPTS:
-                break
-
-    # Все попытки провалились
-    logger.error(
-        f"Все {MAX_ATTEMPTS} попыток оценить релевантность курсов провалились: {str(last_exception)}",
-        exc_info=True,
+    # Формируем входные данные для промпта
+    if DYNAMIC_SCHEMA_MODE == SCHEMA_MODE_INDEX:
+        # Навыки передаются один раз пронумерованными, пары — номерами:
+        # промпт растёт линейно, а не с каждым повтором названия навыка в паре
+        vac_numbers = {skill: number for number, skill in numbered(unmatched_vac_list).items()}
+        res_numbers = {skill: number for number, skill in numbered(unmatched_res_list).items()}
+        prompt_input = {
+            "input": {
+                "vacancy_skills": numbered(unmatched_vac_list),
+                "resume_skills": numbered(unmatched_res_list),
+                "pairs": [
+                    {
+                        "vacancy_skill": vac_numbers[pair["vacancy_skill"]],
+                        "resume_skill": res_numbers[pair["resume_skill"]],
+                    }
+                    for pair in pairs
+                ],
+            }
+        }
+    else:
+        prompt_input = {"input": {"pairs": pairs}}
+
+    return await invoke_structured_llm(
+        pydantic_model=RelevancedSkills,
+        prompt=skills_relevance_full_prompt,
+        prompt_input=prompt_input,
+        description="оценить релевантность навыков",
     )
-    return None
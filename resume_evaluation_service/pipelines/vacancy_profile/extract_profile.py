@@ -0,0 +1,129 @@
+"""
+Функция-обертка, которая обрабатывает текст вакансии и извлекает её профиль.
+Профиль извлекается один раз на оценку и передаётся во все блоки оценки.
+"""
+
+import inspect
+from typing import Any, Awaitable, Dict, Optional, Union
+
+from pipelines.vacancy_profile.extract_profile_llm.extract_profile import extract_vacancy_profile_llm
+from pipelines.vacancy_profile.prompts.version import VACANCY_PROFILE_PROMPT_VERSION
+from utils.clean_text import clean_text
+from utils.logger import setup_logger
+from utils.vacancy_cache import cached_stage
+
+# Логирование
+logger = setup_logger(__name__)
+
+
+async def get_vacancy_profile(vacancy_text: str) -> Dict[str, Any]:
+    """
+    Асинхронно извлекает профиль вакансии.
+
+    Args:
+        vacancy_text (str): Текст вакансии.
+
+    Returns:
+        Профиль вакансии (dict) или {'status': 'failed'} при ошибке.
+    """
+    # Проверяем, что текст не пустой
+    if not vacancy_text or not vacancy_text.strip():
+        logger.warning("Пустой текст для извлечения профиля вакансии")
+        return {'status': 'failed'}
+
+    # очищаем текст
+    logger.info("Очищаем текст вакансии от лишних символов")
+    cleaned_vacancy = clean_text(vacancy_text)
+
+    # Профиль зависит только от текста вакансии — берём из кэша, если он уже извлекался
+    return await cached_stage(
+        "profile",
+        cleaned_vacancy,
+        VACANCY_PROFILE_PROMPT_VERSION,
+        lambda: _extract_vacancy_profile(cleaned_vacancy),
+    )
+
+
+async def _extract_vacancy_profile(cleaned_vacancy: str) -> Dict[str, Any]:
+    """Извлекает профиль из очищенного текста вакансии с помощью LLM."""
+    try:
+        result = await extract_vacancy_profile_llm(cleaned_vacancy)
+
+        # Проверяем, что результат не None
+        if result is None:
+            logger.error("Результат равен None")
+            return {'status': 'failed'}
+
+        # Переводим в словарь
+        result_dict = result.model_dump()
+
+        # Устанавливаем флаг успешного выполнения
+        result_dict['status'] = 'success'
+        logger.info("Профиль вакансии извлечён")
+        return result_dict
+
+    except Exception as e:
+        logger.error(f"Ошибка выполнения: {str(e)}", exc_info=True)
+        return {'status': 'failed'}
+
+
+async def resolve_vacancy_profile(
+    vacancy_text: Optional[str],
+    vacancy_profile: Union[Dict[str, Any], Awaitable[Dict[str, Any]], None],
+) -> Dict[str, Any]:
+    """
+    Возвращает готовый профиль вакансии или извлекает его из текста.
+    Нужна для запуска блоков оценки по отдельности.
+
+    Args:
+        vacancy_text: Текст вакансии (используется, если профиль не передан).
+        vacancy_profile: Уже извлечённый профиль вакансии или ожидание его
+            извлечения (блок запускается, не дожидаясь профиля).
+
+    Returns:
+        Профиль вакансии (dict) или {'status': 'failed'} при ошибке.
+    """
+    if inspect.isawaitable(vacancy_profile):
+        return await vacancy_profile
+    if vacancy_profile is not None:
+        return vacancy_profile
+    return await get_vacancy_profile(vacancy_text)
+
+
+def format_vacancy_summary(vacancy_profile: Dict[str, Any]) -> str:
+    """
+    Собирает компактное описание вакансии для промптов оценки релевантности:
+    должность, обязанности и требования вместо полного текста вакансии.
+
+    Args:
+        vacancy_profile: Профиль вакансии.
+
+    Returns:
+        Текст описания вакансии.
+    """
+    parts = []
+    if vacancy_profile.get('position'):
+        parts.append(f"Должность: {vacancy_profile['position']}")
+    if vacancy_profile.get('responsibilities'):
+        parts.append(f"Обязанности: {vacancy_profile['responsibilities']}")
+    if vacancy_profile.get('requirements_text'):
+        parts.append(f"Требования: {vacancy_profile['requirements_text']}")
+    return "\n".join(parts)
+
+
+def format_vacancy_schedule(vacancy_profile: Dict[str, Any]) -> str:
+    """
+    Собирает описание условий работы из профиля вакансии.
+
+    Args:
+        vacancy_profile: Профиль вакансии.
+
+    Returns:
+        Текст с графиком работы вакансии.
+    """
+    schedule = vacancy_profile.get('schedule') or {}
+    schedule_list = ", ".join(schedule.get('schedule') or []) or "не указан"
+    text = f"График работы: {schedule_list}"
+    if schedule.get('details'):
+        text += f". Детали: {schedule['details']}"
+    return text
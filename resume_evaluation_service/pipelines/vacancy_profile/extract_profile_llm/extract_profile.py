@@ -0,0 +1,38 @@
+"""
+Функция для создания запроса на извлечение профиля вакансии с структурированным выводом
+с постепенным изменением температуры
+"""
+
+from typing import Optional
+
+from pipelines.vacancy_profile.prompts.prompt_builder import vacancy_profile_full_prompt
+from pipelines.vacancy_profile.pydantic_models.vacancy_profile import VacancyProfile
+from utils.llm_retry import invoke_structured_llm
+from utils.logger import setup_logger
+
+# Логирование
+logger = setup_logger(__name__)
+
+
+async def extract_vacancy_profile_llm(vacancy_text: str) -> Optional[VacancyProfile]:
+    """
+    Извлекает профиль вакансии одним запросом к LLM.
+    Температура модели плавно увеличивается с номером попытки, что повышает вероятность
+    корректного парсинга при повторных вызовах в случае ошибок.
+
+    Args:
+        vacancy_text (str): Текст вакансии
+
+    Returns:
+        Экземпляр VacancyProfile или None, если все попытки провалились.
+    """
+
+    # Формируем входные данные для промпта
+    prompt_input = {"vacancy_text": vacancy_text}
+
+    return await invoke_structured_llm(
+        pydantic_model=VacancyProfile,
+        prompt=vacancy_profile_full_prompt,
+        prompt_input=prompt_input,
+        description="извлечь профиль вакансии",
+    )
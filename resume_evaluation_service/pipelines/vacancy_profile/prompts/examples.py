@@ -0,0 +1,56 @@
+vacancy_profile_examples = [
+    {
+        "input": """Вакансия: Python-разработчик в IT-компанию.
+Зарплата: от 120 000 до 150 000 рублей.
+Обязанности: разработка и поддержка backend-сервисов, участие в код-ревью.
+Требования: опыт от 3 лет, знание Django, FastAPI, PostgreSQL.
+Образование: высшее в области информатики или смежных дисциплин.
+Условия: 5/2 с 10 до 18, полный день, ДМС.""",
+        "output": {
+            "position": "Python-разработчик",
+            "responsibilities": "Разработка и поддержка backend-сервисов, участие в код-ревью.",
+            "salary": {
+                "min_amount": 120000,
+                "max_amount": 150000,
+                "is_specified": True,
+                "extracted_text": "от 120 000 до 150 000 рублей",
+            },
+            "edu_list": [
+                {"level": "Высшее", "specialization": ["Техническое"]},
+            ],
+            "work_years": 3,
+            "requirements_text": "опыт от 3 лет, знание Django, FastAPI, PostgreSQL.",
+            "schedule": {
+                "schedule": ["Полный день"],
+                "details": "5/2 с 10 до 18",
+            },
+        },
+    },
+    {
+        "input": """Ищем менеджера по логистике на склад.
+Задачи: планирование поставок, контроль остатков, работа с перевозчиками.
+Мы ожидаем: знание 1С и WMS, уверенный Excel, опыт желателен.
+Образование среднее-специальное или высшее (логистика, экономика).
+Зарплата по договорённости. Сменный график 2/2.""",
+        "output": {
+            "position": "Менеджер по логистике",
+            "responsibilities": "Планирование поставок, контроль складских остатков, работа с перевозчиками.",
+            "salary": {
+                "min_amount": None,
+                "max_amount": None,
+                "is_specified": False,
+                "extracted_text": "Зарплата по договорённости",
+            },
+            "edu_list": [
+                {"level": "Среднее-специальное", "specialization": ["Логистическое", "Экономическое"]},
+                {"level": "Высшее", "specialization": ["Логистическое", "Экономическое"]},
+            ],
+            "work_years": 0,
+            "requirements_text": "знание 1С и WMS, уверенный Excel, опыт желателен.",
+            "schedule": {
+                "schedule": ["Сменный график"],
+                "details": "2/2",
+            },
+        },
+    },
+]
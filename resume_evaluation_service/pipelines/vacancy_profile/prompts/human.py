@@ -0,0 +1 @@
+vacancy_profile_human_prompt = "Извлеки теперь профиль из новой вакансии: {vacancy_text}"
@@ -5,9 +5,9 @@ from langchain_core.prompts import (
 )
 from langchain_core.prompts.few_shot import FewShotChatMessagePromptTemplate
 
-from pipelines.skills_evaluation.prompts.extract_reqs.examples import examples_reqs_extraction
-from pipelines.skills_evaluation.prompts.extract_reqs.human import reqs_extraction_human_prompt as human
-from pipelines.skills_evaluation.prompts.extract_reqs.system import system_reqs_prompt as system
+from pipelines.vacancy_profile.prompts.examples import vacancy_profile_examples
+from pipelines.vacancy_profile.prompts.human import vacancy_profile_human_prompt as human
+from pipelines.vacancy_profile.prompts.system import system_vacancy_profile_prompt as system
 
 # Оборачиваем системный промпт
 system_prompt = SystemMessagePromptTemplate.from_template(system)
@@ -21,14 +21,14 @@ example_prompt = ChatPromptTemplate.from_messages(
 )
 
 examples = FewShotChatMessagePromptTemplate(
-    examples=examples_reqs_extraction, example_prompt=example_prompt
+    examples=vacancy_profile_examples, example_prompt=example_prompt
 )
 
 # оборачиваем хьюман промпт
 human_prompt = HumanMessagePromptTemplate.from_template(human)
 
 # Собираем промпт в шаблон
-extraction_reqs_full_prompt = ChatPromptTemplate.from_messages(
+vacancy_profile_full_prompt = ChatPromptTemplate.from_messages(
     [
         system_prompt,
         examples,
@@ -0,0 +1,29 @@
+"""
+Версия промпта извлечения профиля вакансии.
+
+Вычисляется по тексту системного и пользовательского промптов и примерам,
+поэтому любое их изменение автоматически делает устаревшими профили
+в кэше вакансий. Ручной номер ревизии повышается, если меняется смысл
+профиля без изменения текста (например, схема ответа).
+"""
+
+import hashlib
+import json
+
+from pipelines.vacancy_profile.prompts.examples import vacancy_profile_examples
+from pipelines.vacancy_profile.prompts.human import vacancy_profile_human_prompt
+from pipelines.vacancy_profile.prompts.system import system_vacancy_profile_prompt
+
+# Ручная ревизия промпта
+VACANCY_PROFILE_PROMPT_REVISION = 1
+
+_digest = hashlib.sha256(
+    "\n".join([
+        system_vacancy_profile_prompt,
+        vacancy_profile_human_prompt,
+        json.dumps(vacancy_profile_examples, ensure_ascii=False, sort_keys=True),
+    ]).encode("utf-8")
+).hexdigest()[:12]
+
+# Версия промпта: <ревизия>-<хэш текста>
+VACANCY_PROFILE_PROMPT_VERSION = f"{VACANCY_PROFILE_PROMPT_REVISION}-{_digest}"
@@ -0,0 +1,40 @@
+"""Модель данных профиля вакансии"""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from pipelines.additional_evaluation.pydantic_models.additional_info import WorkScheduleInfo
+from pipelines.education_evaluation.pydantic_models.extract_main_edu import EducationInfo
+from pipelines.salary_evaluation.pydantic_models.salary_extraction_model import SalaryData
+
+
+class VacancyProfile(BaseModel):
+    """
+    Профиль вакансии — всё, что нужно блокам оценки, извлечённое за один запрос.
+
+    Attributes:
+        position (str): Название должности
+        responsibilities (str): Краткое описание обязанностей
+        salary (SalaryData): Зарплатная вилка вакансии
+        edu_list (List[EducationInfo]): Требования к образованию
+        work_years (int): Минимальное количество лет опыта работы
+        requirements_text (str): Текст блока требований в оригинальном виде
+        schedule (WorkScheduleInfo): График работы
+    """
+
+    position: str = Field("", description="Название должности")
+    responsibilities: str = Field(
+        "", description="Краткое описание обязанностей (1-3 предложения)"
+    )
+    salary: SalaryData = Field(..., description="Зарплатная вилка вакансии")
+    edu_list: List[EducationInfo] = Field(
+        ..., description="Требования к образованию"
+    )
+    work_years: int = Field(
+        0, description="Минимальное количество лет опыта работы, 0 если не указано"
+    )
+    requirements_text: str = Field(
+        "", description="Полный текст блока требований в оригинальном виде"
+    )
+    schedule: WorkScheduleInfo = Field(..., description="График работы")
@@ -1,82 +0,0 @@
-work_years_extraction_examples = [
-    {
-        "input": """Вакансия: Python-разработчик
-Требования:
-- Опыт работы с Python от 3 лет
-- Знание Django, Flask
-- Умение работать в команде""",
-        "output": {"work_years": 3}, 
-    },
-    {
-        "input": """Вакансия: Junior Python-разработчик
-Требования:
-- Базовое знание Python
-- Опыт работы приветствуется, но не обязателен
-- Умение читать техническую документацию""",
-        "output": {"work_years": 0},  
-    },
-    {
-        "input": """Вакансия: Team Lead Python
-Требования:
-- Опыт работы от 5 лет
-- Опыт управления командой
-- Знание архитектуры, микросервисов""",
-        "output": {"work_years": 5}, 
-    },
-    {
-        "input": """Вакансия: Аналитик данных
-Требования:
-- Опыт работы от 2 до 4 лет
-- Знание SQL, Excel
-- Навыки визуализации данных""",
-        "output": {"work_years": 2}, 
-    },
-    {
-        "input": """Вакансия: Бухгалтер
-Требования:
-- Опыт работы от 1.5 лет
-- Знание 1С, Excel
-- Ответственность и внимательность""",
-        "output": {"work_years": 2}, 
-    },
-    {
-        "input": """Вакансия: Менеджер по продажам
-Требования:
-- Опыт работы в продажах от 2 лет
-- Знание CRM
-- Активная жизненная позиция""",
-        "output": {"work_years": 2},  
-    },
-    {
-        "input": """Вакансия: DevOps-инженер
-Требования:
-- Опыт работы с Docker, Kubernetes
-- Опыт не менее 3 лет
-- Умение работать в распределённой команде""",
-        "output": {"work_years": 3},  
-    },
-    {
-        "input": """Вакансия: Экономист
-Требования:
-- Опыт работы приветствуется, но не обязателен
-- Знание Excel, 1С
-- Внимательность""",
-        "output": {"work_years": 0},  
-    },
-    {
-        "input": """Вакансия: Руководитель отдела разработки
-Требования:
-- Опыт на руководящих должностях от 4 лет
-- Знание методологий управления проектами
-- Опыт построения процессов""",
-        "output": {"work_years": 4},
-    },
-    {
-        "input": """Вакансия: QA-инженер
-Требования:
-- Опыт работы от 1 года
-- Знание методологий тестирования
-- Умение писать тест-кейсы""",
-        "output": {"work_years": 1},  
-    },
-]
@@ -1 +0,0 @@
-work_requirements_human_prompt = """Извлеки требования к опыту работы из следующей вакансии {vacancy}"""
\ No newline at end of file
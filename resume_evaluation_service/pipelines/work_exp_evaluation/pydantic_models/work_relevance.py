@@ -1,11 +1,14 @@
 """Модель оценки релевантности опыта работы кандидата"""
 
-from typing import List, Literal
+from functools import lru_cache
+from typing import List, Tuple
 
 from pydantic import BaseModel, Field, create_model
 
+from utils.dynamic_models import DYNAMIC_MODEL_CACHE_SIZE, DYNAMIC_SCHEMA_MODE, choice_field
 
-def create_pydantic_work_exp_relevance_matching_model(work_list: list):
+
+def create_pydantic_work_exp_relevance_matching_model(work_list: list, mode: str = DYNAMIC_SCHEMA_MODE):
     """
     Создаёт Pydantic-модель с динамическим `Literal` типом для оценки релевантности опыта работы.
     
@@ -13,18 +16,21 @@ def create_pydantic_work_exp_relevance_matching_model(work_list: list):
         company_position (str): Компания и позиция кандидата из списка его прошлой работы.
         reason (str): Краткое обоснование, почему опыт кандидата на этой должности релевантен или не релевантен вакансии.
         relevance (bool): Релевантен ли опыт кандидата на этой должности для вакансии.
+
+    Args:
+        work_list: Строки "компания | позиция" из опыта работы
+        mode: Режим схемы (enum или index, см. utils.dynamic_models)
     """
+    return _work_exp_relevance_model(tuple(work_list), mode)
 
-    work_list_literal = Literal[tuple(work_list)]
 
+@lru_cache(maxsize=DYNAMIC_MODEL_CACHE_SIZE)
+def _work_exp_relevance_model(work_list: Tuple[str, ...], mode: str):
+    """Модель для списка опыта (кэшируется, см. create_pydantic_work_exp_relevance_matching_model)."""
     RelevancedWork = create_model(
         "RelevancedWork",
-        company_position=(
-            work_list_literal,
-            Field(
-                ...,
-                description="Компания и позиция кандидата из списка его прошлой работы",
-            ),
+        company_position=choice_field(
+            work_list, "Компания и позиция кандидата из списка его прошлой работы", mode
         ),
         reason=(
             str,
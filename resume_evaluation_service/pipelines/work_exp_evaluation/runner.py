@@ -5,97 +5,87 @@
 
 import asyncio
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Dict, Optional, Union
 
 from utils.logger import setup_logger
+from utils.stage_graph import StageGraph
 from pipelines.work_exp_evaluation.extract_work_exp import get_work_exp as get_resume_work_exp
-from pipelines.work_exp_evaluation.extract_work_reqs import get_work_reqs
 from pipelines.work_exp_evaluation.get_report import evaluate_work_experience_match
 from pipelines.work_exp_evaluation.work_relevance import get_work_exp_relevance
+from pipelines.vacancy_profile.extract_profile import format_vacancy_summary, resolve_vacancy_profile
 
 # Логирование
 logger = setup_logger(__name__)
 
 
 async def evaluate_work_experience_pipeline(
-    resume_text: str, vacancy_text: str
+    resume_text: str,
+    vacancy_text: Optional[str] = None,
+    vacancy_profile: Union[Dict[str, Any], Awaitable[Dict[str, Any]], None] = None,
 ) -> Dict[str, Any]:
     """
     Полный асинхронный пайплайн оценки опыта работы.
 
+    Извлечение опыта из резюме и профиль вакансии выполняются параллельно
+    (этапы графа зависимостей), оценка релевантности — как только оба готовы.
+
     Args:
         resume_text: Текст резюме.
-        vacancy_text: Текст вакансии.
+        vacancy_text: Текст вакансии (используется, если профиль не передан).
+        vacancy_profile: Профиль вакансии или ожидание его извлечения.
 
     Returns:
         Словарь с финальным отчётом по опыту работы.
     """
     logger.info("Запуск пайплайна оценки опыта работы")
 
-    try:
-        # 1. Извлечение опыта из резюме
-        logger.info("Извлечение опыта работы из резюме")
-        resume_work_task = get_resume_work_exp(resume_text)
-
-        # 2. Извлечение требований к опыту из вакансии
-        logger.info("Извлечение требований к опыту из вакансии")
-        vacancy_reqs_task = get_work_reqs(vacancy_text)
-
-        # Параллельное выполнение задач
-        parsing_results = await asyncio.gather(
-            resume_work_task,
-            vacancy_reqs_task,
-            return_exceptions=True,
-        )
-
-        resume_work_exp, vacancy_work_reqs = parsing_results
-
-    except Exception as e:
-        logger.error(
-            f"Ошибка при извлечении данных: {str(e)}", exc_info=True
+    async def relevance(
+        resume_work_exp: Dict[str, Any], vacancy_profile: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # 3. Оценка релевантности опыта
+        logger.info("Оценка релевантности опыта работы для вакансии")
+        return await get_work_exp_relevance(
+            resume_work_exp, format_vacancy_summary(vacancy_profile)
         )
-        return {"status": "failed"}
-
-    # Проверка на наличие ошибок при извлечении данных опыта работы
-    if resume_work_exp is None or resume_work_exp.get("status") == "failed":
-        logger.error("Не удалось извлечь опыт работы из резюме")
-        return {"status": "failed"}
 
-    # Проверка на наличие ошибок при извлечении требований к опыту работы из вакансии
-    if vacancy_work_reqs is None or vacancy_work_reqs.get("status") == "failed":
-        logger.error("Не удалось извлечь требования к опыту работы из вакансии")
-        return {"status": "failed"}
-
-    # 3. Оценка релевантности опыта
-    logger.info("Оценка релевантности опыта работы для вакансии")
-    try:
-        relevance_result = await get_work_exp_relevance(
-            resume_work_exp, vacancy_text
+    async def report(
+        resume_work_exp: Dict[str, Any],
+        vacancy_profile: Dict[str, Any],
+        relevance: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        # 4. Генерация финального отчёта
+        logger.info("Генерация финального отчёта по опыту работы")
+        return evaluate_work_experience_match(
+            resume_work_exp=resume_work_exp,
+            vacancy_required_exp={"work_years": vacancy_profile.get("work_years") or 0},
+            relevance_result=relevance,
         )
 
-    except Exception as e:
-        logger.error(f"Ошибка при оценке релевантности опыта: {e}", exc_info=True)
+    # Блок выполняется целиком или не выполняется: при неуспехе этапа остальные отменяются
+    graph = StageGraph("work_experience", fail_fast=True)
+    # 1. Извлечение опыта из резюме
+    graph.add("resume_work_exp", lambda: get_resume_work_exp(resume_text))
+    # 2. Требования к опыту берутся из профиля вакансии
+    graph.add("vacancy_profile", lambda: resolve_vacancy_profile(vacancy_text, vacancy_profile))
+    graph.add("relevance", relevance, deps=("resume_work_exp", "vacancy_profile"), required=False)
+    # Без опыта в резюме релевантность не оценивается, но отчёт формируется
+    graph.add(
+        "report",
+        report,
+        deps=("resume_work_exp", "vacancy_profile", "relevance"),
+        optional=("relevance",),
+    )
+
+    results = await graph.run()
+
+    final_report = results["report"]
+    # Проверка на наличие ошибок при извлечении отчета
+    if final_report is None or final_report.get("status") != "success":
+        logger.error("Не удалось получить отчет по опыту работы")
         return {"status": "failed"}
 
-    # 4. Генерация финального отчёта
-    logger.info("Генерация финального отчёта по опыту работы")
-    try:
-        final_report = evaluate_work_experience_match(
-            resume_work_exp=resume_work_exp,
-            vacancy_required_exp=vacancy_work_reqs,
-            relevance_result=relevance_result,
-        )
-        
-        # Проверка на наличие ошибок при извлечении отчета
-        if final_report is None or final_report.get("status") != "success":
-            logger.error("Не удалось извлечь отчет по опыту работы")
-            return {"status": "failed"}
-        
-        logger.info("Пайплайн оценки опыта работы завершён успешно")
-        return final_report
-    except Exception as e:
-        logger.error(f"Ошибка при генерации отчёта: {e}", exc_info=True)
-        return {"error": f"Ошибка при генерации отчёта: {e}", "evaluation": None}
+    logger.info("Пайплайн оценки опыта работы завершён успешно")
+    return final_report
 
 
 def evaluate_work_experience_pipeline_sync(
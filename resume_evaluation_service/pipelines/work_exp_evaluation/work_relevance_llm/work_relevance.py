@@ -5,10 +5,10 @@
 
 from typing import Optional
 
-from langchain_core.messages import BaseMessage
 from pydantic import BaseModel
 
-from utils.create_llm_with_retries import get_structured_llm
+from utils.dynamic_models import DYNAMIC_SCHEMA_MODE, SCHEMA_MODE_INDEX
+from utils.llm_retry import invoke_structured_llm
 from utils.logger import setup_logger
 from pipelines.work_exp_evaluation.prompts.work_relevance.prompt_builder import work_relevance_full_prompt
 from pipelines.work_exp_evaluation.pydantic_models.work_relevance import (
@@ -18,9 +18,6 @@ from pipelines.work_exp_evaluation.pydantic_models.work_relevance import (
 # Логирование
 logger = setup_logger(__name__)
 
-# Максимальное количество попыток
-MAX_ATTEMPTS = 10
-
 
 async def evaluate_work_exp_relevance_llm(
     response_work_exp, vacancy: str
@@ -66,6 +63,12 @@ async def evaluate_work_exp_relevance_llm(
     
     print('filtered_work_list', filtered_work_list)
 
+    # В режиме index ответ ссылается на места работы по номерам
+    if DYNAMIC_SCHEMA_MODE == SCHEMA_MODE_INDEX:
+        filtered_work_list = [
+            {"id": number, **item} for number, item in enumerate(filtered_work_list, 1)
+        ]
+
     input_llm = {"work_list": filtered_work_list}
 
     logger.info("Оцениваем релевантность опыта работы")
@@ -81,45 +84,12 @@ async def evaluate_work_exp_relevance_llm(
         )
         return None
 
-    last_exception = None
-
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        logger.info(
-            f"Попытка {attempt}/{MAX_ATTEMPTS} для оценки релевантности курсов"
-        )
-
-        try:
-            # Получаем LLM с увеличивающейся температурой
-            structured_llm = get_structured_llm(
-                pydantic_model=RelevancedWork, attempt_number=attempt
-            )
-
-            # Формируем входные данные
-            prompt_input = {"vacancy": vacancy.strip(), "work_exp": input_llm}
-
-            # Генерируем сообщения
-            messages: list[BaseMessage] = await work_relevance_full_prompt.ainvoke(
-                prompt_input
-            )
-
-            # Выполняем вызов
-            response = await structured_llm.ainvoke(messages)
-
-            logger.info(f"Успешно оценена релевантность опыта после {attempt} попытки")
-            return response
-
-        except Exception as e:
-            last_exception = e
-            logger.warning(
-                f"Ошибка при попытке {attempt} оценить релевантность опыта: {str(e)}"
-            )
-
-            if attempt == MAX_ATTEMPTS:
-                break
+    # Формируем входные данные для промпта
+    prompt_input = {"vacancy": vacancy.strip(), "work_exp": input_llm}
 
-    # Все попытки провалились
-    logger.error(
-        f"Все {MAX_ATTEMPTS} попыток оценить релевантность опыта провалились: {str(last_exception)}",
-        exc_info=True,
+    return await invoke_structured_llm(
+        pydantic_model=RelevancedWork,
+        prompt=work_relevance_full_prompt,
+        prompt_input=prompt_input,
+        description="оценить релевантность опыта",
     )
-    return None
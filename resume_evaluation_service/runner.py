@@ -1,106 +1,241 @@
 """
 Раннер модуля resume_evaluation_service.
-Запускает полный пайплайн: извлечение → сравнение → отчёт.
+Запускает полный пайплайн: профиль вакансии → извлечение → сравнение → отчёт.
+Блоки оценки выполняются как этапы графа (utils.stage_graph): извлечение
+данных из резюме не ждёт разбора вакансии.
 """
 import asyncio
-from typing import Any, Dict
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from pipelines.additional_evaluation.runner import evaluate_additional_match
 from pipelines.education_evaluation.runner import evaluate_education_match_pipeline
 from pipelines.salary_evaluation.runner import evaluate_salary_match
 from pipelines.work_exp_evaluation.runner import evaluate_work_experience_pipeline
-from pipelines.skills_evaluation.runner import evaluate_skills_pipeline
+from pipelines.skills_evaluation.runner import evaluate_skills_pipeline, prepare_vacancy_skills
+from pipelines.vacancy_profile.extract_profile import get_vacancy_profile
+from utils.llm_limiter import llm_stage, set_llm_stage, track_queue_time
+from utils.llm_retry import retry_budget
 from utils.logger import setup_logger
+from utils.stage_graph import PIPELINE_BLOCK_TIMEOUT, StageGraph, is_failed
 
 # Логирование
 logger = setup_logger(__name__)
 
+# Колбэк прогресса: (название этапа, процент выполнения 0-100)
+ProgressCallback = Callable[[str, int], Awaitable[None]]
 
-async def run_pipeline(vacancy_text: str, resume_text: str) -> Dict[str, Any]:
+# Доля прогресса, приходящаяся на разбор вакансии
+VACANCY_STAGE_PROGRESS = 10
+
+# Режимы оценки:
+# strict — неуспех любого блока сразу отменяет остальные, оценка неуспешна;
+# partial — выполняются все блоки, отчёт содержит успешные и статус каждого блока
+MODE_STRICT = "strict"
+MODE_PARTIAL = "partial"
+EVALUATION_MODES = (MODE_STRICT, MODE_PARTIAL)
+EVALUATION_MODE = os.getenv("EVALUATION_MODE", MODE_STRICT)
+
+# Блоки оценки: этап графа → (ключ в отчёте, сообщение при неуспехе)
+REPORT_BLOCKS = {
+    "salary": ("salary_evaluation", "Не удалось получить отчет по зарплатным ожиданиям"),
+    "education": ("education_evaluation", "Не удалось получить отчет по образованию"),
+    "additional": ("additional_evaluation", "Не удалось получить отчет по условиям работы"),
+    "work_experience": ("work_experience_report", "Не удалось получить отчет по опыту работы"),
+    "skills": ("skills_report", "Не удалось получить отчет по навыкам"),
+}
+
+
+async def prepare_vacancy(vacancy_text: str) -> Dict[str, Any]:
+    """
+    Выполняет все этапы, зависящие только от вакансии: профиль вакансии
+    и подготовку навыков. Результат можно переиспользовать для оценки
+    нескольких резюме по одной вакансии.
+
+    Returns:
+        {'profile': ..., 'skills': ..., 'status': 'success'} или {'status': 'failed'}
+    """
+    # Профиль вакансии — один запрос к LLM на все блоки оценки
+    with llm_stage("vacancy_profile"):
+        vacancy_profile = await get_vacancy_profile(vacancy_text)
+    if vacancy_profile is None or vacancy_profile.get("status") == "failed":
+        logger.error("Не удалось извлечь профиль вакансии")
+        return {"status": "failed"}
+
+    with llm_stage("skills"):
+        vacancy_skills = await prepare_vacancy_skills(vacancy_profile.get("requirements_text"))
+    if vacancy_skills is None or vacancy_skills.get("status") == "failed":
+        logger.error("Не удалось подготовить навыки вакансии")
+        return {"status": "failed"}
+
+    return {"profile": vacancy_profile, "skills": vacancy_skills, "status": "success"}
+
+
+async def run_pipeline(
+    vacancy_text: str,
+    resume_text: str,
+    prepared_vacancy: Optional[Dict[str, Any]] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    mode: str = EVALUATION_MODE,
+) -> Dict[str, Any]:
     """
     Основная функция пайплайна — принимает тексты и возвращает отчёт.
     Может быть вызвана извне (например, из worker.py).
+
+    Args:
+        vacancy_text: Текст вакансии
+        resume_text: Текст резюме
+        prepared_vacancy: Результат prepare_vacancy (если вакансия уже разобрана)
+        on_progress: Колбэк, вызываемый после завершения каждого этапа
+        mode: Режим оценки (strict или partial, см. EVALUATION_MODES)
+
+    Returns:
+        Отчёт; {'status': 'failed'} при неуспехе; в режиме partial при неуспехе
+        части блоков — отчёт со status='partial' (неуспешные блоки равны None)
     """
     logger.info("Запуск модуля: resume_evaluation_service")
 
-    try:
-        # Запускаем параллельно все блоки оценки
-        # === 1: Оценка зарплаты ===
-        salary_report_task = evaluate_salary_match(
-            resume_text=resume_text, vacancy_text=vacancy_text
-        )
-
-        # === 2: Оценка образования и курсов ===
-        education_report_task = evaluate_education_match_pipeline(
-            resume_text=resume_text, vacancy_text=vacancy_text
-        )
-
-        # === 3: Оценка условий работы ===
-        additional_report_task = evaluate_additional_match(
-            resume_text=resume_text, vacancy_text=vacancy_text
-        )
-
-        # === 4: Оценка условий работы ===
-        work_experience_report_task = evaluate_work_experience_pipeline(
-                resume_text=resume_text, vacancy_text=vacancy_text
-            )
+    # Время ожидания в очереди ограничителя LLM по этапам и бюджет повторов запросов
+    with track_queue_time() as queue_times, retry_budget() as budget:
+        report = await _run_stages(vacancy_text, resume_text, prepared_vacancy, on_progress, mode)
 
-        # === 5: Оценка скиллов ===
-        skills_report_task = evaluate_skills_pipeline(
-            resume_text=resume_text, vacancy_text=vacancy_text
-        )
-
-        # Параллельное выполнение задач
-        parsing_results = await asyncio.gather(
-            salary_report_task,
-            education_report_task,
-            additional_report_task,
-            work_experience_report_task,
-            skills_report_task,
-            return_exceptions=True,
-        )
-
-        salary_report_data, education_report_data, additional_report_data, work_experience_report_data, skills_report_data = parsing_results
-
-    except Exception as e:
-        logger.error(
-            f"Ошибка при извлечении данных в одном из блоков: {str(e)}", exc_info=True
-        )
-        return {"status": "failed"}
+    logger.info(
+        "Время ожидания запросов к LLM по этапам",
+        extra={"queue_time": {stage: round(seconds, 3) for stage, seconds in queue_times.items()}},
+    )
+    logger.info(
+        f"Попытки запросов к LLM: {sum(budget.attempts.values())}, повторов {budget.used}, "
+        f"исправлено ответов {sum(budget.repaired.values())}",
+        extra=budget.summary(),
+    )
+    return report
 
-    # Проверка на наличие отчета по зарплатным ожиданиям
-    if salary_report_data is None or salary_report_data.get("status") == "failed":
-        logger.error("Не удалось получить отчет по зарплатным ожиданиям")
-        return {"status": "failed"}
 
-    # Проверка на наличие отчета по образованию
-    if education_report_data is None or education_report_data.get("status") == "failed":
-        logger.error("Не удалось получить отчет по образованию")
-        return {"status": "failed"}
+async def _run_stages(
+    vacancy_text: str,
+    resume_text: str,
+    prepared_vacancy: Optional[Dict[str, Any]],
+    on_progress: Optional[ProgressCallback],
+    mode: str,
+) -> Dict[str, Any]:
+    """Выполняет этапы пайплайна (см. run_pipeline)."""
 
-    # Проверка на наличие отчета по дополнительным условиям
-    if additional_report_data is None or additional_report_data.get("status") == "failed":
-        logger.error("Не удалось получить отчет по условиям работы")
-        return {"status": "failed"}
+    async def report_progress(stage: str, progress: int) -> None:
+        if on_progress is None:
+            return
+        try:
+            await on_progress(stage, progress)
+        except Exception as e:
+            # Ошибка отправки прогресса не должна прерывать оценку
+            logger.warning(f"Не удалось отправить прогресс этапа {stage}: {str(e)}")
 
-    # Проверка на наличие отчета по опыту работы
-    if work_experience_report_data is None or work_experience_report_data.get("status") == "failed":
-        logger.error("Не удалось получить отчет по опыту работы")
-        return {"status": "failed"}
+    # === 0: Этапы по вакансии ===
+    if prepared_vacancy is not None:
+        if prepared_vacancy.get("status") == "failed":
+            return {"status": "failed"}
+        vacancy_skills = prepared_vacancy["skills"]
+    else:
+        # Навыки вакансии готовятся внутри блока навыков параллельно с остальными блоками
+        vacancy_skills = None
+
+    blocks_total = 5
+    blocks_done = 0
+
+    async def vacancy_profile_stage() -> Dict[str, Any]:
+        """Профиль вакансии — один запрос к LLM на все блоки оценки."""
+        if prepared_vacancy is not None:
+            vacancy_profile = prepared_vacancy["profile"]
+        else:
+            set_llm_stage("vacancy_profile")
+            vacancy_profile = await get_vacancy_profile(vacancy_text)
+        if is_failed(vacancy_profile):
+            logger.error("Не удалось извлечь профиль вакансии")
+        else:
+            await report_progress("vacancy_profile", VACANCY_STAGE_PROGRESS)
+        return vacancy_profile
+
+    def block(stage: str, pipeline: Callable[..., Awaitable[Dict[str, Any]]], **kwargs: Any):
+        """
+        Этап графа для блока оценки.
 
-    # Проверка на наличие отчета по навыкам
-    if skills_report_data is None or skills_report_data.get("status") == "failed":
-        logger.error("Не удалось получить отчет по навыкам")
+        Блок запускается сразу и ждёт профиль вакансии только там, где он нужен:
+        извлечение данных из резюме идёт параллельно с разбором вакансии.
+        """
+        async def run() -> Dict[str, Any]:
+            nonlocal blocks_done
+            # Блок выполняется в своей задаче графа, этап действует только в ней
+            set_llm_stage(stage)
+            result = await pipeline(
+                resume_text=resume_text,
+                vacancy_profile=graph.wait("vacancy_profile", by=stage),
+                **kwargs,
+            )
+            blocks_done += 1
+            progress = VACANCY_STAGE_PROGRESS + (100 - VACANCY_STAGE_PROGRESS) * blocks_done // blocks_total
+            await report_progress(stage, progress)
+            return result
+        return run
+
+    # Без профиля вакансии не выполнится ни один блок — он обязателен в любом режиме.
+    # В режиме strict обязателен каждый блок: первый неуспех отменяет остальные
+    graph = StageGraph("resume_evaluation", default_timeout=PIPELINE_BLOCK_TIMEOUT, fail_fast=True)
+    blocks_required = mode == MODE_STRICT
+    graph.add("vacancy_profile", vacancy_profile_stage)
+    # === 1: Оценка зарплаты ===
+    graph.add("salary", block("salary", evaluate_salary_match), required=blocks_required)
+    # === 2: Оценка образования и курсов ===
+    graph.add(
+        "education",
+        block("education", evaluate_education_match_pipeline),
+        required=blocks_required,
+    )
+    # === 3: Оценка условий работы ===
+    graph.add("additional", block("additional", evaluate_additional_match), required=blocks_required)
+    # === 4: Оценка опыта работы ===
+    graph.add(
+        "work_experience",
+        block("work_experience", evaluate_work_experience_pipeline),
+        required=blocks_required,
+    )
+    # === 5: Оценка скиллов ===
+    graph.add(
+        "skills",
+        block("skills", evaluate_skills_pipeline, vacancy_skills=vacancy_skills),
+        required=blocks_required,
+    )
+
+    results = await graph.run()
+
+    if is_failed(results["vacancy_profile"]):
         return {"status": "failed"}
 
     # === Шаг 6: Формируем общий отчёт ===
-    final_report = {
-        "salary_evaluation": salary_report_data if salary_report_data else None,
-        "education_evaluation": education_report_data if education_report_data else None,
-        "additional_evaluation": additional_report_data if additional_report_data else None,
-        "work_experience_report": work_experience_report_data if work_experience_report_data else None,
-        "skills_report": skills_report_data if skills_report_data else None
-    }
+    final_report: Dict[str, Any] = {}
+    block_status: Dict[str, str] = {}
+    for stage, (report_key, error_message) in REPORT_BLOCKS.items():
+        block_report = results[stage]
+        if is_failed(block_report):
+            block_status[stage] = (block_report or {}).get("status", "failed")
+            if block_status[stage] == "failed":
+                logger.error(error_message)
+            final_report[report_key] = None
+        else:
+            block_status[stage] = "success"
+            final_report[report_key] = block_report
+
+    failed_blocks = [stage for stage, status in block_status.items() if status != "success"]
+    if failed_blocks and (mode == MODE_STRICT or len(failed_blocks) == len(REPORT_BLOCKS)):
+        return {"status": "failed"}
+
+    if mode == MODE_PARTIAL:
+        final_report["block_status"] = block_status
+        if failed_blocks:
+            final_report["status"] = "partial"
+            logger.warning(
+                "Пайплайн завершён частично",
+                extra={"failed_blocks": failed_blocks},
+            )
+            return final_report
 
     print(final_report)
     logger.info("Полный пайплайн завершён")
@@ -0,0 +1,90 @@
+"""
+Поля динамических Pydantic-моделей с выбором значения из входных данных.
+
+Модели оценки релевантности (навыки, опыт работы, курсы) ограничивают ответ
+модели значениями из входных данных. Есть два режима схемы (DYNAMIC_SCHEMA_MODE):
+- enum — поле Literal: каждое значение целиком повторяется в JSON-схеме
+  вызова функции, и схема растёт вместе со списками;
+- index — в схеме только диапазон номеров 1..N, значения передаются
+  в промпте пронумерованными (numbered), а номер из ответа заменяется
+  значением при валидации. Поле модели остаётся строкой, поэтому результат
+  model_dump() одинаков в обоих режимах.
+
+В режиме index при валидации принимается и само значение (в том числе
+с отличием в регистре или опечаткой, см. utils.output_repair): примеры
+в промптах записаны значениями, а не номерами.
+
+Фабрики моделей кэшируются по кортежу значений (DYNAMIC_MODEL_CACHE_SIZE):
+повторный запрос с теми же списками не создаёт класс заново и попадает
+в кэш привязок with_structured_output.
+"""
+
+import os
+from functools import partial
+from typing import Annotated, Any, Dict, Literal, Sequence, Tuple
+
+from dotenv import load_dotenv
+from pydantic import BeforeValidator, Field, WithJsonSchema
+
+from utils.output_repair import snap_literal
+
+load_dotenv()
+
+# Режимы схемы
+SCHEMA_MODE_ENUM = "enum"
+SCHEMA_MODE_INDEX = "index"
+
+DYNAMIC_SCHEMA_MODE = os.getenv("DYNAMIC_SCHEMA_MODE", SCHEMA_MODE_ENUM)
+# Максимальное количество закэшированных классов на фабрику
+DYNAMIC_MODEL_CACHE_SIZE = int(os.getenv("DYNAMIC_MODEL_CACHE_SIZE", "128"))
+
+
+def _resolve_choice(values: Tuple[str, ...], value: Any) -> Any:
+    """Заменяет номер из ответа значением (режим index)."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        index = value
+    elif isinstance(value, str) and value.strip().isdigit():
+        index = int(value.strip())
+    elif isinstance(value, str):
+        if value in values:
+            return value
+        snapped = snap_literal(value, values)
+        if snapped is None:
+            raise ValueError(f"Значение {value!r} отсутствует в списке")
+        return snapped
+    else:
+        return value
+
+    if not 1 <= index <= len(values):
+        raise ValueError(f"Номер {index} вне диапазона 1..{len(values)}")
+    return values[index - 1]
+
+
+def choice_field(
+    values: Tuple[str, ...], description: str, mode: str = DYNAMIC_SCHEMA_MODE
+) -> Tuple[Any, Any]:
+    """
+    Определение поля для create_model с выбором одного из values.
+
+    Args:
+        values: Допустимые значения
+        description: Описание поля
+        mode: Режим схемы (enum или index)
+
+    Returns:
+        Кортеж (тип, Field) для create_model
+    """
+    if mode != SCHEMA_MODE_INDEX:
+        return Literal[values], Field(..., description=description)
+
+    choice_type = Annotated[
+        str,
+        BeforeValidator(partial(_resolve_choice, values)),
+        WithJsonSchema({"type": "integer", "minimum": 1, "maximum": len(values)}),
+    ]
+    return choice_type, Field(..., description=f"{description} — номер из пронумерованного списка")
+
+
+def numbered(values: Sequence[str]) -> Dict[int, str]:
+    """Пронумерованный список значений для промпта в режиме index: {номер: значение}."""
+    return {number: value for number, value in enumerate(values, 1)}
@@ -0,0 +1,257 @@
+"""
+Выполнение этапов пайплайна по графу зависимостей.
+
+Каждый этап объявляет этапы, результаты которых ему нужны, и запускается,
+как только они готовы, — без общих барьеров asyncio.gather между фазами.
+Поэтому время пайплайна равно длине критического пути, а не сумме фаз.
+
+Неуспешный этап (исключение, превышение таймаута или {'status': 'failed'})
+не прерывает независимые этапы, а зависящие от него этапы не запускаются
+и получают {'status': 'failed'} (кроме необязательных зависимостей:
+такие этапы получают неуспешный результат как есть).
+
+В режиме fail_fast неуспех обязательного этапа сразу отменяет все
+незавершённые этапы (они получают {'status': 'cancelled'}): работа,
+результат которой уже не понадобится, не тратит запросы к LLM.
+
+После выполнения в лог пишется критический путь — цепочка этапов,
+определившая время выполнения графа.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+
+from utils.logger import setup_logger
+
+# Логирование
+logger = setup_logger(__name__)
+
+load_dotenv()
+
+# Таймауты по умолчанию (секунд, 0 — без ограничения)
+PIPELINE_STAGE_TIMEOUT = float(os.getenv("PIPELINE_STAGE_TIMEOUT", "0"))  # этап внутри блока оценки
+PIPELINE_BLOCK_TIMEOUT = float(os.getenv("PIPELINE_BLOCK_TIMEOUT", "0"))  # блок оценки целиком
+
+
+# Статусы неуспешного этапа
+FAILED_STATUSES = ("failed", "cancelled")
+
+
+def is_failed(result: Any) -> bool:
+    """Проверяет, что результат этапа неуспешный (в том числе отменённый)."""
+    return result is None or (isinstance(result, dict) and result.get("status") in FAILED_STATUSES)
+
+
+@dataclass
+class Stage:
+    """
+    Этап графа.
+
+    Attributes:
+        name: Название этапа (имя аргумента для зависящих этапов)
+        func: Корутина-функция; результаты зависимостей передаются по именам
+        deps: Этапы, результаты которых нужны до запуска
+        timeout: Таймаут этапа в секундах (None — таймаут графа по умолчанию)
+        optional: Зависимости, при неуспехе которых этап всё равно выполняется
+        required: Неуспех этапа отменяет граф в режиме fail_fast
+    """
+
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    deps: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    optional: Tuple[str, ...] = ()
+    required: bool = True
+    # Этапы, результат которых ожидался по ходу выполнения (StageGraph.wait)
+    waited: Set[str] = field(default_factory=set)
+
+
+class StageGraph:
+    """
+    Граф этапов одного запуска пайплайна.
+
+    Этапы добавляются после своих зависимостей, поэтому граф всегда ацикличен.
+    Экземпляр рассчитан на один вызов run().
+    """
+
+    def __init__(
+        self,
+        name: str,
+        default_timeout: float = PIPELINE_STAGE_TIMEOUT,
+        fail_fast: bool = False,
+    ):
+        """
+        Args:
+            name: Название графа для логов
+            default_timeout: Таймаут этапов по умолчанию (секунд, 0 — без ограничения)
+            fail_fast: Отменять незавершённые этапы при неуспехе обязательного
+        """
+        self.name = name
+        self.default_timeout = default_timeout
+        self.fail_fast = fail_fast
+        self.stages: Dict[str, Stage] = {}
+        self.results: Dict[str, Any] = {}
+        # Начало и конец этапа относительно запуска графа (секунд)
+        self.timings: Dict[str, Tuple[float, float]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._started = 0.0
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        deps: Tuple[str, ...] = (),
+        timeout: Optional[float] = None,
+        optional: Tuple[str, ...] = (),
+        required: bool = True,
+    ) -> None:
+        """
+        Добавляет этап.
+
+        Raises:
+            ValueError: Если этап уже есть или зависимость ещё не добавлена
+        """
+        if name in self.stages:
+            raise ValueError(f"Этап {name} уже добавлен в граф {self.name}")
+        unknown = [dep for dep in deps if dep not in self.stages]
+        if unknown:
+            raise ValueError(f"Этап {name} зависит от неизвестных этапов: {', '.join(unknown)}")
+        self.stages[name] = Stage(name, func, tuple(deps), timeout, tuple(optional), required)
+
+    def wait(self, name: str, by: str) -> Awaitable[Any]:
+        """
+        Результат этапа name для этапа by, которому он нужен не с самого начала.
+
+        Этап by запускается сразу и ждёт name только там, где результат нужен
+        (например, блок оценки извлекает данные из резюме, не дожидаясь профиля
+        вакансии). Ожидание учитывается в критическом пути. Вызывать из этапов
+        во время run().
+        """
+        self.stages[by].waited.add(name)
+        # shield: отмена ожидающего этапа не отменяет сам этап name
+        return asyncio.shield(self._tasks[name])
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Выполняет все этапы графа.
+
+        Returns:
+            Словарь {этап: результат}
+        """
+        self._started = time.monotonic()
+        for name, stage in self.stages.items():
+            self._tasks[name] = asyncio.create_task(self._run_stage(stage))
+
+        pending = set(self._tasks.values())
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                failed = self._failed_required(done) if self.fail_fast else None
+                if failed is not None and pending:
+                    logger.warning(
+                        f"Этап {failed} не выполнен, оставшиеся этапы {self.name} отменены",
+                        extra={"graph": self.name},
+                    )
+                    break
+        finally:
+            # При отмене run() или неуспехе обязательного этапа
+            # незавершённые этапы не должны продолжать работу
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for name in self.stages:
+            self.results.setdefault(name, {"status": "cancelled"})
+
+        self._log_critical_path()
+        return self.results
+
+    def _failed_required(self, done: Set[asyncio.Task]) -> Optional[str]:
+        """Название неуспешного обязательного этапа среди завершившихся или None."""
+        for name, task in self._tasks.items():
+            if task in done and self.stages[name].required and is_failed(self.results.get(name)):
+                return name
+        return None
+
+    async def _run_stage(self, stage: Stage) -> Any:
+        """Ждёт зависимости и выполняет этап."""
+        if stage.deps:
+            # asyncio.wait не отменяет зависимости при отмене этапа
+            await asyncio.wait([self._tasks[dep] for dep in stage.deps])
+
+        failed_deps = [
+            dep for dep in stage.deps
+            if dep not in stage.optional and is_failed(self.results.get(dep))
+        ]
+        if failed_deps:
+            logger.warning(
+                f"Этап {stage.name} пропущен: не выполнены {', '.join(failed_deps)}",
+                extra={"graph": self.name},
+            )
+            self.results[stage.name] = {"status": "failed"}
+            return self.results[stage.name]
+
+        timeout = stage.timeout if stage.timeout is not None else self.default_timeout
+        start = time.monotonic()
+        try:
+            result = await asyncio.wait_for(
+                stage.func(**{dep: self.results[dep] for dep in stage.deps}),
+                timeout if timeout > 0 else None,
+            )
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Превышен таймаут этапа {stage.name} ({timeout} с)",
+                extra={"graph": self.name},
+            )
+            result = {"status": "failed"}
+        except Exception as e:
+            logger.error(f"Ошибка этапа {stage.name}: {str(e)}", extra={"graph": self.name}, exc_info=True)
+            result = {"status": "failed"}
+
+        self.timings[stage.name] = (start - self._started, time.monotonic() - self._started)
+        self.results[stage.name] = result
+        return result
+
+    def critical_path(self) -> List[str]:
+        """
+        Цепочка этапов, определившая время выполнения графа.
+
+        Начинается с последнего завершившегося этапа; на каждом шаге берётся
+        та из его зависимостей (в том числе ожидавшихся через wait),
+        что завершилась последней.
+        """
+        if not self.timings:
+            return []
+
+        name = max(self.timings, key=lambda stage: self.timings[stage][1])
+        path = [name]
+        while True:
+            stage = self.stages[name]
+            inputs = [dep for dep in (*stage.deps, *stage.waited) if dep in self.timings]
+            if not inputs:
+                break
+            name = max(inputs, key=lambda dep: self.timings[dep][1])
+            path.append(name)
+        return path[::-1]
+
+    def _log_critical_path(self) -> None:
+        """Пишет в лог критический путь и длительности этапов."""
+        path = self.critical_path()
+        if not path:
+            return
+        logger.info(
+            f"Критический путь {self.name}: {' → '.join(path)}",
+            extra={
+                "graph": self.name,
+                "critical_path": path,
+                "total_time": round(self.timings[path[-1]][1], 3),
+                "stage_times": {
+                    name: round(end - start, 3) for name, (start, end) in self.timings.items()
+                },
+            },
+        )
@@ -0,0 +1,224 @@
+"""
+Кэш промежуточных результатов разбора вакансий.
+
+Результаты этапов, которые зависят только от текста вакансии (профиль вакансии,
+подготовленные навыки), сохраняются по ключу <этап>:<версия промптов>:<sha256>,
+где хэш считается по модели LLM (OPENAI_MODEL_NAME) и нормализованному тексту.
+Повторная оценка резюме по той же вакансии берёт их из кэша без обращения к LLM,
+а после изменения промптов этапа или смены модели старые записи не используются.
+
+Бэкенд выбирается переменной окружения VACANCY_CACHE_BACKEND:
+- memory (по умолчанию) — LRU-кэш в памяти воркера с TTL
+- core_api — таблица vacancy_cache в PostgreSQL через внутренние эндпоинты Core API
+- none — кэш отключён
+"""
+
+import copy
+import hashlib
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+from utils.clean_text import clean_text
+from utils.logger import setup_logger
+
+# Логирование
+logger = setup_logger(__name__)
+
+load_dotenv()
+
+# Настройки кэша
+VACANCY_CACHE_BACKEND = os.getenv("VACANCY_CACHE_BACKEND", "memory")
+VACANCY_CACHE_TTL = int(os.getenv("VACANCY_CACHE_TTL", str(24 * 3600)))  # секунды
+VACANCY_CACHE_MAX_SIZE = int(os.getenv("VACANCY_CACHE_MAX_SIZE", "256"))  # записей в памяти
+CORE_API_URL = os.getenv("CORE_API_URL", "http://core_api:8000")
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+LLM_MODEL_NAME = os.getenv("OPENAI_MODEL_NAME", "")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Нормализует текст для построения ключа: убирает невидимые символы,
+    приводит к нижнему регистру и схлопывает пробелы.
+    """
+    return re.sub(r"\s+", " ", clean_text(text or "")).strip().lower()
+
+
+def make_cache_key(
+    stage: str, text: str, version: str, model_name: str = LLM_MODEL_NAME
+) -> str:
+    """
+    Строит ключ кэша для этапа по версии промптов, модели и нормализованному тексту.
+
+    Args:
+        stage: Название этапа (например, "profile", "skills")
+        text: Текст, от которого зависит результат этапа
+        version: Версия промптов этапа
+        model_name: Модель LLM, вычисляющая результат
+
+    Returns:
+        Ключ вида <этап>:<версия>:<sha256>
+    """
+    digest = hashlib.sha256(
+        f"{model_name}\n{normalize_text(text)}".encode("utf-8")
+    ).hexdigest()
+    return f"{stage}:{version}:{digest}"
+
+
+class VacancyCacheBackend:
+    """Базовый бэкенд кэша: ничего не хранит."""
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Возвращает значение по ключу или None."""
+        return None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Сохраняет значение по ключу."""
+        return None
+
+
+class InMemoryVacancyCache(VacancyCacheBackend):
+    """
+    LRU-кэш в памяти процесса с временем жизни записей.
+
+    Attributes:
+        max_size: Максимальное количество записей
+        ttl: Время жизни записи в секундах
+    """
+
+    def __init__(self, max_size: int = VACANCY_CACHE_MAX_SIZE, ttl: int = VACANCY_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        # Копия, чтобы изменения в пайплайне не портили закэшированное значение
+        return copy.deepcopy(value)
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+
+class CoreApiVacancyCache(VacancyCacheBackend):
+    """
+    Кэш в PostgreSQL через внутренние эндпоинты Core API.
+    Общий для всех экземпляров воркера и переживает их перезапуск.
+
+    Attributes:
+        base_url: URL Core API
+        ttl: Время жизни записи в секундах
+    """
+
+    def __init__(
+        self,
+        base_url: str = CORE_API_URL,
+        ttl: int = VACANCY_CACHE_TTL,
+        token: Optional[str] = INTERNAL_API_TOKEN,
+        timeout: float = 5.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.ttl = ttl
+        headers = {"X-Internal-Token": token} if token else {}
+        self._client = httpx.AsyncClient(timeout=timeout, headers=headers)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        response = await self._client.get(f"{self.base_url}/internal/vacancy-cache/{key}")
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json().get("value")
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        response = await self._client.put(
+            f"{self.base_url}/internal/vacancy-cache/{key}",
+            json={"value": value, "ttl_seconds": self.ttl},
+        )
+        response.raise_for_status()
+
+
+def _create_backend(name: str) -> VacancyCacheBackend:
+    """Создаёт бэкенд кэша по названию."""
+    if name == "memory":
+        return InMemoryVacancyCache()
+    if name == "core_api":
+        return CoreApiVacancyCache()
+    if name != "none":
+        logger.warning(f"Неизвестный бэкенд кэша вакансий: {name}, кэш отключён")
+    return VacancyCacheBackend()
+
+
+# Глобальный бэкенд кэша
+_vacancy_cache: VacancyCacheBackend = _create_backend(VACANCY_CACHE_BACKEND)
+
+
+def set_vacancy_cache(backend: VacancyCacheBackend) -> None:
+    """Устанавливает глобальный бэкенд кэша."""
+    global _vacancy_cache
+    _vacancy_cache = backend
+
+
+def get_vacancy_cache() -> VacancyCacheBackend:
+    """Возвращает глобальный бэкенд кэша."""
+    return _vacancy_cache
+
+
+async def cached_stage(
+    stage: str,
+    text: str,
+    version: str,
+    compute: Callable[[], Awaitable[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """
+    Возвращает результат этапа из кэша или вычисляет и сохраняет его.
+    Неуспешные результаты ({'status': 'failed'}) не кэшируются.
+    Ошибки бэкенда не прерывают пайплайн — этап просто выполняется заново.
+
+    Args:
+        stage: Название этапа
+        text: Текст, от которого зависит результат этапа
+        version: Версия промптов этапа
+        compute: Корутина-функция, вычисляющая результат
+
+    Returns:
+        Результат этапа
+    """
+    cache = get_vacancy_cache()
+    key = make_cache_key(stage, text, version)
+
+    try:
+        cached = await cache.get(key)
+    except Exception as e:
+        logger.warning(f"Ошибка чтения кэша вакансий: {str(e)}")
+        cached = None
+
+    if cached is not None:
+        logger.info(f"Результат этапа {stage} взят из кэша", extra={"key": key})
+        return cached
+
+    result = await compute()
+
+    if result is not None and result.get("status") != "failed":
+        try:
+            await cache.set(key, result)
+        except Exception as e:
+            logger.warning(f"Ошибка записи в кэш вакансий: {str(e)}")
+
+    return result
@@ -1,15 +1,35 @@
 """
 Воркер для обработки задач из RabbitMQ.
 Вызывает run_pipeline из resume_evaluation_service.runner.
+
+Работает в одном event loop и обрабатывает несколько задач параллельно:
+количество задач, выдаваемых брокером, ограничивается prefetch_count,
+а количество одновременно выполняемых пайплайнов — семафором.
+
+Задача с type="batch" содержит одну вакансию и несколько резюме: вакансия
+разбирается один раз, резюме оцениваются параллельно, а результаты
+отправляются в reply_to по мере готовности (type="item"), последним
+отправляется итог (type="done").
+
+Если в задаче указан report_progress=true, после каждого этапа пайплайна
+в reply_to отправляется сообщение type="progress", а итоговый ответ
+помечается type="done".
+
+Запросы к LLM пакетных задач получают низкий приоритет в общем ограничителе
+(utils.llm_limiter), чтобы не задерживать интерактивные запросы. Приоритет
+можно указать явно полем priority ("interactive" или "batch").
 """
 
+import asyncio
 import json
 import os
 
-import pika
+import aio_pika
 from dotenv import load_dotenv
 
-from runner import run_pipeline_sync
+from runner import EVALUATION_MODE, EVALUATION_MODES, ProgressCallback, prepare_vacancy, run_pipeline
+from utils.create_llm_with_retries import get_llm_client_registry
+from utils.llm_limiter import PRIORITY_BATCH, PRIORITY_INTERACTIVE, set_llm_priority
 from utils.logger import setup_logger
 
 # Логирование
@@ -24,68 +44,287 @@ RABBITMQ_PORT = os.getenv("RABBITMQ_PORT")
 RABBITMQ_DEFAULT_VHOST = os.getenv("RABBITMQ_DEFAULT_VHOST")
 RABBITMQ_DEFAULT_HOST = os.getenv("RABBITMQ_DEFAULT_HOST")
 RABBITMQ_URL = f"amqp://{RABBITMQ_USER}:{RABBITMQ_PASS}@{RABBITMQ_DEFAULT_HOST}:{RABBITMQ_PORT}{RABBITMQ_DEFAULT_VHOST}"
-print(RABBITMQ_URL)
 
-def run_resume_evaluation_worker():
+# Настройки параллельной обработки
+QUEUE_NAME = "resume_evaluation_task"
+WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "20"))  # одновременно выполняемые пайплайны
+WORKER_PREFETCH_COUNT = int(os.getenv("WORKER_PREFETCH_COUNT", str(WORKER_CONCURRENCY)))  # задачи, выданные брокером
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "5"))  # одновременно оцениваемые резюме в пакете
+
+
+async def process_request(
+    request_data: dict,
+    prepared_vacancy: dict | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> dict:
     """
-    Запускает воркер, слушающий очередь resume_evaluation_task.
-    При получении задачи вызывает runner.run_pipeline и отправляет результат.
+    Выполняет пайплайн оценки резюме для одной задачи.
+
+    Args:
+        request_data: Тело сообщения из очереди
+        prepared_vacancy: Уже разобранная вакансия (для пакетной оценки)
+        on_progress: Колбэк прогресса по этапам пайплайна
+
+    Returns:
+        Ответ для отправки в очередь reply_to
     """
-    connection = pika.BlockingConnection(pika.URLParameters(RABBITMQ_URL))
-    channel = connection.channel()
+    try:
+        vacancy_text = request_data["vacancy_text"]
+        resume_text = request_data["resume_text"]
+        mode = request_data.get("mode") or EVALUATION_MODE
+        if mode not in EVALUATION_MODES:
+            raise ValueError(f"Неизвестный режим оценки: {mode}")
 
-    # Объявляем очередь
-    channel.queue_declare(queue="resume_evaluation_task", durable=True)
-    channel.basic_qos(prefetch_count=1)
+        # Выполняем пайплайн
+        report = await run_pipeline(vacancy_text, resume_text, prepared_vacancy, on_progress, mode)
 
-    def on_request(ch, method, properties, body):
-        try:
-            request_data = json.loads(body)
-            vacancy_text = request_data["vacancy_text"]
-            resume_text = request_data["resume_text"]
-
-            # Выполняем пайплайн
-            report = run_pipeline_sync(vacancy_text, resume_text)
-            
-            if report is None or report.get("status") == "failed":
-                logger.error("Не удалось получить отчет по образованию")
-                return {"status": "failed"}
-            
-            # Формируем ответ
-            response = {
-                "status": "success",
+        if report is None or report.get("status") == "failed":
+            logger.error("Не удалось получить отчет по оценке резюме")
+            return {
+                "status": "failed",
+                "data": None,
+                "message": "Не удалось получить отчет по оценке резюме",
+            }
+
+        # Часть блоков не выполнена (режим partial): статусы блоков — в block_status
+        if report.get("status") == "partial":
+            return {
+                "status": "partial",
                 "data": report,
+                "message": "Часть блоков оценки не выполнена",
             }
-            
+
+        # Формируем ответ
+        return {
+            "status": "success",
+            "data": report,
+        }
+
+    except Exception as e:
+        logger.error(f"Ошибка воркера: {str(e)}", exc_info=True)
+        # Возвращаем валидный data даже при ошибке
+        return {
+            "status": "error",
+            "data": None,
+            "message": f"Ошибка воркера: {str(e)}",
+        }
+
+
+async def process_batch(request_data: dict, publish) -> None:
+    """
+    Выполняет пакетную оценку: одна вакансия и несколько резюме.
+
+    Args:
+        request_data: Тело сообщения из очереди
+            ({"type": "batch", "vacancy_text": ..., "resumes": [{"id": ..., "resume_text": ...}]})
+        publish: Корутина-функция отправки сообщения в reply_to
+    """
+    vacancy_text = request_data.get("vacancy_text", "")
+    resumes = request_data.get("resumes") or []
+
+    # Этапы по вакансии выполняются один раз на весь пакет
+    try:
+        prepared_vacancy = await prepare_vacancy(vacancy_text)
+    except Exception as e:
+        logger.error(f"Ошибка разбора вакансии: {str(e)}", exc_info=True)
+        prepared_vacancy = {"status": "failed"}
+
+    if prepared_vacancy.get("status") == "failed":
+        await publish({
+            "type": "done",
+            "status": "failed",
+            "total": len(resumes),
+            "succeeded": 0,
+            "message": "Не удалось разобрать вакансию",
+        })
+        return
+
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def evaluate(index: int, resume: dict) -> dict:
+        # Ошибка одного резюме становится его ответом и не прерывает пакет
+        resume_id = resume.get("id") if isinstance(resume, dict) else None
+        try:
+            if not isinstance(resume, dict):
+                raise ValueError("Элемент resumes должен быть объектом")
+            async with semaphore:
+                response = await process_request(
+                    {
+                        "vacancy_text": vacancy_text,
+                        "resume_text": resume.get("resume_text", ""),
+                        "mode": request_data.get("mode"),
+                    },
+                    prepared_vacancy,
+                )
         except Exception as e:
-            # Возвращаем валидный data даже при ошибке
+            logger.error(f"Ошибка оценки резюме {index} в пакете: {str(e)}", exc_info=True)
             response = {
                 "status": "error",
                 "data": None,
                 "message": f"Ошибка воркера: {str(e)}",
             }
+        response.update({"type": "item", "index": index, "id": resume_id})
+        return response
+
+    # Отправляем результаты по мере готовности
+    succeeded = 0
+    tasks = [asyncio.create_task(evaluate(index, resume)) for index, resume in enumerate(resumes)]
+    try:
+        for task in asyncio.as_completed(tasks):
+            response = await task
+            if response.get("status") == "success":
+                succeeded += 1
+            await publish(response)
+    finally:
+        # При ошибке отправки оставшиеся оценки не продолжаются в фоне
+        for task in tasks:
+            task.cancel()
+
+    await publish({
+        "type": "done",
+        "status": "success",
+        "total": len(resumes),
+        "succeeded": succeeded,
+    })
+    logger.info(
+        "Пакетная оценка завершена",
+        extra={"total": len(resumes), "succeeded": succeeded},
+    )
+
 
-        ch.basic_publish(
-            exchange="",
-            routing_key=properties.reply_to,
-            properties=pika.BasicProperties(correlation_id=properties.correlation_id),
-            body=json.dumps(response, ensure_ascii=False),
+async def handle_message(
+    message: aio_pika.abc.AbstractIncomingMessage,
+    exchange: aio_pika.abc.AbstractExchange,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    """
+    Обрабатывает одно сообщение: выполняет пайплайн, отправляет ответ и подтверждает сообщение.
+
+    Ответ отправляется и сообщение снимается с очереди при любом исходе:
+    при ошибке в reply_to уходит итог со status="error" (type="done"),
+    а сообщение отклоняется без возврата в очередь.
+
+    Args:
+        message: Входящее сообщение
+        exchange: Exchange для отправки ответа
+        semaphore: Ограничитель количества одновременно выполняемых пайплайнов
+    """
+    async def publish(response: dict) -> None:
+        if not message.reply_to:
+            return
+        await exchange.publish(
+            aio_pika.Message(
+                body=json.dumps(response, ensure_ascii=False).encode(),
+                content_type="application/json",
+                correlation_id=message.correlation_id,
+            ),
+            routing_key=message.reply_to,
         )
-        ch.basic_ack(delivery_tag=method.delivery_tag)
-        logger.info("💤 Готов к приёму новой задачи...")
+
+    async with semaphore:
+        try:
+            request_data = json.loads(message.body)
+            if not isinstance(request_data, dict):
+                raise ValueError("Тело сообщения должно быть JSON-объектом")
+
+            # Приоритет запросов к LLM действует в контексте задачи обработки сообщения
+            priority = request_data.get("priority") or (
+                "batch" if request_data.get("type") == "batch" else "interactive"
+            )
+            set_llm_priority(PRIORITY_BATCH if priority == "batch" else PRIORITY_INTERACTIVE)
+
+            if request_data.get("type") == "batch":
+                await process_batch(request_data, publish)
+            elif request_data.get("report_progress"):
+                async def on_progress(stage: str, progress: int) -> None:
+                    await publish({"type": "progress", "stage": stage, "progress": progress})
+
+                response = await process_request(request_data, on_progress=on_progress)
+                response["type"] = "done"
+                await publish(response)
+            else:
+                await publish(await process_request(request_data))
+        except Exception as e:
+            logger.error(
+                f"Ошибка обработки сообщения: {str(e)}",
+                extra={"correlation_id": message.correlation_id},
+                exc_info=True,
+            )
+            try:
+                await publish({
+                    "type": "done",
+                    "status": "error",
+                    "data": None,
+                    "message": f"Ошибка воркера: {str(e)}",
+                })
+            except Exception as publish_error:
+                logger.error(f"Не удалось отправить ответ об ошибке: {str(publish_error)}")
+            await _settle(message, ack=False)
+            return
+
+        await _settle(message, ack=True)
+        logger.info(
+            "💤 Задача обработана",
+            extra={"correlation_id": message.correlation_id},
+        )
+
+
+async def _settle(message: aio_pika.abc.AbstractIncomingMessage, ack: bool) -> None:
+    """Подтверждает или отклоняет сообщение (ошибка канала только логируется)."""
+    try:
+        if ack:
+            await message.ack()
+        else:
+            await message.reject(requeue=False)
+    except Exception as e:
+        logger.error(
+            f"Не удалось {'подтвердить' if ack else 'отклонить'} сообщение: {str(e)}",
+            extra={"correlation_id": message.correlation_id},
+        )
+
+
+async def run_resume_evaluation_worker():
+    """
+    Запускает воркер, слушающий очередь resume_evaluation_task.
+    Каждая полученная задача обрабатывается в отдельной asyncio-задаче.
+    """
+    connection = await aio_pika.connect_robust(RABBITMQ_URL)
+    channel = await connection.channel()
+    await channel.set_qos(prefetch_count=WORKER_PREFETCH_COUNT)
+
+    # Объявляем очередь
+    queue = await channel.declare_queue(QUEUE_NAME, durable=True)
+
+    semaphore = asyncio.Semaphore(WORKER_CONCURRENCY)
+    tasks: set[asyncio.Task] = set()
+
+    async def on_request(message: aio_pika.abc.AbstractIncomingMessage):
+        # Не блокируем получение следующих сообщений
+        task = asyncio.create_task(
+            handle_message(message, channel.default_exchange, semaphore)
+        )
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
 
     # Подключаем обработчик
-    channel.basic_consume(
-        queue="resume_evaluation_task", on_message_callback=on_request
-    )
+    await queue.consume(on_request)
 
-    logger.info("✅ Воркер запущен. Ожидание задач...")
+    logger.info(
+        "✅ Воркер запущен. Ожидание задач...",
+        extra={"concurrency": WORKER_CONCURRENCY, "prefetch_count": WORKER_PREFETCH_COUNT},
+    )
     try:
-        channel.start_consuming()
-    except KeyboardInterrupt:
-        logger.info("🛑 Воркер остановлен")
-        connection.close()
+        await asyncio.Future()
+    finally:
+        # Дожидаемся уже начатых задач, чтобы отправить по ним ответы
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await connection.close()
+        await get_llm_client_registry().aclose_loop()
 
 
 if __name__ == "__main__":
-    run_resume_evaluation_worker()
+    try:
+        asyncio.run(run_resume_evaluation_worker())
+    except KeyboardInterrupt:
+        logger.info("🛑 Воркер остановлен")